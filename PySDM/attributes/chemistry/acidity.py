@@ -9,12 +9,19 @@ from PySDM.dynamics.impl.chemistry_utils import AQUEOUS_COMPOUNDS
 
 @register_attribute(name="pH")
 class Acidity(DerivedAttribute):
+    """with `AqueousChemistry.active_droplets` set (adaptive substepping), only
+    the pH of the listed super-droplets is recalculated (concentrations being
+    evaluated from mole amounts for these super-droplets only)"""
+
     def __init__(self, builder):
-        self.conc = {}
+        self.moles = {}
         for key, val in AQUEOUS_COMPOUNDS.items():
             if len(val) > 1:
-                self.conc[key] = builder.get_attribute("conc_" + key)
-        super().__init__(builder, name="pH", dependencies=self.conc.values())
+                self.moles[key] = builder.get_attribute("moles_" + key)
+        self.volume = builder.get_attribute("volume")
+        super().__init__(
+            builder, name="pH", dependencies=(*self.moles.values(), self.volume)
+        )
         self.environment = builder.particulator.environment
         self.cell_id = builder.get_attribute("cell id")
 
@@ -28,17 +35,13 @@ class Acidity(DerivedAttribute):
         self.particulator.backend.equilibrate_H(
             equilibrium_consts=dynamic.equilibrium_consts,
             cell_id=self.cell_id.get(),
-            conc=_conc(
-                N_mIII=self.conc["N_mIII"].get(),
-                N_V=self.conc["N_V"].get(),
-                C_IV=self.conc["C_IV"].get(),
-                S_IV=self.conc["S_IV"].get(),
-                S_VI=self.conc["S_VI"].get(),
-            ),
+            moles=_conc(**{key: self.moles[key].get() for key in _conc._fields}),
+            volume=self.volume.get(),
             do_chemistry_flag=dynamic.do_chemistry_flag,
             pH=self.data,
             H_min=dynamic.pH_H_min,
             H_max=dynamic.pH_H_max,
             ionic_strength_threshold=dynamic.ionic_strength_threshold,
             rtol=dynamic.pH_rtol,
+            droplets=dynamic.active_droplets,
         )
@@ -38,5 +38,12 @@ class Attribute:
     def mark_updated(self):
         self.timestamp += 1
 
+    def permute(self, permutation):
+        """reorders the values in memory (the last dimension) so that the element at
+        position `i` becomes the one previously at `permutation[i]` (see
+        `PySDM.impl.particle_attributes.ParticleAttributes.defragment`)"""
+        if self.data is not None:
+            self.data.upload(self.data.to_ndarray(raw=True)[..., permutation])
+
     def __str__(self):
         return self.name
@@ -32,5 +32,10 @@ class DiffusionalGrowthMassChange(DerivedAttribute):
         self.data.data[:] = new - self.old
         self.old[:] = new
 
+    def permute(self, permutation):
+        super().permute(permutation)
+        if self.old is not None:
+            self.old[:] = self.old[permutation]
+
     def recalculate(self):
         pass
@@ -67,7 +67,7 @@ else:
 
     ThrustRTC.ENABLE = False
 
-    class Random(RandomCommon):  # pylint: disable=too-few-public-methods
+    class Random(RandomCommon):
         def __init__(self, size, seed):
             super().__init__(size, seed)
             self.generator = np.random.default_rng(seed)
@@ -76,6 +76,12 @@ else:
             # pylint: disable=unsupported-assignment-operation
             storage.data.ndarray[:] = self.generator.uniform(0, 1, storage.shape)
 
+        def get_state(self):
+            return self.generator.bit_generator.state
+
+        def set_state(self, state):
+            self.generator.bit_generator.state = state
+
     ThrustRTC.Random = Random
 
 _BACKEND_CACHE = {}
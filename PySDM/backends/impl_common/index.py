@@ -48,6 +48,18 @@ def make_Index(backend):
                     idx=self.data, u01=temporary.data, cell_start=parts.data
                 )
 
+        def shuffle_incremental(self, temporary, parts):
+            """cheap re-shuffle of a per-cell permutation (see
+            `shuffle_local_incremental` in the Numba backend) using
+            `shuffle_incremental_u01_length(parts)` leading elements of `temporary`"""
+            backend.shuffle_local_incremental(
+                idx=self.data, u01=temporary.data, cell_start=parts.data
+            )
+
+        @staticmethod
+        def shuffle_incremental_u01_length(parts):
+            return backend.shuffle_local_incremental_u01_length(cell_start=parts.data)
+
         def remove_zero_n_or_flagged(self, indexed_storage):
             self.length = backend.remove_zero_n_or_flagged(
                 indexed_storage.data, self.data, self.length
@@ -3,8 +3,21 @@ common base class for random number generation abstraction layer
 """
 
 
-class RandomCommon:  # pylint: disable=too-few-public-methods
+class RandomCommon:
     def __init__(self, size: int, seed: int):
         assert isinstance(size, int)
         assert isinstance(seed, int)
         self.size = size
+
+    def get_state(self):
+        """returns a JSON-serialisable state of the generator
+        (see `PySDM.impl.checkpoint`)"""
+        raise NotImplementedError(
+            f"checkpointing state of {type(self).__name__} is not supported"
+        )
+
+    def set_state(self, state):
+        """sets the state of the generator from the value returned by `get_state`"""
+        raise NotImplementedError(
+            f"checkpointing state of {type(self).__name__} is not supported"
+        )
@@ -0,0 +1,50 @@
+"""
+partitioning of cells among threads for the Numba-parallel backend routines
+ processing cells in per-thread loops (condensation, deposition and aqueous chemistry)
+"""
+
+import numba
+import numpy as np
+
+from PySDM.backends.impl_numba import conf
+
+
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False, "cache": False}})
+def round_robin_partition(cell_order, n_threads):
+    """returns `cell_order` rearranged so that the cells assigned to each thread
+    (in a round-robin manner) are stored contiguously, and the (n_threads + 1)
+    offsets of each thread's range of cells"""
+    n_cell = len(cell_order)
+    thread_cell_order = np.empty_like(cell_order)
+    thread_start = np.empty(n_threads + 1, dtype=np.int64)
+    i = 0
+    for thread_id in range(n_threads):
+        thread_start[thread_id] = i
+        for j in range(thread_id, n_cell, n_threads):
+            thread_cell_order[i] = cell_order[j]
+            i += 1
+    thread_start[n_threads] = n_cell
+    return thread_cell_order, thread_start
+
+
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False, "cache": False}})
+def cost_weighted_partition(cell_cost, n_threads):
+    """same as `round_robin_partition` but with cells assigned to threads using
+    the longest-processing-time-first rule: cells sorted by decreasing cost are
+    assigned one by one to the least loaded thread"""
+    n_cell = len(cell_cost)
+    thread_of_cell = np.empty(n_cell, dtype=np.int64)
+    thread_load = np.zeros(n_threads)
+    thread_start = np.zeros(n_threads + 1, dtype=np.int64)
+    for cell_id in np.argsort(cell_cost)[::-1]:
+        thread_id = np.argmin(thread_load)
+        thread_load[thread_id] += cell_cost[cell_id]
+        thread_of_cell[cell_id] = thread_id
+        thread_start[thread_id + 1] += 1
+    thread_start = np.cumsum(thread_start)
+    thread_cell_order = np.empty(n_cell, dtype=np.int64)
+    position = thread_start[:-1].copy()
+    for cell_id in range(n_cell):
+        thread_cell_order[position[thread_of_cell[cell_id]]] = cell_id
+        position[thread_of_cell[cell_id]] += 1
+    return thread_cell_order, thread_start
@@ -7,4 +7,5 @@ JIT_FLAGS = {
     "fastmath": True,
     "error_model": "numpy",
     "cache": False,  # https://github.com/numba/numba/issues/2956
+    "nogil": True,  # letting dynamics run concurrently (see PySDM.impl.scheduler)
 }
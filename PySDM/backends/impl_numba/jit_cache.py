@@ -0,0 +1,190 @@
+"""
+persistent (on-disk) cache of Numba-compiled backend kernels; Numba's own cache cannot
+ be used for the closure-based kernels of the `PySDM.backends.numba.Numba` backend
+ (see https://github.com/numba/numba/issues/2956) as the index key it derives
+ from closure variables changes from process to process; here, the index key is instead
+ derived from a deterministic fingerprint of the kernel code, of the closure variables and
+ referenced globals (incl. the JIT-compiled formulae and the constants catalogue) and
+ of the JIT flags. Enabled with `Numba(..., override_jit_flags={"cache": True})` for
+ the kernels defined with `njit` (other dispatchers are not affected), the cache location
+ follows Numba settings (e.g., `NUMBA_CACHE_DIR` env var)
+"""
+
+import hashlib
+import types
+
+import numba
+import numpy as np
+from numba.core.caching import FunctionCache, NullCache
+from numba.core.dispatcher import Dispatcher
+
+
+class UnknownObjectError(TypeError):
+    """raised when the code of a dispatcher refers to an object whose value cannot
+    be fingerprinted (the dispatcher is then not cached)"""
+
+
+_SIMPLE_TYPES = (
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    np.generic,
+    np.dtype,
+)
+
+
+def _fingerprint(obj, ctx) -> str:
+    # pylint: disable=too-many-return-statements
+    if isinstance(obj, _SIMPLE_TYPES):
+        return repr(obj)
+    if id(obj) in ctx.visited:
+        return "<visited>"
+    ctx.visited.add(id(obj))
+    if isinstance(obj, Dispatcher):
+        return _fingerprint(obj.py_func, ctx) + repr(sorted(obj.targetoptions.items()))
+    if isinstance(obj, types.FunctionType):
+        names = _code_names(obj.__code__)
+        ctx.names_found |= set(names)
+        referenced_globals = tuple(
+            (name, _fingerprint(obj.__globals__[name], ctx))
+            for name in names
+            if name in obj.__globals__
+        )
+        closure = tuple(
+            _fingerprint(cell.cell_contents, ctx) for cell in obj.__closure__ or ()
+        )
+        defaults = _fingerprint(obj.__defaults__, ctx)
+        return repr(
+            (_code_fingerprint(obj.__code__), referenced_globals, closure, defaults)
+        )
+    if isinstance(obj, types.ModuleType):
+        return obj.__name__
+    if isinstance(obj, tuple) and hasattr(obj, "_fields"):
+        return repr(
+            (
+                type(obj).__name__,
+                tuple(
+                    (field, _fingerprint(getattr(obj, field), ctx))
+                    for field in obj._fields
+                    if field in ctx.names_used
+                ),
+            )
+        )
+    if isinstance(obj, (tuple, list)):
+        return repr(
+            (type(obj).__name__, tuple(_fingerprint(item, ctx) for item in obj))
+        )
+    if isinstance(obj, dict):
+        return repr(
+            tuple((repr(key), _fingerprint(value, ctx)) for key, value in obj.items())
+        )
+    if isinstance(obj, np.ndarray):
+        return repr(
+            (
+                obj.dtype,
+                obj.shape,
+                hashlib.sha256(np.ascontiguousarray(obj)).hexdigest(),
+            )
+        )
+    if isinstance(obj, types.SimpleNamespace):
+        return _fingerprint(vars(obj), ctx)
+    if isinstance(obj, (type, types.BuiltinFunctionType)):
+        return obj.__module__ + "." + obj.__qualname__
+    raise UnknownObjectError(
+        f"cannot fingerprint an object of type {type(obj).__qualname__}"
+    )
+
+
+def fingerprint(dispatcher) -> str:
+    """returns a deterministic description of the code (and of all code and data it refers
+    to) of a given dispatcher (raising `UnknownObjectError` if it refers to objects of
+    types other than those known to be fingerprinted by value); fields of named tuples
+    (e.g., of the flattened formulae or of the constants catalogue) are taken into account
+    only if their names are referenced from within the code reachable from the dispatcher
+    (iterated until no new names are found)"""
+    names = set()
+    while True:
+        ctx = types.SimpleNamespace(visited=set(), names_used=names, names_found=set())
+        result = _fingerprint(dispatcher, ctx)
+        if ctx.names_found <= names:
+            return result
+        names = names | ctx.names_found
+
+
+def _code_names(code):
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= set(_code_names(const))
+    return sorted(names)
+
+
+def _code_fingerprint(code):
+    return (
+        code.co_code,
+        tuple(
+            (
+                _code_fingerprint(const)
+                if isinstance(const, types.CodeType)
+                else repr(sorted(const) if isinstance(const, frozenset) else const)
+            )
+            for const in code.co_consts
+        ),
+        code.co_names,
+    )
+
+
+class KeyedFunctionCache(FunctionCache):
+    """Numba `FunctionCache` with index key derived from the code, closure, referenced
+    globals and JIT flags (instead of the pickled closure variables)"""
+
+    def __init__(self, dispatcher, key):
+        super().__init__(dispatcher.py_func)
+        self._key = key
+
+    def _index_key(self, sig, codegen):
+        return sig, codegen.magic_tuple(), self._key
+
+
+def njit(*args, cache=False, **jit_flags):
+    """`numba.njit` counterpart for backend kernels: with `cache=True`, the returned
+    dispatcher is cached using `KeyedFunctionCache` (or not cached at all if no
+    cache locator is available for it, e.g., for exec-defined code, or if its code
+    refers to objects which cannot be fingerprinted)"""
+
+    def decorator(func):
+        dispatcher = numba.njit(func, cache=False, **jit_flags)
+        if cache and isinstance(dispatcher, Dispatcher):
+            try:
+                key = hashlib.sha256(fingerprint(dispatcher).encode()).hexdigest()
+                dispatcher._cache = (
+                    KeyedFunctionCache(  # pylint: disable=protected-access
+                        dispatcher, key
+                    )
+                )
+            except (RuntimeError, UnknownObjectError):
+                dispatcher._cache = NullCache()  # pylint: disable=protected-access
+        return dispatcher
+
+    if args:
+        return decorator(*args)
+    return decorator
+
+
+def prewarm(build_particulator, steps=1):
+    """compiles (and thus stores in the persistent cache) all kernels used by the
+    simulation set up by the `build_particulator()` callable by running it for a given
+    number of `steps` - intended for populating the cache ahead of a batch of runs
+    using the same formulae and backend settings; returns the particulator"""
+    particulator = build_particulator()
+    if not particulator.backend.default_jit_flags.get("cache", False):
+        raise ValueError(
+            "prewarming requires a backend with caching enabled"
+            ' (override_jit_flags={"cache": True})'
+        )
+    particulator.run(steps=steps)
+    return particulator
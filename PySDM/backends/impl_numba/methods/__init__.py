@@ -6,11 +6,13 @@ from .condensation_methods import CondensationMethods
 from .displacement_methods import DisplacementMethods
 from .fragmentation_methods import FragmentationMethods
 from .freezing_methods import FreezingMethods
+from .fused_collisions_methods import FusedCollisionsMethods
 from .index_methods import IndexMethods
 from .isotope_methods import IsotopeMethods
 from .moments_methods import MomentsMethods
 from .pair_methods import PairMethods
 from .physics_methods import PhysicsMethods
+from .random_methods import RandomMethods
 from .terminal_velocity_methods import TerminalVelocityMethods
 from .seeding_methods import SeedingMethods
 from .deposition_methods import DepositionMethods
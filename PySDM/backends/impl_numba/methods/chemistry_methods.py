@@ -3,12 +3,14 @@ CPU implementation of backend methods for aqueous chemistry
 """
 
 from collections import namedtuple
+from functools import cached_property
 
 import numba
 import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
-from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba import conf, jit_cache
+from PySDM.backends.impl_numba.cell_partition import round_robin_partition
 from PySDM.backends.impl_numba.toms748 import toms748_solve
 from PySDM.dynamics.impl.chemistry_utils import (
     DIFFUSION_CONST,
@@ -31,6 +33,10 @@ _QUITE_CLOSE_MULTIPLIER = 2
 
 _K = namedtuple("_K", ("NH3", "SO2", "HSO3", "HSO4", "HCO3", "CO2", "HNO3"))
 _conc = namedtuple("_conc", ("N_mIII", "N_V", "C_IV", "S_IV", "S_VI"))
+_CompoundConsts = namedtuple(
+    "_CompoundConsts",
+    ("specific_gravity", "alpha", "diffusion_const"),
+)
 
 
 class ChemistryMethods(BackendMethods):
@@ -40,12 +46,28 @@ class ChemistryMethods(BackendMethods):
         self.KINETIC_CONST = KineticConsts(self.formulae)
         self.EQUILIBRIUM_CONST = EquilibriumConsts(self.formulae)
         self.specific_gravities = SpecificGravities(self.formulae.constants)
+        self.__compound_consts = _CompoundConsts(
+            specific_gravity=np.array(
+                [
+                    self.specific_gravities[compound]
+                    for compound in GASEOUS_COMPOUNDS.values()
+                ]
+            ),
+            alpha=np.array(
+                [
+                    MASS_ACCOMMODATION_COEFFICIENTS[compound]
+                    for compound in GASEOUS_COMPOUNDS.values()
+                ]
+            ),
+            diffusion_const=np.array(
+                [DIFFUSION_CONST[compound] for compound in GASEOUS_COMPOUNDS.values()]
+            ),
+        )
 
     def dissolution(  # pylint:disable=too-many-locals
         self,
         *,
         n_cell,
-        n_threads,
         cell_order,
         cell_start_arg,
         idx,
@@ -62,100 +84,149 @@ class ChemistryMethods(BackendMethods):
         droplet_volume,
         multiplicity,
     ):
-        assert n_cell == 1
-        assert n_threads == 1
-        for i in range(n_cell):
-            cell_id = cell_order[i]
-
-            cell_start = cell_start_arg[cell_id]
-            cell_end = cell_start_arg[cell_id + 1]
-            n_sd_in_cell = cell_end - cell_start
-            if n_sd_in_cell == 0:
-                continue
-
-            super_droplet_ids = numba.typed.List()
-            for sd_id in idx[cell_start:cell_end]:
-                if do_chemistry_flag.data[sd_id]:
-                    super_droplet_ids.append(sd_id)
-
-            if len(super_droplet_ids) == 0:
-                return
-
-            for key, compound in GASEOUS_COMPOUNDS.items():
-                ChemistryMethods.dissolution_body(
-                    super_droplet_ids=super_droplet_ids,
-                    mole_amounts=mole_amounts[key].data,
-                    env_mixing_ratio=env_mixing_ratio[compound][cell_id : cell_id + 1],
-                    henrysConstant=self.HENRY_CONST.HENRY_CONST[compound].at(
-                        env_T[cell_id]
-                    ),
-                    env_p=env_p[cell_id],
-                    env_T=env_T[cell_id],
-                    env_rho_d=env_rho_d[cell_id],
-                    timestep=timestep,
-                    dv=dv,
-                    droplet_volume=droplet_volume.data,
-                    multiplicity=multiplicity.data,
-                    system_type=system_type,
-                    specific_gravity=self.specific_gravities[compound],
-                    alpha=MASS_ACCOMMODATION_COEFFICIENTS[compound],
-                    diffusion_const=DIFFUSION_CONST[compound],
-                    dissociation_factor=dissociation_factors[compound].data,
-                    radius=self.formulae.trivia.radius,
-                    const=self.formulae.constants,
-                )
-
-    @staticmethod
-    @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
-    def dissolution_body(  # pylint: disable=too-many-locals
-        *,
-        super_droplet_ids,
-        mole_amounts,
-        env_mixing_ratio,
-        henrysConstant,
-        env_p,
-        env_T,
-        env_rho_d,
-        timestep,
-        dv,
-        droplet_volume,
-        multiplicity,
-        system_type,
-        specific_gravity,
-        alpha,
-        diffusion_const,
-        dissociation_factor,
-        radius,
-        const,
-    ):
-        mole_amount_taken = 0
-        for i in super_droplet_ids:
-            Mc = specific_gravity * const.Md
-            Rc = const.R_str / Mc
-            cinf = env_p / env_T / (const.Rd / env_mixing_ratio[0] + Rc) / Mc
-            r_w = radius(volume=droplet_volume[i])
-            v_avg = np.sqrt(8 * const.R_str * env_T / (np.pi * Mc))
-            dt_over_scale = timestep / (
-                4 * r_w / (3 * v_avg * alpha) + r_w**2 / (3 * diffusion_const)
-            )
-            A_old = mole_amounts[i] / droplet_volume[i]
-            H_eff = henrysConstant * dissociation_factor[i]
-            A_new = (A_old + dt_over_scale * cinf) / (
-                1 + dt_over_scale / H_eff / const.R_str / env_T
-            )
-            new_mole_amount_per_real_droplet = A_new * droplet_volume[i]
-            assert new_mole_amount_per_real_droplet >= 0
-
-            mole_amount_taken += multiplicity[i] * (
-                new_mole_amount_per_real_droplet - mole_amounts[i]
+        n_threads = min(numba.get_num_threads(), n_cell)
+        thread_cell_order, thread_start = round_robin_partition(
+            np.asarray(cell_order, dtype=np.int64), n_threads
+        )
+        failed = np.zeros(n_cell, dtype=np.int64)
+        self._dissolution_body(
+            n_threads=n_threads,
+            thread_start=thread_start,
+            cell_order=thread_cell_order,
+            cell_start=cell_start_arg.data,
+            idx=idx.data,
+            do_chemistry_flag=do_chemistry_flag.data,
+            mole_amounts=tuple(mole_amounts[key].data for key in GASEOUS_COMPOUNDS),
+            env_mixing_ratio=tuple(
+                env_mixing_ratio[compound] for compound in GASEOUS_COMPOUNDS.values()
+            ),
+            dissociation_factors=tuple(
+                dissociation_factors[compound].data
+                for compound in GASEOUS_COMPOUNDS.values()
+            ),
+            henrys_constant=np.array(
+                [
+                    self.HENRY_CONST.HENRY_CONST[compound].at(env_T.data)
+                    for compound in GASEOUS_COMPOUNDS.values()
+                ]
+            ),
+            env_T=env_T.data,
+            env_p=env_p.data,
+            env_rho_d=env_rho_d.data,
+            timestep=np.broadcast_to(np.asarray(timestep, dtype=float), (n_cell,)),
+            dv=dv,
+            closed_system=system_type == "closed",
+            droplet_volume=droplet_volume.data,
+            multiplicity=multiplicity.data,
+            compound_consts=self.__compound_consts,
+            failed=failed,
+        )
+        if failed.any():
+            raise ValueError(
+                "dissolution yielded negative mole amounts or depleted the ambient gas"
+                f" in cell(s): {np.flatnonzero(failed)} (try more substeps)"
             )
-            mole_amounts[i] = new_mole_amount_per_real_droplet
-        delta_mr = mole_amount_taken * specific_gravity * const.Md / (dv * env_rho_d)
-        assert delta_mr <= env_mixing_ratio
-        if system_type == "closed":
-            env_mixing_ratio -= delta_mr
 
-    def oxidation(  # pylint: disable=too-many-locals
+    @cached_property
+    def _dissolution_body(self):
+        """cell-parallel kernel handling all compounds in one pass over the
+        (cell-sorted) super-droplets of each cell; gas-phase budgets are
+        accumulated per cell and failures recorded in `failed` (not asserted,
+        which would prevent parallelisation)"""
+        radius = self.formulae.trivia.radius
+        const = self.formulae.constants
+
+        @jit_cache.njit(**self.default_jit_flags)
+        def body(  # pylint: disable=too-many-locals,too-many-arguments
+            *,
+            n_threads,
+            thread_start,
+            cell_order,
+            cell_start,
+            idx,
+            do_chemistry_flag,
+            mole_amounts,
+            env_mixing_ratio,
+            dissociation_factors,
+            henrys_constant,
+            env_T,
+            env_p,
+            env_rho_d,
+            timestep,
+            dv,
+            closed_system,
+            droplet_volume,
+            multiplicity,
+            compound_consts,
+            failed,
+        ):
+            n_compounds = len(mole_amounts)
+            for thread_id in numba.prange(n_threads):  # pylint: disable=not-an-iterable
+                Mc = np.empty(n_compounds)
+                cinf = np.empty(n_compounds)
+                v_avg = np.empty(n_compounds)
+                mole_amount_taken = np.empty(n_compounds)
+                for i in range(thread_start[thread_id], thread_start[thread_id + 1]):
+                    cell_id = cell_order[i]
+                    if timestep[cell_id] == 0:
+                        continue
+                    T = env_T[cell_id]
+                    for c in range(n_compounds):
+                        Mc[c] = compound_consts.specific_gravity[c] * const.Md
+                        cinf[c] = (
+                            env_p[cell_id]
+                            / T
+                            / (
+                                const.Rd / env_mixing_ratio[c][cell_id]
+                                + const.R_str / Mc[c]
+                            )
+                            / Mc[c]
+                        )
+                        v_avg[c] = np.sqrt(8 * const.R_str * T / (np.pi * Mc[c]))
+                        mole_amount_taken[c] = 0
+                    for j in range(cell_start[cell_id], cell_start[cell_id + 1]):
+                        sd_id = idx[j]
+                        if not do_chemistry_flag[sd_id]:
+                            continue
+                        r_w = radius(droplet_volume[sd_id])
+                        for c in range(n_compounds):
+                            dt_over_scale = timestep[cell_id] / (
+                                4 * r_w / (3 * v_avg[c] * compound_consts.alpha[c])
+                                + r_w**2 / (3 * compound_consts.diffusion_const[c])
+                            )
+                            A_old = mole_amounts[c][sd_id] / droplet_volume[sd_id]
+                            H_eff = (
+                                henrys_constant[c, cell_id]
+                                * dissociation_factors[c][sd_id]
+                            )
+                            A_new = (A_old + dt_over_scale * cinf[c]) / (
+                                1 + dt_over_scale / H_eff / const.R_str / T
+                            )
+                            new_mole_amount_per_real_droplet = (
+                                A_new * droplet_volume[sd_id]
+                            )
+                            if new_mole_amount_per_real_droplet < 0:
+                                failed[cell_id] = 1
+                            mole_amount_taken[c] += multiplicity[sd_id] * (
+                                new_mole_amount_per_real_droplet
+                                - mole_amounts[c][sd_id]
+                            )
+                            mole_amounts[c][sd_id] = new_mole_amount_per_real_droplet
+                    for c in range(n_compounds):
+                        delta_mr = (
+                            mole_amount_taken[c]
+                            * compound_consts.specific_gravity[c]
+                            * const.Md
+                            / (dv * env_rho_d[cell_id])
+                        )
+                        if delta_mr > env_mixing_ratio[c][cell_id]:
+                            failed[cell_id] = 1
+                        if closed_system:
+                            env_mixing_ratio[c][cell_id] -= delta_mr
+
+        return body
+
+    def oxidation(  # pylint: disable=too-many-locals,too-many-arguments
         self,
         *,
         n_sd,
@@ -176,20 +247,45 @@ class ChemistryMethods(BackendMethods):
         moles_H2O2,
         moles_S_IV,
         moles_S_VI,
+        cell_order=None,
+        cell_start_arg=None,
+        idx=None,
+        relative_change=None,
+        max_relative_change=None,
     ):
-        ChemistryMethods.oxidation_body(
-            n_sd=n_sd,
-            cell_ids=cell_ids.data,
+        """`timestep` can be a scalar or a per-cell array; only the super-droplets
+        within the cells listed in `cell_order` are updated (all cells by default, with
+        the super-droplets then grouped by cell based on `cell_ids`, otherwise taken
+        from the cell-sorted `idx`); if `relative_change` is given, it is filled (for
+        the listed cells) with the largest relative change of oxidant and S(IV) amounts
+        among the super-droplets in each cell (exceeding unity if an update would yield
+        negative amounts) and, if `max_relative_change` is given as well, no update is
+        applied in the cells in which it is exceeded"""
+        n_cell = len(k0)
+        if cell_order is None:
+            cell_order = np.arange(n_cell)
+            idx_data = np.argsort(cell_ids.data[:n_sd], kind="stable")
+            cell_start = np.searchsorted(cell_ids.data[idx_data], np.arange(n_cell + 1))
+        else:
+            idx_data = idx.data
+            cell_start = cell_start_arg.data
+        n_threads = min(numba.get_num_threads(), len(cell_order))
+        if n_threads == 0:
+            return
+        thread_cell_order, thread_start = round_robin_partition(
+            np.asarray(cell_order, dtype=np.int64), n_threads
+        )
+        self._oxidation_body(
+            n_threads=n_threads,
+            thread_start=thread_start,
+            cell_order=thread_cell_order,
+            cell_start=cell_start,
+            idx=idx_data,
             do_chemistry_flag=do_chemistry_flag.data,
-            explicit_euler=self.formulae.trivia.explicit_euler,
-            pH2H=self.formulae.trivia.pH2H,
-            k0=k0.data,
-            k1=k1.data,
-            k2=k2.data,
-            k3=k3.data,
+            k=(k0.data, k1.data, k2.data, k3.data),
             K_SO2=K_SO2.data,
             K_HSO3=K_HSO3.data,
-            timestep=timestep,
+            timestep=np.broadcast_to(np.asarray(timestep, dtype=float), (n_cell,)),
             droplet_volume=droplet_volume.data,
             pH=pH.data,
             dissociation_factor_SO2=dissociation_factor_SO2.data,
@@ -198,96 +294,158 @@ class ChemistryMethods(BackendMethods):
             moles_H2O2=moles_H2O2.data,
             moles_S_IV=moles_S_IV.data,
             moles_S_VI=moles_S_VI.data,
+            relative_change=(
+                np.empty(0) if relative_change is None else relative_change.data
+            ),
+            max_relative_change=(
+                np.empty(0)
+                if max_relative_change is None
+                else np.broadcast_to(
+                    np.asarray(max_relative_change, dtype=float), (n_cell,)
+                )
+            ),
         )
 
-    @staticmethod
-    @numba.njit(**conf.JIT_FLAGS)
-    def oxidation_body(  # pylint: disable=too-many-locals
-        *,
-        n_sd,
-        cell_ids,
-        do_chemistry_flag,
-        explicit_euler,
-        pH2H,
-        k0,
-        k1,
-        k2,
-        k3,
-        K_SO2,
-        K_HSO3,
-        timestep,
-        droplet_volume,
-        pH,
-        dissociation_factor_SO2,
-        # output
-        moles_O3,
-        moles_H2O2,
-        moles_S_IV,
-        moles_S_VI,
-    ):
-        for i in numba.prange(n_sd):  # pylint: disable=not-an-iterable
-            if not do_chemistry_flag[i]:
-                continue
-
-            cid = cell_ids[i]
-            H = pH2H(pH[i])
-            SO2aq = moles_S_IV[i] / droplet_volume[i] / dissociation_factor_SO2[i]
-
-            # NB: This might not be entirely correct
-            # https://doi.org/10.1029/JD092iD04p04171
-            # https://doi.org/10.5194/acp-16-1693-2016
+    @cached_property
+    def _oxidation_body(self):
+        """cell-parallel kernel; with relative changes requested, these are first
+        evaluated for all super-droplets in a cell (and the maximum stored), and
+        the updates are then applied unless the maximum exceeds the threshold"""
+        pH2H = self.formulae.trivia.pH2H
+        explicit_euler = self.formulae.trivia.explicit_euler
+
+        @jit_cache.njit(**self.default_jit_flags)
+        def body(  # pylint: disable=too-many-locals
+            *,
+            n_threads,
+            thread_start,
+            cell_order,
+            cell_start,
+            idx,
+            do_chemistry_flag,
+            k,
+            K_SO2,
+            K_HSO3,
+            timestep,
+            droplet_volume,
+            pH,
+            dissociation_factor_SO2,
+            # output
+            moles_O3,
+            moles_H2O2,
+            moles_S_IV,
+            moles_S_VI,
+            relative_change,
+            max_relative_change,
+        ):
+            store_relative_change = len(relative_change) != 0
+            check_relative_change = len(max_relative_change) != 0
+            for thread_id in numba.prange(n_threads):  # pylint: disable=not-an-iterable
+                for c in range(thread_start[thread_id], thread_start[thread_id + 1]):
+                    cid = cell_order[c]
+                    cell_k = (k[0][cid], k[1][cid], k[2][cid], k[3][cid])
+                    if store_relative_change:
+                        relative_change[cid] = 0
+                        for j in range(cell_start[cid], cell_start[cid + 1]):
+                            i = idx[j]
+                            if do_chemistry_flag[i]:
+                                relative_change[cid] = max(
+                                    relative_change[cid],
+                                    _relative_change(
+                                        (moles_O3[i], moles_H2O2[i], moles_S_IV[i]),
+                                        timestep[cid] * droplet_volume[i],
+                                        *_oxidation_rates(
+                                            pH2H(pH[i]),
+                                            moles_S_IV[i]
+                                            / droplet_volume[i]
+                                            / dissociation_factor_SO2[i],
+                                            moles_O3[i] / droplet_volume[i],
+                                            moles_H2O2[i] / droplet_volume[i],
+                                            cell_k,
+                                            K_SO2[cid],
+                                            K_HSO3[cid],
+                                        ),
+                                    ),
+                                )
+                        if (
+                            check_relative_change
+                            and relative_change[cid] > max_relative_change[cid]
+                        ):
+                            continue
+                    for j in range(cell_start[cid], cell_start[cid + 1]):
+                        i = idx[j]
+                        if not do_chemistry_flag[i]:
+                            continue
+                        ozone, peroxide = _oxidation_rates(
+                            pH2H(pH[i]),
+                            moles_S_IV[i]
+                            / droplet_volume[i]
+                            / dissociation_factor_SO2[i],
+                            moles_O3[i] / droplet_volume[i],
+                            moles_H2O2[i] / droplet_volume[i],
+                            cell_k,
+                            K_SO2[cid],
+                            K_HSO3[cid],
+                        )
+                        dt_times_volume = timestep[cid] * droplet_volume[i]
+
+                        dconc_dt_O3 = -ozone
+                        dconc_dt_S_IV = -(ozone + peroxide)
+                        dconc_dt_H2O2 = -peroxide
+                        dconc_dt_S_VI = ozone + peroxide
+
+                        if (
+                            moles_O3[i] + dconc_dt_O3 * dt_times_volume < 0
+                            or moles_S_IV[i] + dconc_dt_S_IV * dt_times_volume < 0
+                            or moles_S_VI[i] + dconc_dt_S_VI * dt_times_volume < 0
+                            or moles_H2O2[i] + dconc_dt_H2O2 * dt_times_volume < 0
+                        ):
+                            continue
+
+                        moles_O3[i] = explicit_euler(
+                            moles_O3[i], dt_times_volume, dconc_dt_O3
+                        )
+                        moles_S_IV[i] = explicit_euler(
+                            moles_S_IV[i], dt_times_volume, dconc_dt_S_IV
+                        )
+                        moles_S_VI[i] = explicit_euler(
+                            moles_S_VI[i], dt_times_volume, dconc_dt_S_VI
+                        )
+                        moles_H2O2[i] = explicit_euler(
+                            moles_H2O2[i], dt_times_volume, dconc_dt_H2O2
+                        )
+
+        return body
 
-            ozone = (
-                (
-                    k0[cid]
-                    + (k1[cid] * K_SO2[cid] / H)
-                    + (k2[cid] * K_SO2[cid] * K_HSO3[cid] / H**2)
-                )
-                * (moles_O3[i] / droplet_volume[i])
-                * SO2aq
-            )
-            peroxide = (
-                k3[cid]
-                * K_SO2[cid]
-                / (1 + k4 * H)
-                * (moles_H2O2[i] / droplet_volume[i])
-                * SO2aq
+    def chem_recalculate_drop_data(
+        self, dissociation_factors, equilibrium_consts, cell_id, pH, droplets=None
+    ):
+        """(for the super-droplets listed in `droplets` only, if given)"""
+        sd = slice(None) if droplets is None else droplets
+        H = self.formulae.trivia.pH2H(pH.data[sd])
+        for key in DIFFUSION_CONST:
+            dissociation_factors[key].data[sd] = DISSOCIATION_FACTORS[key](
+                H, equilibrium_consts, cell_id.data[sd]
             )
-            dt_times_volume = timestep * droplet_volume[i]
-
-            dconc_dt_O3 = -ozone
-            dconc_dt_S_IV = -(ozone + peroxide)
-            dconc_dt_H2O2 = -peroxide
-            dconc_dt_S_VI = ozone + peroxide
-
-            if (
-                moles_O3[i] + dconc_dt_O3 * dt_times_volume < 0
-                or moles_S_IV[i] + dconc_dt_S_IV * dt_times_volume < 0
-                or moles_S_VI[i] + dconc_dt_S_VI * dt_times_volume < 0
-                or moles_H2O2[i] + dconc_dt_H2O2 * dt_times_volume < 0
-            ):
-                continue
 
-            moles_O3[i] = explicit_euler(moles_O3[i], dt_times_volume, dconc_dt_O3)
-            moles_S_IV[i] = explicit_euler(
-                moles_S_IV[i], dt_times_volume, dconc_dt_S_IV
-            )
-            moles_S_VI[i] = explicit_euler(
-                moles_S_VI[i], dt_times_volume, dconc_dt_S_VI
-            )
-            moles_H2O2[i] = explicit_euler(
-                moles_H2O2[i], dt_times_volume, dconc_dt_H2O2
-            )
+    @staticmethod
+    def chem_droplets(*, cell_order, cell_start_arg, idx):
+        """returns the ids of the super-droplets within the cells listed in
+        `cell_order` (as given by the cell-sorted `idx` and `cell_start_arg`)"""
+        start = cell_start_arg.data[cell_order]
+        count = cell_start_arg.data[cell_order + 1] - start
+        offset = np.repeat(start - np.cumsum(count) + count, count)
+        return idx.data[offset + np.arange(count.sum())]
 
-    def chem_recalculate_drop_data(
-        self, dissociation_factors, equilibrium_consts, cell_id, pH
-    ):
-        for i in range(len(pH)):
-            H = self.formulae.trivia.pH2H(pH.data[i])
-            for key in DIFFUSION_CONST:
-                dissociation_factors[key].data[i] = DISSOCIATION_FACTORS[key](
-                    H, equilibrium_consts, cell_id.data[i]
-                )
+    @staticmethod
+    def chem_copy_state(*, droplets, cells, source, target):
+        """copies the mole amounts (`(storages, mixing ratios)` pairs of dicts) of
+        the listed super-droplets and the ambient mixing ratios in the listed cells
+        from `source` to `target`"""
+        for key, storage in source[0].items():
+            target[0][key].data[droplets] = storage.data[droplets]
+        for key, mixing_ratio in source[1].items():
+            target[1][key][cells] = mixing_ratio[cells]
 
     def chem_recalculate_cell_data(
         self, equilibrium_consts, kinetic_consts, temperature
@@ -304,30 +462,35 @@ class ChemistryMethods(BackendMethods):
                     temperature.data[i]
                 )
 
-    def equilibrate_H(
+    def equilibrate_H(  # pylint: disable=too-many-locals
         self,
         *,
         equilibrium_consts,
         cell_id,
-        conc,
+        moles,
+        volume,
         do_chemistry_flag,
         pH,
         H_min,
         H_max,
         ionic_strength_threshold,
         rtol,
+        droplets=None,
     ):
-        ChemistryMethods.equilibrate_H_body(
+        """updates `pH` (and `do_chemistry_flag`) based on the concentrations computed
+        from the given mole amounts (a `_conc` tuple of storages) and droplet volumes
+        (for the super-droplets listed in `droplets` only, if given)"""
+        sd = slice(None) if droplets is None else droplets
+        sd_volume = volume.data[sd]
+        sd_pH = pH.data[sd]
+        sd_do_chemistry_flag = do_chemistry_flag.data[sd]
+        n_failed = self._equilibrate_H_body(
             within_tolerance=self.formulae.trivia.within_tolerance,
             pH2H=self.formulae.trivia.pH2H,
             H2pH=self.formulae.trivia.H2pH,
-            cell_id=cell_id.data,
+            cell_id=cell_id.data[sd],
             conc=_conc(
-                N_mIII=conc.N_mIII.data,
-                N_V=conc.N_V.data,
-                C_IV=conc.C_IV.data,
-                S_IV=conc.S_IV.data,
-                S_VI=conc.S_VI.data,
+                *(getattr(moles, key).data[sd] / sd_volume for key in _conc._fields)
             ),
             K=_K(
                 NH3=equilibrium_consts["K_NH3"].data,
@@ -339,14 +502,30 @@ class ChemistryMethods(BackendMethods):
                 HNO3=equilibrium_consts["K_HNO3"].data,
             ),
             # output
-            do_chemistry_flag=do_chemistry_flag.data,
-            pH=pH.data,
+            do_chemistry_flag=sd_do_chemistry_flag,
+            pH=sd_pH,
             # params
             H_min=H_min,
             H_max=H_max,
             ionic_strength_threshold=ionic_strength_threshold,
             rtol=rtol,
         )
+        if droplets is not None:
+            pH.data[droplets] = sd_pH
+            do_chemistry_flag.data[droplets] = sd_do_chemistry_flag
+        if n_failed != 0:
+            raise ValueError(
+                f"pH equilibration did not converge for {n_failed} super-droplet(s)"
+            )
+
+    @cached_property
+    def _equilibrate_H_body(self):
+        """`equilibrate_H_body` compiled with the backend JIT flags (i.e.,
+        multi-threaded if enabled)"""
+        return jit_cache.njit(**{**self.default_jit_flags, **{"cache": False}})(
+            getattr(ChemistryMethods.equilibrate_H_body, "py_func", None)
+            or ChemistryMethods.equilibrate_H_body
+        )
 
     @staticmethod
     @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False, "cache": False}})
@@ -366,7 +545,11 @@ class ChemistryMethods(BackendMethods):
         ionic_strength_threshold,
         rtol,
     ):
-        for i, pH_i in enumerate(pH):
+        """returns the number of super-droplets for which the solver did not
+        converge (counted instead of asserted to allow parallelisation)"""
+        n_failed = 0
+        for i in numba.prange(len(pH)):  # pylint: disable=not-an-iterable
+            pH_i = pH[i]
             cid = cell_id[i]
             args = (
                 _conc(
@@ -424,10 +607,12 @@ class ChemistryMethods(BackendMethods):
                 max_iter=max_iter,
                 within_tolerance=within_tolerance,
             )
-            assert _iters_taken != max_iter
+            if _iters_taken == max_iter:
+                n_failed += 1
             pH[i] = H2pH(H)
             ionic_strength = calc_ionic_strength(H, *args)
             do_chemistry_flag[i] = ionic_strength <= ionic_strength_threshold
+        return n_failed
 
 
 @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
@@ -475,3 +660,27 @@ def acidity_minfun(H, conc, K):
     )
     zero = H + ammonia - (nitric + sulfous + water + sulfuric + carbonic)
     return zero
+
+
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def _oxidation_rates(H, SO2aq, conc_O3, conc_H2O2, k, K_SO2, K_HSO3):
+    """returns the rates of S(IV) oxidation by ozone and by hydrogen peroxide
+    (`k` being the tuple of the `k0`...`k3` kinetic constants)"""
+    # NB: This might not be entirely correct
+    # https://doi.org/10.1029/JD092iD04p04171
+    # https://doi.org/10.5194/acp-16-1693-2016
+    ozone = (k[0] + (k[1] * K_SO2 / H) + (k[2] * K_SO2 * K_HSO3 / H**2)) * (
+        conc_O3 * SO2aq
+    )
+    peroxide = k[3] * K_SO2 / (1 + k4 * H) * conc_H2O2 * SO2aq
+    return ozone, peroxide
+
+
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def _relative_change(moles, dt_times_volume, ozone, peroxide):
+    """returns the largest relative change of the (O3, H2O2, S(IV)) `moles`"""
+    result = 0.0
+    for moles_i, loss_rate in zip(moles, (ozone, peroxide, ozone + peroxide)):
+        if moles_i > 0:
+            result = max(result, loss_rate * dt_times_volume / moles_i)
+    return result
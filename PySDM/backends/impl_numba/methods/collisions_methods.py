@@ -7,12 +7,30 @@ import numba
 import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
-from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba import conf, jit_cache
 from PySDM.backends.impl_numba.atomic_operations import atomic_add
 from PySDM.backends.impl_numba.storage import Storage
 from PySDM.backends.impl_numba.warnings import warn
 
 
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def linear_collection_efficiency(params, r, r_s):  # pylint: disable=too-many-locals
+    """Berry's parameterisation of the collection efficiency of droplets of radii
+    `r` >= `r_s` (expressed in the units assumed in `params`), zero where undefined"""
+    A, B, D1, D2, E1, E2, F1, F2, G1, G2, G3, Mf, Mg = params
+    p = r_s / r
+    if p in (0, 1):
+        return 0.0
+    G = (G1 / r) ** Mg + G2 + G3 * r
+    Gp = (1 - p) ** G
+    if Gp == 0:
+        return 0.0
+    D = D1 / r**D2
+    E = E1 / r**E2
+    F = (F1 / r) ** Mf + F2
+    return max(0.0, A + B * p + D / p**F + E / Gp)
+
+
 @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
 def pair_indices(i, idx, is_first_in_pair, prob_like):
     """given permutation array `idx` and `is_first_in_pair` flag array,
@@ -59,6 +77,37 @@ def coalesce(
             attributes[a, k] = attributes[a, j]
 
 
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False, "inline": "always"}})
+def gamma_and_coalesce(
+    i,
+    j,
+    k,
+    cid,
+    prob,
+    rand,
+    multiplicity,
+    gamma,
+    attributes,
+    collision_rate,
+    collision_rate_deficit,
+    coalescence_rate,
+    healthy,
+):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    """single-pair equivalent of `compute_gamma` followed by `collision_coalescence`"""
+    gamma[i] = np.ceil(prob - rand[i])
+    if gamma[i] == 0:
+        return
+    prop = multiplicity[j] // multiplicity[k]
+    g = min(int(gamma[i]), prop)
+    atomic_add(collision_rate, cid, g * multiplicity[k])
+    atomic_add(collision_rate_deficit, cid, (int(gamma[i]) - g) * multiplicity[k])
+    gamma[i] = g
+    if g == 0:
+        return
+    coalesce(i, j, k, cid, multiplicity, gamma, attributes, coalescence_rate)
+    flag_zero_multiplicity(j, k, multiplicity, healthy)
+
+
 @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
 def compute_transfer_multiplicities(
     gamma, j, k, multiplicity, particle_mass, fragment_mass_i, max_multiplicity
@@ -243,12 +292,16 @@ def break_up_while(
         warn("overflow", __file__)
 
 
+INCREMENTAL_SORT_MAX_RELATIVE_COST = 0.25
+MOVES_POSITION, MOVES_SOURCE, MOVES_TARGET, MOVES_RECORD_AT = range(4)
+
+
 class CollisionsMethods(BackendMethods):
     @cached_property
     def _collision_coalescence_breakup_body(self):
         _break_up = break_up_while if self.formulae.handle_all_breakups else break_up
 
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(
             *,
             multiplicity,
@@ -312,7 +365,7 @@ class CollisionsMethods(BackendMethods):
 
     @cached_property
     def _adaptive_sdm_end_body(self):
-        @numba.njit(**{**self.default_jit_flags, "parallel": False})
+        @jit_cache.njit(**{**self.default_jit_flags, "parallel": False})
         def body(dt_left, n_cell, cell_start):
             end = 0
             for i in range(n_cell - 1, -1, -1):
@@ -329,7 +382,7 @@ class CollisionsMethods(BackendMethods):
 
     @cached_property
     def _scale_prob_for_adaptive_sdm_gamma_body(self):
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(
             prob,
             idx,
@@ -416,7 +469,7 @@ class CollisionsMethods(BackendMethods):
 
     @cached_property
     def _collision_coalescence_body(self):
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(
             *,
             multiplicity,
@@ -520,7 +573,7 @@ class CollisionsMethods(BackendMethods):
 
     @cached_property
     def _compute_gamma_body(self):
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(
             prob,
             rand,
@@ -592,9 +645,18 @@ class CollisionsMethods(BackendMethods):
                     else:
                         scheme = "counting_sort"
                 self.scheme = scheme
-                if scheme in ("counting_sort", "counting_sort_parallel"):
+                self.full_sort_scheme = scheme
+                if scheme == "incremental":
+                    self.full_sort_scheme = "counting_sort"
+                    # rows: position in idx, source and target cell id (per record)
+                    # and record number (per position in idx, -1 if none)
+                    self.moves = Storage.empty((4, *idx_shape), idx_dtype)
+                    self.moves[MOVES_RECORD_AT, :] = -1
+                    self.n_moved = 0
+                    self.stats = {"incremental": 0, "full": 0}
+                if self.full_sort_scheme in ("counting_sort", "counting_sort_parallel"):
                     self.tmp_idx = Storage.empty(idx_shape, idx_dtype)
-                if scheme == "counting_sort_parallel":
+                if self.full_sort_scheme == "counting_sort_parallel":
                     self.cell_starts = Storage.empty(
                         (
                             numba.config.NUMBA_NUM_THREADS,  # pylint: disable=no-member
@@ -603,9 +665,46 @@ class CollisionsMethods(BackendMethods):
                         dtype=int,
                     )
 
-            def __call__(self, cell_id, cell_idx, cell_start, idx):
+            def update_cell_id(self, cell_id, cell_origin, strides, idx):
+                """(for the "incremental" scheme only) recomputes cell ids from cell
+                origins (as the `cell_id` backend method does) recording the positions
+                in `idx` of the super-particles which changed cell since the last sort,
+                for use in the next call with `bucketed=True`"""
+                self.n_moved = CollisionsMethods._update_cell_id_recording_moves(
+                    cell_id=cell_id.data,
+                    cell_origin=cell_origin.data,
+                    strides=strides.data,
+                    idx=idx.data,
+                    length=len(idx),
+                    n_moved=self.n_moved,
+                    moves=self.moves.data,
+                )
+
+            def __call__(self, cell_id, cell_idx, cell_start, idx, bucketed=False):
+                """with `bucketed=True` (relevant for the "incremental" scheme only),
+                `idx` and `cell_start` are assumed to have been consistent with
+                the cell ids before their updates with `update_cell_id()`, and only
+                the recorded super-particles are re-bucketed (unless the cost
+                of moving them exceeds that of a full sort)"""
+                # pylint: disable=too-many-arguments
                 length = len(idx)
-                if self.scheme == "counting_sort":
+                if self.scheme == "incremental":
+                    rebucketed = bucketed and CollisionsMethods._rebucket_moved(
+                        idx=idx.data,
+                        cell_idx=cell_idx.data,
+                        length=length,
+                        cell_start=cell_start.data,
+                        max_cost=INCREMENTAL_SORT_MAX_RELATIVE_COST * length,
+                        n_moved=self.n_moved,
+                        moves=self.moves.data,
+                    )
+                    CollisionsMethods._clear_moves(self.n_moved, self.moves.data)
+                    self.n_moved = 0
+                    if rebucketed:
+                        self.stats["incremental"] += 1
+                        return
+                    self.stats["full"] += 1
+                if self.full_sort_scheme == "counting_sort":
                     CollisionsMethods._counting_sort_by_cell_id_and_update_cell_start(
                         self.tmp_idx.data,
                         idx.data,
@@ -614,7 +713,7 @@ class CollisionsMethods(BackendMethods):
                         length,
                         cell_start.data,
                     )
-                elif self.scheme == "counting_sort_parallel":
+                elif self.full_sort_scheme == "counting_sort_parallel":
                     CollisionsMethods._parallel_counting_sort_by_cell_id_and_update_cell_start(
                         self.tmp_idx.data,
                         idx.data,
@@ -630,8 +729,20 @@ class CollisionsMethods(BackendMethods):
 
     @cached_property
     def _normalize_body(self):
-        @numba.njit(**{**self.default_jit_flags, **{"parallel": False}})
-        def body(prob, cell_id, cell_idx, cell_start, norm_factor, timestep, dv):
+        @jit_cache.njit(**{**self.default_jit_flags, **{"parallel": False}})
+        # pylint: disable=too-many-arguments
+        def body(
+            *,
+            prob,
+            idx,
+            is_first_in_pair,
+            cell_id,
+            cell_idx,
+            cell_start,
+            norm_factor,
+            timestep,
+            dv,
+        ):
             n_cell = cell_start.shape[0] - 1
             for i in range(n_cell):
                 sd_num = cell_start[i + 1] - cell_start[i]
@@ -641,27 +752,40 @@ class CollisionsMethods(BackendMethods):
                     norm_factor[i] = (
                         timestep / dv * sd_num * (sd_num - 1) / 2 / (sd_num // 2)
                     )
-            for d in numba.prange(prob.shape[0]):  # pylint: disable=not-an-iterable
-                prob[d] *= norm_factor[cell_idx[cell_id[d]]]
+            for i in numba.prange(prob.shape[0]):  # pylint: disable=not-an-iterable
+                j, _, skip_pair = pair_indices(i, idx, is_first_in_pair, prob)
+                if not skip_pair:
+                    prob[i] *= norm_factor[cell_idx[cell_id[j]]]
 
         return body
 
     def normalize(
-        self, prob, cell_id, cell_idx, cell_start, norm_factor, timestep, dv
-    ):  # pylint: disable=too-many-positional-arguments
+        self,
+        *,
+        prob,
+        is_first_in_pair,
+        cell_id,
+        cell_idx,
+        cell_start,
+        norm_factor,
+        timestep,
+        dv,
+    ):
         return self._normalize_body(
-            prob.data,
-            cell_id.data,
-            cell_idx.data,
-            cell_start.data,
-            norm_factor.data,
-            timestep,
-            dv,
+            prob=prob.data,
+            idx=cell_id.idx.data,
+            is_first_in_pair=is_first_in_pair.indicator.data,
+            cell_id=cell_id.data,
+            cell_idx=cell_idx.data,
+            cell_start=cell_start.data,
+            norm_factor=norm_factor.data,
+            timestep=timestep,
+            dv=dv,
         )
 
     @cached_property
     def remove_zero_n_or_flagged(self):
-        @numba.njit(**{**self.default_jit_flags, **{"parallel": False}})
+        @jit_cache.njit(**{**self.default_jit_flags, **{"parallel": False}})
         def body(multiplicity, idx, length) -> int:
             flag = len(idx)
             new_length = length
@@ -677,6 +801,78 @@ class CollisionsMethods(BackendMethods):
 
         return body
 
+    @staticmethod
+    @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+    def _update_cell_id_recording_moves(
+        *, cell_id, cell_origin, strides, idx, length, n_moved, moves
+    ):
+        """returns the updated number of records (see `CellCaretaker.update_cell_id`),
+        a super-particle changing cell more than once is recorded once (with the source
+        cell of the first and the target cell of the last change)"""
+        for i, j in enumerate(idx):
+            new_cell_id = 0
+            for dim in range(cell_origin.shape[0]):
+                new_cell_id += strides[0, dim] * cell_origin[dim, j]
+            if i < length and new_cell_id != cell_id[j]:
+                if moves[MOVES_RECORD_AT, i] == -1:
+                    moves[MOVES_POSITION, n_moved] = i
+                    moves[MOVES_SOURCE, n_moved] = cell_id[j]
+                    moves[MOVES_RECORD_AT, i] = n_moved
+                    n_moved += 1
+                moves[MOVES_TARGET, moves[MOVES_RECORD_AT, i]] = new_cell_id
+            cell_id[j] = new_cell_id
+        return n_moved
+
+    @staticmethod
+    @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+    def _clear_moves(n_moved, moves):
+        for record in range(n_moved):
+            moves[MOVES_RECORD_AT, moves[MOVES_POSITION, record]] = -1
+
+    @staticmethod
+    @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+    def _rebucket_moved(*, idx, cell_idx, length, cell_start, max_cost, n_moved, moves):
+        """moves the recorded super-particles to their new cells through chains of swaps
+        at the boundaries of the cells in between (hence at a cost proportional to
+        the number of moved particles times the distance in cell index, and with no
+        pass over the particles which did not move); returns False leaving `idx` and
+        `cell_start` intact if `cell_start` does not partition `idx` or if the cost
+        exceeds `max_cost` (the records are to be cleared by the caller)"""
+        if cell_start[0] != 0 or cell_start[-1] != length:
+            return False
+        cost = 0
+        for record in range(n_moved):
+            cost += abs(
+                cell_idx[moves[MOVES_TARGET, record]]
+                - cell_idx[moves[MOVES_SOURCE, record]]
+            )
+        if cost > max_cost:
+            return False
+
+        for record in range(n_moved):
+            cell = cell_idx[moves[MOVES_SOURCE, record]]
+            target = cell_idx[moves[MOVES_TARGET, record]]
+            step = 1 if target > cell else -1
+            while cell != target:
+                # swapping within the current cell so that the particle is at its edge
+                i = moves[MOVES_POSITION, record]
+                j = cell_start[cell + 1] - 1 if step == 1 else cell_start[cell]
+                idx[i], idx[j] = idx[j], idx[i]
+                moves[MOVES_RECORD_AT, i], moves[MOVES_RECORD_AT, j] = (
+                    moves[MOVES_RECORD_AT, j],
+                    moves[MOVES_RECORD_AT, i],
+                )
+                if moves[MOVES_RECORD_AT, i] != -1:
+                    moves[MOVES_POSITION, moves[MOVES_RECORD_AT, i]] = i
+                moves[MOVES_POSITION, record] = j
+                # moving the boundary so that the particle belongs to the adjacent cell
+                if step == 1:
+                    cell_start[cell + 1] -= 1
+                else:
+                    cell_start[cell] += 1
+                cell += step
+        return True
+
     @staticmethod
     @numba.njit(**conf.JIT_FLAGS)
     def _counting_sort_by_cell_id_and_update_cell_start(
@@ -738,29 +934,16 @@ class CollisionsMethods(BackendMethods):
 
     @cached_property
     def _linear_collection_efficiency_body(self):
-        @numba.njit(**self.default_jit_flags)
-        # pylint: disable=too-many-locals
+        @jit_cache.njit(**self.default_jit_flags)
         def body(params, output, radii, is_first_in_pair, idx, length, unit):
-            A, B, D1, D2, E1, E2, F1, F2, G1, G2, G3, Mf, Mg = params
             output[:] = 0
             for i in numba.prange(length - 1):  # pylint: disable=not-an-iterable
                 if is_first_in_pair[i]:
-                    if radii[idx[i]] > radii[idx[i + 1]]:
-                        r = radii[idx[i]] / unit
-                        r_s = radii[idx[i + 1]] / unit
-                    else:
-                        r = radii[idx[i + 1]] / unit
-                        r_s = radii[idx[i]] / unit
-                    p = r_s / r
-                    if p not in (0, 1):
-                        G = (G1 / r) ** Mg + G2 + G3 * r
-                        Gp = (1 - p) ** G
-                        if Gp != 0:
-                            D = D1 / r**D2
-                            E = E1 / r**E2
-                            F = (F1 / r) ** Mf + F2
-                            output[i // 2] = A + B * p + D / p**F + E / Gp
-                            output[i // 2] = max(0, output[i // 2])
+                    r_j = radii[idx[i]] / unit
+                    r_k = radii[idx[i + 1]] / unit
+                    output[i // 2] = linear_collection_efficiency(
+                        params, max(r_j, r_k), min(r_j, r_k)
+                    )
 
         return body
 
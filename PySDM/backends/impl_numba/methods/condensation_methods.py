@@ -11,7 +11,11 @@ import numba
 import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
-from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba import conf, jit_cache
+from PySDM.backends.impl_numba.cell_partition import (
+    cost_weighted_partition,
+    round_robin_partition,
+)
 from PySDM.backends.impl_numba.toms748 import toms748_solve
 from PySDM.backends.impl_numba.warnings import warn
 
@@ -49,16 +53,30 @@ _RelativeTolerances = namedtuple(
     typename="_RelativeTolerances", field_names=("x", "thd")
 )
 
+# kernels passing JIT-compiled functions as arguments (`minfun` to `toms748_solve`,
+# `solver` to `_condensation`) or calling such kernels embed pointers to dispatcher
+# objects in the compiled code, and Numba refuses to cache them ("uses dynamic
+# globals") - caching is thus explicitly disabled for them regardless of backend flags
+_UNCACHEABLE = {"cache": False}
+
 
 class CondensationMethods(BackendMethods):
     # pylint: disable=unused-argument
     @staticmethod
     def condensation(**kwargs):
         n_threads = min(numba.get_num_threads(), kwargs["n_cell"])
+        if kwargs.get("cell_cost") is None:
+            cell_order, thread_start = round_robin_partition(
+                np.asarray(kwargs["cell_order"], dtype=np.int64), n_threads
+            )
+        else:
+            cell_order, thread_start = cost_weighted_partition(
+                np.asarray(kwargs["cell_cost"], dtype=np.float64), n_threads
+            )
         CondensationMethods._condensation(
             solver=kwargs["solver"],
             n_threads=n_threads,
-            n_cell=kwargs["n_cell"],
+            thread_start=thread_start,
             cell_start_arg=kwargs["cell_start_arg"].data,
             attributes=_Attributes(
                 signed_water_mass=kwargs["signed_water_mass"].data,
@@ -74,7 +92,7 @@ class CondensationMethods(BackendMethods):
                 rhod=kwargs["rhod"].data,
                 thd=kwargs["thd"].data,
                 water_vapour_mixing_ratio=kwargs["water_vapour_mixing_ratio"].data,
-                dv_mean=kwargs["dv"],
+                dv_mean=np.full(kwargs["n_cell"], kwargs["dv"]),
                 prhod=kwargs["prhod"].data,
                 pthd=kwargs["pthd"].data,
                 predicted_water_vapour_mixing_ratio=(
@@ -94,18 +112,18 @@ class CondensationMethods(BackendMethods):
                 n_deactivating=kwargs["counters"]["n_deactivating"].data,
                 n_ripening=kwargs["counters"]["n_ripening"].data,
             ),
-            cell_order=kwargs["cell_order"],
+            cell_order=cell_order,
             RH_max=kwargs["RH_max"].data,
             success=kwargs["success"].data,
         )
 
     @staticmethod
-    @numba.njit(**{**conf.JIT_FLAGS, **{"cache": False}})
+    @jit_cache.njit(**{**conf.JIT_FLAGS, **_UNCACHEABLE})
     def _condensation(  # pylint: disable=too-many-locals
         *,
         solver,
         n_threads,
-        n_cell,
+        thread_start,
         cell_start_arg,
         attributes,
         cell_data,
@@ -129,7 +147,7 @@ class CondensationMethods(BackendMethods):
         cnt_n_ripening = counters.n_ripening
 
         for thread_id in numba.prange(n_threads):  # pylint: disable=not-an-iterable
-            for i in range(thread_id, n_cell, n_threads):
+            for i in range(thread_start[thread_id], thread_start[thread_id + 1]):
                 cell_id = cell_order[i]
                 cell_start = cell_start_arg[cell_id]
                 cell_end = cell_start_arg[cell_id + 1]
@@ -166,7 +184,7 @@ class CondensationMethods(BackendMethods):
                     m_d=(
                         (cell_data.prhod[cell_id] + cell_data.rhod[cell_id])
                         / 2
-                        * cell_data.dv_mean
+                        * cell_data.dv_mean[cell_id]
                     ),
                     air_density=cell_data.air_density[cell_id],
                     air_dynamic_viscosity=cell_data.air_dynamic_viscosity[cell_id],
@@ -188,7 +206,7 @@ class CondensationMethods(BackendMethods):
         n_substeps_max = math.floor(timestep / dt_range[0])
         n_substeps_min = math.ceil(timestep / dt_range[1])
 
-        @numba.njit(**jit_flags)
+        @jit_cache.njit(**{**jit_flags, **_UNCACHEABLE})
         def adapt_substeps(step_impl_args, n_substeps, thd, rtol_thd):
             n_substeps = np.maximum(n_substeps_min, n_substeps // multiplier)
             success = False
@@ -230,7 +248,7 @@ class CondensationMethods(BackendMethods):
 
     @staticmethod
     def make_step_fake(jit_flags, step_impl):
-        @numba.njit(**jit_flags)
+        @jit_cache.njit(**{**jit_flags, **_UNCACHEABLE})
         def step_fake(step_impl_args, dt, n_substeps):
             dt /= n_substeps
             _, thd_new, _, _, _, _, success = step_impl(*step_impl_args, dt, 1, True)
@@ -240,7 +258,7 @@ class CondensationMethods(BackendMethods):
 
     @staticmethod
     def make_step(jit_flags, step_impl):
-        @numba.njit(**jit_flags)
+        @jit_cache.njit(**{**jit_flags, **_UNCACHEABLE})
         def step(step_impl_args, dt, n_substeps):
             return step_impl(*step_impl_args, dt, n_substeps, False)
 
@@ -254,7 +272,7 @@ class CondensationMethods(BackendMethods):
         calculate_ml_old,
         calculate_ml_new,
     ):
-        @numba.njit(**jit_flags)
+        @jit_cache.njit(**{**jit_flags, **_UNCACHEABLE})
         def step_impl(  # pylint: disable=too-many-positional-arguments,too-many-locals
             attributes,
             cell_idx,
@@ -358,7 +376,7 @@ class CondensationMethods(BackendMethods):
 
     @staticmethod
     def make_calculate_ml_old(jit_flags):
-        @numba.njit(**jit_flags)
+        @jit_cache.njit(**jit_flags)
         def calculate_ml_old(signed_water_mass, multiplicity, cell_idx):
             result = 0
             for drop in cell_idx:
@@ -376,7 +394,7 @@ class CondensationMethods(BackendMethods):
         max_iters,
         RH_rtol,
     ):
-        @numba.njit(**jit_flags)
+        @jit_cache.njit(**jit_flags)
         def minfun(  # pylint: disable=too-many-positional-arguments,too-many-locals
             x_new, x_old, timestep, kappa, f_org, rd3, temperature, RH, Fk, Fd
         ):
@@ -406,7 +424,7 @@ class CondensationMethods(BackendMethods):
                 + timestep * formulae.diffusion_coordinate__dx_dt(mass_new, dm_dt)
             )
 
-        @numba.njit(**jit_flags)
+        @jit_cache.njit(**{**jit_flags, **_UNCACHEABLE})
         def calculate_ml_new(  # pylint: disable=too-many-branches,too-many-positional-arguments,too-many-locals
             attributes,
             timestep,
@@ -592,6 +610,7 @@ class CondensationMethods(BackendMethods):
     ):
         return CondensationMethods.make_condensation_solver_impl(
             formulae=self.formulae_flattened,
+            jit_flags=tuple(sorted(self.default_jit_flags.items())),
             timestep=timestep,
             dt_range=dt_range,
             adaptive=adaptive,
@@ -606,6 +625,7 @@ class CondensationMethods(BackendMethods):
     def make_condensation_solver_impl(
         *,
         formulae,
+        jit_flags,
         timestep,
         dt_range,
         adaptive,
@@ -615,8 +635,8 @@ class CondensationMethods(BackendMethods):
         max_iters,
     ):
         jit_flags = {
-            **conf.JIT_FLAGS,
-            **{"parallel": False, "cache": False, "fastmath": formulae.fastmath},
+            **dict(jit_flags),
+            **{"parallel": False, "fastmath": formulae.fastmath},
         }
 
         step_impl = CondensationMethods.make_step_impl(
@@ -642,7 +662,7 @@ class CondensationMethods(BackendMethods):
         )
         step = CondensationMethods.make_step(jit_flags, step_impl)
 
-        @numba.njit(**jit_flags)
+        @jit_cache.njit(**{**jit_flags, **_UNCACHEABLE})
         def solve(  # pylint: disable=too-many-positional-arguments,too-many-locals
             attributes,
             cell_idx,
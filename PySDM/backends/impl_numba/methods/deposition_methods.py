@@ -7,6 +7,8 @@ import numba
 import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba import jit_cache
+from PySDM.backends.impl_numba.cell_partition import round_robin_partition
 
 # TODO #1524
 # pylint: disable=too-many-arguments,too-many-locals,too-many-statements
@@ -23,7 +25,7 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
         rel_tol_rh = 1e-2
         fuse = 16
 
-        @numba.njit(**{**self.default_jit_flags, **{"parallel": False}})
+        @jit_cache.njit(**{**self.default_jit_flags, **{"parallel": False}})
         def calc_saturation_ratio_ice_temperature_and_pressure(
             vapour_mixing_ratio, dry_air_potential_temperature, dry_air_density
         ):
@@ -46,7 +48,7 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
             )
             return saturation_ratio_ice, temperature, total_pressure
 
-        @numba.njit(**{**self.default_jit_flags, **{"parallel": False}})
+        @jit_cache.njit(**{**self.default_jit_flags, **{"parallel": False}})
         def mass_deposition_rate_per_droplet(
             temperature: float,
             rho_d: float,
@@ -97,27 +99,15 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
                 * formulae.constants.rho_w
             )
 
-            mass_deposition_rate = (
-                4 * np.pi * capacity * howell_factor_x_diffcoef_x_rhovsice_x_icess
-            )
-            if mass_deposition_rate > 1:
-                print(
-                    radius,
-                    Fk,
-                    Fd,
-                    mass_deposition_rate,
-                    howell_factor_x_diffcoef_x_rhovsice_x_icess,
-                    pvs_ice,
-                )
-                assert False
-            return mass_deposition_rate
+            return 4 * np.pi * capacity * howell_factor_x_diffcoef_x_rhovsice_x_icess
 
-        @numba.njit(**{**self.default_jit_flags, **{"parallel": False}})
+        @jit_cache.njit(**{**self.default_jit_flags, **{"parallel": False}})
         def _loop(
             fake,
             temperature,
             rhod,
             thd,
+            cell_idx,
             signed_water_mass,
             saturation_ratio_ice,
             total_pressure,
@@ -125,9 +115,13 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
             sub_time_step,
             mass_of_dry_air,
         ):  # pylint: disable=too-many-positional-arguments
+            """returns changes of vapour mixing ratio and dry-air potential temperature
+            and a success flag (failures are flagged rather than asserted to
+            allow calling it from within parallel loops)"""
+            success = True
             latent_heat_sub = formulae.latent_heat_sublimation__ls(temperature)
             delta_rv = 0
-            for i, ksi in enumerate(multiplicity):
+            for i in cell_idx:
                 if not formulae.trivia__unfrozen(signed_water_mass[i]):
                     mass_deposition_rate = mass_deposition_rate_per_droplet(
                         temperature=temperature,
@@ -137,8 +131,13 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
                         saturation_ratio_ice=saturation_ratio_ice,
                         pressure=total_pressure,
                     )
+                    if mass_deposition_rate > 1:
+                        success = False
                     delta_rv += (
-                        -mass_deposition_rate * ksi * sub_time_step / mass_of_dry_air
+                        -mass_deposition_rate
+                        * multiplicity[i]
+                        * sub_time_step
+                        / mass_of_dry_air
                     )
                     if not fake:
                         x_old = formulae.diffusion_coordinate__x(-signed_water_mass[i])
@@ -152,8 +151,7 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
                             x_new
                         )
                         if x_new > 1:
-                            print(x_old, dx_dt_old, x_new, signed_water_mass[i])
-                            assert False
+                            success = False
             delta_thd = (
                 formulae.state_variable_triplet__dthd_dt(
                     rhod=rhod,
@@ -165,70 +163,64 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
                 * sub_time_step
             )
             if delta_rv == 0:
-                assert delta_thd == 0
+                success = success and delta_thd == 0
             else:
-                assert (delta_rv < 0 < delta_thd) or (delta_rv > 0 > delta_thd)
-            return delta_rv, delta_thd
+                success = success and (
+                    (delta_rv < 0 < delta_thd) or (delta_rv > 0 > delta_thd)
+                )
+            return delta_rv, delta_thd, success
 
-        @numba.njit(**{**self.default_jit_flags, **{"parallel": False}})
-        def body(  # pylint: disable=too-many-arguments
-            *,
+        @jit_cache.njit(**{**self.default_jit_flags, **{"parallel": False}})
+        def cell_body(  # pylint: disable=too-many-positional-arguments
             adaptive,
+            n_substeps,
+            cell_idx,
             multiplicity,
             signed_water_mass,
             current_vapour_mixing_ratio,
             current_dry_air_density,
             current_dry_potential_temperature,
-            cell_volume,
-            time_step,
-            cell_id,
-            # to be modified
             predicted_vapour_mixing_ratio,
             predicted_dry_potential_temperature,
             predicted_dry_air_density,
+            dry_air_mass_mean,
+            time_step,
         ):
             """simplest adaptivity:
-            - global dt - no cell-wise logic (we don't have any test/example for it!)
-            - no mechanism to retain dt value over timesteps
-            - explicit Euler mass integration (vs. implicit in condensation)
+            - search for the substep count starting from the one retained from the
+              previous timestep (divided by `multiplier`, i.e. allowing it to decrease)
+            - explicit Euler mass integration (vs. implicit in condensation);
+            returns success flag, substep count and the predicted vapour mixing ratio
+            and dry-air potential temperature
             """
             # pylint: disable=too-many-locals
-            n_substeps = 1
-            cid = cell_id[0]  # TODO #1524: add support for multi-cell environments
-
             rv_tendency = (
-                predicted_vapour_mixing_ratio[cid] - current_vapour_mixing_ratio[cid]
+                predicted_vapour_mixing_ratio - current_vapour_mixing_ratio
             ) / time_step
             thd_tendency = (
-                predicted_dry_potential_temperature[cid]
-                - current_dry_potential_temperature[cid]
+                predicted_dry_potential_temperature - current_dry_potential_temperature
             ) / time_step
             rhod_tendency = (
-                predicted_dry_air_density[cid] - current_dry_air_density[cid]
+                predicted_dry_air_density - current_dry_air_density
             ) / time_step
-            dry_air_mass_mean = (
-                cell_volume
-                * (predicted_dry_air_density[cid] + current_dry_air_density[cid])
-                / 2
-            )
 
             if adaptive:
-                n_substeps = 1 / multiplier
+                n_substeps = max(1, n_substeps // multiplier) / multiplier
                 delta_rh_long = np.nan
                 for burnout in range(fuse + 1):
                     if burnout == fuse:
-                        assert False
+                        return False, 0, np.nan, np.nan
                     sub_time_step = time_step / n_substeps
                     rhod = (
-                        current_dry_air_density[cid]
+                        current_dry_air_density
                         + rhod_tendency * (0.5 if midpoint else 1) * sub_time_step
                     )
                     rv = (
-                        current_vapour_mixing_ratio[cid]
+                        current_vapour_mixing_ratio
                         + rv_tendency * (0.5 if midpoint else 1) * sub_time_step
                     )
                     thd = (
-                        current_dry_potential_temperature[cid]
+                        current_dry_potential_temperature
                         + thd_tendency * (0.5 if midpoint else 1) * sub_time_step
                     )
 
@@ -239,11 +231,12 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
                             dry_air_density=rhod,
                         )
                     )
-                    delta_rv, delta_thd = _loop(
+                    delta_rv, delta_thd, _ = _loop(
                         fake=True,
                         temperature=temperature,
                         rhod=rhod,
                         thd=thd,
+                        cell_idx=cell_idx,
                         signed_water_mass=signed_water_mass,
                         saturation_ratio_ice=saturation_ratio_ice,
                         total_pressure=total_pressure,
@@ -260,7 +253,7 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
                         - saturation_ratio_ice
                     )
                     if (
-                        n_substeps < 1
+                        burnout == 0
                         or rv < -delta_rv
                         or not formulae.trivia__within_tolerance(
                             abs(delta_rh_long - multiplier * delta_rh_short),
@@ -274,11 +267,11 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
                         break
             sub_time_step = time_step / n_substeps
 
-            rv = current_vapour_mixing_ratio[cid]
-            thd = current_dry_potential_temperature[cid]
-            rhod = current_dry_air_density[cid]
+            rv = current_vapour_mixing_ratio
+            thd = current_dry_potential_temperature
+            rhod = current_dry_air_density
 
-            assert n_substeps == int(n_substeps)
+            success = n_substeps == int(n_substeps)
             for _ in range(int(n_substeps)):
                 rv += sub_time_step * rv_tendency * (0.5 if midpoint else 1)
                 thd += sub_time_step * thd_tendency * (0.5 if midpoint else 1)
@@ -291,11 +284,12 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
                         dry_air_density=rhod,
                     )
                 )
-                delta_rv, delta_thd = _loop(
+                delta_rv, delta_thd, loop_success = _loop(
                     fake=False,
                     temperature=temperature,
                     rhod=rhod,
                     thd=thd,
+                    cell_idx=cell_idx,
                     signed_water_mass=signed_water_mass,
                     saturation_ratio_ice=saturation_ratio_ice,
                     total_pressure=total_pressure,
@@ -305,15 +299,77 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
                 )
                 thd += delta_thd
                 rv += delta_rv
-                assert rv >= 0
+                success = success and loop_success and rv >= 0
 
                 if midpoint:
                     thd += sub_time_step * thd_tendency / 2
                     rv += sub_time_step * rv_tendency / 2
                     rhod += sub_time_step * rhod_tendency / 2
 
-            predicted_dry_potential_temperature[cid] = thd
-            predicted_vapour_mixing_ratio[cid] = rv
+            return success, int(n_substeps), rv, thd
+
+        @jit_cache.njit(**self.default_jit_flags)
+        def body(  # pylint: disable=too-many-arguments
+            *,
+            adaptive,
+            n_threads,
+            thread_start,
+            cell_order,
+            cell_start,
+            idx,
+            multiplicity,
+            signed_water_mass,
+            current_vapour_mixing_ratio,
+            current_dry_air_density,
+            current_dry_potential_temperature,
+            cell_volume,
+            time_step,
+            # to be modified
+            predicted_vapour_mixing_ratio,
+            predicted_dry_potential_temperature,
+            predicted_dry_air_density,
+            n_substeps,
+            success,
+        ):
+            for thread_id in numba.prange(n_threads):  # pylint: disable=not-an-iterable
+                for i in range(thread_start[thread_id], thread_start[thread_id + 1]):
+                    cid = cell_order[i]
+                    if cell_start[cid] == cell_start[cid + 1]:
+                        success[cid] = True
+                        continue
+                    (
+                        success[cid],
+                        n_substeps[cid],
+                        predicted_vapour_mixing_ratio[cid],
+                        predicted_dry_potential_temperature[cid],
+                    ) = cell_body(
+                        adaptive=adaptive,
+                        n_substeps=n_substeps[cid],
+                        cell_idx=idx[cell_start[cid] : cell_start[cid + 1]],
+                        multiplicity=multiplicity,
+                        signed_water_mass=signed_water_mass,
+                        current_vapour_mixing_ratio=current_vapour_mixing_ratio[cid],
+                        current_dry_air_density=current_dry_air_density[cid],
+                        current_dry_potential_temperature=(
+                            current_dry_potential_temperature[cid]
+                        ),
+                        predicted_vapour_mixing_ratio=predicted_vapour_mixing_ratio[
+                            cid
+                        ],
+                        predicted_dry_potential_temperature=(
+                            predicted_dry_potential_temperature[cid]
+                        ),
+                        predicted_dry_air_density=predicted_dry_air_density[cid],
+                        dry_air_mass_mean=(
+                            cell_volume
+                            * (
+                                predicted_dry_air_density[cid]
+                                + current_dry_air_density[cid]
+                            )
+                            / 2
+                        ),
+                        time_step=time_step,
+                    )
 
         return body
 
@@ -321,6 +377,9 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
         self,
         *,
         adaptive,
+        n_cell,
+        cell_start,
+        idx,
         multiplicity,
         signed_water_mass,
         current_vapour_mixing_ratio,
@@ -328,13 +387,23 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
         current_dry_potential_temperature,
         cell_volume,
         time_step,
-        cell_id,
         predicted_vapour_mixing_ratio,
         predicted_dry_potential_temperature,
         predicted_dry_air_density,
+        n_substeps,
+        success,
     ):
+        n_threads = min(numba.get_num_threads(), n_cell)
+        cell_order, thread_start = round_robin_partition(
+            np.arange(n_cell, dtype=np.int64), n_threads
+        )
         self._deposition(
             adaptive=adaptive,
+            n_threads=n_threads,
+            thread_start=thread_start,
+            cell_order=cell_order,
+            cell_start=cell_start.data,
+            idx=idx.data,
             multiplicity=multiplicity.data,
             signed_water_mass=signed_water_mass.data,
             current_vapour_mixing_ratio=current_vapour_mixing_ratio.data,
@@ -342,8 +411,9 @@ class DepositionMethods(BackendMethods):  # pylint:disable=too-few-public-method
             current_dry_potential_temperature=current_dry_potential_temperature.data,
             cell_volume=cell_volume,
             time_step=time_step,
-            cell_id=cell_id.data,
             predicted_vapour_mixing_ratio=predicted_vapour_mixing_ratio.data,
             predicted_dry_potential_temperature=predicted_dry_potential_temperature.data,
             predicted_dry_air_density=predicted_dry_air_density.data,
+            n_substeps=n_substeps.data,
+            success=success.data,
         )
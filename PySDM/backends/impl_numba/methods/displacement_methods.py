@@ -6,8 +6,9 @@ CPU implementation of backend methods for particle displacement (advection and s
 from functools import cached_property
 
 import numba
+import numpy as np
 
-from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba import conf, jit_cache
 
 from ...impl_common.backend_methods import BackendMethods
 
@@ -23,6 +24,32 @@ def calculate_displacement_body_common(
     )
 
 
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def arakawa_c_1d(cell_origin, droplet, dim):  # pylint: disable=unused-argument
+    return cell_origin[0, droplet], cell_origin[0, droplet] + 1
+
+
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def arakawa_c_2d(cell_origin, droplet, dim):
+    return (cell_origin[0, droplet], cell_origin[1, droplet]), (
+        cell_origin[0, droplet] + 1 * (dim == 0),
+        cell_origin[1, droplet] + 1 * (dim == 1),
+    )
+
+
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def arakawa_c_3d(cell_origin, droplet, dim):
+    return (
+        cell_origin[0, droplet],
+        cell_origin[1, droplet],
+        cell_origin[2, droplet],
+    ), (
+        cell_origin[0, droplet] + 1 * (dim == 0),
+        cell_origin[1, droplet] + 1 * (dim == 1),
+        cell_origin[2, droplet] + 1 * (dim == 2),
+    )
+
+
 class DisplacementMethods(BackendMethods):
     @staticmethod
     @numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False, "cache": False}})
@@ -142,9 +169,116 @@ class DisplacementMethods(BackendMethods):
         else:
             raise NotImplementedError()
 
+    @cached_property
+    def _displace_with_local_substeps_body(self):
+        scheme = self.formulae.particle_advection.displacement
+
+        def make_body(arakawa_c):
+            @jit_cache.njit(**self.default_jit_flags)
+            def body(  # pylint: disable=too-many-arguments,too-many-locals
+                displacement,
+                courant,
+                cell_origin,
+                position_in_cell,
+                cell_id,
+                n_substeps_in_cell,
+                n_substeps_of_droplet,
+                grid,
+                fall_velocity,
+                dt_over_dz,
+                precipitation_counting_level_index,
+            ):
+                n_dims, n_sd = displacement.shape
+                for droplet in numba.prange(n_sd):  # pylint: disable=not-an-iterable
+                    n_substeps = n_substeps_in_cell[cell_id[droplet]]
+                    n_substeps_of_droplet[droplet] = n_substeps
+                    for _ in range(n_substeps):
+                        for dim in range(n_dims):
+                            _l, _r = arakawa_c(cell_origin, droplet, dim)
+                            displacement[dim, droplet] = scheme(
+                                position_in_cell[dim, droplet],
+                                courant[dim][_l] / n_substeps,
+                                courant[dim][_r] / n_substeps,
+                            )
+                        if len(fall_velocity) != 0:
+                            displacement[-1, droplet] -= (
+                                fall_velocity[droplet] * dt_over_dz / n_substeps
+                            )
+                        for dim in range(n_dims):
+                            position_in_cell[dim, droplet] += displacement[dim, droplet]
+                            floor_of_position = np.floor(position_in_cell[dim, droplet])
+                            cell_origin[dim, droplet] += np.int64(floor_of_position)
+                            position_in_cell[dim, droplet] -= floor_of_position
+                        position_within_column = (
+                            cell_origin[-1, droplet] + position_in_cell[-1, droplet]
+                        )
+                        if (
+                            position_within_column < 0
+                            or position_within_column > grid[-1]
+                            or (
+                                displacement[-1, droplet] < 0
+                                and position_within_column
+                                < precipitation_counting_level_index
+                            )
+                        ):
+                            break  # left to be flagged by the caller
+                        for dim in range(n_dims):
+                            cell_origin[dim, droplet] %= grid[dim]
+
+            return body
+
+        return {
+            1: make_body(arakawa_c_1d),
+            2: make_body(arakawa_c_2d),
+            3: make_body(arakawa_c_3d),
+        }
+
+    def displace_with_local_substeps(
+        self,
+        *,
+        displacement,
+        courant,
+        cell_origin,
+        position_in_cell,
+        cell_id,
+        n_substeps_in_cell,
+        n_substeps_of_droplet,
+        grid,
+        sedimentation=None,
+        precipitation_counting_level_index=0,
+    ):  # pylint: disable=too-many-arguments
+        """displaces each droplet with the number of substeps of the cell it resides in at
+        the beginning of the timestep (all substeps within a single launch), with
+        `sedimentation=(fall_velocity, dt_over_dz)` the displacement in the last dimension
+        includes the sedimentation term; droplets leaving the column (or falling through
+        the precipitation-counting level) stop there and are left for `flag_precipitated`
+        and `flag_out_of_column`, for all other ones the periodic boundary condition is
+        applied after each substep"""
+        n_dims = len(courant)
+        if n_dims not in (1, 2, 3):
+            raise NotImplementedError()
+        fall_velocity, dt_over_dz = (
+            (np.empty(0), 0.0)
+            if sedimentation is None
+            else (sedimentation[0].data, float(sedimentation[1]))
+        )
+        self._displace_with_local_substeps_body[n_dims](
+            displacement.data,
+            tuple(component.data for component in courant),
+            cell_origin.data,
+            position_in_cell.data,
+            cell_id.data,
+            n_substeps_in_cell.data,
+            n_substeps_of_droplet.data,
+            grid.data,
+            fall_velocity,
+            dt_over_dz,
+            precipitation_counting_level_index,
+        )
+
     @cached_property
     def _flag_precipitated_body(self):
-        @numba.njit(**{**self.default_jit_flags, "parallel": False})
+        @jit_cache.njit(**{**self.default_jit_flags, "parallel": False})
         def body(
             cell_origin,
             position_in_cell,
@@ -178,7 +312,7 @@ class DisplacementMethods(BackendMethods):
 
     @cached_property
     def _flag_out_of_column_body(self):
-        @numba.njit(**{**self.default_jit_flags, "parallel": False})
+        @jit_cache.njit(**{**self.default_jit_flags, "parallel": False})
         def body(
             cell_origin, position_in_cell, idx, length, healthy, domain_top_level_index
         ):
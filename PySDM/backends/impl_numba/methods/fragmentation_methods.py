@@ -5,7 +5,7 @@ CPU implementation of backend methods supporting fragmentation functions
 from functools import cached_property
 import numba
 import numpy as np
-from PySDM.backends.impl_numba import conf
+from PySDM.backends.impl_numba import conf, jit_cache
 from PySDM.backends.impl_common.backend_methods import BackendMethods
 
 
@@ -75,7 +75,7 @@ def ll82_Nr(
 class FragmentationMethods(BackendMethods):
     @cached_property
     def _fragmentation_limiters_body(self):
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         # pylint: disable=too-many-arguments
         def body(n_fragment, frag_volume, vmin, nfmax, x_plus_y):
             for i in numba.prange(len(frag_volume)):  # pylint: disable=not-an-iterable
@@ -105,7 +105,7 @@ class FragmentationMethods(BackendMethods):
 
     @cached_property
     def _slams_fragmentation_body(self):
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(n_fragment, frag_volume, x_plus_y, probs, rand):
             for i in numba.prange(len(n_fragment)):  # pylint: disable=not-an-iterable
                 probs[i] = 0.0
@@ -139,7 +139,7 @@ class FragmentationMethods(BackendMethods):
 
     @cached_property
     def _exp_fragmentation_body(self):
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         # pylint: disable=too-many-arguments
         def body(*, scale, frag_volume, rand, tol=1e-5):
             for i in numba.prange(len(frag_volume)):  # pylint: disable=not-an-iterable
@@ -308,7 +308,7 @@ class FragmentationMethods(BackendMethods):
 
     @cached_property
     def _ll82_coalescence_check_body(self):
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(*, Ec, dl):
             for i in numba.prange(len(Ec)):  # pylint: disable=not-an-iterable
                 if dl[i] < 0.4e-3:
@@ -326,7 +326,7 @@ class FragmentationMethods(BackendMethods):
     def _straub_fragmentation_body(self):
         ff = self.formulae_flattened
 
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(
             CW, gam, ds, v_max, frag_volume, rand, Nr1, Nr2, Nr3, Nr4, Nrt, d34
         ):  # pylint: disable=too-many-arguments,too-many-locals,too-many-positional-arguments
@@ -386,7 +386,7 @@ class FragmentationMethods(BackendMethods):
     def _ll82_fragmentation_body(self):  # pylint: disable=too-many-statements
         ff = self.formulae_flattened
 
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(
             CKE, W, W2, St, ds, dl, dcoal, frag_volume, rand, Rf, Rs, Rd, tol
         ):  # pylint: disable=too-many-branches,too-many-locals,too-many-statements,too-many-positional-arguments
@@ -483,7 +483,7 @@ class FragmentationMethods(BackendMethods):
     def _gauss_fragmentation_body(self):
         ff = self.formulae_flattened
 
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(mu, sigma, frag_volume, rand):  # pylint: disable=too-many-arguments
             for i in numba.prange(len(frag_volume)):  # pylint: disable=not-an-iterable
                 frag_volume[i] = mu + sigma * ff.trivia__erfinv_approx(rand[i])
@@ -494,7 +494,7 @@ class FragmentationMethods(BackendMethods):
     def _feingold1988_fragmentation_body(self):
         ff = self.formulae_flattened
 
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         # pylint: disable=too-many-arguments
         def body(scale, frag_volume, x_plus_y, rand, fragtol):
             for i in numba.prange(len(frag_volume)):  # pylint: disable=not-an-iterable
@@ -9,6 +9,7 @@ import numba
 import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba import jit_cache
 
 from ...impl_common.freezing_attributes import (
     SingularAttributes,
@@ -21,7 +22,7 @@ from ...impl_common.freezing_attributes import (
 class FreezingMethods(BackendMethods):
     @cached_property
     def _freeze(self):
-        @numba.njit(**{**self.default_jit_flags, **{"parallel": False}})
+        @jit_cache.njit(**{**self.default_jit_flags, **{"parallel": False}})
         def body(signed_water_mass, i):
             signed_water_mass[i] = -1 * signed_water_mass[i]
             # TODO #599: change thd (latent heat)!
@@ -30,7 +31,7 @@ class FreezingMethods(BackendMethods):
 
     @cached_property
     def _thaw(self):
-        @numba.njit(**{**self.default_jit_flags, **{"parallel": False}})
+        @jit_cache.njit(**{**self.default_jit_flags, **{"parallel": False}})
         def body(signed_water_mass, i):
             signed_water_mass[i] = -1 * signed_water_mass[i]
             # TODO #599: change thd (latent heat)!
@@ -44,7 +45,7 @@ class FreezingMethods(BackendMethods):
             self.formulae.trivia.frozen_and_above_freezing_point
         )
 
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(attributes, cell, temperature):
             n_sd = len(attributes.signed_water_mass)
             for i in numba.prange(n_sd):  # pylint: disable=not-an-iterable
@@ -60,7 +61,7 @@ class FreezingMethods(BackendMethods):
         _freeze = self._freeze
         unfrozen_and_saturated = self.formulae.trivia.unfrozen_and_saturated
 
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(
             attributes,
             temperature,
@@ -88,7 +89,7 @@ class FreezingMethods(BackendMethods):
         j_het = self.formulae.heterogeneous_ice_nucleation_rate.j_het
         prob_zero_events = self.formulae.trivia.poissonian_avoidance_function
 
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(  # pylint: disable=too-many-arguments
             rand,
             attributes,
@@ -129,7 +130,7 @@ class FreezingMethods(BackendMethods):
             self.formulae.homogeneous_ice_nucleation_rate.d_a_w_ice_maximum
         )
 
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(  # pylint: disable=unused-argument,too-many-positional-arguments
             rand,
             attributes,
@@ -170,7 +171,7 @@ class FreezingMethods(BackendMethods):
         unfrozen_and_ice_saturated = self.formulae.trivia.unfrozen_and_ice_saturated
         const = self.formulae.constants
 
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(attributes, cell, temperature, relative_humidity_ice):
             n_sd = len(attributes.signed_water_mass)
             for i in numba.prange(n_sd):  # pylint: disable=not-an-iterable
@@ -278,7 +279,7 @@ class FreezingMethods(BackendMethods):
     def _record_freezing_temperatures_body(self):
         ff = self.formulae_flattened
 
-        @numba.njit(**{**self.default_jit_flags, "fastmath": False})
+        @jit_cache.njit(**{**self.default_jit_flags, "fastmath": False})
         def body(data, cell_id, temperature, signed_water_mass):
             for drop_id in numba.prange(len(data)):  # pylint: disable=not-an-iterable
                 if ff.trivia__unfrozen(signed_water_mass[drop_id]):
@@ -0,0 +1,274 @@
+"""
+CPU implementation of backend methods performing collisions in fused loops over
+ pairs (single-pass probability evaluation and the monolithic SDM coalescence step)
+"""
+
+import numba
+import numpy as np
+
+from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba import jit_cache
+from PySDM.backends.impl_numba.methods.collisions_methods import (
+    gamma_and_coalesce,
+    pair_indices,
+)
+
+
+class FusedCollisionsMethods(BackendMethods):
+    def __init__(self):
+        BackendMethods.__init__(self)
+        self._fused_probabilities_of_collision_bodies = {}
+        self._fused_collision_coalescence_bodies = {}
+
+    def _fused_probabilities_of_collision_body(self, pair_kernel):
+        if pair_kernel not in self._fused_probabilities_of_collision_bodies:
+            jit_flags = {**self.default_jit_flags, **{"parallel": False}}
+            kernel = jit_cache.njit(**jit_flags)(pair_kernel)
+
+            @jit_cache.njit(**self.default_jit_flags)
+            # pylint: disable=too-many-arguments,too-many-locals
+            def body(
+                *,
+                prob,
+                kernel_args,
+                attr_1,
+                attr_2,
+                multiplicity,
+                is_first_in_pair,
+                idx,
+                length,
+                cell_id,
+                cell_idx,
+                cell_start,
+                norm_factor,
+                timestep,
+                dv,
+            ):
+                n_cell = cell_start.shape[0] - 1
+                for c in range(n_cell):
+                    sd_num = cell_start[c + 1] - cell_start[c]
+                    if sd_num < 2:
+                        norm_factor[c] = 0
+                    else:
+                        norm_factor[c] = (
+                            timestep / dv * sd_num * (sd_num - 1) / 2 / (sd_num // 2)
+                        )
+                prob[:] = 0
+                for i in numba.prange(length - 1):  # pylint: disable=not-an-iterable
+                    if is_first_in_pair[i]:
+                        j = idx[i]
+                        k = idx[i + 1]
+                        prob[i // 2] = (
+                            max(multiplicity[j], multiplicity[k])
+                            * kernel(
+                                kernel_args, attr_1[j], attr_1[k], attr_2[j], attr_2[k]
+                            )
+                            * norm_factor[cell_idx[cell_id[j]]]
+                        )
+
+            self._fused_probabilities_of_collision_bodies[pair_kernel] = body
+        return self._fused_probabilities_of_collision_bodies[pair_kernel]
+
+    def fused_probabilities_of_collision(
+        self,
+        *,
+        prob,
+        pair_kernel,
+        pair_kernel_args,
+        attributes,
+        multiplicity,
+        is_first_in_pair,
+        cell_id,
+        cell_idx,
+        cell_start,
+        norm_factor,
+        timestep,
+        dv,
+    ):
+        """single-pass equivalent of evaluating the collision kernel, multiplying it
+        by the larger of the multiplicities within each pair and normalising
+        (see `normalize`), with the kernel given by a per-pair scalar function
+        `pair_kernel(pair_kernel_args, a_j, a_k, b_j, b_k)` of the values of (up to)
+        two `attributes` (`a` and `b`) of the particles `j` and `k` within a pair"""
+        attr_1 = attributes[0] if len(attributes) > 0 else multiplicity
+        attr_2 = attributes[1] if len(attributes) > 1 else attr_1
+        return self._fused_probabilities_of_collision_body(pair_kernel)(
+            prob=prob.data,
+            kernel_args=pair_kernel_args,
+            attr_1=attr_1.data,
+            attr_2=attr_2.data,
+            multiplicity=multiplicity.data,
+            is_first_in_pair=is_first_in_pair.indicator.data,
+            idx=multiplicity.idx.data,
+            length=len(multiplicity),
+            cell_id=cell_id.data,
+            cell_idx=cell_idx.data,
+            cell_start=cell_start.data,
+            norm_factor=norm_factor.data,
+            timestep=timestep,
+            dv=dv,
+        )
+
+    def _fused_collision_coalescence_body(self, pair_kernel):
+        if pair_kernel not in self._fused_collision_coalescence_bodies:
+            jit_flags = {**self.default_jit_flags, **{"parallel": False}}
+            kernel = jit_cache.njit(**jit_flags)(pair_kernel)
+
+            @jit_cache.njit(**self.default_jit_flags)
+            # pylint: disable=too-many-arguments,too-many-locals,too-many-branches
+            def body(
+                *,
+                multiplicity,
+                idx,
+                length,
+                attributes,
+                kernel_args,
+                attr_1,
+                attr_2,
+                cell_id,
+                cell_idx,
+                cell_start,
+                is_first_in_pair,
+                rand,
+                gamma,
+                norm_factor,
+                timestep,
+                dv,
+                n_substeps,
+                adaptive,
+                dt_left,
+                dt_range,
+                stats_n_substep,
+                stats_dt_min,
+                collision_rate,
+                collision_rate_deficit,
+                coalescence_rate,
+                healthy,
+            ):
+                n_cell = cell_start.shape[0] - 1
+                for c in range(n_cell):
+                    sd_num = cell_start[c + 1] - cell_start[c]
+                    if sd_num < 2:
+                        norm_factor[c] = 0
+                    else:
+                        norm_factor[c] = (
+                            timestep / dv * sd_num * (sd_num - 1) / 2 / (sd_num // 2)
+                        )
+                gamma[:] = 0
+                is_first_in_pair[length - 1] = False
+                for i in numba.prange(length - 1):  # pylint: disable=not-an-iterable
+                    cid = cell_id[idx[i]]
+                    is_first_in_pair[i] = (
+                        cid == cell_id[idx[i + 1]]
+                        and (i - cell_start[cell_idx[cid]]) % 2 == 0
+                    )
+                    if not is_first_in_pair[i]:
+                        continue
+                    if multiplicity[idx[i]] < multiplicity[idx[i + 1]]:
+                        idx[i], idx[i + 1] = idx[i + 1], idx[i]
+                    j = idx[i]
+                    k = idx[i + 1]
+                    prob = (
+                        multiplicity[j]
+                        * kernel(
+                            kernel_args, attr_1[j], attr_1[k], attr_2[j], attr_2[k]
+                        )
+                        * norm_factor[cell_idx[cid]]
+                    )
+                    if adaptive:
+                        gamma[i // 2] = prob
+                    else:
+                        gamma_and_coalesce(
+                            i // 2,
+                            j,
+                            k,
+                            cid,
+                            prob / n_substeps,
+                            rand,
+                            multiplicity,
+                            gamma,
+                            attributes,
+                            collision_rate,
+                            collision_rate_deficit,
+                            coalescence_rate,
+                            healthy,
+                        )
+                if not adaptive:
+                    return
+                dt_todo = np.minimum(dt_left, dt_range[1])
+                for i in range(length // 2):
+                    j, k, skip_pair = pair_indices(i, idx, is_first_in_pair, gamma)
+                    if skip_pair:
+                        continue
+                    prop = multiplicity[j] // multiplicity[k]
+                    dt_optimal = timestep * prop / gamma[i]
+                    cid = cell_id[j]
+                    dt_optimal = max(dt_optimal, dt_range[0])
+                    dt_todo[cid] = min(dt_todo[cid], dt_optimal)
+                    stats_dt_min[cid] = min(stats_dt_min[cid], dt_optimal)
+                for i in numba.prange(length // 2):  # pylint: disable=not-an-iterable
+                    j, k, skip_pair = pair_indices(i, idx, is_first_in_pair, gamma)
+                    if skip_pair:
+                        continue
+                    cid = cell_id[j]
+                    gamma_and_coalesce(
+                        i,
+                        j,
+                        k,
+                        cid,
+                        gamma[i] * dt_todo[cid] / timestep,
+                        rand,
+                        multiplicity,
+                        gamma,
+                        attributes,
+                        collision_rate,
+                        collision_rate_deficit,
+                        coalescence_rate,
+                        healthy,
+                    )
+                for c, dt in enumerate(dt_todo):
+                    dt_left[c] -= dt
+                    if dt > 0:
+                        stats_n_substep[c] += 1
+
+            self._fused_collision_coalescence_bodies[pair_kernel] = body
+        return self._fused_collision_coalescence_bodies[pair_kernel]
+
+    def fused_collision_coalescence(self, **kwargs):
+        """monolithic SDM coalescence step performing (for the already permuted `idx`)
+        pair formation (`find_pairs`), sorting within pairs by multiplicity,
+        evaluation of probabilities (see `fused_probabilities_of_collision`),
+        adaptive time-step selection (if `adaptive`, otherwise scaling by
+        `1 / n_substeps`), `compute_gamma` and `collision_coalescence` in one parallel
+        loop over pairs (with a per-cell reduction and a second loop if `adaptive`);
+        the collision kernel is given by `pair_kernel`, `pair_kernel_args` and
+        `kernel_attributes` (as in `fused_probabilities_of_collision`)"""
+        kernel_attributes = kwargs["kernel_attributes"] or (kwargs["multiplicity"],)
+        self._fused_collision_coalescence_body(kwargs["pair_kernel"])(
+            multiplicity=kwargs["multiplicity"].data,
+            idx=kwargs["idx"].data,
+            length=len(kwargs["idx"]),
+            attributes=kwargs["attributes"].data,
+            kernel_args=kwargs["pair_kernel_args"],
+            attr_1=kernel_attributes[0].data,
+            attr_2=kernel_attributes[-1].data,
+            cell_id=kwargs["cell_id"].data,
+            cell_idx=kwargs["cell_idx"].data,
+            cell_start=kwargs["cell_start"].data,
+            is_first_in_pair=kwargs["is_first_in_pair"].indicator.data,
+            rand=kwargs["rand"].data,
+            gamma=kwargs["gamma"].data,
+            norm_factor=kwargs["norm_factor"].data,
+            timestep=kwargs["timestep"],
+            dv=kwargs["dv"],
+            n_substeps=kwargs["n_substeps"],
+            adaptive=kwargs["adaptive"],
+            dt_left=kwargs["dt_left"].data,
+            dt_range=kwargs["dt_range"],
+            stats_n_substep=kwargs["stats_n_substep"].data,
+            stats_dt_min=kwargs["stats_dt_min"].data,
+            collision_rate=kwargs["collision_rate"].data,
+            collision_rate_deficit=kwargs["collision_rate_deficit"].data,
+            coalescence_rate=kwargs["coalescence_rate"].data,
+            healthy=kwargs["healthy"].data,
+        )
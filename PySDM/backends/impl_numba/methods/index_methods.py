@@ -5,14 +5,54 @@ CPU implementation of shuffling and sorting backend methods
 from functools import cached_property
 
 import numba
+import numpy as np
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba import conf, jit_cache
+
+INCREMENTAL_SHUFFLE_MIN_CELL_SIZE = 64
+
+
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+def coprime_multiplier(n, u01):
+    """returns the `int(u01 * m)`-th (in increasing order) of the `m` integers
+    within `[2, n-2]` co-prime with `n` (`n > 4`), hence a value drawn uniformly
+    from among them for `u01` uniformly distributed in `[0, 1)`"""
+    factors = np.empty(16, dtype=np.int64)  # distinct prime factors of n
+    n_factors = 0
+    m = n
+    rest = n
+    p = 2
+    while p * p <= rest:
+        if rest % p == 0:
+            factors[n_factors] = p
+            n_factors += 1
+            m = m // p * (p - 1)
+            while rest % p == 0:
+                rest //= p
+        p += 1
+    if rest > 1:
+        factors[n_factors] = rest
+        n_factors += 1
+        m = m // rest * (rest - 1)
+    k = int(u01 * (m - 2))  # Euler's totient less the excluded 1 and n-1
+    a = 1
+    while k >= 0:
+        a += 1
+        coprime = True
+        for f in range(n_factors):
+            if a % factors[f] == 0:
+                coprime = False
+                break
+        if coprime:
+            k -= 1
+    return a
 
 
 class IndexMethods(BackendMethods):
     @cached_property
     def identity_index(self):
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(idx):
             for i in numba.prange(len(idx)):  # pylint: disable=not-an-iterable
                 idx[i] = i
@@ -21,7 +61,7 @@ class IndexMethods(BackendMethods):
 
     @cached_property
     def shuffle_global(self):
-        @numba.njit(**{**self.default_jit_flags, "parallel": False})
+        @jit_cache.njit(**{**self.default_jit_flags, "parallel": False})
         def body(idx, length, u01):
             for i in range(length - 1, 0, -1):
                 j = int(u01[i] * (i + 1))
@@ -31,7 +71,7 @@ class IndexMethods(BackendMethods):
 
     @cached_property
     def shuffle_local(self):
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(idx, u01, cell_start):
             # pylint: disable=not-an-iterable
             for c in numba.prange(len(cell_start) - 1):
@@ -43,6 +83,64 @@ class IndexMethods(BackendMethods):
 
         return body
 
+    @cached_property
+    def shuffle_local_incremental_u01_length(self):
+        """number of random numbers used by `shuffle_local_incremental`
+        (zero if any cell is too small for the incremental re-shuffle)"""
+
+        @jit_cache.njit(**{**self.default_jit_flags, "parallel": False})
+        def body(cell_start):
+            n_cell = len(cell_start) - 1
+            for c in range(n_cell):
+                n = cell_start[c + 1] - cell_start[c]
+                if 1 < n < INCREMENTAL_SHUFFLE_MIN_CELL_SIZE:
+                    return 0
+            result = 2 * n_cell + cell_start[n_cell] // 2 // 32 + 1
+            return result if result <= cell_start[n_cell] else 0
+
+        return body
+
+    @cached_property
+    def shuffle_local_incremental(self):
+        """re-shuffles a per-cell permutation by reversing the order within each
+        pair of neighbours with probability 1/2 (undoing the sorting within pairs)
+        followed by an affine re-indexing `q -> (a q + b) mod n` within each cell
+        (with `a` co-prime with the cell size `n` and `a != 1, n-1`, hence never
+        re-forming the pairs of the previous step) with `a` drawn uniformly from
+        among such multipliers (see `coprime_multiplier`); random bits for the
+        reversals are taken from 32-bit words stored in `u01` after the `(a, b)`
+        pairs of all cells; note that unlike with `shuffle_local`, permutations
+        obtained in consecutive steps are correlated (each being an affine image
+        of the previous one up to the swaps within pairs)"""
+
+        @jit_cache.njit(**self.default_jit_flags)
+        def body(idx, u01, cell_start):
+            n_cell = len(cell_start) - 1
+            tmp = np.empty(cell_start[n_cell], dtype=idx.dtype)
+            # pylint: disable=not-an-iterable
+            for c in numba.prange(n_cell):
+                start = cell_start[c]
+                n = cell_start[c + 1] - start
+                if n < 2:
+                    continue
+                for p in range(start, start + n - 1, 2):
+                    k = p // 2
+                    word = np.uint64(u01[2 * n_cell + k // 32] * 4294967296.0)
+                    if (word >> np.uint64(k % 32)) & np.uint64(1):
+                        idx[p], idx[p + 1] = idx[p + 1], idx[p]
+
+                a = coprime_multiplier(n, u01[2 * c])
+                s = int(u01[2 * c + 1] * n)
+                for q in range(n):
+                    tmp[start + q] = idx[start + s]
+                    s += a
+                    if s >= n:
+                        s -= n
+                for q in range(start, start + n):
+                    idx[q] = tmp[q]
+
+        return body
+
     @staticmethod
     def sort_by_key(idx, attr):
         idx.data[:] = attr.data.argsort(kind="stable")[::-1]
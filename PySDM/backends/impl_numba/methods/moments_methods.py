@@ -7,13 +7,14 @@ from functools import cached_property
 import numba
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba import jit_cache
 from PySDM.backends.impl_numba.atomic_operations import atomic_add
 
 
 class MomentsMethods(BackendMethods):
     @cached_property
     def _moments_body(self):
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(
             *,
             moment_0,
@@ -100,7 +101,7 @@ class MomentsMethods(BackendMethods):
 
     @cached_property
     def _spectrum_moments_body(self):
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(
             *,
             moment_0,
@@ -180,3 +181,104 @@ class MomentsMethods(BackendMethods):
             weighting_attribute=weighting_attribute.data,
             weighting_rank=weighting_rank,
         )
+
+    @cached_property
+    def _fused_moments_body(self):
+        @jit_cache.njit(**self.default_jit_flags)
+        def body(
+            *,
+            moment_0,
+            moments,
+            multiplicity,
+            attr_data,
+            cell_id,
+            idx,
+            length,
+            attr_indices,
+            ranks,
+            x_edges,
+            row_offsets,
+            weighting_ranks,
+            skip_division_by_m0,
+        ):
+            # pylint: disable=too-many-locals
+            moment_0[:, :] = 0
+            moments[:, :] = 0
+            for idx_i in numba.prange(length):  # pylint: disable=not-an-iterable
+                i = idx[idx_i]
+                for r in range(ranks.shape[0]):
+                    first = row_offsets[r] + r
+                    last = row_offsets[r + 1] + r
+                    x = attr_data[attr_indices[1, r], i]
+                    if not x_edges[first] <= x < x_edges[last]:
+                        continue
+                    while last - first > 1:
+                        middle = (first + last) // 2
+                        if x < x_edges[middle]:
+                            last = middle
+                        else:
+                            first = middle
+                    row = first - r
+                    weight = (
+                        multiplicity[i]
+                        * attr_data[attr_indices[2, r], i] ** weighting_ranks[r]
+                    )
+                    atomic_add(moment_0, (row, cell_id[i]), weight)
+                    atomic_add(
+                        moments,
+                        (row, cell_id[i]),
+                        weight * attr_data[attr_indices[0, r], i] ** ranks[r],
+                    )
+            for r in range(ranks.shape[0]):
+                if not skip_division_by_m0[r]:
+                    for row in range(row_offsets[r], row_offsets[r + 1]):
+                        for c_id in range(moment_0.shape[1]):
+                            moments[row, c_id] = (
+                                moments[row, c_id] / moment_0[row, c_id]
+                                if moment_0[row, c_id] != 0
+                                else 0
+                            )
+
+        return body
+
+    def fused_moments(
+        self,
+        *,
+        moment_0,
+        moments,
+        multiplicity,
+        attr_data,
+        cell_id,
+        idx,
+        length,
+        attr_indices,
+        ranks,
+        x_edges,
+        row_offsets,
+        weighting_ranks,
+        skip_division_by_m0,
+    ):
+        """computes, in a single pass over particles, moments for a set of requests
+        (`ranks.shape[0]` of them), each defined by: the rows of `attr_data` holding
+        the moment attribute, the filter attribute binned with edges `x_edges` and
+        the weighting attribute (`attr_indices[:, r]`, in this order),
+        by the moment rank and weighting rank, and by whether
+        to divide by the zero-th moment; results for request `r` are written to rows
+        `row_offsets[r]:row_offsets[r + 1]` of `moment_0` and `moments` (one per bin),
+        its bin edges are `x_edges[row_offsets[r] + r:row_offsets[r + 1] + r + 1]`"""
+        assert moment_0.shape == moments.shape
+        return self._fused_moments_body(
+            moment_0=moment_0.data,
+            moments=moments.data,
+            multiplicity=multiplicity.data,
+            attr_data=attr_data.data,
+            cell_id=cell_id.data,
+            idx=idx.data,
+            length=length,
+            attr_indices=attr_indices.data,
+            ranks=ranks.data,
+            x_edges=x_edges.data,
+            row_offsets=row_offsets.data,
+            weighting_ranks=weighting_ranks.data,
+            skip_division_by_m0=skip_division_by_m0.data,
+        )
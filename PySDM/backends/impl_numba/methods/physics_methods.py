@@ -8,6 +8,7 @@ import numba
 from numba import prange
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba import jit_cache
 
 
 class PhysicsMethods(BackendMethods):
@@ -18,7 +19,7 @@ class PhysicsMethods(BackendMethods):
     def _critical_volume_body(self):
         ff = self.formulae_flattened
 
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(*, v_cr, kappa, f_org, v_dry, v_wet, T, cell):
             for i in prange(len(v_cr)):  # pylint: disable=not-an-iterable
                 sigma = ff.surface_tension__sigma(
@@ -50,7 +51,7 @@ class PhysicsMethods(BackendMethods):
     def _temperature_pressure_rh_body(self):
         ff = self.formulae_flattened
 
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(*, rhod, thd, water_vapour_mixing_ratio, T, p, RH):
             for i in prange(T.shape[0]):  # pylint: disable=not-an-iterable
                 T[i] = ff.state_variable_triplet__T(rhod[i], thd[i])
@@ -79,7 +80,7 @@ class PhysicsMethods(BackendMethods):
     def _a_w_ice_body(self):
         ff = self.formulae_flattened
 
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(
             *, T_in, p_in, RH_in, water_vapour_mixing_ratio_in, a_w_ice_out, RH_ice_out
         ):
@@ -108,7 +109,7 @@ class PhysicsMethods(BackendMethods):
     def _volume_of_mass_body(self):
         ff = self.formulae_flattened
 
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(volume, mass):
             for i in prange(volume.shape[0]):  # pylint: disable=not-an-iterable
                 volume[i] = ff.particle_shape_and_density__mass_to_volume(mass[i])
@@ -122,7 +123,7 @@ class PhysicsMethods(BackendMethods):
     def _mass_of_volume_body(self):
         ff = self.formulae_flattened
 
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(mass, volume):
             for i in prange(volume.shape[0]):  # pylint: disable=not-an-iterable
                 mass[i] = ff.particle_shape_and_density__volume_to_mass(volume[i])
@@ -136,7 +137,7 @@ class PhysicsMethods(BackendMethods):
     def __air_density_body(self):
         formulae = self.formulae.flatten
 
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(output, rhod, water_vapour_mixing_ratio):
             for i in numba.prange(output.shape[0]):  # pylint: disable=not-an-iterable
                 output[i] = (
@@ -154,7 +155,7 @@ class PhysicsMethods(BackendMethods):
     def __air_dynamic_viscosity_body(self):
         formulae = self.formulae.flatten
 
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(output, temperature):
             for i in numba.prange(output.shape[0]):  # pylint: disable=not-an-iterable
                 output[i] = formulae.air_dynamic_viscosity__eta_air(temperature[i])
@@ -168,7 +169,7 @@ class PhysicsMethods(BackendMethods):
     def __reynolds_number_body(self):
         formulae = self.formulae.flatten
 
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(  # pylint: disable=too-many-arguments
             output,
             cell_id,
@@ -203,7 +204,7 @@ class PhysicsMethods(BackendMethods):
     def _explicit_euler_body(self):
         ff = self.formulae_flattened
 
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(y, dt, dy_dt):
             y[:] = ff.trivia__explicit_euler(y, dt, dy_dt)
 
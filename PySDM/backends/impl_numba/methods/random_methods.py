@@ -0,0 +1,81 @@
+"""
+CPU implementation of the counter-based Philox4x32-10 random number generator
+ ([Salmon et al. 2011](https://doi.org/10.1145/2063384.2063405))
+"""
+
+from functools import cached_property
+
+import numba
+import numpy as np
+
+from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba import conf, jit_cache
+
+PHILOX_M0 = 0xD2511F53
+PHILOX_M1 = 0xCD9E8D57
+PHILOX_W0 = 0x9E3779B9
+PHILOX_W1 = 0xBB67AE85
+PHILOX_ROUNDS = 10
+MASK32 = 0xFFFFFFFF
+
+
+@numba.njit(**{**conf.JIT_FLAGS, "parallel": False, "inline": "always"})
+def philox4x32(counter, key):
+    """returns the four 32-bit words of the Philox4x32-10 block for a given
+    (128-bit) counter and (64-bit) key, both passed as tuples of 32-bit words
+    (held in 64-bit integers)"""
+    c0, c1, c2, c3 = counter
+    k0, k1 = key
+    for _ in range(PHILOX_ROUNDS):
+        product0 = np.uint64(PHILOX_M0) * np.uint64(c0)
+        product1 = np.uint64(PHILOX_M1) * np.uint64(c2)
+        c0, c1, c2, c3 = (
+            (np.uint64(product1 >> np.uint64(32)) ^ np.uint64(c1) ^ np.uint64(k0))
+            & np.uint64(MASK32),
+            product1 & np.uint64(MASK32),
+            (np.uint64(product0 >> np.uint64(32)) ^ np.uint64(c3) ^ np.uint64(k1))
+            & np.uint64(MASK32),
+            product0 & np.uint64(MASK32),
+        )
+        k0 = (np.uint64(k0) + np.uint64(PHILOX_W0)) & np.uint64(MASK32)
+        k1 = (np.uint64(k1) + np.uint64(PHILOX_W1)) & np.uint64(MASK32)
+    return c0, c1, c2, c3
+
+
+class RandomMethods(BackendMethods):  # pylint: disable=too-few-public-methods
+    @cached_property
+    def philox_uniform(self):
+        """fills `out` with consecutive elements (starting from `offset`) of a stream
+        of uniform [0, 1) numbers in which the two 53-bit numbers constructed
+        from the Philox4x32-10 block of the counter `i` are the elements `2i`
+        and `2i+1`; each element depends only on its position and on the key,
+        hence the result is independent of the number of threads"""
+
+        @jit_cache.njit(**{**self.default_jit_flags, "fastmath": False})
+        def body(out, offset, key0, key1):
+            n = len(out)
+            if n == 0:
+                return
+            first = offset // 2
+            n_blocks = (offset + n - 1) // 2 - first + 1
+            key = (np.uint64(key0), np.uint64(key1))
+            for i in numba.prange(n_blocks):  # pylint: disable=not-an-iterable
+                block = np.uint64(first + i)
+                x0, x1, x2, x3 = philox4x32(
+                    (
+                        block & np.uint64(MASK32),
+                        block >> np.uint64(32),
+                        np.uint64(0),
+                        np.uint64(0),
+                    ),
+                    key,
+                )
+                j = 2 * (first + i) - offset
+                if j >= 0:
+                    out[j] = ((x0 | (x1 << np.uint64(32))) >> np.uint64(11)) * 2.0**-53
+                if j + 1 < n:
+                    out[j + 1] = (
+                        (x2 | (x3 << np.uint64(32))) >> np.uint64(11)
+                    ) * 2.0**-53
+
+        return body
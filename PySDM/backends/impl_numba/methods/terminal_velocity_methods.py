@@ -7,13 +7,14 @@ from functools import cached_property
 import numba
 
 from PySDM.backends.impl_common.backend_methods import BackendMethods
+from PySDM.backends.impl_numba import jit_cache
 
 
 class TerminalVelocityMethods(BackendMethods):
 
     @cached_property
     def _gunn_and_kinzer_interpolation_body(self):
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(output, radius, factor, b, c):
             for i in numba.prange(len(radius)):  # pylint: disable=not-an-iterable
                 if radius[i] > 0:
@@ -34,7 +35,7 @@ class TerminalVelocityMethods(BackendMethods):
     def _rogers_and_yau_terminal_velocity_body(self):
         v_term = self.formulae.terminal_velocity.v_term
 
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(*, values, radius):
             for i in numba.prange(len(values)):  # pylint: disable=not-an-iterable
                 if radius[i] >= 0.0:
@@ -47,7 +48,7 @@ class TerminalVelocityMethods(BackendMethods):
 
     @cached_property
     def _power_series_body(self):
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(*, values, radius, num_terms, prefactors, powers):
             for i in numba.prange(len(values)):  # pylint: disable=not-an-iterable
                 values[i] = 0.0
@@ -83,7 +84,7 @@ class TerminalVelocityMethods(BackendMethods):
             self.formulae.terminal_velocity_ice.atmospheric_correction_factor
         )
 
-        @numba.njit(**self.default_jit_flags)
+        @jit_cache.njit(**self.default_jit_flags)
         def body(*, values, signed_water_mass, cell_id, temperature, pressure):
             for i in numba.prange(len(values)):  # pylint: disable=not-an-iterable
                 if signed_water_mass[i] < 0:
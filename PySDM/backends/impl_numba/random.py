@@ -1,19 +1,115 @@
 """
-random number generator class for Numba backend
+random number generator classes for Numba backend
 """
 
+import collections
+
 import numpy as np
 
+from PySDM.impl.thread_pool import thread_pool
+
 from ..impl_common.random_common import RandomCommon
 
-#  TIP: can be called asynchronously
 #  TIP: sometimes only half array is needed
 
 
-class Random(RandomCommon):  # pylint: disable=too-few-public-methods
+class Random(RandomCommon):
     def __init__(self, size, seed):
         super().__init__(size, seed)
         self.generator = np.random.default_rng(seed)
 
     def __call__(self, storage):
         storage.data[:] = self.generator.uniform(0, 1, storage.shape)
+
+    def get_state(self):
+        return self.generator.bit_generator.state
+
+    def set_state(self, state):
+        self.generator.bit_generator.state = state
+
+
+class AsyncRandom(Random):
+    """double-buffered variant of `Random` producing the very same numbers: blocks
+    of `size` numbers are generated in advance on a background thread (NumPy releases
+    the GIL while generating) so that filling a storage is a copy of the already
+    generated numbers; `generator` reflects the state as if the numbers were drawn
+    synchronously (it is advanced upon each call, and changing its state, e.g., when
+    restoring a checkpoint, discards the numbers generated in advance)"""
+
+    N_BLOCKS_AHEAD = 2
+
+    def __init__(self, size, seed):
+        super().__init__(size, seed)
+        self.__expected_state = None
+        self.__producer = None
+        self.__pending = collections.deque()
+        self.__block = None
+        self.__position = 0
+
+    @staticmethod
+    def __fill(generator, block):
+        generator.random(out=block)
+        return block
+
+    def __submit(self, producer, block):
+        self.__pending.append(
+            thread_pool("RNG", max_workers=1).submit(self.__fill, producer, block)
+        )
+
+    def __restart(self):
+        for future in self.__pending:
+            future.result()
+        self.__pending.clear()
+        producer = np.random.Generator(type(self.generator.bit_generator)())
+        producer.bit_generator.state = self.generator.bit_generator.state
+        self.__producer = producer
+        for _ in range(self.N_BLOCKS_AHEAD):
+            self.__submit(producer, np.empty(max(self.size, 1)))
+        self.__block = None
+        self.__position = 0
+
+    def __call__(self, storage):
+        if self.generator.bit_generator.state != self.__expected_state:
+            self.__restart()
+        out = storage.data.reshape(-1)
+        filled = 0
+        while filled < out.size:
+            if self.__block is None or self.__position == self.__block.size:
+                if self.__block is not None:
+                    self.__submit(self.__producer, self.__block)
+                self.__block = self.__pending.popleft().result()
+                self.__position = 0
+            count = min(out.size - filled, self.__block.size - self.__position)
+            out[filled : filled + count] = self.__block[
+                self.__position : self.__position + count
+            ]
+            filled += count
+            self.__position += count
+        self.generator.bit_generator.advance(out.size)
+        self.__expected_state = self.generator.bit_generator.state
+
+
+class PhiloxRandom(RandomCommon):
+    """counter-based generator filling storages in parallel with the Philox4x32-10
+    stream (see `PySDM.backends.impl_numba.methods.random_methods`) keyed with
+    the seed; the numbers do not depend on the number of threads (nor on how
+    the stream is split into calls); its state is the key and the stream position"""
+
+    def __init__(self, size, seed, *, backend):
+        super().__init__(size, seed)
+        self.key = (seed & 0xFFFFFFFF, (seed >> 32) & 0xFFFFFFFF)
+        self.counter = 0
+        self.backend = backend
+
+    def __call__(self, storage):
+        out = storage.data.reshape(-1)
+        self.backend.philox_uniform(out, self.counter, *self.key)
+        self.counter += out.size
+
+    def get_state(self):
+        return {"key": list(self.key), "counter": self.counter}
+
+    def set_state(self, state):
+        if tuple(state["key"]) != self.key:
+            raise ValueError("Philox key (seed) differs from the checkpointed one")
+        self.counter = int(state["counter"])
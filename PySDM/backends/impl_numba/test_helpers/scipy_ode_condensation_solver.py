@@ -31,7 +31,15 @@ def patch_particulator(particulator):
 
 
 def _condensation(
-    particulator, *, rtol_x, rtol_thd, counters, RH_max, success, cell_order
+    particulator,
+    *,
+    rtol_x,
+    rtol_thd,
+    counters,
+    RH_max,
+    success,
+    cell_order,
+    cell_cost=None,  # pylint: disable=unused-argument
 ):
     func = Numba._condensation
     if not numba.config.DISABLE_JIT:  # pylint: disable=no-member
@@ -39,7 +47,7 @@ def _condensation(
     func(
         solver=particulator.condensation_solver,
         n_threads=1,
-        n_cell=particulator.mesh.n_cell,
+        thread_start=np.asarray([0, particulator.mesh.n_cell]),
         cell_start_arg=particulator.attributes.cell_start.data,
         attributes=_Attributes(
             signed_water_mass=particulator.attributes["signed water mass"].data,
@@ -57,7 +65,7 @@ def _condensation(
             water_vapour_mixing_ratio=particulator.environment[
                 "water_vapour_mixing_ratio"
             ].data,
-            dv_mean=particulator.environment.dv,
+            dv_mean=np.full(particulator.mesh.n_cell, particulator.environment.dv),
             prhod=particulator.environment.get_predicted("rhod").data,
             pthd=particulator.environment.get_predicted("thd").data,
             predicted_water_vapour_mixing_ratio=particulator.environment.get_predicted(
@@ -10,7 +10,7 @@ import numba
 from PySDM.backends.impl_numba import conf
 
 
-@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False}})
+@numba.njit(**{**conf.JIT_FLAGS, **{"parallel": False, "nogil": False}})
 def warn(msg, file, context=None, return_value=None):
     with numba.objmode():
         print(msg, file=sys.stderr)
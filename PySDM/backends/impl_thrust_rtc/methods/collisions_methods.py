@@ -483,11 +483,25 @@ class CollisionsMethods(
     @cached_property
     def __normalize_body_1(self):
         return trtc.For(
-            param_names=("prob", "cell_id", "norm_factor"),
+            param_names=(
+                "prob",
+                "idx",
+                "is_first_in_pair",
+                "cell_id",
+                "cell_idx",
+                "norm_factor",
+            ),
             name_iter="i",
-            body="""
-            prob[i] *= norm_factor[cell_id[i]];
-            """,
+            body=f"""
+            {COMMONS}
+            int64_t _j[1] = {{}};
+            int64_t _k[1] = {{}};
+            auto skip_pair = Commons::pair_indices(i, _j, _k, idx, is_first_in_pair, prob);
+            if (skip_pair) {{
+                return;
+            }}
+            prob[i] *= norm_factor[cell_idx[cell_id[_j[0]]]];
+            """.replace("real_type", self._get_c_type()),
         )
 
     @cached_property
@@ -910,7 +924,16 @@ class CollisionsMethods(
     # pylint: disable=unused-argument
     @nice_thrust(**NICE_THRUST_FLAGS)
     def normalize(
-        self, *, prob, cell_id, cell_idx, cell_start, norm_factor, timestep, dv
+        self,
+        *,
+        prob,
+        is_first_in_pair,
+        cell_id,
+        cell_idx,
+        cell_start,
+        norm_factor,
+        timestep,
+        dv,
     ):
         n_cell = cell_start.shape[0] - 1
         device_dt_div_dv = self._get_floating_point(timestep / dv)
@@ -918,7 +941,15 @@ class CollisionsMethods(
             n=n_cell, args=(cell_start.data, norm_factor.data, device_dt_div_dv)
         )
         self.__normalize_body_1.launch_n(
-            prob.shape[0], (prob.data, cell_id.data, norm_factor.data)
+            prob.shape[0],
+            (
+                prob.data,
+                cell_id.idx.data,
+                is_first_in_pair.indicator.data,
+                cell_id.data,
+                cell_idx.data,
+                norm_factor.data,
+            ),
         )
 
     @nice_thrust(**NICE_THRUST_FLAGS)
@@ -423,6 +423,7 @@ class CondensationMethods(
         reynolds_number,
         air_density,
         air_dynamic_viscosity,
+        cell_cost=None,
     ):
         assert solver is None
 
@@ -61,6 +61,92 @@ class DisplacementMethods(ThrustRTCBackendMethods):
             for n_dims in (1, 2, 3)
         }
 
+    @cached_property
+    def __displace_with_local_substeps_body(self):
+        def courant_indices(n_dims, dim):
+            """C expressions for the row-major offsets of the left and right
+            (Arakawa-C grid) values of a given Courant-number component"""
+            shape = [f"(grid_{d} + {int(d == dim)})" for d in range(n_dims)]
+            left = "cell_origin[i]"
+            for d in range(1, n_dims):
+                left = f"({left}) * {shape[d]} + cell_origin[i + {d} * n_sd]"
+            stride = " * ".join(["1"] + shape[dim + 1 :])
+            return left, f"{left} + {stride}"
+
+        def displacement(n_dims, dim):
+            _l, _r = courant_indices(n_dims, dim)
+            return f"""
+                displacement[i + n_sd * {dim}] = {
+                    self.formulae.particle_advection.displacement.c_inline(
+                        position_in_cell=f"position_in_cell[i + n_sd * {dim}]",
+                        c_l=f"courant_{dim}[{_l}] / n",
+                        c_r=f"courant_{dim}[{_r}] / n",
+                    )
+                };"""
+
+        def periodic_boundary_condition(dim):
+            return f"""
+                cell_origin[i + n_sd * {dim}] = (
+                    cell_origin[i + n_sd * {dim}] % grid_{dim} + grid_{dim}
+                ) % grid_{dim};"""
+
+        return {
+            n_dims: trtc.For(
+                param_names=(
+                    "n_sd",
+                    "displacement",
+                    "courant_0",
+                    "courant_1",
+                    "courant_2",
+                    "cell_origin",
+                    "position_in_cell",
+                    "cell_id",
+                    "n_substeps_in_cell",
+                    "n_substeps_of_droplet",
+                    "grid_0",
+                    "grid_1",
+                    "grid_2",
+                    "sedimentation",
+                    "fall_velocity",
+                    "dt_over_dz",
+                    "precipitation_counting_level_index",
+                ),
+                name_iter="i",
+                body=f"""
+            auto n = n_substeps_in_cell[cell_id[i]];
+            n_substeps_of_droplet[i] = n;
+            for (auto substep = 0; substep < n; substep += 1) {{
+                {"".join(displacement(n_dims, dim) for dim in range(n_dims))}
+                if (sedimentation) {{
+                    displacement[i + n_sd * {n_dims - 1}] -= fall_velocity[i] * dt_over_dz / n;
+                }}
+                for (auto dim = 0; dim < {n_dims}; dim += 1) {{
+                    position_in_cell[i + n_sd * dim] += displacement[i + n_sd * dim];
+                    auto floor_of_position = floor(position_in_cell[i + n_sd * dim]);
+                    cell_origin[i + n_sd * dim] += (int64_t)(floor_of_position);
+                    position_in_cell[i + n_sd * dim] -= floor_of_position;
+                }}
+                auto position_within_column = (
+                    cell_origin[i + n_sd * {n_dims - 1}]
+                    + position_in_cell[i + n_sd * {n_dims - 1}]
+                );
+                if (
+                    position_within_column < 0
+                    || position_within_column > grid_{n_dims - 1}
+                    || (
+                        displacement[i + n_sd * {n_dims - 1}] < 0
+                        && position_within_column < precipitation_counting_level_index
+                    )
+                ) {{
+                    break;
+                }}
+                {"".join(periodic_boundary_condition(dim) for dim in range(n_dims))}
+            }}
+            """.replace("real_type", self._get_c_type()),
+            )
+            for n_dims in (1, 2, 3)
+        }
+
     @cached_property
     def __flag_precipitated_body(self):
         return trtc.For(
@@ -111,6 +197,52 @@ class DisplacementMethods(ThrustRTCBackendMethods):
             ),
         )
 
+    @cached_property
+    def __placeholder(self):
+        return trtc.device_vector(self._get_c_type(), 1)
+
+    @nice_thrust(**NICE_THRUST_FLAGS)
+    def displace_with_local_substeps(
+        self,
+        *,
+        displacement,
+        courant,
+        cell_origin,
+        position_in_cell,
+        cell_id,
+        n_substeps_in_cell,
+        n_substeps_of_droplet,
+        grid,
+        sedimentation=None,
+        precipitation_counting_level_index=0,
+    ):  # pylint: disable=too-many-arguments
+        padding = 3 - len(courant)
+        fall_velocity, dt_over_dz = (
+            (self.__placeholder, 0)
+            if sedimentation is None
+            else (sedimentation[0].data, sedimentation[1])
+        )
+        self.__displace_with_local_substeps_body[len(courant)].launch_n(
+            n=position_in_cell.shape[1],
+            args=(
+                trtc.DVInt64(position_in_cell.shape[1]),
+                displacement.data,
+                *(component.data for component in courant),
+                *(self.__placeholder,) * padding,
+                cell_origin.data,
+                position_in_cell.data,
+                cell_id.data,
+                n_substeps_in_cell.data,
+                n_substeps_of_droplet.data,
+                *(trtc.DVInt64(int(extent)) for extent in grid.to_ndarray()),
+                *(trtc.DVInt64(-1),) * padding,
+                trtc.DVBool(sedimentation is not None),
+                fall_velocity,
+                self._get_floating_point(dt_over_dz),
+                trtc.DVInt64(precipitation_counting_level_index),
+            ),
+        )
+
     @nice_thrust(**NICE_THRUST_FLAGS)
     def flag_precipitated(  # pylint: disable=unused-argument
         self,
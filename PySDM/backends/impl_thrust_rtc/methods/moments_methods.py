@@ -146,6 +146,89 @@ class MomentsMethods(ThrustRTCBackendMethods):
         """,
         )
 
+    @cached_property
+    def __fused_moments_body_0(self):
+        return trtc.For(
+            (
+                "idx",
+                "attr_data",
+                "moment_0",
+                "moments",
+                "cell_id",
+                "multiplicity",
+                "attr_indices",
+                "ranks",
+                "x_edges",
+                "row_offsets",
+                "weighting_ranks",
+                "n_requests",
+                "n_sd",
+                "n_cell",
+            ),
+            "fake_i",
+            self.commons + """
+            auto i = idx[fake_i];
+            for (auto r = 0; r < n_requests; r+=1) {
+                auto first = row_offsets[r] + r;
+                auto last = row_offsets[r + 1] + r;
+                auto x = attr_data[n_sd * attr_indices[n_requests + r] + i];
+                if (x != x || x < x_edges[first] || x_edges[last] <= x) {
+                    continue;
+                }
+                while (last - first > 1) {
+                    auto middle = (int64_t)((first + last) / 2);
+                    if (x < x_edges[middle]) {
+                        last = middle;
+                    }
+                    else {
+                        first = middle;
+                    }
+                }
+                auto row = first - r;
+                auto weight = multiplicity[i] * pow(
+                    (real_type)(
+                        attr_data[n_sd * attr_indices[2 * n_requests + r] + i]
+                    ),
+                    (real_type)(weighting_ranks[r])
+                );
+                auto value = weight * pow(
+                    (real_type)(attr_data[n_sd * attr_indices[r] + i]),
+                    (real_type)(ranks[r])
+                );
+                atomicAdd((real_type*) &moment_0[n_cell * row + cell_id[i]], weight);
+                atomicAdd((real_type*) &moments[n_cell * row + cell_id[i]], value);
+            }
+        """.replace("real_type", self._get_c_type()),
+        )
+
+    @cached_property
+    def __fused_moments_body_1(self):
+        return trtc.For(
+            (
+                "moments",
+                "moment_0",
+                "row_offsets",
+                "skip_division_by_m0",
+                "n_requests",
+                "n_cell",
+            ),
+            "c_id",
+            """
+            for (auto r = 0; r < n_requests; r+=1) {
+                if (! skip_division_by_m0[r]) {
+                    for (auto row = row_offsets[r]; row < row_offsets[r + 1]; row+=1) {
+                        if (moment_0[n_cell * row + c_id] == 0) {
+                            moments[n_cell * row + c_id] = 0;
+                        }
+                        else {
+                            moments[n_cell * row + c_id] /= moment_0[n_cell * row + c_id];
+                        }
+                    }
+                }
+            }
+        """,
+        )
+
     @staticmethod
     def ensure_floating_point(data):
         data_type = data.data.name_elem_cls()
@@ -266,3 +349,64 @@ class MomentsMethods(ThrustRTCBackendMethods):
         self.__spectrum_moments_body_1.launch_n(
             moment_0.shape[1], (n_bins, moments.data, moment_0.data, n_cell)
         )
+
+    # pylint: disable=unused-argument,too-many-locals
+    @nice_thrust(**NICE_THRUST_FLAGS)
+    def fused_moments(
+        self,
+        *,
+        moment_0,
+        moments,
+        multiplicity,
+        attr_data,
+        cell_id,
+        idx,
+        length,
+        attr_indices,
+        ranks,
+        x_edges,
+        row_offsets,
+        weighting_ranks,
+        skip_division_by_m0,
+    ):
+        assert moment_0.shape == moments.shape
+        self.ensure_floating_point(moment_0)
+        self.ensure_floating_point(moments)
+
+        n_cell = trtc.DVInt64(moments.shape[1])
+        n_sd = trtc.DVInt64(attr_data.shape[1])
+        n_requests = trtc.DVInt64(ranks.shape[0])
+
+        moments[:] = 0
+        moment_0[:] = 0
+
+        self.__fused_moments_body_0.launch_n(
+            length,
+            (
+                idx.data,
+                attr_data.data,
+                moment_0.data,
+                moments.data,
+                cell_id.data,
+                multiplicity.data,
+                attr_indices.data,
+                ranks.data,
+                x_edges.data,
+                row_offsets.data,
+                weighting_ranks.data,
+                n_requests,
+                n_sd,
+                n_cell,
+            ),
+        )
+        self.__fused_moments_body_1.launch_n(
+            moment_0.shape[1],
+            (
+                moments.data,
+                moment_0.data,
+                row_offsets.data,
+                skip_division_by_m0.data,
+                n_requests,
+                n_cell,
+            ),
+        )
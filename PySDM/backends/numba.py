@@ -5,12 +5,14 @@ Multi-threaded CPU backend using LLVM-powered just-in-time compilation
 import os
 import platform
 import warnings
+from functools import partial
 
 import numba
 from numba import prange
 import numpy as np
 
 from PySDM.backends.impl_numba import methods
+from PySDM.backends.impl_numba.random import AsyncRandom, PhiloxRandom
 from PySDM.backends.impl_numba.random import Random as ImportedRandom
 from PySDM.backends.impl_numba.storage import Storage as ImportedStorage
 from PySDM.formulae import Formulae
@@ -19,10 +21,12 @@ from PySDM.backends.impl_numba.conf import JIT_FLAGS
 
 class Numba(  # pylint: disable=too-many-ancestors,duplicate-code
     methods.CollisionsMethods,
+    methods.FusedCollisionsMethods,
     methods.FragmentationMethods,
     methods.PairMethods,
     methods.IndexMethods,
     methods.PhysicsMethods,
+    methods.RandomMethods,
     methods.CondensationMethods,
     methods.ChemistryMethods,
     methods.MomentsMethods,
@@ -39,10 +43,23 @@ class Numba(  # pylint: disable=too-many-ancestors,duplicate-code
     default_croupier = "local"
 
     def __init__(
-        self, formulae=None, *, double_precision=True, override_jit_flags=None
+        self,
+        formulae=None,
+        *,
+        double_precision=True,
+        override_jit_flags=None,
+        asynchronous_rng=False,
+        rng="default",
     ):
+        """`asynchronous_rng` selects `PySDM.backends.impl_numba.random.AsyncRandom`
+        (random numbers generated in advance on a background thread); `rng="philox"`
+        selects `PySDM.backends.impl_numba.random.PhiloxRandom` (counter-based
+        generator filling storages in parallel) instead of the NumPy default one"""
         if not double_precision:
             raise NotImplementedError()
+        self.Random = self.__random_class(  # pylint: disable=invalid-name
+            rng, asynchronous_rng
+        )
         self.formulae = formulae or Formulae()
         self.formulae_flattened = self.formulae.flatten
 
@@ -93,10 +110,12 @@ class Numba(  # pylint: disable=too-many-ancestors,duplicate-code
         }
 
         methods.CollisionsMethods.__init__(self)
+        methods.FusedCollisionsMethods.__init__(self)
         methods.FragmentationMethods.__init__(self)
         methods.PairMethods.__init__(self)
         methods.IndexMethods.__init__(self)
         methods.PhysicsMethods.__init__(self)
+        methods.RandomMethods.__init__(self)
         methods.CondensationMethods.__init__(self)
         methods.ChemistryMethods.__init__(self)
         methods.MomentsMethods.__init__(self)
@@ -106,3 +125,14 @@ class Numba(  # pylint: disable=too-many-ancestors,duplicate-code
         methods.IsotopeMethods.__init__(self)
         methods.SeedingMethods.__init__(self)
         methods.DepositionMethods.__init__(self)
+
+    def __random_class(self, rng, asynchronous_rng):
+        if rng not in ("default", "philox"):
+            raise ValueError(f"unknown rng: {rng}")
+        if rng == "philox":
+            if asynchronous_rng:
+                raise ValueError(
+                    "asynchronous_rng is available for the default rng only"
+                )
+            return partial(PhiloxRandom, backend=self)
+        return AsyncRandom if asynchronous_rng else ImportedRandom
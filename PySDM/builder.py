@@ -7,6 +7,7 @@ import inspect
 import numpy as np
 
 from PySDM.attributes.impl.attribute_registry import get_attribute_class
+from PySDM.impl import checkpoint, warmup as warmup_impl
 from PySDM.impl.particle_attributes_factory import ParticleAttributesFactory
 from PySDM.impl.wall_timer import WallTimer
 from PySDM.initialisation.discretise_multiplicities import (  # TODO #324
@@ -70,9 +71,18 @@ class Builder:
         attributes: dict,
         products: tuple = (),
         int_caster=discretise_multiplicities,
+        warmup: bool = False,
     ):
+        """returns a `PySDM.particulator.Particulator` instance with the given initial
+        values of attributes and given products; with `warmup=True`, all kernels are
+        JIT-compiled upfront (see `PySDM.impl.warmup`) and the warm-up report is stored
+        in the `warmup_report` attribute of the returned particulator"""
         assert self.particulator.environment is not None
 
+        warmup_report = (
+            self.__warmup(attributes, products, int_caster) if warmup else None
+        )
+
         if "volume" in attributes and "water mass" not in attributes:
             assert self.particulator.formulae.particle_shape_and_density.__name__ in (
                 LiquidSpheres.__name__,
@@ -116,7 +126,7 @@ class Builder:
                 )
             )
         attributes["multiplicity"] = int_caster(attributes["multiplicity"])
-        if self.particulator.mesh.dimension == 0:
+        if self.particulator.mesh.dimension == 0 and "cell id" not in attributes:
             attributes["cell id"] = np.zeros_like(
                 attributes["multiplicity"], dtype=np.int64
             )
@@ -132,4 +142,41 @@ class Builder:
             self.particulator.attributes.healthy = False
             self.particulator.attributes.sanitize()
 
+        self.particulator.warmup_report = warmup_report
         return self.particulator
+
+    def __warmup(self, attributes, products, int_caster):
+        """builds a twin particulator with a handful of super-particles, sharing
+        the backend with the one being built and using copies of its environment,
+        dynamics and products (hence each of the given objects is registered with
+        one particulator only), and warms it up (see `PySDM.impl.warmup`)"""
+        twin_attributes = warmup_impl.dummy_attributes(attributes)
+        environment, dynamics, products = warmup_impl.detached_copies(
+            self.particulator, products
+        )
+        twin = Builder(
+            n_sd=len(twin_attributes["multiplicity"]),
+            backend=self.particulator.backend,
+            environment=environment,
+        )
+        twin.req_attr_names = list(self.req_attr_names)
+        twin.aerosol_radius_threshold = self.aerosol_radius_threshold
+        for dynamic in dynamics:
+            twin.add_dynamic(dynamic)
+        return warmup_impl.warmup(
+            twin.build(
+                attributes=twin_attributes, products=products, int_caster=int_caster
+            )
+        )
+
+    def from_checkpoint(self, path, products: tuple = ()):
+        """builds a particulator (with environment and dynamics set up as for the one
+        which saved the checkpoint) and restores its state from the checkpoint file
+        written by `PySDM.particulator.Particulator.save_checkpoint`"""
+        with np.load(path) as data:
+            particulator = self.build(
+                attributes=checkpoint.load_attributes(self.particulator, data),
+                products=products,
+            )
+            checkpoint.restore(particulator, data)
+        return particulator
@@ -3,10 +3,15 @@ environment-sync triggering class
 """
 
 from PySDM.dynamics.impl import register_dynamic
+from PySDM.impl.scheduler import ENVIRONMENT
 
 
 @register_dynamic()
 class AmbientThermodynamics:
+    eulerian_fields = ("thd", "water_vapour_mixing_ratio")
+    reads = ()
+    writes = (ENVIRONMENT,)
+
     def __init__(self):
         self.particulator = None
 
@@ -1,5 +1,11 @@
 """
-Hoppel-gap resolving aqueous-phase chemistry (incl. SO2 oxidation)
+Hoppel-gap resolving aqueous-phase chemistry (incl. SO2 oxidation);
+with `adaptive=True`, the number of substeps is chosen for each cell separately
+(starting from `n_substep` and retained across timesteps) so that the relative
+change of oxidant and S(IV) amounts in any droplet within a substep of the
+explicit-Euler oxidation scheme does not exceed `substep_rtol`: substeps exceeding
+it are rejected and redone with half the length (down to `dt / n_substep_max`),
+and each substep involves only the super-droplets in cells with substeps left
 """
 
 from collections import namedtuple
@@ -14,14 +20,36 @@ from PySDM.dynamics.impl.chemistry_utils import (
     SpecificGravities,
 )
 from PySDM.dynamics.impl import register_dynamic
+from PySDM.impl.scheduler import ENVIRONMENT, IDX
 
-DEFAULTS = namedtuple("_", ("pH_min", "pH_max", "pH_rtol", "ionic_strength_threshold"))(
-    pH_min=-1.0, pH_max=14.0, pH_rtol=1e-6, ionic_strength_threshold=0.02 * M
+DEFAULTS = namedtuple(
+    "_",
+    (
+        "pH_min",
+        "pH_max",
+        "pH_rtol",
+        "ionic_strength_threshold",
+        "substep_rtol",
+        "n_substep_max",
+    ),
+)(
+    pH_min=-1.0,
+    pH_max=14.0,
+    pH_rtol=1e-6,
+    ionic_strength_threshold=0.02 * M,
+    substep_rtol=0.1,
+    n_substep_max=1024,
 )
 
 
 @register_dynamic()
 class AqueousChemistry:  # pylint: disable=too-many-instance-attributes
+    checkpoint_fields = ("environment_mixing_ratios", "counters")
+
+    eulerian_fields = ()
+    reads = ("volume", "multiplicity", "pH", "cell id", ENVIRONMENT)
+    writes = (IDX, *("moles_" + key for key in AQUEOUS_COMPOUNDS))
+
     def __init__(
         self,
         *,
@@ -34,6 +62,9 @@ class AqueousChemistry:  # pylint: disable=too-many-instance-attributes
         pH_H_min=None,
         pH_H_max=None,
         pH_rtol=DEFAULTS.pH_rtol,
+        adaptive=False,
+        substep_rtol=DEFAULTS.substep_rtol,
+        n_substep_max=DEFAULTS.n_substep_max,
     ):
         self.environment_mole_fractions = environment_mole_fractions
         self.environment_mixing_ratios = {}
@@ -43,6 +74,14 @@ class AqueousChemistry:  # pylint: disable=too-many-instance-attributes
         self.system_type = system_type
         assert isinstance(n_substep, int) and n_substep > 0
         self.n_substep = n_substep
+        self.adaptive = adaptive
+        self.substep_rtol = substep_rtol
+        assert n_substep <= n_substep_max
+        self.n_substep_max = n_substep_max
+        self.counters = {}
+        self.relative_change = None
+        self.saved_state = None
+        self.active_droplets = None
         self.dry_rho = dry_rho
         self.dry_molar_mass = dry_molar_mass
         self.ionic_strength_threshold = ionic_strength_threshold
@@ -62,10 +101,9 @@ class AqueousChemistry:  # pylint: disable=too-many-instance-attributes
             self.particulator.formulae.constants
         )
 
-        for key, compound in GASEOUS_COMPOUNDS.items():
-            shape = (1,)
+        for compound in GASEOUS_COMPOUNDS.values():
             self.environment_mixing_ratios[compound] = np.full(
-                shape,
+                self.particulator.mesh.n_cell,
                 self.particulator.formulae.trivia.mole_fraction_2_mixing_ratio(
                     self.environment_mole_fractions[compound],
                     self.specific_gravities[compound],
@@ -97,33 +135,117 @@ class AqueousChemistry:  # pylint: disable=too-many-instance-attributes
         self.do_chemistry_flag = self.particulator.Storage.empty(
             self.particulator.n_sd, dtype=bool
         )
+        self.counters["n_substeps"] = self.particulator.Storage.empty(
+            self.particulator.mesh.n_cell, dtype=int
+        )
+        self.counters["n_substeps"][:] = self.n_substep
+        if self.adaptive:
+            self.relative_change = self.particulator.Storage.empty(
+                self.particulator.mesh.n_cell, dtype=float
+            )
+            self.saved_state = (
+                {
+                    key: self.particulator.Storage.empty(
+                        self.particulator.n_sd, dtype=float
+                    )
+                    for key in GASEOUS_COMPOUNDS
+                },
+                {
+                    compound: np.empty(self.particulator.mesh.n_cell)
+                    for compound in GASEOUS_COMPOUNDS.values()
+                },
+            )
 
     def __call__(self):
         self.particulator.chem_recalculate_cell_data(
             equilibrium_consts=self.equilibrium_consts,
             kinetic_consts=self.kinetic_consts,
         )
-        for _ in range(self.n_substep):
-            self.particulator.chem_recalculate_drop_data(
-                equilibrium_consts=self.equilibrium_consts,
-                dissociation_factors=self.dissociation_factors,
+        if self.adaptive:
+            self.__adaptive_substeps()
+        else:
+            for _ in range(self.n_substep):
+                self.__substep(timestep=self.particulator.dt / self.n_substep)
+
+    def __substep(self, *, timestep, cells=None, max_relative_change=None):
+        self.particulator.chem_recalculate_drop_data(
+            equilibrium_consts=self.equilibrium_consts,
+            dissociation_factors=self.dissociation_factors,
+            droplets=self.active_droplets,
+        )
+        self.particulator.dissolution(
+            gaseous_compounds=GASEOUS_COMPOUNDS,
+            system_type=self.system_type,
+            dissociation_factors=self.dissociation_factors,
+            environment_mixing_ratios=self.environment_mixing_ratios,
+            timestep=timestep,
+            do_chemistry_flag=self.do_chemistry_flag,
+            cells=cells,
+        )
+        self.particulator.chem_recalculate_drop_data(
+            equilibrium_consts=self.equilibrium_consts,
+            dissociation_factors=self.dissociation_factors,
+            droplets=self.active_droplets,
+        )
+        self.particulator.oxidation(
+            kinetic_consts=self.kinetic_consts,
+            equilibrium_consts=self.equilibrium_consts,
+            dissociation_factors=self.dissociation_factors,
+            do_chemistry_flag=self.do_chemistry_flag,
+            timestep=timestep,
+            cells=cells,
+            relative_change=self.relative_change,
+            max_relative_change=max_relative_change,
+        )
+
+    def __adaptive_substeps(self):
+        """integrates each cell with its own substep length (starting with
+        `dt / counters["n_substeps"]`), in each substep handling only the cells
+        with substeps left; substeps are saved before and restored if rejected"""
+        n_substeps = self.counters["n_substeps"].to_ndarray()
+        n_left = n_substeps.copy()
+        max_relative_change = np.zeros(len(n_substeps))
+        cells = np.flatnonzero(n_left)
+        while len(cells) != 0:
+            self.active_droplets = (
+                None
+                if len(cells) == len(n_left)
+                else self.particulator.chem_droplets(cells)
             )
-            self.particulator.dissolution(
-                gaseous_compounds=GASEOUS_COMPOUNDS,
-                system_type=self.system_type,
-                dissociation_factors=self.dissociation_factors,
-                environment_mixing_ratios=self.environment_mixing_ratios,
-                timestep=self.particulator.dt / self.n_substep,
-                do_chemistry_flag=self.do_chemistry_flag,
+            state = {
+                "gaseous_compounds": GASEOUS_COMPOUNDS,
+                "environment_mixing_ratios": self.environment_mixing_ratios,
+                "saved": self.saved_state,
+            }
+            self.particulator.chem_save_state(cells=cells, **state)
+            threshold = np.where(
+                2 * n_substeps <= self.n_substep_max, self.substep_rtol, np.inf
             )
-            self.particulator.chem_recalculate_drop_data(
-                equilibrium_consts=self.equilibrium_consts,
-                dissociation_factors=self.dissociation_factors,
+            self.__substep(
+                timestep=self.particulator.dt / n_substeps,
+                cells=cells,
+                max_relative_change=threshold,
             )
-            self.particulator.oxidation(
-                kinetic_consts=self.kinetic_consts,
-                equilibrium_consts=self.equilibrium_consts,
-                dissociation_factors=self.dissociation_factors,
-                do_chemistry_flag=self.do_chemistry_flag,
-                timestep=self.particulator.dt / self.n_substep,
+            relative_change = self.relative_change.to_ndarray()[cells]
+            rejected = relative_change > threshold[cells]
+            if rejected.any():
+                self.particulator.chem_restore_state(cells=cells[rejected], **state)
+                n_substeps[cells[rejected]] *= 2
+                n_left[cells[rejected]] *= 2
+            accepted = cells[~rejected]
+            max_relative_change[accepted] = np.maximum(
+                max_relative_change[accepted], relative_change[~rejected]
             )
+            n_left[accepted] -= 1
+            cells = np.flatnonzero(n_left)
+        self.active_droplets = None
+        self.__adapt_substeps(n_substeps, max_relative_change)
+
+    def __adapt_substeps(self, n_substeps, max_relative_change):
+        """the relative change within a substep is proportional to its length,
+        hence the substep count is scaled by the ratio of the largest accepted
+        change to `substep_rtol` (decreasing it at most twofold per timestep)"""
+        estimate = np.ceil(n_substeps * max_relative_change / self.substep_rtol)
+        self.counters["n_substeps"][:] = np.clip(
+            np.maximum(estimate, n_substeps // 2), 1, self.n_substep_max
+        ).astype(int)
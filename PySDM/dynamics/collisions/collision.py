@@ -39,6 +39,23 @@ DEFAULTS = namedtuple(
 
 @register_dynamic()
 class Collision:  # pylint: disable=too-many-instance-attributes
+    checkpoint_fields = (
+        "rnd_opt_coll",
+        "rnd_opt_proc",
+        "rnd_opt_frag",
+        "dt_left",
+        "stats_n_substep",
+        "stats_dt_min",
+        "collision_rate",
+        "collision_rate_deficit",
+        "coalescence_rate",
+        "breakup_rate",
+        "breakup_rate_deficit",
+    )
+
+    eulerian_fields = ()
+    reads = writes = None  # collision kernels may access any attribute
+
     def __init__(
         self,
         *,
@@ -53,7 +70,23 @@ class Collision:  # pylint: disable=too-many-instance-attributes
         dt_coal_range=DEFAULTS.dt_coal_range,
         enable_breakup: bool = True,
         warn_overflows: bool = True,
+        fused_kernel: bool = True,
+        fused: bool = False,
     ):
+        """`fused_kernel` enables (if supported by both the collision kernel and the
+        backend) evaluation of collision probabilities in a single pass over pairs;
+        `fused` selects the monolithic SDM step (pair formation, probabilities, gamma
+        and coalescence in one backend call) available for coalescence-only setups;
+        `croupier` is one of "global", "local" (per-cell Fisher-Yates shuffle at each
+        step) or "local_incremental", defaults to the backend's `default_croupier`
+        (never "local_incremental"); "local_incremental" is an approximate croupier,
+        strictly opt-in: the per-cell permutation is reused across steps and only
+        cheaply re-shuffled (see `PySDM.impl.particle_attributes`), hence while each
+        candidate pair is equally likely in any given step, pairings in consecutive
+        steps are not independent - a pair formed in one step is never formed in
+        the next one, and each permutation is an affine image of the previous one
+        (up to swaps within pairs) - which biases statistics of collision events
+        over consecutive steps with respect to the SDM with independent shuffles"""
         assert substeps == 1 or adaptive is False
 
         self.particulator = None
@@ -64,6 +97,8 @@ class Collision:  # pylint: disable=too-many-instance-attributes
         self.max_multiplicity = DEFAULTS.max_multiplicity
 
         self.collision_kernel = collision_kernel
+        self.fused_kernel = fused_kernel
+        self.fused = fused
         self.compute_coalescence_efficiency = coalescence_efficiency
         self.compute_breakup_efficiency = breakup_efficiency
         self.compute_number_of_fragments = fragmentation_function
@@ -112,6 +147,11 @@ class Collision:  # pylint: disable=too-many-instance-attributes
 
         if self.particulator.n_sd < 2:
             raise ValueError("No one to collide with!")
+        if np.ndim(self.particulator.mesh.dv) != 0:
+            raise NotImplementedError(
+                "collisions require a domain-wide cell volume"
+                " (member-specific volumes of ParcelEnsemble are not supported)"
+            )
         if self.dt_coal_range[1] > self.particulator.dt:
             self.dt_coal_range = (self.dt_coal_range[0], self.particulator.dt)
         assert self.dt_coal_range[0] <= self.dt_coal_range[1]
@@ -137,9 +177,29 @@ class Collision:  # pylint: disable=too-many-instance-attributes
 
         self.rnd_opt_coll.register(builder)
         self.collision_kernel.register(builder)
+        self.fused_kernel = (
+            self.fused_kernel
+            and hasattr(self.collision_kernel, "pair_kernel")
+            and hasattr(self.particulator.backend, "fused_probabilities_of_collision")
+        )
+        if self.fused and (
+            self.enable_breakup
+            or not hasattr(self.collision_kernel, "pair_kernel")
+            or not hasattr(self.particulator.backend, "fused_collision_coalescence")
+        ):
+            raise ValueError(
+                "fused SDM step is available only for coalescence-only setups"
+                " with kernels defining `pair_kernel` (and not on all backends)"
+            )
 
         if self.croupier is None:
             self.croupier = self.particulator.backend.default_croupier
+        if self.croupier == "local_incremental" and not hasattr(
+            self.particulator.backend, "shuffle_local_incremental"
+        ):
+            raise ValueError(
+                "local_incremental croupier is not available on this backend"
+            )
 
         counter_args = (np.zeros(self.particulator.mesh.n_cell, dtype=int),)
         self.collision_rate = self.particulator.Storage.from_ndarray(*counter_args)
@@ -194,7 +254,19 @@ class Collision:  # pylint: disable=too-many-instance-attributes
                 self.rnd_opt_frag.reset()
 
     def step(self):
-        pairs_rand, rand = self.rnd_opt_coll.get_random_arrays()
+        pairs_rand, rand = self.rnd_opt_coll.get_random_arrays(
+            pairs_rand_length=(
+                self.particulator.attributes.permutation_u01_length(
+                    local=True, incremental=True
+                )
+                if self.croupier == "local_incremental"
+                else None
+            )
+        )
+
+        if self.fused:
+            self.fused_step(pairs_rand, rand)
+            return
 
         self.toss_candidate_pairs_and_sort_within_pair_by_multiplicity(
             self.is_first_in_pair, pairs_rand
@@ -233,10 +305,38 @@ class Collision:  # pylint: disable=too-many-instance-attributes
             max_multiplicity=self.max_multiplicity,
         )
 
+    def fused_step(self, pairs_rand, rand):
+        self.__permutation(pairs_rand)
+        self.particulator.fused_collision_coalescence(
+            collision_kernel=self.collision_kernel,
+            is_first_in_pair=self.is_first_in_pair,
+            rand=rand,
+            gamma=self.gamma,
+            norm_factor=self.norm_factor_temp,
+            n_substeps=self.__substeps,
+            adaptive=self.adaptive,
+            dt_left=self.dt_left,
+            dt_range=self.dt_coal_range,
+            stats_n_substep=self.stats_n_substep,
+            stats_dt_min=self.stats_dt_min,
+            collision_rate=self.collision_rate,
+            collision_rate_deficit=self.collision_rate_deficit,
+            coalescence_rate=self.coalescence_rate,
+        )
+        if self.adaptive and self.stats_dt_min.amin() == self.dt_coal_range[0]:
+            warnings.warn("adaptive time-step reached dt_min")
+
+    def __permutation(self, u01):
+        self.particulator.attributes.permutation(
+            u01,
+            local=self.croupier in ("local", "local_incremental"),
+            incremental=self.croupier == "local_incremental",
+        )
+
     def toss_candidate_pairs_and_sort_within_pair_by_multiplicity(
         self, is_first_in_pair, u01
     ):
-        self.particulator.attributes.permutation(u01, self.croupier == "local")
+        self.__permutation(u01)
         is_first_in_pair.update(
             self.particulator.attributes.cell_start,
             self.particulator.attributes.cell_idx,
@@ -248,10 +348,30 @@ class Collision:  # pylint: disable=too-many-instance-attributes
 
     def compute_probabilities_of_collision(self, is_first_in_pair, out):
         """eq. (20) in [Shima et al. 2009](https://doi.org/10.1002/qj.441)"""
+        if self.fused_kernel:
+            attributes = self.particulator.attributes
+            self.particulator.backend.fused_probabilities_of_collision(
+                prob=out,
+                pair_kernel=self.collision_kernel.pair_kernel,
+                pair_kernel_args=self.collision_kernel.pair_kernel_args,
+                attributes=tuple(
+                    attributes[name]
+                    for name in self.collision_kernel.pair_kernel_attributes
+                ),
+                multiplicity=attributes["multiplicity"],
+                is_first_in_pair=is_first_in_pair,
+                cell_id=attributes["cell id"],
+                cell_idx=attributes.cell_idx,
+                cell_start=attributes.cell_start,
+                norm_factor=self.norm_factor_temp,
+                timestep=self.particulator.dt,
+                dv=self.particulator.mesh.dv,
+            )
+            return
         self.collision_kernel(self.kernel_temp, is_first_in_pair)
         out.max(self.particulator.attributes["multiplicity"], is_first_in_pair)
         out *= self.kernel_temp
-        self.particulator.normalize(out, self.norm_factor_temp)
+        self.particulator.normalize(out, self.norm_factor_temp, is_first_in_pair)
 
     def compute_n_fragment(self, n_fragment, u01, is_first_in_pair):
         self.compute_number_of_fragments(n_fragment, u01, is_first_in_pair)
@@ -302,6 +422,8 @@ class Coalescence(Collision):
         substeps: int = DEFAULTS.substeps,
         adaptive: bool = DEFAULTS.adaptive,
         dt_coal_range=DEFAULTS.dt_coal_range,
+        fused_kernel: bool = True,
+        fused: bool = False,
     ):
         breakup_efficiency = ConstEb(Eb=0)
         fragmentation_function = AlwaysN(n=1)
@@ -316,6 +438,8 @@ class Coalescence(Collision):
             adaptive=adaptive,
             dt_coal_range=dt_coal_range,
             enable_breakup=False,
+            fused_kernel=fused_kernel,
+            fused=fused,
         )
 
 
@@ -332,6 +456,7 @@ class Breakup(Collision):
         adaptive: bool = DEFAULTS.adaptive,
         dt_coal_range=DEFAULTS.dt_coal_range,
         warn_overflows=True,
+        fused_kernel: bool = True,
     ):
         coalescence_efficiency = ConstEc(Ec=0.0)
         breakup_efficiency = ConstEb(Eb=1.0)
@@ -346,4 +471,5 @@ class Breakup(Collision):
             adaptive=adaptive,
             dt_coal_range=dt_coal_range,
             warn_overflows=warn_overflows,
+            fused_kernel=fused_kernel,
         )
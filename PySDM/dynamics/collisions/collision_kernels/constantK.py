@@ -11,5 +11,15 @@ class ConstantK:
     def __call__(self, output, is_first_in_pair):
         output.fill(self.a)
 
+    pair_kernel_attributes = ()
+
+    @property
+    def pair_kernel_args(self):
+        return (self.a,)
+
+    @staticmethod
+    def pair_kernel(args, _, __, ___, ____):
+        return args[0]
+
     def register(self, builder):
         self.particulator = builder.particulator
@@ -2,6 +2,8 @@
 basic geometric kernel
 """
 
+import numpy as np
+
 from PySDM.dynamics.collisions.collision_kernels.impl.gravitational import Gravitational
 from PySDM.physics import constants as const
 
@@ -20,3 +22,13 @@ class Geometric(Gravitational):
             self.particulator.attributes["relative fall velocity"], is_first_in_pair
         )
         output *= self.pair_tmp
+
+    pair_kernel_attributes = ("radius", "relative fall velocity")
+
+    @property
+    def pair_kernel_args(self):
+        return (const.PI * self.collection_efficiency,)
+
+    @staticmethod
+    def pair_kernel(args, r_j, r_k, v_j, v_k):
+        return args[0] * (r_j + r_k) ** 2 * np.abs(v_j - v_k)
@@ -15,6 +15,16 @@ class Golovin:
         output.sum(self.particulator.attributes["volume"], is_first_in_pair)
         output *= self.b
 
+    pair_kernel_attributes = ("volume",)
+
+    @property
+    def pair_kernel_args(self):
+        return (self.b,)
+
+    @staticmethod
+    def pair_kernel(args, v_j, v_k, _, __):
+        return args[0] * (v_j + v_k)
+
     def register(self, builder):
         self.particulator = builder.particulator
         builder.request_attribute("volume")
@@ -1,5 +1,7 @@
 """common parent class for collision kernels specified using Berry's parameterization"""
 
+import numpy as np
+
 from PySDM.physics import constants as const
 
 from .gravitational import Gravitational
@@ -28,3 +30,29 @@ class Parameterized(Gravitational):
             self.particulator.attributes["relative fall velocity"], is_first_in_pair
         )
         output *= self.pair_tmp
+
+    pair_kernel_attributes = ("radius", "relative fall velocity")
+
+    @property
+    def pair_kernel_args(self):
+        return (*(float(param) for param in self.params), const.si.um)
+
+    @staticmethod
+    def pair_kernel(args, r_j, r_k, v_j, v_k):  # pylint: disable=too-many-locals
+        """same as the chain of operations in `__call__` (including Berry's collection
+        efficiency as in the backend `linear_collection_efficiency` method),
+        for a single pair"""
+        A, B, D1, D2, E1, E2, F1, F2, G1, G2, G3, Mf, Mg, unit = args
+        r_max = max(r_j, r_k)
+        r = r_max / unit
+        p = min(r_j, r_k) / r_max
+        efficiency = 0.0
+        if p not in (0, 1):
+            G = (G1 / r) ** Mg + G2 + G3 * r
+            Gp = (1 - p) ** G
+            if Gp != 0:
+                D = D1 / r**D2
+                E = E1 / r**E2
+                F = (F1 / r) ** Mf + F2
+                efficiency = max(0.0, A + B * p + D / p**F + E / Gp)
+        return efficiency**2 * const.PI * r_max**2 * np.abs(v_j - v_k)
@@ -14,6 +14,16 @@ class Linear:
         output *= self.b
         output += self.a
 
+    pair_kernel_attributes = ("volume",)
+
+    @property
+    def pair_kernel_args(self):
+        return (self.a, self.b)
+
+    @staticmethod
+    def pair_kernel(args, v_j, v_k, _, __):
+        return args[1] * (v_j + v_k) + args[0]
+
     def register(self, builder):
         self.particulator = builder.particulator
         builder.request_attribute("volume")
@@ -37,6 +37,23 @@ class Long1974:
                 self.particulator.n_sd // 2, dtype=bool
             )
 
+    pair_kernel_attributes = ("volume", "radius")
+
+    @property
+    def pair_kernel_args(self):
+        return (self.lc, self.sc, self.rt)
+
+    @staticmethod
+    def pair_kernel(args, v_j, v_k, r_j, r_k):
+        lin_coeff, sq_coeff, r_thres = args
+        v_lg = max(v_j, v_k)
+        v_ratio = min(v_j, v_k)
+        if v_lg != 0:
+            v_ratio /= v_lg
+        if max(r_j, r_k) < r_thres:
+            return sq_coeff * (v_ratio**2 + 1) * v_lg**2
+        return lin_coeff * (v_ratio + 1) * v_lg
+
     def __call__(self, output, is_first_in_pair):
         # get smaller and larger radii, volume
         self.arrays["r_lg"].max(
@@ -2,6 +2,8 @@
 basic geometric kernel (not taking fall velocity into account)
 """
 
+import numpy as np
+
 
 class SimpleGeometric:
     def __init__(self, C):
@@ -24,3 +26,13 @@ class SimpleGeometric:
         output *= self.pair_tmp
         self.pair_tmp.distance(self.particulator.attributes["area"], is_first_in_pair)
         output *= self.pair_tmp
+
+    pair_kernel_attributes = ("radius", "area")
+
+    @property
+    def pair_kernel_args(self):
+        return (self.C,)
+
+    @staticmethod
+    def pair_kernel(args, r_j, r_k, a_j, a_k):
+        return args[0] * (r_j + r_k) ** 2 * np.abs(a_j - a_k)
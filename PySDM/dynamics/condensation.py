@@ -1,7 +1,13 @@
 """
 bespoke condensational growth solver
 with implicit-in-particle-size integration and adaptive timestepping
-as in [Bartman 2020 (MSc thesis, Section 3.3)](https://www.ap.uj.edu.pl/diplomas/attachments/file/download/125485)
+as in [Bartman 2020 (MSc thesis, Section 3.3)](https://www.ap.uj.edu.pl/diplomas/attachments/file/download/125485);
+cells are processed in parallel with the following `schedule` options for distributing
+them among threads:
+- `"static"`: round-robin in the order of cell ids,
+- `"dynamic"`: round-robin in the order of substep counts from the previous timestep,
+- `"balanced"`: cost-weighted, with the cost of a cell estimated as the product of
+  the substep count from the previous timestep and the number of super-particles
 """  # pylint: disable=line-too-long
 
 from collections import namedtuple
@@ -10,6 +16,7 @@ import numpy as np
 
 from PySDM.physics import si
 from PySDM.dynamics.impl import register_dynamic
+from PySDM.impl.scheduler import ENVIRONMENT, IDX
 
 DEFAULTS = namedtuple("_", ("rtol_x", "rtol_thd", "cond_range", "schedule"))(
     rtol_x=1e-6,
@@ -21,6 +28,22 @@ DEFAULTS = namedtuple("_", ("rtol_x", "rtol_thd", "cond_range", "schedule"))(
 
 @register_dynamic()
 class Condensation:  # pylint: disable=too-many-instance-attributes
+    checkpoint_fields = ("counters", "rh_max", "success", "cell_order")
+
+    eulerian_fields = ("thd", "water_vapour_mixing_ratio")
+    reads = (
+        "multiplicity",
+        "signed water mass",
+        "dry volume",
+        "kappa",
+        "dry volume organic fraction",
+        "critical volume",
+        "Reynolds number",
+        "cell id",
+        ENVIRONMENT,
+    )
+    writes = ("signed water mass", IDX, ENVIRONMENT)
+
     def __init__(
         self,
         *,
@@ -55,6 +78,7 @@ class Condensation:  # pylint: disable=too-many-instance-attributes
         self.max_iters = max_iters
 
         self.cell_order = None
+        self.cell_cost = None
 
         self.update_thd = update_thd
 
@@ -99,6 +123,10 @@ class Condensation:  # pylint: disable=too-many-instance-attributes
                 self.cell_order = np.argsort(self.counters["n_substeps"])
             elif self.schedule == "static":
                 pass
+            elif self.schedule == "balanced":
+                self.cell_cost = np.maximum(
+                    self.counters["n_substeps"].to_ndarray(), 1
+                ) * np.diff(self.particulator.attributes.cell_start.to_ndarray())
             else:
                 raise NotImplementedError()
 
@@ -109,6 +137,7 @@ class Condensation:  # pylint: disable=too-many-instance-attributes
                 RH_max=self.rh_max,
                 success=self.success,
                 cell_order=self.cell_order,
+                cell_cost=self.cell_cost,
             )
             if not self.success.all():
                 raise RuntimeError("Condensation failed")
@@ -4,7 +4,15 @@ particle displacement due to advection by the flow & sedimentation
 adaptive time-stepping controlled by comparing implicit-Euler (I)
 and explicit-Euler (E) maximal displacements with:
 rtol > |(I - E) / E|
-(see eqs 13-16 in [Arabas et al. 2015](https://doi.org/10.5194/gmd-8-1677-2015))
+(see eqs 13-16 in [Arabas et al. 2015](https://doi.org/10.5194/gmd-8-1677-2015));
+with `local_substeps=True`, the number of substeps is evaluated for each grid cell
+and each super-particle is displaced with the number of substeps of the cell in which
+it resides at the beginning of the timestep, all its substeps being carried out within
+a single backend call (hence particles in quiescent regions are not affected by
+substepping triggered elsewhere in the domain);
+in domain-decomposed simulations (see `PySDM.environments.domain_decomposition`),
+the number of substeps is agreed across all slabs and super-particles leaving the slab
+are migrated to the neighbouring one after each substep
 """
 
 from collections import namedtuple
@@ -12,18 +20,52 @@ from collections import namedtuple
 import numpy as np
 
 from PySDM.dynamics.impl import register_dynamic
+from PySDM.impl.scheduler import IDX
 
-DEFAULTS = namedtuple("_", ("rtol", "adaptive"))(rtol=1e-2, adaptive=True)
+DEFAULTS = namedtuple("_", ("rtol", "adaptive", "local_substeps"))(
+    rtol=1e-2, adaptive=True, local_substeps=False
+)
+
+
+def _n_substeps(abs_delta_courant, rtol):
+    """returns the (power-of-two) number of substeps needed to meet the `rtol` criterion
+    for each element of the arrays of absolute Courant number differences (one per
+    dimension, all of the same shape)"""
+    n_substeps = np.ones(abs_delta_courant[0].shape, dtype=np.int64)
+    while True:
+        error_estimate = np.zeros(n_substeps.shape)
+        for component in abs_delta_courant:
+            delta = component / n_substeps
+            with np.errstate(divide="ignore"):
+                error_estimate = np.maximum(
+                    error_estimate,
+                    np.where(delta == 0, 0, 1 / (1 / delta - 1)),
+                )
+        exceeded = error_estimate >= rtol
+        if not exceeded.any():
+            return n_substeps
+        n_substeps[exceeded] *= 2
 
 
 @register_dynamic()
 class Displacement:  # pylint: disable=too-many-instance-attributes
+    checkpoint_fields = (
+        "courant",
+        "precipitation_mass_in_last_step",
+        "_n_substeps",
+        "n_substeps_in_cell",
+        "n_substeps_of_droplet",
+    )
+
+    eulerian_fields = ("courant",)
+
     def __init__(
         self,
         enable_sedimentation=False,
         precipitation_counting_level_index: int = 0,
         adaptive=DEFAULTS.adaptive,
         rtol=DEFAULTS.rtol,
+        local_substeps=DEFAULTS.local_substeps,
     ):  # pylint: disable=too-many-arguments
         self.particulator = None
         self.enable_sedimentation = enable_sedimentation
@@ -39,9 +81,35 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
         self.rtol = rtol
         self._n_substeps = 1
 
+        if local_substeps and not adaptive:
+            raise ValueError("local_substeps requires adaptive=True")
+        self.local_substeps = local_substeps
+        self.n_substeps_in_cell = None
+        self.n_substeps_of_droplet = None
+        self.domain = None
+
+    @property
+    def reads(self):
+        return (
+            "relative fall velocity",
+            "cell id",
+            *(("water mass", "multiplicity") if self.enable_sedimentation else ()),
+        )
+
+    @property
+    def writes(self):
+        if self.domain is not None:
+            return None  # migration affects all attributes
+        return ("cell origin", "position in cell", "cell id", IDX)
+
     def register(self, builder):
         builder.request_attribute("relative fall velocity")
         self.particulator = builder.particulator
+        self.domain = getattr(builder.particulator.environment, "domain", None)
+        if self.domain is not None and self.local_substeps:
+            raise NotImplementedError(
+                "local_substeps not supported in domain-decomposed simulations"
+            )
         self.dimension = len(builder.particulator.environment.mesh.grid)
         self.grid = self.particulator.Storage.from_ndarray(
             np.array(builder.particulator.environment.mesh.grid, dtype=np.int64)
@@ -71,31 +139,36 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
         self.temp = self.particulator.Storage.from_ndarray(
             np.zeros((self.dimension, self.particulator.n_sd), dtype=np.int64)
         )
+        if self.local_substeps:
+            self.n_substeps_in_cell = self.particulator.Storage.from_ndarray(
+                np.ones(self.particulator.mesh.n_cell, dtype=np.int64)
+            )
+            self.n_substeps_of_droplet = self.particulator.Storage.from_ndarray(
+                np.ones(self.particulator.n_sd, dtype=np.int64)
+            )
 
     def upload_courant_field(self, courant_field):
         for i, component in enumerate(courant_field):
             self.courant[i].upload(component)
 
-        # note: to be improved, should make n_substeps variable in space as in cond/coal
         if self.adaptive:
-            error_estimate = self.rtol
-            self._n_substeps = 0.5
-            while error_estimate >= self.rtol:
-                self._n_substeps = int(self._n_substeps * 2)
-                error_estimate = 0
-                for i, courant_component in enumerate(courant_field):
-                    max_abs_delta_courant = np.amax(
-                        np.abs(np.diff(courant_component, axis=i))
-                    )
-                    max_abs_delta_courant /= self._n_substeps
-                    error_estimate = max(
-                        error_estimate,
-                        (
-                            0
-                            if max_abs_delta_courant == 0
-                            else 1 / (1 / max_abs_delta_courant - 1)
-                        ),
+            abs_delta_courant = [
+                np.abs(np.diff(courant_component, axis=i))
+                for i, courant_component in enumerate(courant_field)
+            ]
+            if self.local_substeps:
+                n_substeps_in_cell = _n_substeps(abs_delta_courant, self.rtol)
+                self.n_substeps_in_cell.upload(n_substeps_in_cell.ravel())
+                self._n_substeps = int(np.amax(n_substeps_in_cell))
+            else:
+                self._n_substeps = int(
+                    _n_substeps(
+                        [np.amax(component) for component in abs_delta_courant],
+                        self.rtol,
                     )
+                )
+            if self.domain is not None:
+                self._n_substeps = self.domain.max(self._n_substeps)
 
     def __call__(self):
         # TIP: not need all array only [idx[:sd_num]]
@@ -103,24 +176,55 @@ class Displacement:  # pylint: disable=too-many-instance-attributes
         position_in_cell = self.particulator.attributes["position in cell"]
 
         self.precipitation_mass_in_last_step = 0.0
-        for _ in range(self._n_substeps):
-            self.calculate_displacement(
-                self.displacement, self.courant, cell_origin, position_in_cell
+        if self.local_substeps:
+            self.particulator.displace_with_local_substeps(
+                displacement=self.displacement,
+                courant=self.courant,
+                grid=self.grid,
+                n_substeps_in_cell=self.n_substeps_in_cell,
+                n_substeps_of_droplet=self.n_substeps_of_droplet,
+                sedimentation=(
+                    (
+                        self.particulator.attributes["relative fall velocity"],
+                        self.particulator.dt / self.particulator.mesh.dz,
+                    )
+                    if self.enable_sedimentation
+                    else None
+                ),
+                precipitation_counting_level_index=(
+                    self.precipitation_counting_level_index
+                    if self.enable_sedimentation
+                    else 0
+                ),
             )
-            self.update_position(position_in_cell, self.displacement)
-            if self.enable_sedimentation:
-                self.precipitation_mass_in_last_step += self.particulator.remove_precipitated(
-                    displacement=self.displacement,
-                    precipitation_counting_level_index=self.precipitation_counting_level_index,
+            self.remove_out_of_domain(cell_origin)
+        else:
+            for _ in range(self._n_substeps):
+                self.calculate_displacement(
+                    self.displacement, self.courant, cell_origin, position_in_cell
                 )
-            self.particulator.flag_out_of_column()
-            self.update_cell_origin(cell_origin, position_in_cell)
-            self.boundary_condition(cell_origin)
-            self.particulator.recalculate_cell_id()
+                self.update_position(position_in_cell, self.displacement)
+                self.update_cell_origin(cell_origin, position_in_cell)
+                self.remove_out_of_domain(cell_origin)
 
-        for key in ("position in cell", "cell origin", "cell id"):
+        for key in ("position in cell", "cell origin"):
             self.particulator.attributes.mark_updated(key)
 
+    def remove_out_of_domain(self, cell_origin):
+        """flags precipitated and out-of-column super-particles, migrates the ones
+        leaving the slab (if domain-decomposed) and applies the periodic boundary
+        condition to the remaining ones"""
+        if self.enable_sedimentation:
+            self.precipitation_mass_in_last_step += self.particulator.remove_precipitated(
+                displacement=self.displacement,
+                precipitation_counting_level_index=self.precipitation_counting_level_index,
+            )
+        self.particulator.flag_out_of_column()
+        if self.domain is not None:
+            self.domain.migrate(self.particulator)
+        self.boundary_condition(cell_origin)
+        self.particulator.recalculate_cell_id()
+
     def calculate_displacement(
         self, displacement, courant, cell_origin, position_in_cell
     ):
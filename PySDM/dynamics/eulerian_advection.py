@@ -1,22 +1,89 @@
 """
-wrapper class for triggering integration in the Eulerian advection solver
+wrapper class for triggering integration in the Eulerian advection solver;
+with `asynchronous=True`, the solver step is performed on a background thread
+ overlapping with the subsequent dynamics (e.g., displacement or collisions) -
+ the `PySDM.particulator.Particulator` waits for its completion before running
+ any dynamic which accesses the Eulerian fields (as declared by the `eulerian_fields`
+ class attribute of dynamics, dynamics not declaring it are assumed to access all
+ of them), and so do the kinematic environments when the fields are requested;
+ the Courant field (uploaded by the solvers to `PySDM.dynamics.Displacement`)
+ is assumed to be written only in the first step unless the solvers report
+ a time-dependent advector (with `advector_time_dependent` attribute, defaulting
+ to `True` if not present)
 """
 
 from PySDM.dynamics.impl import register_dynamic
+from PySDM.impl.thread_pool import thread_pool
+
+EULERIAN_FIELDS = ("thd", "water_vapour_mixing_ratio", "courant")
 
 
 @register_dynamic()
 class EulerianAdvection:
-    def __init__(self, solvers):
+    checkpoint_fields = ("advectees",)
+
+    eulerian_fields = EULERIAN_FIELDS
+
+    def __init__(self, solvers, *, asynchronous=False):
         self.solvers = solvers
+        self.asynchronous = asynchronous
         self.particulator = None
+        self.__pending = None
+        self.__pending_fields = ()
+        self.__first_step = True
 
     def register(self, builder):
         self.particulator = builder.particulator
+        if (
+            self.asynchronous
+            and getattr(builder.particulator.environment, "domain", None) is not None
+        ):
+            raise NotImplementedError(
+                "asynchronous advection not supported in domain-decomposed simulations"
+            )
+
+    @property
+    def advectees(self):
+        """Eulerian fields held by the solvers (as exposed by the environment, i.e.,
+        arrays sharing memory with the solver state, allowing to checkpoint them)"""
+        environment = self.particulator.environment
+        return {
+            "thd": environment.get_thd(),
+            "water_vapour_mixing_ratio": environment.get_water_vapour_mixing_ratio(),
+        }
 
     def __call__(self):
+        self.wait()
         for field in ("water_vapour_mixing_ratio", "thd"):
             self.particulator.environment.get_predicted(field).download(
                 getattr(self.particulator.environment, f"get_{field}")(), reshape=True
             )
-        self.solvers(self.particulator.dynamics["Displacement"])
+        displacement = self.particulator.dynamics["Displacement"]
+        if not self.asynchronous:
+            self.solvers(displacement)
+            return
+        if self.__first_step or getattr(self.solvers, "advector_time_dependent", True):
+            self.__pending_fields = EULERIAN_FIELDS
+        else:
+            self.__pending_fields = EULERIAN_FIELDS[:-1]
+        self.__first_step = False
+        self.__pending = thread_pool("EulerianAdvection", max_workers=1).submit(
+            self.solvers, displacement
+        )
+
+    def wait(self):
+        """blocks until the solver step (if any in progress) completes"""
+        if self.__pending is not None:
+            pending, self.__pending = self.__pending, None
+            pending.result()
+        if hasattr(self.solvers, "wait"):
+            self.solvers.wait()
+
+    def wait_for(self, dynamic):
+        """blocks until the solver step (if any in progress) completes if the given
+        `dynamic` accesses any of the fields being written by it"""
+        if self.__pending is None or dynamic is self:
+            return
+        fields = getattr(dynamic, "eulerian_fields", None)
+        if fields is None or not set(fields).isdisjoint(self.__pending_fields):
+            self.wait()
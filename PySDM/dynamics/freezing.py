@@ -6,10 +6,15 @@ and homogeneous freezing and thaw
 
 from typing import Optional
 from PySDM.dynamics.impl import register_dynamic
+from PySDM.impl.scheduler import ENVIRONMENT
 
 
 @register_dynamic()
 class Freezing:  # pylint: disable=too-many-instance-attributes
+    checkpoint_fields = ("rng",)
+
+    eulerian_fields = ()
+
     def __init__(
         self,
         *,
@@ -74,6 +79,21 @@ class Freezing:  # pylint: disable=too-many-instance-attributes
                 self.particulator.n_sd, self.particulator.formulae.seed
             )
 
+    @property
+    def reads(self):
+        reads = ["signed water mass", "cell id", ENVIRONMENT]
+        if self.immersion_freezing == "singular":
+            reads.append("freezing temperature")
+        if self.immersion_freezing == "time-dependent":
+            reads.append("immersed surface area")
+        if self.homogeneous_freezing == "time-dependent":
+            reads.append("volume")
+        return tuple(reads)
+
+    @property
+    def writes(self):
+        return ("signed water mass",)
+
     def __call__(self):
         if "Coalescence" in self.particulator.dynamics:
             # TODO #594
@@ -6,6 +6,8 @@ import math
 
 
 class RandomGeneratorOptimizer:  # pylint: disable=too-many-instance-attributes
+    checkpoint_fields = ("rnd", "substep", "pairs_rand", "rand")
+
     def __init__(self, optimized_random, dt_min, seed):
         self.particulator = None
         self.optimized_random = optimized_random
@@ -34,7 +36,10 @@ class RandomGeneratorOptimizer:  # pylint: disable=too-many-instance-attributes
     def reset(self):
         self.substep = 0
 
-    def get_random_arrays(self):
+    def get_random_arrays(self, pairs_rand_length=None):
+        """`pairs_rand_length`, if given, limits the number of (leading) elements
+        of the returned `pairs_rand` that are refreshed (ignored with
+        `optimized_random`)"""
         if self.optimized_random:
             shift = self.substep
             if self.substep == 0:
@@ -42,7 +47,10 @@ class RandomGeneratorOptimizer:  # pylint: disable=too-many-instance-attributes
                 self.rand.urand(self.rnd)
         else:
             shift = 0
-            self.pairs_rand.urand(self.rnd)
+            if pairs_rand_length is None:
+                self.pairs_rand.urand(self.rnd)
+            else:
+                self.pairs_rand[:pairs_rand_length].urand(self.rnd)
             self.rand.urand(self.rnd)
         self.substep += 1
         return self.pairs_rand[shift : self.particulator.n_sd + shift], self.rand
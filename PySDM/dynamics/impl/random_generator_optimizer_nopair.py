@@ -6,6 +6,8 @@ import math
 
 
 class RandomGeneratorOptimizerNoPair:
+    checkpoint_fields = ("rnd", "substep", "rand")
+
     def __init__(self, optimized_random, dt_min, seed):
         self.particulator = None
         self.optimized_random = optimized_random
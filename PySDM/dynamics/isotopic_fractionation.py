@@ -7,6 +7,7 @@ Considers only single-substituted molecules (i.e. no D2O, etc.)
 
 from PySDM.dynamics.condensation import Condensation
 from PySDM.dynamics.impl import register_dynamic
+from PySDM.impl.scheduler import ENVIRONMENT
 
 LIGHT_ISOTOPES = ("1H", "16O")
 HEAVY_ISOTOPES = ("2H", "3H", "17O", "18O")
@@ -14,6 +15,8 @@ HEAVY_ISOTOPES = ("2H", "3H", "17O", "18O")
 
 @register_dynamic()
 class IsotopicFractionation:
+    eulerian_fields = ()
+
     def __init__(self, isotopes: tuple = HEAVY_ISOTOPES):
         self.isotopes = isotopes
         self.particulator = None
@@ -44,5 +47,20 @@ class IsotopicFractionation:
             builder.request_attribute(f"moles_{isotope}")
             builder.request_attribute(f"Bolin number for {isotope}")
 
+    @property
+    def reads(self):
+        return (
+            "cell id",
+            "multiplicity",
+            "diffusional growth mass change",
+            "signed water mass",
+            ENVIRONMENT,
+            *(f"Bolin number for {isotope}" for isotope in self.isotopes),
+        )
+
+    @property
+    def writes(self):
+        return (ENVIRONMENT, *(f"moles_{isotope}" for isotope in self.isotopes))
+
     def __call__(self):
         self.particulator.isotopic_fractionation(self.isotopes)
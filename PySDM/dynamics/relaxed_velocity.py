@@ -16,6 +16,15 @@ class RelaxedVelocity:  # pylint: disable=too-many-instance-attributes
     proportional to the sqrt of the droplet radius.
     """
 
+    eulerian_fields = ()
+    reads = (
+        "relative fall momentum",
+        "terminal velocity",
+        "signed water mass",
+        "square root of radius",
+    )
+    writes = ("relative fall momentum",)
+
     def __init__(self, c: float = 8, constant: bool = False):
         """
         Parameters:
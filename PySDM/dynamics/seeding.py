@@ -7,11 +7,17 @@ from collections.abc import Sized
 import numpy as np
 
 from PySDM.dynamics.impl import register_dynamic
+from PySDM.impl.scheduler import IDX
 from PySDM.initialisation import discretise_multiplicities
 
 
 @register_dynamic()
 class Seeding:
+    checkpoint_fields = ("rnd",)
+
+    eulerian_fields = ()
+    reads = ("multiplicity", IDX)
+
     def __init__(
         self,
         *,
@@ -29,6 +35,14 @@ class Seeding:
         self.u01 = None
         self.index = None
 
+    @property
+    def writes(self):
+        return (
+            "multiplicity",
+            IDX,
+            *self.particulator.attributes.get_extensive_attribute_keys(),
+        )
+
     def register(self, builder):
         self.particulator = builder.particulator
 
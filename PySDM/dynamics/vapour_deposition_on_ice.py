@@ -1,14 +1,31 @@
-"""basic water vapor deposition on ice"""
+"""basic water vapor deposition on ice; with `adaptive=True`, the number of substeps
+is chosen for each cell separately and retained between timesteps (see the per-cell
+`counters["n_substeps"]`); cells are processed in parallel"""
 
 from PySDM.dynamics.impl import register_dynamic
+from PySDM.impl.scheduler import ENVIRONMENT, IDX
 
 
 @register_dynamic()
 class VapourDepositionOnIce:
+    checkpoint_fields = ("counters", "success")
+
+    eulerian_fields = ("thd", "water_vapour_mixing_ratio")
+    reads = (
+        "multiplicity",
+        "signed water mass",
+        "Reynolds number",
+        "cell id",
+        ENVIRONMENT,
+    )
+    writes = ("signed water mass", IDX, ENVIRONMENT)
+
     def __init__(self, adaptive: bool = True):
         """called by the user while building a particulator"""
         self.particulator = None
         self.adaptive = adaptive
+        self.counters = {}
+        self.success = None
 
     def register(self, *, builder):
         """called by the builder"""
@@ -16,6 +33,21 @@ class VapourDepositionOnIce:
         assert builder.formulae.particle_shape_and_density.supports_mixed_phase()
         builder.request_attribute("Reynolds number")
 
+        self.counters["n_substeps"] = self.particulator.Storage.empty(
+            self.particulator.mesh.n_cell, dtype=int
+        )
+        self.counters["n_substeps"][:] = -1 if self.adaptive else 1
+        self.success = self.particulator.Storage.empty(
+            self.particulator.mesh.n_cell, dtype=bool
+        )
+        self.success[:] = False
+
     def __call__(self):
         """called by the particulator during simulation"""
-        self.particulator.deposition(adaptive=self.adaptive)
+        self.particulator.deposition(
+            adaptive=self.adaptive,
+            n_substeps=self.counters["n_substeps"],
+            success=self.success,
+        )
+        if not self.success.all():
+            raise RuntimeError("Vapour deposition on ice failed")
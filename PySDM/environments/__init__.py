@@ -1,10 +1,12 @@
 """
 Classes representing particle environment:
 `PySDM.environments.box.Box`,
-`PySDM.environments.parcel.Parcel`, ...
+`PySDM.environments.parcel.Parcel`,
+`PySDM.environments.parcel_ensemble.ParcelEnsemble`, ...
 """
 
 from .box import Box
 from .kinematic_1d import Kinematic1D
 from .kinematic_2d import Kinematic2D
 from .parcel import Parcel
+from .parcel_ensemble import ParcelEnsemble
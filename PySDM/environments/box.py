@@ -10,6 +10,8 @@ from PySDM.environments.impl import register_environment
 
 @register_environment()
 class Box:
+    checkpoint_fields = ("_ambient_air",)
+
     def __init__(self, dt, dv):
         self.dt = dt
         self.mesh = Mesh.mesh_0d(dv)
@@ -0,0 +1,231 @@
+"""
+slab domain decomposition (along the first, x, dimension) of
+ `PySDM.environments.kinematic_2d.Kinematic2D` simulations across worker processes
+ launched with `run_decomposed()`: each worker owns a particulator covering its slab
+ (built with `Kinematic2D(..., domain=domain)`), super-droplets crossing slab edges are
+ migrated (with all base attributes) to the neighbouring worker within
+ `PySDM.dynamics.Displacement`, and Eulerian fields are advected by solvers exchanging
+ x-halos between neighbours with `SlabDomain.exchange_halo()`; the domain is periodic
+ in both dimensions and the workers communicate through `multiprocessing` queues
+ (hence the decomposition is limited to a single machine)
+
+Limitation: the only solver exchanging halos is the first-order upwind (donor-cell)
+ `DonorCell_2D` of `PySDM_examples.utils.kinematic_2d` - the MPDATA solvers
+ (`MPDATA_2D`) operate on a single whole domain, hence domain-decomposed runs use
+ first-order upwind advection of the Eulerian fields (more numerically diffusive than
+ that of the non-decomposed MPDATA-based runs, which they do not reproduce)
+
+Example of use:
+
+    def worker(domain):
+        environment = Kinematic2D(dt=dt, grid=grid, size=size, rhod_of=rhod_of, domain=domain)
+        builder = Builder(n_sd=n_sd_per_worker, backend=CPU(), environment=environment)
+        ...
+        return result
+
+    results = run_decomposed(worker, n_slabs=4, grid=grid, size=size)
+"""  # pylint: disable=line-too-long
+
+import multiprocessing
+import traceback
+
+import numpy as np
+
+
+def slab_bounds(n_x, n_slabs):
+    """returns (start, stop) pairs of x-indices of cells in each slab"""
+    if not 0 < n_slabs <= n_x:
+        raise ValueError(f"cannot decompose {n_x} columns into {n_slabs} slabs")
+    edges = np.linspace(0, n_x, n_slabs + 1).astype(int)
+    return tuple(zip(edges[:-1], edges[1:]))
+
+
+class SlabDomain:
+    """geometry of the slab of a given worker (`rank`) and communication with
+    the neighbouring ones (queues as created by `run_decomposed()`)"""
+
+    def __init__(self, *, grid, size, n_slabs, rank, queues):
+        self.grid = tuple(grid)
+        self.size = tuple(size)
+        self.rank = rank
+        self.bounds = slab_bounds(grid[0], n_slabs)
+        self.__queues = queues
+        self.n_migrated = 0
+
+    @property
+    def n_slabs(self):
+        return len(self.bounds)
+
+    @property
+    def start(self):
+        return self.bounds[self.rank][0]
+
+    @property
+    def stop(self):
+        return self.bounds[self.rank][1]
+
+    @property
+    def slab_grid(self):
+        return (self.stop - self.start, *self.grid[1:])
+
+    @property
+    def slab_size(self):
+        return (self.size[0] * self.slab_grid[0] / self.grid[0], *self.size[1:])
+
+    def __deepcopy__(self, memo):
+        """communication endpoints are not copied (e.g., by the `Builder`)"""
+        return self
+
+    def local(self, field, staggered=False):
+        """returns the part of a whole-domain `field` (x along the first axis)
+        pertaining to the slab (including the right edge if `staggered`, i.e.,
+        for x-components of vector fields on the Arakawa-C grid)"""
+        return np.asarray(field)[self.start : self.stop + (1 if staggered else 0)]
+
+    def sendrecv(self, *, to_left, to_right):
+        """sends data to both neighbours and returns a tuple of data received
+        from the left and the right one (to be called by all workers); the data
+        is pickled asynchronously, hence must not be modified after sending"""
+        send_left, send_right, recv_left, recv_right = self.__queues
+        send_left.put(to_left)
+        send_right.put(to_right)
+        return recv_left.get(), recv_right.get()
+
+    def max(self, value):
+        """returns the maximum of `value` over all workers"""
+        result = value
+        for _ in range(self.n_slabs - 1):
+            from_left, _ = self.sendrecv(to_left=None, to_right=value)
+            result = max(result, from_left)
+            value = from_left
+        return result
+
+    def exchange_halo(self, field, halo=1):
+        """returns the slab part of a scalar field extended (along x) with `halo`
+        columns of each of the neighbouring slabs"""
+        if not 0 < halo <= field.shape[0]:
+            raise ValueError("halo must be positive and not wider than the slab")
+        from_left, from_right = self.sendrecv(
+            to_left=field[:halo].copy(), to_right=field[-halo:].copy()
+        )
+        return np.concatenate((from_left, field, from_right))
+
+    def migrate(self, particulator):
+        """sends super-droplets which left the slab (i.e., with x-component of
+        "cell origin" outside of the slab) to the neighbouring workers and stores
+        the ones received from them in place of the leaving ones, or in slots freed
+        by removal of other super-droplets (to be called by all workers before
+        recalculation of cell ids); the storage slots of leaving super-droplets are
+        reused at their positions in the index (keeping their former "cell id"
+        values), hence with the "incremental" sorting scheme only the migrated
+        super-droplets are re-bucketed, while a full sort is needed only if the
+        numbers of leaving and incoming super-droplets differ"""
+        attributes = particulator.attributes
+        raw = {
+            name: attr.data.to_ndarray(raw=True)
+            for name, attr in attributes.get_base_attributes().items()
+            if name != "cell id"
+        }
+        idx = attributes._ParticleAttributes__idx  # pylint: disable=protected-access
+        idx = idx.to_ndarray()[: attributes.super_droplet_count]
+        x = raw["cell origin"][0, idx]
+        leaving = idx[(x < 0) | (x >= self.slab_grid[0])]
+
+        incoming = self.sendrecv(**self.__outgoing(raw, idx, x))
+        n_in = sum(len(data["multiplicity"]) for data in incoming)
+        if n_in == 0 and len(leaving) == 0:
+            return
+        appended = np.setdiff1d(np.arange(particulator.n_sd), idx, assume_unique=True)[
+            : max(0, n_in - len(leaving))
+        ]
+        if n_in > len(leaving) + len(appended):
+            raise ValueError(
+                f"no space for {n_in} migrating super-droplets in rank {self.rank}"
+                f" (only {len(leaving) + len(appended)} free slots, increase n_sd)"
+            )
+        slots = np.concatenate((leaving[:n_in], appended))
+        raw["multiplicity"][leaving[n_in:]] = 0
+        for name, values in raw.items():
+            values[..., slots] = np.concatenate(
+                [data[name] for data in incoming], axis=-1
+            )
+            attributes.get_base_attributes()[name].data.upload(values)
+            attributes.mark_updated(name)
+        self.n_migrated += len(leaving)
+
+        if len(appended) > 0:
+            attributes.append_idx(appended)
+        if len(leaving) > n_in:
+            attributes.healthy = False
+            attributes.sanitize()
+
+    def __outgoing(self, raw, idx, x):
+        """attribute values of super-droplets leaving through each slab edge, with
+        x-component of "cell origin" shifted to the frame of the receiving slab"""
+        n_x = self.slab_grid[0]
+        outgoing = {}
+        for side, mask, shift in (
+            ("to_left", x < 0, self.__extent(self.rank - 1)),
+            ("to_right", x >= n_x, -n_x),
+        ):
+            outgoing[side] = {
+                name: values[..., idx[mask]] for name, values in raw.items()
+            }
+            outgoing[side]["cell origin"][0] += shift
+        return outgoing
+
+    def __extent(self, rank):
+        start, stop = self.bounds[rank % self.n_slabs]
+        return stop - start
+
+
+def _worker_main(worker, domain_args, queues, results, args):
+    rank = domain_args["rank"]
+    try:
+        result = worker(SlabDomain(**domain_args, queues=queues), *args)
+        results.put((rank, True, result))
+    except Exception:  # pylint: disable=broad-except
+        results.put((rank, False, traceback.format_exc()))
+
+
+def run_decomposed(worker, *, n_slabs, grid, size, args=(), context="spawn"):
+    """runs `worker(domain, *args)` in `n_slabs` processes (with `domain` being
+    a `SlabDomain` instance) and returns a list of the values returned by the workers
+    (ordered by rank); `worker` has to be picklable (e.g., a module-level function)"""
+    context = multiprocessing.get_context(context)
+    rightward = [context.Queue() for _ in range(n_slabs)]
+    leftward = [context.Queue() for _ in range(n_slabs)]
+    results = context.Queue()
+    processes = [
+        context.Process(
+            target=_worker_main,
+            args=(
+                worker,
+                {"grid": grid, "size": size, "n_slabs": n_slabs, "rank": rank},
+                (
+                    leftward[rank],
+                    rightward[rank],
+                    rightward[(rank - 1) % n_slabs],
+                    leftward[(rank + 1) % n_slabs],
+                ),
+                results,
+                args,
+            ),
+        )
+        for rank in range(n_slabs)
+    ]
+    for process in processes:
+        process.start()
+    outcomes = {}
+    try:
+        for _ in range(n_slabs):
+            rank, success, value = results.get()
+            if not success:
+                raise RuntimeError(f"worker {rank} failed:\n{value}")
+            outcomes[rank] = value
+    finally:
+        for process in processes:
+            if process.is_alive() and len(outcomes) < n_slabs:
+                process.terminate()
+            process.join()
+    return [outcomes[rank] for rank in range(n_slabs)]
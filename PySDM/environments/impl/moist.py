@@ -8,6 +8,8 @@ import numpy as np
 
 
 class Moist:
+    checkpoint_fields = ("_values", "_tmp")
+
     def __init__(self, dt, mesh, variables, mixed_phase=False):
         variables += ["water_vapour_mixing_ratio", "thd", "T", "p", "RH"]
         if mixed_phase:
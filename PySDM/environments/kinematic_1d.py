@@ -28,7 +28,10 @@ class Kinematic1D(Moist):
         self._tmp["rhod"] = rhod
 
     def get_water_vapour_mixing_ratio(self) -> np.ndarray:
-        return self.particulator.dynamics["EulerianAdvection"].solvers.advectee
+        advection = self.particulator.dynamics["EulerianAdvection"]
+        if hasattr(advection, "wait"):
+            advection.wait()
+        return advection.solvers.advectee
 
     def get_thd(self) -> np.ndarray:
         return self.thd0
@@ -1,6 +1,11 @@
 """
 Two-dimensional single-eddy prescribed-flow framework with moisture and heat advection
-handled by [PyMPDATA](http://github.com/open-atmos/PyMPDATA/)
+handled by [PyMPDATA](http://github.com/open-atmos/PyMPDATA/); with `domain` given
+(see `PySDM.environments.domain_decomposition`), the environment covers
+only the slab of the whole domain (of given `grid` and `size`) pertaining to a worker;
+note that the MPDATA solvers do not exchange halos between slabs, hence
+domain-decomposed runs have to use the first-order upwind `DonorCell_2D` solver
+of `PySDM_examples.utils.kinematic_2d` for the Eulerian fields
 """
 
 import numpy as np
@@ -18,9 +23,16 @@ from PySDM.environments.impl import register_environment
 
 @register_environment()
 class Kinematic2D(Moist):
-    def __init__(self, *, dt, grid, size, rhod_of, mixed_phase=False):
+    def __init__(
+        self, *, dt, grid, size, rhod_of, mixed_phase=False, domain=None
+    ):  # pylint: disable=too-many-arguments
+        if domain is not None:
+            if tuple(grid) != domain.grid or tuple(size) != domain.size:
+                raise ValueError("grid and size must match those of the domain")
+            grid, size = domain.slab_grid, domain.slab_size
         super().__init__(dt, Mesh(grid=grid, size=size), [], mixed_phase=mixed_phase)
         self.rhod_of = rhod_of
+        self.domain = domain
         self.formulae = None
 
     def register(self, builder):
@@ -87,14 +99,14 @@ class Kinematic2D(Moist):
 
         return attributes
 
+    def __solvers(self):
+        advection = self.particulator.dynamics["EulerianAdvection"]
+        if hasattr(advection, "wait"):
+            advection.wait()
+        return advection.solvers
+
     def get_thd(self):
-        return self.particulator.dynamics["EulerianAdvection"].solvers["th"]
+        return self.__solvers()["th"]
 
     def get_water_vapour_mixing_ratio(self):
-        return self.particulator.dynamics["EulerianAdvection"].solvers[
-            "water_vapour_mixing_ratio"
-        ]
-
-    def sync(self):
-        self.particulator.dynamics["EulerianAdvection"].solvers.wait()
-        super().sync()
+        return self.__solvers()["water_vapour_mixing_ratio"]
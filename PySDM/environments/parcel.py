@@ -17,6 +17,8 @@ from PySDM.environments.impl import register_environment
 
 @register_environment()
 class Parcel(Moist):  # pylint: disable=too-many-instance-attributes
+    checkpoint_fields = Moist.checkpoint_fields + ("delta_liquid_water_mixing_ratio",)
+
     def __init__(
         self,
         *,
@@ -0,0 +1,167 @@
+"""
+ensemble of independent zero-dimensional adiabatic parcels represented as cells of
+ a single particulator (e.g., for parameter sweeps), hence with the per-timestep overhead
+ shared among members and with all members processed within single backend calls;
+ parameters can be given as scalars (common to all members) or as arrays (one value per
+ member), super-particles are assigned to members through the `cell id` attribute
+ (see `ParcelEnsemble.init_attributes`) and products are evaluated with
+ the ensemble dimension (one value per member); note that the cell volume
+ is member-specific, which is supported by the Numba-backend condensation solver and
+ the products, but not by the ThrustRTC backend nor by dynamics normalising by a domain-wide
+ cell volume (e.g., collisions), both resulting in an error at build time
+"""
+
+from typing import List, Optional, Union
+
+import numpy as np
+
+from PySDM.backends.numba import Numba
+from PySDM.environments.impl import register_environment
+from PySDM.environments.parcel import Parcel
+from PySDM.impl.mesh import Mesh
+from PySDM.initialisation.hygroscopic_equilibrium import (
+    default_rtol,
+    equilibrate_wet_radii,
+)
+
+
+@register_environment()
+class ParcelEnsemble(Parcel):
+    def __init__(
+        self,
+        *,
+        dt,
+        n_members: int,
+        mass_of_dry_air: Union[float, np.ndarray],
+        p0: Union[float, np.ndarray],
+        initial_water_vapour_mixing_ratio: Union[float, np.ndarray],
+        T0: Union[float, np.ndarray],
+        w: Union[float, np.ndarray, callable],
+        z0: Union[float, np.ndarray] = 0,
+        mixed_phase=False,
+        variables: Optional[List[str]] = None,
+    ):
+        """`w` can be given as a function of time returning a scalar or an array
+        of values for each member"""
+        super().__init__(
+            dt=dt,
+            mass_of_dry_air=self.__per_member(mass_of_dry_air, n_members),
+            p0=self.__per_member(p0, n_members),
+            initial_water_vapour_mixing_ratio=self.__per_member(
+                initial_water_vapour_mixing_ratio, n_members
+            ),
+            T0=self.__per_member(T0, n_members),
+            w=w if callable(w) else self.__per_member(w, n_members),
+            z0=self.__per_member(z0, n_members),
+            mixed_phase=mixed_phase,
+            variables=variables,
+        )
+        self.mesh = Mesh(
+            grid=(n_members,),
+            size=(),
+            n_cell=n_members,
+            dv=np.nan,
+            n_dims=0,
+            strides=(-1,),
+        )
+        self.n_members = n_members
+        self.delta_liquid_water_mixing_ratio = np.full(n_members, np.nan)
+
+    def register(self, builder):
+        if not isinstance(builder.particulator.backend, Numba):
+            raise NotImplementedError(
+                "ParcelEnsemble is supported with the Numba backend only"
+            )
+        super().register(builder)
+
+    @staticmethod
+    def __per_member(value, n_members):
+        return np.broadcast_to(np.asarray(value, dtype=float), (n_members,)).copy()
+
+    @property
+    def dv(self):
+        rhod_mean = (
+            self.get_predicted("rhod").to_ndarray() + self["rhod"].to_ndarray()
+        ) / 2
+        return self.particulator.formulae.trivia.volume_of_density_mass(
+            rhod_mean, self.mass_of_dry_air
+        )
+
+    def init_attributes(
+        self,
+        *,
+        n_in_dv: np.ndarray,
+        kappa: Union[float, np.ndarray],
+        r_dry: np.ndarray,
+        cell_id: np.ndarray,
+        rtol=default_rtol,
+        include_dry_volume_in_attribute: bool = True,
+    ):  # pylint: disable=arguments-differ,too-many-arguments
+        """as `PySDM.environments.parcel.Parcel.init_attributes` but with all arguments
+        given per super-particle and with `cell_id` denoting the ensemble member index
+        """
+        attributes = {}
+        dry_volume = self.particulator.formulae.trivia.volume(radius=r_dry)
+        attributes["kappa times dry volume"] = dry_volume * kappa
+        attributes["multiplicity"] = n_in_dv
+        attributes["cell id"] = np.asarray(cell_id, dtype=np.int64)
+        r_wet = equilibrate_wet_radii(
+            r_dry=r_dry,
+            environment=self,
+            kappa_times_dry_volume=attributes["kappa times dry volume"],
+            cell_id=attributes["cell id"],
+            rtol=rtol,
+        )
+        attributes["volume"] = self.particulator.formulae.trivia.volume(radius=r_wet)
+        if include_dry_volume_in_attribute:
+            attributes["dry volume"] = dry_volume
+        return attributes
+
+    def advance_parcel_vars(self):
+        dt = self.particulator.dt
+        formulae = self.particulator.formulae
+        T = self["T"].to_ndarray()
+        p = self["p"].to_ndarray()
+
+        dz_dt = np.broadcast_to(
+            np.asarray(
+                self.w((self.particulator.n_steps + 1 / 2) * dt), dtype=float
+            ),  # "mid-point"
+            (self.n_members,),
+        )
+        water_vapour_mixing_ratio = (
+            self["water_vapour_mixing_ratio"].to_ndarray()
+            - self.delta_liquid_water_mixing_ratio / 2
+        )
+
+        drho_dz = formulae.hydrostatics.drho_dz(
+            p=p,
+            T=T,
+            water_vapour_mixing_ratio=water_vapour_mixing_ratio,
+            lv=formulae.latent_heat_vapourisation.lv(T),
+            d_liquid_water_mixing_ratio__dz=np.divide(
+                self.delta_liquid_water_mixing_ratio / dt,
+                dz_dt,
+                out=np.zeros(self.n_members),
+                where=dz_dt != 0,
+            ),
+        )
+        drhod_dz = drho_dz
+
+        self.particulator.backend.explicit_euler(self._tmp["z"], dt, dz_dt)
+        self.particulator.backend.explicit_euler(
+            self._tmp["rhod"], dt, dz_dt * drhod_dz
+        )
+
+        self.mesh.dv = formulae.trivia.volume_of_density_mass(
+            (self._tmp["rhod"].to_ndarray() + self["rhod"].to_ndarray()) / 2,
+            self.mass_of_dry_air,
+        )
+
+    def sync_parcel_vars(self):
+        self.delta_liquid_water_mixing_ratio = (
+            self._tmp["water_vapour_mixing_ratio"].to_ndarray()
+            - self["water_vapour_mixing_ratio"].to_ndarray()
+        )
+        for var in self.variables:
+            self._tmp[var][:] = self[var][:]
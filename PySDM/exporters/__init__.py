@@ -2,8 +2,13 @@
 Exporters handling output to metadata-rich file formats incl. netCDF and VTK
 """
 
+from .async_exporter import AsyncExporter
 from .netcdf_exporter import NetCDFExporter
 from .netcdf_exporter_1d import NetCDFExporter_1d, readNetCDF_1d
+from .netcdf_streaming_exporter import (
+    NetCDFStreamingExporter,
+    read_attributes_snapshot,
+)
 from .vtk_exporter import VTKExporter
 from .vtk_exporter_1d import VTKExporter_1d
 from .vtk_exporter_parcel import VTKExporterParcel
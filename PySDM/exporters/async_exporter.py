@@ -0,0 +1,235 @@
+"""
+asynchronous wrapper for exporters (e.g., `PySDM.exporters.VTKExporter` or
+ `PySDM.exporters.NetCDFStreamingExporter`) overlapping output with computation: product
+ values and particle attributes are copied (within the calling thread) into one of a bounded
+ pool of reusable buffers and written by the wrapped exporter from a background thread;
+ if all buffers are awaiting output, the simulation is stalled until one is freed
+ (back-pressure); pending output is flushed upon `close()` which is also called when
+ the particulator is garbage-collected or at interpreter exit
+"""
+
+import copy
+import queue
+import threading
+import weakref
+
+import numpy as np
+
+
+def _product_snapshot(product, value):
+    """returns a shallow copy of `product` (an instance of the same class, hence
+    passing `isinstance()` checks in exporters) with `get()` returning `value`"""
+    snapshot = copy.copy(product)
+    snapshot.get = lambda: value
+    return snapshot
+
+
+class _AttributeSnapshot:
+    def __init__(self, data, idx):
+        self.data = data
+        self.idx = idx
+
+    @property
+    def shape(self):
+        return self.data.shape
+
+    def to_ndarray(self, *, raw=False):
+        if raw:
+            return self.data
+        return self.data[..., self.idx]
+
+
+class _AttributesSnapshot:
+    def __init__(self, attributes, base_attribute_keys, super_droplet_count):
+        self.__attributes = attributes
+        self.__base_attribute_keys = base_attribute_keys
+        self.super_droplet_count = super_droplet_count
+
+    def keys(self):
+        return self.__attributes.keys()
+
+    def __getitem__(self, item):
+        return self.__attributes[item]
+
+    def __contains__(self, key):
+        return key in self.__attributes
+
+    def get_base_attributes(self):
+        return {key: self.__attributes[key] for key in self.__base_attribute_keys}
+
+
+class _ParticulatorSnapshot:  # pylint: disable=too-few-public-methods
+    def __init__(self, particulator, products=None, attributes=None):
+        self.n_steps = particulator.n_steps
+        self.dt = particulator.dt
+        self.mesh = particulator.mesh
+        self.products = products
+        self.attributes = attributes
+
+
+class _Buffers:  # pylint: disable=too-few-public-methods
+    """arrays reused across snapshots (reallocated only if shape or type changes)"""
+
+    def __init__(self):
+        self.arrays = {}
+
+    def __get(self, key, shape, dtype):
+        array = self.arrays.get(key)
+        if array is None or array.shape != shape or array.dtype != dtype:
+            array = np.empty(shape, dtype=dtype)
+            self.arrays[key] = array
+        return array
+
+    def copy(self, key, value):
+        if not isinstance(value, np.ndarray):
+            return value
+        array = self.__get(key, value.shape, value.dtype)
+        np.copyto(array, value)
+        return array
+
+    def download(self, key, storage):
+        array = self.__get(key, tuple(storage.shape), np.dtype(storage.dtype))
+        storage.download(array)
+        return array
+
+
+class AsyncExporter:
+    """
+    Example of use:
+
+    exporter = AsyncExporter(VTKExporter())
+
+    for step in range(settings.n_steps):
+        simulation.particulator.run(1)
+
+        exporter.export_attributes(simulation.particulator)
+        exporter.export_products(simulation.particulator)
+
+    exporter.close()
+    """
+
+    def __init__(self, exporter, *, max_queue_size=2, attributes=None):
+        """`max_queue_size` is the number of snapshot buffers (i.e., the maximal
+        number of pending output steps); `attributes` (names of the particle attributes
+        made available to the wrapped exporter) defaults to all attributes"""
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be positive")
+        self.exporter = exporter
+        self.attributes = attributes
+        self.__free = queue.Queue()
+        for _ in range(max_queue_size):
+            self.__free.put(_Buffers())
+        self.__pending = queue.Queue()
+        self.__error = None
+        self.__finalizers = {}  # None once closed
+        self.__thread = threading.Thread(target=self.__worker, daemon=True)
+        self.__thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __call_exporter(self, method, *args):
+        if self.__error is None:
+            try:
+                getattr(self.exporter, method)(*args)
+            except Exception as exception:  # pylint: disable=broad-except
+                self.__error = exception
+
+    def __worker(self):
+        while True:
+            task = self.__pending.get()
+            try:
+                if task is None:
+                    if hasattr(self.exporter, "close"):
+                        self.__call_exporter("close")
+                    return
+                method, snapshot, buffers = task
+                self.__call_exporter(method, snapshot)
+                self.__free.put(buffers)
+                task = snapshot = None  # not to keep the particulator alive
+            finally:
+                self.__pending.task_done()
+
+    def __raise_pending_error(self):
+        if self.__error is not None:
+            error, self.__error = self.__error, None
+            raise error
+
+    def __submit(self, method, particulator, snapshot_factory):
+        if self.__finalizers is None:
+            raise ValueError("exporter already closed")
+        self.__raise_pending_error()
+        if id(particulator) not in self.__finalizers:
+            self.__finalizers[id(particulator)] = weakref.finalize(
+                particulator, self.close
+            )
+        buffers = self.__free.get()  # back-pressure: blocks if all buffers are in use
+        snapshot = None
+        try:
+            snapshot = snapshot_factory(particulator, buffers)
+        finally:
+            if snapshot is None:
+                self.__free.put(buffers)
+        self.__pending.put((method, snapshot, buffers))
+
+    @staticmethod
+    def __products_snapshot(particulator, buffers):
+        return _ParticulatorSnapshot(
+            particulator,
+            products={
+                name: _product_snapshot(product, buffers.copy(name, product.get()))
+                for name, product in particulator.products.items()
+            },
+        )
+
+    def __attributes_snapshot(self, particulator, buffers):
+        attributes = particulator.attributes
+        names = self.attributes if self.attributes is not None else attributes.keys()
+        base_attribute_keys = attributes.get_base_attributes().keys()
+        multiplicity = attributes["multiplicity"]
+        idx = multiplicity.idx.to_ndarray()[: len(multiplicity)]
+        return _ParticulatorSnapshot(
+            particulator,
+            attributes=_AttributesSnapshot(
+                {
+                    name: _AttributeSnapshot(
+                        buffers.download(name, attributes[name]),
+                        idx,
+                    )
+                    for name in names
+                },
+                base_attribute_keys=tuple(
+                    name for name in names if name in base_attribute_keys
+                ),
+                super_droplet_count=attributes.super_droplet_count,
+            ),
+        )
+
+    def export_products(self, particulator):
+        """evaluates all products and queues their output"""
+        self.__submit("export_products", particulator, self.__products_snapshot)
+
+    def export_attributes(self, particulator):
+        """copies particle attributes and queues their output"""
+        self.__submit("export_attributes", particulator, self.__attributes_snapshot)
+
+    def flush(self):
+        """blocks until all pending output is written (re-raising errors, if any)"""
+        self.__pending.join()
+        self.__raise_pending_error()
+
+    def close(self):
+        """flushes pending output, stops the background thread and closes the wrapped
+        exporter (if it has a `close()` method)"""
+        if self.__finalizers is None:
+            return
+        finalizers, self.__finalizers = self.__finalizers, None
+        for finalizer in finalizers.values():
+            finalizer.detach()
+        self.__pending.put(None)
+        if threading.current_thread() is not self.__thread:
+            self.__thread.join()
+            self.__raise_pending_error()
@@ -0,0 +1,213 @@
+"""
+streaming netCDF exporter implemented using [netCDF4](https://unidata.github.io/netcdf4-python/)
+ (an optional dependency imported upon instantiation): products are appended along an unlimited
+ time dimension as soon as they are computed (hence with no need to keep the output in memory),
+ variables are chunked along time and compressed (losslessly), and super-particle attribute
+ snapshots (the number of super-particles may vary over time) are stored using
+ the CF contiguous ragged array representation
+"""  # pylint: disable=line-too-long
+
+import numbers
+
+import numpy as np
+
+from PySDM.exporters.netcdf_exporter import DIM_SUFFIX
+from PySDM.products.impl.spectrum_moment_product import SpectrumMomentProduct
+
+MESH_DIMENSIONS = {0: ("cell",), 1: ("Z",), 2: ("X", "Z"), 3: ("X", "Y", "Z")}
+
+
+class NetCDFStreamingExporter:  # pylint: disable=too-many-instance-attributes
+    """
+    Example of use:
+
+    with NetCDFStreamingExporter("output.nc", attributes=("water mass",)) as exporter:
+        for step in range(settings.n_steps):
+            simulation.particulator.run(1)
+
+            exporter.export_products(simulation.particulator)
+            exporter.export_attributes(simulation.particulator)
+
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        filename,
+        *,
+        attributes=None,
+        settings=None,
+        chunk_steps=16,
+        chunk_particles=2**16,
+        compression="zlib",
+        complevel=4,
+        shuffle=True,
+    ):
+        """`attributes` (names of exported particle attributes) defaults to all base
+        attributes; `compression` is passed to `netCDF4.Dataset.createVariable()`
+        (`None` disables compression), as are `complevel` and `shuffle`;
+        public numeric and string attributes of `settings` are stored as global ones"""
+        from netCDF4 import Dataset  # pylint: disable=import-outside-toplevel
+
+        self.attributes = attributes
+        self.chunk_steps = chunk_steps
+        self.chunk_particles = chunk_particles
+        self.compression = {
+            "compression": compression,
+            "complevel": complevel,
+            "shuffle": shuffle,
+        }
+        self.vars = {}
+        self.n_products_records = 0
+        self.n_attributes_records = 0
+        self.n_particles_written = 0
+
+        self.ncdf = Dataset(filename, mode="w", format="NETCDF4")
+        if settings is not None:
+            self._write_settings(settings)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def _write_settings(self, settings):
+        for setting in dir(settings):
+            if setting.startswith("_"):
+                continue
+            value = getattr(settings, setting)
+            if isinstance(value, (numbers.Number, str)) and not isinstance(value, bool):
+                self.ncdf.setncattr(setting, value)
+            elif isinstance(value, np.ndarray) and value.dtype.kind in "iuf":
+                self.ncdf.setncattr(setting, value)
+
+    def _create_variable(self, name, dimensions, dtype="f8", chunk_size=None):
+        chunksizes = [self.ncdf.dimensions[dim].size for dim in dimensions]
+        chunksizes[0] = chunk_size or self.chunk_steps  # unlimited dimension
+        return self.ncdf.createVariable(
+            name, dtype, dimensions, chunksizes=chunksizes, **self.compression
+        )
+
+    def _product_dimensions(self, particulator, name, product, shape):
+        mesh = particulator.mesh
+        dimensions = []
+        if shape[: len(mesh.grid)] == tuple(mesh.grid):
+            dimensions.extend(MESH_DIMENSIONS[mesh.dimension][: len(mesh.grid)])
+            for index, label in enumerate(dimensions):
+                if label not in self.ncdf.dimensions:
+                    self.ncdf.createDimension(label, mesh.grid[index])
+                    if mesh.dimension != 0:
+                        self.vars[label] = self.ncdf.createVariable(
+                            label, "f8", (label,)
+                        )
+                        self.vars[label][:] = (mesh.size[index] / mesh.grid[index]) * (
+                            1 / 2 + np.arange(mesh.grid[index])
+                        )
+                        self.vars[label].units = "metres"
+        for index in range(len(dimensions), len(shape)):
+            if isinstance(product, SpectrumMomentProduct) and index == len(shape) - 1:
+                label = f"{name}{DIM_SUFFIX}"
+                self.ncdf.createDimension(label, shape[index])
+                self.vars[label] = self.ncdf.createVariable(label, "f8", (label,))
+                self.vars[label][:] = product.attr_bins_edges.to_ndarray()[:-1]
+                self.vars[label].units = product.attr_unit
+            else:
+                label = f"{name}_dim{index}"
+                self.ncdf.createDimension(label, shape[index])
+            dimensions.append(label)
+        return tuple(dimensions)
+
+    def _create_product_variables(self, particulator, values):
+        self.ncdf.createDimension("T", None)
+        self.vars["T"] = self._create_variable("T", ("T",))
+        self.vars["T"].units = "seconds"
+
+        for name, product in particulator.products.items():
+            if name in self.vars or name in self.ncdf.dimensions:
+                raise AssertionError(
+                    f"product ({name}) has same name as one of netCDF dimensions"
+                )
+            dimensions = self._product_dimensions(
+                particulator, name, product, values[name].shape
+            )
+            self.vars[name] = self._create_variable(name, ("T", *dimensions))
+            self.vars[name].units = getattr(product, "unit", "")
+
+    def export_products(self, particulator):
+        """appends values of all products (evaluated here) as a new time record"""
+        values = {  # note: copying as products may share a single buffer
+            name: np.array(product.get())
+            for name, product in particulator.products.items()
+        }
+        if "T" not in self.vars:
+            self._create_product_variables(particulator, values)
+
+        record = self.n_products_records
+        self.vars["T"][record] = particulator.n_steps * particulator.dt
+        for name, value in values.items():
+            self.vars[name][record, ...] = value
+        self.n_products_records += 1
+
+    def _create_attribute_variables(self, values):
+        self.ncdf.createDimension("snapshot", None)
+        self.ncdf.createDimension("particle", None)
+        self.vars["snapshot_time"] = self._create_variable(
+            "snapshot_time", ("snapshot",)
+        )
+        self.vars["snapshot_time"].units = "seconds"
+        self.vars["row_size"] = self._create_variable(
+            "row_size", ("snapshot",), dtype="i8"
+        )
+        self.vars["row_size"].sample_dimension = "particle"
+
+        for name, value in values.items():
+            dimensions = ("particle",)
+            if value.ndim == 2:
+                label = f"{name} component"
+                self.ncdf.createDimension(label, value.shape[0])
+                dimensions += (label,)
+            elif value.ndim != 1:
+                raise NotImplementedError()
+            self.vars[name] = self._create_variable(
+                name, dimensions, dtype=value.dtype, chunk_size=self.chunk_particles
+            )
+
+    def export_attributes(self, particulator):
+        """appends a snapshot of attributes of all super-particles (in the order
+        of the particle permutation index)"""
+        names = self.attributes
+        if names is None:
+            names = particulator.attributes.get_base_attributes().keys()
+        values = {
+            name: np.asarray(particulator.attributes[name].to_ndarray())
+            for name in names
+        }
+        if "row_size" not in self.vars:
+            self._create_attribute_variables(values)
+
+        n_particles = particulator.attributes.super_droplet_count
+        record = self.n_attributes_records
+        self.vars["snapshot_time"][record] = particulator.n_steps * particulator.dt
+        self.vars["row_size"][record] = n_particles
+        begin = self.n_particles_written
+        end = begin + n_particles
+        if n_particles != 0:
+            for name, value in values.items():
+                self.vars[name][begin:end, ...] = value.T
+        self.n_attributes_records += 1
+        self.n_particles_written = end
+
+    def flush(self):
+        self.ncdf.sync()
+
+    def close(self):
+        if self.ncdf.isopen():
+            self.ncdf.close()
+
+
+def read_attributes_snapshot(ncdf, name, snapshot):
+    """returns values of a given attribute from a given snapshot (an index along
+    the "snapshot" dimension) from an open netCDF4.Dataset (or compatible object)"""
+    row_size = ncdf.variables["row_size"][:]
+    begin = int(np.sum(row_size[:snapshot]))
+    return np.asarray(ncdf.variables[name][begin : begin + row_size[snapshot], ...]).T
@@ -27,6 +27,7 @@ from PySDM.dynamics.terminal_velocity import (
     IceSphere,
 )
 from PySDM.dynamics.terminal_velocity.gunn_and_kinzer import TpDependent
+from PySDM.physics.impl.tabulation import tabulate
 
 
 class Formulae:  # pylint: disable=too-few-public-methods,too-many-instance-attributes,too-many-statements
@@ -71,6 +72,8 @@ class Formulae:  # pylint: disable=too-few-public-methods,too-many-instance-attr
         air_dynamic_viscosity: str = "ZografosEtAl1987",
         bulk_phase_partitioning: str = "Null",
         handle_all_breakups: bool = False,
+        tabulated: Optional[dict] = None,
+        tabulation_rtol: float = 1e-6,
     ):
         # initialisation of the fields below is just to silence pylint and to enable code hints
         # in PyCharm and alike, all these fields are later overwritten within this ctor
@@ -167,6 +170,13 @@ class Formulae:  # pylint: disable=too-few-public-methods,too-many-instance-attr
                 ),
             )
 
+        self._tabulated = dict(tabulated or {})
+        self._tabulation_rtol = tabulation_rtol
+        for key in self._tabulated:
+            component, _, item = key.partition("__")
+            if not callable(getattr(getattr(self, component, None), item, None)):
+                raise ValueError(f"tabulation requested for unknown formula: {key}")
+
         # TODO #348
         self.terminal_velocity_class = {
             "GunnKinzer1949": GunnKinzer1949,
@@ -193,12 +203,21 @@ class Formulae:  # pylint: disable=too-few-public-methods,too-many-instance-attr
                 else:
                     value = attr_value.__class__.__name__
                 description.append(f"{attr}: {value}")
+        if self._tabulated:
+            description.append(
+                f"tabulated: {self._tabulated} (rtol={self._tabulation_rtol})"
+            )
         return ", ".join(description)
 
     @cached_property
     def flatten(self):
         """returns a "flattened" representation providing access to all formulae from within
         one Numba-JIT-usable named tuple, e.g. with obj.latent_heat_vapourisation__lv(T)
+        (formulae listed in the `tabulated` ctor argument, keyed by flattened names
+        with one `(min, max)` range per formula argument, are replaced with
+        lookup-table interpolants - see `PySDM.physics.impl.tabulation` - with
+        an estimated (not rigorous) bound of the relative interpolation error
+        not exceeding `tabulation_rtol`)
         """
         functions = {}
         for component in ["trivia"] + list(self._components):
@@ -206,6 +225,15 @@ class Formulae:  # pylint: disable=too-few-public-methods,too-many-instance-attr
                 attr = getattr(getattr(self, component), item)
                 if not item.startswith("__") and callable(attr):
                     functions[component + "__" + item] = attr
+        if not physics.impl.flag.DIMENSIONAL_ANALYSIS:
+            for key, ranges in self._tabulated.items():
+                functions[key] = tabulate(
+                    functions[key],
+                    ranges=ranges,
+                    rtol=self._tabulation_rtol,
+                    fastmath=self.fastmath,
+                    name=key,
+                )
         for attr in ("constants", "fastmath"):
             functions[attr] = getattr(self, attr)
         return namedtuple("FlattenedFormulae", functions.keys())(**functions)
@@ -255,7 +283,7 @@ def _formula(func, constants, dimensional_analysis, **kw):
                 **{
                     k: v
                     for k, v in conf.JIT_FLAGS.items()
-                    if k not in ("parallel", "error_model")
+                    if k not in ("parallel", "error_model", "nogil")
                 },
             )
         )
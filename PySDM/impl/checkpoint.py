@@ -0,0 +1,159 @@
+"""
+checkpoint/restart logic for `PySDM.particulator.Particulator` instances: particle attributes
+ (incl. the permutation index and the cell bookkeeping), the step counter and the fields
+ listed in the `checkpoint_fields` class attribute of the environment, dynamics and products
+ (storages, arrays, numbers and random-number generators, possibly nested in dicts, lists,
+ tuples or objects declaring `checkpoint_fields`) are stored as named contiguous arrays
+ in a single uncompressed `.npz` file; the Eulerian fields advected by solvers passed
+ to `PySDM.dynamics.EulerianAdvection` are covered (as exposed by the environment), while
+ other state held by objects defined outside of PySDM (e.g., the clock of a solver with
+ a time-dependent advector) is not and needs to be checkpointed by its owner
+"""
+
+import json
+from numbers import Number
+
+import numpy as np
+
+from PySDM.backends.impl_common.random_common import RandomCommon
+from PySDM.backends.impl_common.storage_utils import StorageBase
+
+FORMAT_VERSION = 1
+
+ATTRIBUTES = "attributes"
+INDEX = "particle_attributes"
+STATE = "state"
+SEP = "/"
+
+
+def _host_array(particulator, storage):
+    """returns a host-memory view of the raw storage data (a copy only if the
+    data lives on a device)"""
+    if isinstance(storage.data, np.ndarray):
+        return storage.data
+    return particulator.Storage.to_ndarray(storage)
+
+
+def _fields(obj, prefix):
+    """yields `(key, owner, name, value)` tuples for the fields listed in the
+    `checkpoint_fields` class attribute of `obj`, descending into dicts, lists, tuples
+    and objects declaring `checkpoint_fields` themselves (`None` values are skipped)"""
+    if isinstance(obj, dict):
+        items = ((str(key), key, value) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        items = ((str(i), i, value) for i, value in enumerate(obj))
+    else:
+        items = ((name, name, getattr(obj, name)) for name in obj.checkpoint_fields)
+
+    for label, name, value in items:
+        key = prefix + SEP + label
+        if value is None:
+            continue
+        if isinstance(value, (dict, list, tuple)) or hasattr(
+            value, "checkpoint_fields"
+        ):
+            yield from _fields(value, key)
+        elif isinstance(value, (StorageBase, np.ndarray, RandomCommon, Number)):
+            yield key, obj, name, value
+        else:
+            raise TypeError(f"unsupported type of checkpoint field '{key}'")
+
+
+def _stateful_fields(particulator):
+    components = {
+        "environment": {"": particulator.environment},
+        "dynamics": particulator.dynamics,
+        "products": particulator.products,
+    }
+    for component, objects in components.items():
+        for label, obj in objects.items():
+            if hasattr(obj, "checkpoint_fields"):
+                yield from _fields(
+                    obj, SEP.join(filter(None, (STATE, component, label)))
+                )
+
+
+def save(particulator, path):
+    """writes the state of `particulator` to an `.npz` file at `path`"""
+    arrays = {
+        "format_version": np.asarray(FORMAT_VERSION),
+        "n_sd": np.asarray(particulator.n_sd),
+        "n_steps": np.asarray(particulator.n_steps),
+        "initialised": np.asarray(len(particulator.initialisers) == 0),
+    }
+
+    for name, attr in particulator.attributes.get_base_attributes().items():
+        arrays[ATTRIBUTES + SEP + name] = _host_array(particulator, attr.data)
+
+    for key, value in particulator.attributes.checkpoint_state.items():
+        arrays[INDEX + SEP + key] = (
+            _host_array(particulator, value)
+            if isinstance(value, StorageBase)
+            else np.asarray(value)
+        )
+
+    for key, _, _, value in _stateful_fields(particulator):
+        if isinstance(value, StorageBase):
+            arrays[key] = _host_array(particulator, value)
+        elif isinstance(value, RandomCommon):
+            arrays[key] = np.asarray(json.dumps(value.get_state()))
+        else:
+            arrays[key] = np.asarray(value)
+
+    np.savez(path, **arrays)
+
+
+def _check_compatibility(particulator, checkpoint):
+    if int(checkpoint["format_version"]) != FORMAT_VERSION:
+        raise ValueError(
+            f"unsupported checkpoint format version: {checkpoint['format_version']}"
+        )
+    if int(checkpoint["n_sd"]) != particulator.n_sd:
+        raise ValueError(
+            f"checkpoint super-particle count ({checkpoint['n_sd']})"
+            f" differs from the particulator one ({particulator.n_sd})"
+        )
+
+
+def load_attributes(particulator, checkpoint) -> dict:
+    """returns initial values of base attributes (to be passed to
+    `PySDM.builder.Builder.build`) from an opened checkpoint file"""
+    _check_compatibility(particulator, checkpoint)
+    return {
+        key[len(ATTRIBUTES + SEP) :]: checkpoint[key]
+        for key in checkpoint.files
+        if key.startswith(ATTRIBUTES + SEP)
+    }
+
+
+def restore(particulator, checkpoint):
+    """sets the state of a freshly built `particulator` (constructed with the same
+    settings as the checkpointed one) from an opened checkpoint file"""
+    _check_compatibility(particulator, checkpoint)
+    particulator.n_steps = int(checkpoint["n_steps"])
+    if checkpoint["initialised"]:
+        particulator.initialisers.clear()
+
+    for name, attr in particulator.attributes.get_base_attributes().items():
+        attr.data.upload(checkpoint[ATTRIBUTES + SEP + name])
+
+    particulator.attributes.checkpoint_state = {
+        key[len(INDEX + SEP) :]: checkpoint[key]
+        for key in checkpoint.files
+        if key.startswith(INDEX + SEP)
+    }
+
+    for key, owner, name, value in _stateful_fields(particulator):
+        if key not in checkpoint.files:
+            raise ValueError(f"checkpoint lacks state of '{key}'")
+        saved = checkpoint[key]
+        if isinstance(value, StorageBase):
+            value.upload(saved)
+        elif isinstance(value, np.ndarray):
+            value[...] = saved
+        elif isinstance(value, RandomCommon):
+            value.set_state(json.loads(str(saved)))
+        elif isinstance(owner, (dict, list)):
+            owner[name] = saved.item()
+        else:
+            setattr(owner, name, saved.item())
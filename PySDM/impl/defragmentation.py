@@ -0,0 +1,53 @@
+"""
+policy for periodic physical reordering of super-particle attributes in memory
+ (see `PySDM.impl.particle_attributes.ParticleAttributes.defragment`) triggered
+ by `PySDM.particulator.Particulator.run` after each timestep once enabled with
+ `PySDM.particulator.Particulator.enable_defragmentation`: attributes are defragmented
+ every `interval` steps and/or whenever their `locality()` drops below `min_locality`
+"""
+
+import numpy as np
+
+
+def locality(attributes):
+    """fraction of super-particles stored within the memory range of their cell
+    in the cell-sorted layout (equal to one right after `attributes.defragment()`,
+    decreasing as super-particles change cells or are removed)"""
+    attributes.sanitize()
+    cell_start = attributes.cell_start.to_ndarray()
+    length = attributes.super_droplet_count
+    if length == 0:
+        return 1.0
+    idx = attributes._ParticleAttributes__idx  # pylint: disable=protected-access
+    slots = idx.to_ndarray()[:length]
+    cell_of_position = np.repeat(np.arange(len(cell_start) - 1), np.diff(cell_start))
+    in_range = slots < length
+    return float(
+        np.mean(
+            in_range
+            & (cell_of_position[np.where(in_range, slots, 0)] == cell_of_position)
+        )
+    )
+
+
+class Defragmentation:  # pylint: disable=too-few-public-methods
+    def __init__(self, particulator, *, interval=None, min_locality=None):
+        if interval is None and min_locality is None:
+            raise ValueError("either interval or min_locality has to be specified")
+        if interval is not None and interval < 1:
+            raise ValueError("interval has to be positive")
+        self.particulator = particulator
+        self.interval = interval
+        self.min_locality = min_locality
+        self.n_defragmentations = 0
+        self.__steps_since_last = 0
+
+    def __call__(self):
+        self.__steps_since_last += 1
+        attributes = self.particulator.attributes
+        if (self.interval is not None and self.__steps_since_last >= self.interval) or (
+            self.min_locality is not None and locality(attributes) < self.min_locality
+        ):
+            attributes.defragment()
+            self.n_defragmentations += 1
+            self.__steps_since_last = 0
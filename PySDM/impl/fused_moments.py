@@ -0,0 +1,207 @@
+"""
+planner fusing the statistical-moment computations requested by products
+ (through `PySDM.particulator.Particulator.moments` and
+ `PySDM.particulator.Particulator.spectrum_moments`) into a single pass over
+ super-particles: each request (moments of given ranks of an attribute, filtered
+ or binned by another attribute, weighted by a power of a third one) is added to
+ the plan upon its first occurrence, and whenever the particle state changed (new
+ timestep, change in the number of super-particles or update of any base attribute)
+ since the last pass, the first request triggers computation of all requests in
+ the plan with a single backend call (`fused_moments`), with the subsequent ones
+ served by copying the precomputed rows; learning the plan hence costs one pass
+ per distinct request at the first evaluation
+"""
+
+import numpy as np
+
+
+class _Request:  # pylint: disable=too-few-public-methods
+    def __init__(
+        self, *, pairs, x_attr, x_edges, weighting, skip_division, x_bins=None
+    ):
+        self.pairs = pairs
+        self.x_attr = x_attr
+        self.x_edges = x_edges
+        self.weighting = weighting
+        self.skip_division = skip_division
+        self.x_bins = x_bins  # keeping the storage alive (its id is used in keys)
+        self.first_row = None
+
+    @property
+    def n_bins(self):
+        return len(self.x_edges) - 1
+
+
+class FusedMoments:
+    def __init__(self, particulator):
+        self.particulator = particulator
+        self.requests = {}
+        self.n_passes = 0
+        self.__state = None
+        self.__names = None
+        self.__storage = None
+
+    def __state_signature(self):
+        attributes = self.particulator.attributes
+        return (
+            self.particulator.n_steps,
+            attributes.super_droplet_count,
+            tuple(attr.timestamp for attr in attributes.get_base_attributes().values()),
+        )
+
+    def __plan(self):
+        particulator = self.particulator
+        names = []
+        plan = {
+            key: []
+            for key in (
+                "ranks",
+                "x_edges",
+                "row_offsets",
+                "weighting_ranks",
+                "skip_division_by_m0",
+            )
+        }
+        plan["attr_indices"] = [[], [], []]  # moment, filter and weighting attributes
+        plan["row_offsets"].append(0)
+        for request in self.requests.values():
+            request.first_row = plan["row_offsets"][-1]
+            for attr, rank in request.pairs:
+                for row, name in enumerate(
+                    (attr, request.x_attr, request.weighting[0])
+                ):
+                    if name not in names:
+                        names.append(name)
+                    plan["attr_indices"][row].append(names.index(name))
+                plan["ranks"].append(rank)
+                plan["x_edges"].extend(request.x_edges)
+                plan["row_offsets"].append(plan["row_offsets"][-1] + request.n_bins)
+                plan["weighting_ranks"].append(request.weighting[1])
+                plan["skip_division_by_m0"].append(request.skip_division)
+
+        n_rows = plan["row_offsets"][-1]
+        self.__names = names
+        self.__storage = {
+            key: particulator.Storage.from_ndarray(
+                np.asarray(
+                    values,
+                    dtype={
+                        "ranks": float,
+                        "x_edges": float,
+                        "weighting_ranks": float,
+                        "skip_division_by_m0": bool,
+                    }.get(key, np.int64),
+                )
+            )
+            for key, values in plan.items()
+        }
+        self.__storage["attr_data"] = particulator.Storage.empty(
+            (len(names), particulator.n_sd), dtype=float
+        )
+        for key in ("moment_0", "moments"):
+            self.__storage[key] = particulator.Storage.empty(
+                (n_rows, particulator.mesh.n_cell), dtype=float
+            )
+
+    def __compute(self):
+        attributes = self.particulator.attributes
+        for index, name in enumerate(self.__names):
+            self.__storage["attr_data"][index, :][:] = attributes[name]
+        self.particulator.backend.fused_moments(
+            multiplicity=attributes["multiplicity"],
+            cell_id=attributes["cell id"],
+            idx=attributes._ParticleAttributes__idx,  # pylint: disable=protected-access
+            length=attributes.super_droplet_count,
+            **self.__storage,
+        )
+        self.n_passes += 1
+
+    def __get(self, key, request_factory):
+        if key not in self.requests:
+            self.requests[key] = request_factory()
+            self.__plan()
+            self.__state = None
+        state = self.__state_signature()
+        if state != self.__state:
+            self.__compute()
+            self.__state = state
+        return self.requests[key]
+
+    def moments(
+        self,
+        *,
+        moment_0,
+        moments,
+        specs: dict,
+        attr_name,
+        attr_range,
+        weighting_attribute,
+        weighting_rank,
+        skip_division_by_m0,
+    ):
+        """see `PySDM.particulator.Particulator.moments`"""
+        pairs = tuple((attr, rank) for attr in specs for rank in specs[attr])
+        if len(pairs) == 0:
+            pairs = ((next(iter(specs)), 0),)
+        key = (
+            "moments",
+            pairs,
+            attr_name,
+            tuple(attr_range),
+            weighting_attribute,
+            weighting_rank,
+            skip_division_by_m0,
+        )
+        request = self.__get(
+            key,
+            lambda: _Request(
+                pairs=pairs,
+                x_attr=attr_name,
+                x_edges=tuple(attr_range),
+                weighting=(weighting_attribute, weighting_rank),
+                skip_division=skip_division_by_m0,
+            ),
+        )
+        moment_0[:] = self.__storage["moment_0"][request.first_row, :]
+        n_ranks = sum(len(ranks) for ranks in specs.values())
+        if moments.shape[0] != n_ranks:
+            moments[:] = 0.0
+        for k in range(n_ranks):
+            moments[k, :][:] = self.__storage["moments"][request.first_row + k, :]
+
+    def spectrum_moments(
+        self,
+        *,
+        moment_0,
+        moments,
+        attr,
+        rank,
+        attr_bins,
+        attr_name,
+        weighting_attribute,
+        weighting_rank,
+    ):
+        """see `PySDM.particulator.Particulator.spectrum_moments`"""
+        key = (
+            "spectrum_moments",
+            attr,
+            rank,
+            attr_name,
+            id(attr_bins),
+            weighting_attribute,
+            weighting_rank,
+        )
+        request = self.__get(
+            key,
+            lambda: _Request(
+                pairs=((attr, rank),),
+                x_attr=attr_name,
+                x_edges=tuple(attr_bins.to_ndarray()),
+                weighting=(weighting_attribute, weighting_rank),
+                skip_division=False,
+                x_bins=attr_bins,
+            ),
+        )
+        rows = slice(request.first_row, request.first_row + request.n_bins)
+        moment_0[:] = self.__storage["moment_0"][rows]
+        moments[:] = self.__storage["moments"][rows]
@@ -7,10 +7,10 @@ from typing import Dict
 
 import numpy as np
 
-from PySDM.attributes.impl.attribute import Attribute
+from PySDM.attributes.impl import Attribute, BaseAttribute
 
 
-class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
+class ParticleAttributes:  # pylint: disable=too-many-instance-attributes,too-many-public-methods
     def __init__(
         self,
         *,
@@ -30,13 +30,16 @@ class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
 
         self.cell_idx = particulator.Index.identity_index(len(cell_start) - 1)
         self.__cell_start = particulator.Storage.from_ndarray(cell_start)
-        self.__cell_caretaker = particulator.backend.make_cell_caretaker(
+        self.cell_caretaker = particulator.backend.make_cell_caretaker(
             self.__idx.shape,
             self.__idx.dtype,
             len(self.__cell_start),
             scheme=particulator.sorting_scheme,
         )
         self.__sorted = False
+        self.__bucketed = False
+        self.__incremental = particulator.sorting_scheme == "incremental"
+        self.__reshuffle_required = True
         self.__attributes = attributes
 
     @property
@@ -61,8 +64,20 @@ class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
         assert self.healthy
         return len(self.__idx)
 
-    def mark_updated(self, key):
+    def mark_updated(self, key, moves_recorded=False):
+        """to be called after attribute values are changed in place; for "cell id",
+        the sorting by cell is invalidated as well - with the "incremental" sorting
+        scheme and the changes recorded using `cell_caretaker.update_cell_id()`
+        (`moves_recorded=True`), the next sort only re-buckets the recorded particles"""
         self.__attributes[key].mark_updated()
+        if key == "cell id":
+            self.__bucketed = (
+                self.__incremental
+                and moves_recorded
+                and (self.__sorted or self.__bucketed)
+            )
+            self.__sorted = False
+            self.__reshuffle_required = True
 
     def sanitize(self):
         if not self.healthy:
@@ -71,6 +86,8 @@ class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
             self.__valid_n_sd = self.__idx.length
             self.healthy = True
             self.__sorted = False
+            self.__bucketed = False
+            self.__reshuffle_required = True
 
     def cut_working_length(self, length):
         assert length <= len(self.__idx)
@@ -95,20 +112,75 @@ class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
     def __contains__(self, key):
         return key in self.__attributes
 
-    def permutation(self, u01, local):
+    def permutation(self, u01, local, incremental=False):
         """apply Fisher-Yates algorithm to all super-droplets (local=False) or
-        otherwise on a per-cell basis"""
+        otherwise on a per-cell basis; with `incremental=True`, the per-cell
+        permutation from the previous call is only cheaply re-shuffled
+        (see `PySDM.backends.impl_common.index.make_Index`) unless the set of
+        super-droplets in any cell changed since then (or some cells are small)"""
         if local:
-            self.__idx.shuffle(u01, parts=self.cell_start)
+            if incremental and self.__incremental_permutation_possible():
+                self.__idx.shuffle_incremental(u01, parts=self.cell_start)
+            else:
+                self.__idx.shuffle(u01, parts=self.cell_start)
+            self.__reshuffle_required = False
         else:
             self.__idx.shuffle(u01)
             self.__sorted = False
+            self.__bucketed = False
+            self.__reshuffle_required = True
 
-    def __sort_by_cell_id(self):
-        self.__cell_caretaker(
-            self["cell id"], self.cell_idx, self.__cell_start, self.__idx
+    def permutation_u01_length(self, local, incremental=False):
+        """number of leading elements of `u01` used by `permutation()`"""
+        if local and incremental and self.__incremental_permutation_possible():
+            return self.__idx.shuffle_incremental_u01_length(parts=self.cell_start)
+        return self.super_droplet_count
+
+    def __incremental_permutation_possible(self):
+        return not self.__reshuffle_required and (
+            self.__idx.shuffle_incremental_u01_length(parts=self.cell_start) != 0
         )
+
+    def __sort_by_cell_id(self):
+        if self.__bucketed:
+            self.cell_caretaker(
+                self["cell id"],
+                self.cell_idx,
+                self.__cell_start,
+                self.__idx,
+                bucketed=True,
+            )
+        else:
+            self.cell_caretaker(
+                self["cell id"], self.cell_idx, self.__cell_start, self.__idx
+            )
         self.__sorted = True
+        self.__bucketed = False
+
+    def defragment(self):
+        """physically reorders values of all attributes in memory so that
+        super-particles are stored contiguously in the order of cells (and in
+        the current order within cells) and resets the permutation index to identity,
+        restoring the locality of memory access patterns
+        (see `PySDM.impl.defragmentation.locality`)"""
+        self.sanitize()
+        _ = self.cell_start
+        valid = self.__idx.to_ndarray()[: self.super_droplet_count]
+        permutation = np.concatenate(
+            (valid, np.setdiff1d(np.arange(self.__idx.shape[0]), valid))
+        ).astype(valid.dtype)
+        if self.__extensive_attribute_storage is not None:
+            self.__extensive_attribute_storage.upload(
+                self.__extensive_attribute_storage.to_ndarray(raw=True)[
+                    ..., permutation
+                ]
+            )
+        for key, attr in self.__attributes.items():
+            if key not in self.__extensive_keys:
+                attr.permute(permutation)
+        self.__idx.reset_index()
+        self.__bucketed = False
+        self.__reshuffle_required = True
 
     def get_extensive_attribute_storage(self):
         return self.__extensive_attribute_storage
@@ -119,7 +191,84 @@ class ParticleAttributes:  # pylint: disable=too-many-instance-attributes
     def has_attribute(self, attr):
         return attr in self.__attributes
 
+    def get_dependencies(self, key):
+        """returns names of all attributes (base and derived ones) which the value
+        of a given attribute depends on"""
+        names = set()
+        pending = list(getattr(self.__attributes[key], "dependencies", ()))
+        while pending:
+            dependency = pending.pop()
+            names.add(dependency.name)
+            pending.extend(getattr(dependency, "dependencies", ()))
+        return names
+
     def reset_idx(self):
         self.__valid_n_sd = self.__idx.shape[0]
         self.__idx.reset_index()
         self.healthy = False
+        self.__bucketed = False
+        self.__reshuffle_required = True
+
+    def append_idx(self, slots):
+        """adds super-droplets stored at given `slots` (not referenced by the index,
+        e.g., freed by removal of other ones) to the end of the index, invalidating
+        the sorting by cell"""
+        length = self.super_droplet_count
+        if length + len(slots) > self.__idx.shape[0]:
+            raise ValueError("not enough space in the index")
+        idx = self.__idx.to_ndarray()
+        idx[length : length + len(slots)] = slots
+        self.__idx.upload(idx)
+        self.__idx.length = self.__idx.INT(length + len(slots))
+        self.__valid_n_sd = length + len(slots)
+        self.__sorted = False
+        self.__bucketed = False
+        self.__reshuffle_required = True
+
+    def get_base_attributes(self):
+        """returns all non-derived attributes (i.e., those constituting the particle
+        state, with values in `data` storages and update counters in `timestamp`)"""
+        return {
+            key: attr
+            for key, attr in self.__attributes.items()
+            if isinstance(attr, BaseAttribute)
+        }
+
+    @property
+    def checkpoint_state(self):
+        """permutation index and cell bookkeeping state (see `PySDM.impl.checkpoint`);
+        when set (with arrays loaded from a checkpoint file), all base attributes
+        are marked as updated"""
+        state = {
+            "idx": self.__idx,
+            "idx_length": self.__idx.length,
+            "valid_n_sd": self.__valid_n_sd,
+            "healthy": self.__healthy_memory,
+            "cell_idx": self.cell_idx,
+            "cell_start": self.__cell_start,
+            "sorted": self.__sorted,
+            "bucketed": self.__bucketed,
+            "reshuffle_required": self.__reshuffle_required,
+        }
+        if self.__incremental:
+            state["cell_moves"] = self.cell_caretaker.moves
+            state["cell_n_moved"] = self.cell_caretaker.n_moved
+        return state
+
+    @checkpoint_state.setter
+    def checkpoint_state(self, state):
+        self.__idx.upload(state["idx"])
+        self.__idx.length = self.__idx.INT(state["idx_length"])
+        self.__valid_n_sd = int(state["valid_n_sd"])
+        self.__healthy_memory.upload(state["healthy"])
+        self.cell_idx.upload(state["cell_idx"])
+        self.__cell_start.upload(state["cell_start"])
+        self.__sorted = bool(state["sorted"])
+        self.__bucketed = bool(state.get("bucketed", False))
+        self.__reshuffle_required = bool(state.get("reshuffle_required", True))
+        if self.__incremental and "cell_moves" in state:
+            self.cell_caretaker.moves.upload(state["cell_moves"])
+            self.cell_caretaker.n_moved = int(state["cell_n_moved"])
+        for attr in self.__attributes.values():
+            if isinstance(attr, BaseAttribute):
+                attr.mark_updated()
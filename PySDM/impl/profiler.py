@@ -0,0 +1,214 @@
+"""
+hierarchical profiler of `PySDM.particulator.Particulator` runs: wall time, call counts
+ and an estimate of bytes touched (sizes of the storages and arrays passed as arguments,
+ regardless of how much of them is actually read or written) are recorded for each dynamic
+ and for each backend method (and cell-sorting) call within it; backend methods are
+ instrumented only while a profiler is attached to any of the particulators sharing
+ the backend, and calls are recorded only by the profiler of the particulator running
+ the dynamic being executed (in the calling thread), hence other particulators sharing
+ the backend are not affected; with profiling disabled the only overhead is a single
+ check per dynamic per timestep
+"""
+
+import inspect
+import json
+import threading
+import time
+
+import numpy as np
+
+from PySDM.backends.impl_common.storage_utils import StorageBase
+
+
+def _nbytes(arg):
+    if isinstance(arg, StorageBase):
+        return int(np.prod(arg.shape)) * np.dtype(arg.dtype).itemsize
+    if isinstance(arg, np.ndarray):
+        return arg.nbytes
+    if isinstance(arg, dict):
+        return sum(_nbytes(value) for value in arg.values())
+    if isinstance(arg, (tuple, list)):
+        return sum(_nbytes(value) for value in arg)
+    return 0
+
+
+def _substeps(dynamic):
+    counters = getattr(dynamic, "counters", None)
+    if isinstance(counters, dict) and "n_substeps" in counters:
+        return int(counters["n_substeps"].to_ndarray().max())
+    n_substeps = getattr(dynamic, "_n_substeps", None)
+    if isinstance(n_substeps, (int, np.integer)):
+        return int(n_substeps)
+    return None
+
+
+class _Record:  # pylint: disable=too-few-public-methods
+    def __init__(self):
+        self.calls = 0
+        self.time = 0.0
+        self.bytes = 0
+        self.substeps = None
+        self.children = {}
+
+    def as_dict(self):
+        result = {"calls": self.calls, "time": self.time, "bytes": self.bytes}
+        if self.substeps is not None:
+            result["substeps"] = self.substeps
+        if self.children:
+            result["children"] = {
+                key: child.as_dict() for key, child in self.children.items()
+            }
+        return result
+
+
+_ACTIVE = threading.local()
+_INSTRUMENTED = {}
+
+
+def _active_profiler():
+    return getattr(_ACTIVE, "profiler", None)
+
+
+def _instrumented(name, method):
+    def wrapper(*args, **kwargs):
+        profiler = _active_profiler()
+        if profiler is None:
+            return method(*args, **kwargs)
+        return profiler.region(name, "backend", method, *args, **kwargs)
+
+    return wrapper
+
+
+def _instrument(backend):
+    """wraps public methods of the backend instance (once per backend, reference-counted)"""
+    key = id(backend)
+    if key not in _INSTRUMENTED:
+        for name, member in inspect.getmembers(type(backend)):
+            if name.startswith("_") or not inspect.isfunction(member):
+                continue
+            setattr(backend, name, _instrumented(name, getattr(backend, name)))
+        _INSTRUMENTED[key] = 0
+    _INSTRUMENTED[key] += 1
+
+
+def _uninstrument(backend):
+    key = id(backend)
+    _INSTRUMENTED[key] -= 1
+    if _INSTRUMENTED[key] == 0:
+        del _INSTRUMENTED[key]
+        for name, member in inspect.getmembers(type(backend)):
+            if not name.startswith("_") and inspect.isfunction(member):
+                delattr(backend, name)
+
+
+class _TimedCaretaker:
+    """times the sorting calls of a cell caretaker while delegating access (and
+    assignment) to its other attributes (e.g., the moves recorded with
+    the "incremental" sorting scheme) to the caretaker itself"""
+
+    def __init__(self, caretaker, timed_call):
+        object.__setattr__(self, "caretaker", caretaker)
+        object.__setattr__(self, "timed_call", timed_call)
+
+    def __call__(self, *args, **kwargs):
+        return self.timed_call(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.caretaker, name)
+
+    def __setattr__(self, name, value):
+        setattr(self.caretaker, name, value)
+
+
+class Profiler:
+    """records wall time, call counts and estimated bytes touched in a tree of regions:
+    dynamics (entered through `region` by `PySDM.particulator.Particulator.run`) and,
+    within them, calls to the backend methods and to the cell sorting of the particulator
+    the profiler is attached to (the profiler being active in the calling thread while
+    a dynamic is executed)"""
+
+    @staticmethod
+    def __clock():
+        return time.perf_counter()
+
+    def __init__(self, trace=False):
+        self.__root = _Record()
+        self.__stack = [self.__root]
+        self.__events = [] if trace else None
+        self.__t0 = self.__clock()
+        self.__detached = None
+
+    def region(self, name, category, fun, *args, **kwargs):
+        """calls `fun(*args, **kwargs)` recording its wall time within the current region"""
+        parent = self.__stack[-1]
+        if name not in parent.children:
+            parent.children[name] = _Record()
+        record = parent.children[name]
+        self.__stack.append(record)
+        outer = _active_profiler()
+        _ACTIVE.profiler = self
+        start = self.__clock()
+        try:
+            return fun(*args, **kwargs)
+        finally:
+            duration = self.__clock() - start
+            _ACTIVE.profiler = outer
+            self.__stack.pop()
+            n_bytes = _nbytes(args) + _nbytes(kwargs)
+            record.calls += 1
+            record.time += duration
+            record.bytes += n_bytes
+            if category == "dynamic":
+                record.substeps = _substeps(fun)
+            if self.__events is not None:
+                self.__events.append(
+                    {
+                        "name": name,
+                        "cat": category,
+                        "ph": "X",
+                        "ts": (start - self.__t0) * 1e6,
+                        "dur": duration * 1e6,
+                        "pid": 0,
+                        "tid": 0,
+                        "args": {"bytes": n_bytes},
+                    }
+                )
+
+    def wrap(self, name, category, fun):
+        """returns `fun` wrapped in a call to `region`"""
+
+        def wrapper(*args, **kwargs):
+            return self.region(name, category, fun, *args, **kwargs)
+
+        return wrapper
+
+    def attach(self, particulator):
+        """instruments the particulator's backend methods and cell sorting"""
+        _instrument(particulator.backend)
+        caretaker = particulator.attributes.cell_caretaker
+        particulator.attributes.cell_caretaker = _TimedCaretaker(
+            caretaker, self.wrap("counting sort", "backend", caretaker)
+        )
+        self.__detached = particulator, caretaker
+
+    def detach(self):
+        """restores the particulator's backend and cell sorting"""
+        if self.__detached is not None:
+            particulator, caretaker = self.__detached
+            _uninstrument(particulator.backend)
+            particulator.attributes.cell_caretaker = caretaker
+            self.__detached = None
+
+    def report(self) -> dict:
+        """returns a nested dictionary with `calls`, `time` [s], `bytes` (an estimate,
+        see module docstring) and (if available) `substeps` for each dynamic and for
+        each backend call within ("children")"""
+        return {key: record.as_dict() for key, record in self.__root.children.items()}
+
+    def to_chrome_trace(self, file):
+        """writes the recorded events in the Chrome Trace Event format (viewable with,
+        e.g., chrome://tracing or https://ui.perfetto.dev), requires `trace=True`"""
+        if self.__events is None:
+            raise ValueError("trace recording not enabled")
+        with open(file, "w", encoding="utf-8") as stream:
+            json.dump({"traceEvents": self.__events}, stream)
@@ -0,0 +1,127 @@
+"""
+dependency-aware scheduling of dynamics within a timestep (used by
+ `PySDM.particulator.Particulator.run` if `particulator.scheduler == "dag"`):
+ each dynamic may declare the `reads` and `writes` sets of names of the state it
+ accesses (attribute names, `IDX` for the order and count of super-particles, i.e.,
+ sorting by cell, shuffling and removal, `ENVIRONMENT` for the ambient thermodynamic
+ state, plus the Eulerian fields it declares in `eulerian_fields`, considered as both
+ read and written); at each step, a directed acyclic graph is built in which a dynamic
+ depends on all preceding ones (in the order of registration) it conflicts with
+ (one writing what the other reads or writes), and dynamics with all predecessors
+ completed are run concurrently on a thread pool (Numba-compiled backend routines
+ release the GIL, see `PySDM.backends.impl_numba.conf`) - the results are hence the
+ same as with the sequential execution; dynamics not declaring both `reads`
+ and `writes` (or declaring them as `None`) conflict with all other dynamics;
+ derived attributes read by a dynamic are updated before it is started
+ (and their dependencies are considered as read as well); as Numba-parallel backend
+ routines may then be launched from several threads at once, a thread-safe Numba
+ threading layer (one of `THREAD_SAFE_LAYERS`, see the `NUMBA_THREADING_LAYER`
+ env var) is required
+"""
+
+from concurrent.futures import FIRST_COMPLETED, wait
+from functools import lru_cache
+
+import numba
+import numpy as np
+
+from PySDM.impl.thread_pool import thread_pool
+
+IDX = "idx"
+ENVIRONMENT = "environment"
+THREAD_SAFE_LAYERS = ("tbb", "omp")
+
+
+@numba.njit(parallel=True)
+def _parallel_noop(arr):
+    for i in numba.prange(arr.shape[0]):  # pylint: disable=not-an-iterable
+        arr[i] = i
+
+
+@lru_cache()
+def numba_threading_layer():
+    """returns the name of the Numba threading layer (initialised, if needed, by
+    launching a trivial parallel function) or `None` if JIT is disabled"""
+    if numba.config.DISABLE_JIT:  # pylint: disable=no-member
+        return None
+    _parallel_noop(np.empty(1))
+    return numba.threading_layer()
+
+
+class DAGScheduler:
+    def __init__(self, particulator):
+        layer = numba_threading_layer()
+        if layer not in (None, *THREAD_SAFE_LAYERS):
+            raise ValueError(
+                "DAG scheduler requires a thread-safe Numba threading layer"
+                f" ({' or '.join(THREAD_SAFE_LAYERS)}), got: {layer}"
+                " (try other setting of the NUMBA_THREADING_LAYER env var?)"
+            )
+        self.particulator = particulator
+
+    def __accesses(self, dynamic):
+        reads = getattr(dynamic, "reads", None)
+        writes = getattr(dynamic, "writes", None)
+        if reads is None or writes is None:
+            return None
+        attributes = self.particulator.attributes
+        fields = set(getattr(dynamic, "eulerian_fields", None) or ())
+        reads, writes = set(reads) | fields, set(writes) | fields
+        for name in tuple(reads):
+            if name in attributes:
+                reads |= attributes.get_dependencies(name) | {IDX}
+        return reads, writes
+
+    def graph(self):
+        """returns a dictionary mapping keys of dynamics to tuples of keys of
+        the preceding dynamics they depend on"""
+        keys = tuple(self.particulator.dynamics.keys())
+        accesses = [self.__accesses(self.particulator.dynamics[key]) for key in keys]
+        return {
+            key: tuple(
+                keys[i] for i in range(j) if self.__conflict(accesses[i], accesses[j])
+            )
+            for j, key in enumerate(keys)
+        }
+
+    @staticmethod
+    def __conflict(first, second):
+        if first is None or second is None:
+            return True
+        (first_reads, first_writes), (second_reads, second_writes) = first, second
+        return not (
+            first_writes.isdisjoint(second_reads | second_writes)
+            and second_writes.isdisjoint(first_reads)
+        )
+
+    def __run(self, key, advection):
+        dynamic = self.particulator.dynamics[key]
+        with self.particulator.timers[key]:
+            if advection is not None:
+                advection.wait_for(dynamic)
+            dynamic()
+
+    def __update_derived_attributes(self, dynamic):
+        attributes = self.particulator.attributes
+        for name in getattr(dynamic, "reads", None) or ():
+            if name in attributes:
+                _ = attributes[name]
+
+    def step(self, advection=None):
+        """runs all dynamics (waiting for the `advection` as in the sequential mode)"""
+        remaining = {key: set(pred) for key, pred in self.graph().items()}
+        done = set()
+        running = {}
+        while remaining or running:
+            for key in [key for key, pred in remaining.items() if pred <= done]:
+                del remaining[key]
+                self.__update_derived_attributes(self.particulator.dynamics[key])
+                future = thread_pool("scheduler").submit(self.__run, key, advection)
+                running[future] = key
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                key = running.pop(future)
+                if future.exception() is not None:
+                    wait(running)
+                    raise future.exception()
+                done.add(key)
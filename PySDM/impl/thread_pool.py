@@ -0,0 +1,17 @@
+"""
+process-wide thread pools (created upon first use) for work run in the background:
+ `PySDM.dynamics.EulerianAdvection` steps, dynamics run concurrently by
+ `PySDM.impl.scheduler` and numbers generated in advance by the Numba-backend
+ `AsyncRandom`; single-worker pools run the submitted tasks in submission order
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+
+@lru_cache()
+def thread_pool(name, max_workers=None):
+    """returns the thread pool of a given `name` (threads named `PySDM-{name}`)"""
+    return ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix=f"PySDM-{name}"
+    )
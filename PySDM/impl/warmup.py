@@ -0,0 +1,98 @@
+"""
+ahead-of-time warm-up (triggering JIT compilation) of all backend kernels used by
+ a `PySDM.particulator.Particulator` being built: a twin particulator is built with
+ the same backend (hence sharing the JIT-compiled kernels) and with copies of
+ the environment, dynamics and products, but with a handful of super-particles (the
+ leading elements of the given attribute arrays, thus of the right dtypes and values),
+ a single timestep is carried out on it and all its attributes and products are
+ evaluated; the twin is discarded afterwards, hence the particulator being built
+ is not affected
+"""
+
+import time
+from collections import Counter
+from copy import deepcopy
+
+import numba
+import numpy as np
+from numba.core import event
+
+N_SD = 8
+
+
+def _kernel_compile_times(records):
+    """returns compilation wall time per JIT-compiled function (incl. the time spent
+    compiling the functions it calls)"""
+    started = {}
+    result = Counter()
+    for timestamp, record in records:
+        key = id(record.data["dispatcher"]), str(record.data["args"])
+        if record.is_start:
+            started[key] = timestamp
+        elif key in started:
+            result[
+                record.data["dispatcher"].py_func.__qualname__
+            ] += timestamp - started.pop(key)
+    return dict(result)
+
+
+def _timed(fun):
+    start = time.perf_counter()
+    fun()
+    return time.perf_counter() - start
+
+
+def _step(dynamic):
+    dynamic()
+    if hasattr(dynamic, "wait"):  # e.g., asynchronous Eulerian advection
+        dynamic.wait()
+
+
+def dummy_attributes(attributes: dict, n_sd=N_SD) -> dict:
+    """returns copies of the leading `n_sd` elements of the given attribute arrays
+    (for multi-dimensional ones, e.g., positions, along the last axis)"""
+    n_sd = min(n_sd, len(attributes["multiplicity"]))
+    return {
+        key: np.array(np.asarray(value)[..., :n_sd])
+        for key, value in attributes.items()
+    }
+
+
+def detached_copies(particulator, products):
+    """returns copies of the environment of `particulator` (incl. values set after
+    its registration, e.g., in `PySDM.environments.box.Box`), of its dynamics and
+    of the given `products`, none referring to `particulator` (or to the originals),
+    to be registered with another builder"""
+    return deepcopy(
+        (
+            particulator.environment,
+            tuple(particulator.dynamics.values()),
+            tuple(products),
+        ),
+        memo={id(particulator): None},
+    )
+
+
+def warmup(twin) -> dict:
+    """carries out a timestep and evaluates all attributes and products of the `twin`
+    particulator, returns a report with wall times of the warm-up of each dynamic,
+    attribute and product, as well as JIT compilation times of each kernel"""
+    report = {"dynamics": {}, "attributes": {}, "products": {}}
+    with event.install_recorder("numba:compile") as recorder:
+        for initialiser in twin.initialisers:
+            initialiser.setup()
+        twin.initialisers.clear()
+        for key, dynamic in twin.dynamics.items():
+            report["dynamics"][key] = _timed(lambda dynamic=dynamic: _step(dynamic))
+        twin.n_steps += 1
+        twin._notify_observers()  # pylint: disable=protected-access
+        for key in twin.attributes.keys():
+            report["attributes"][key] = _timed(lambda key=key: twin.attributes[key])
+        for key, product in twin.products.items():
+            report["products"][key] = _timed(product.get)
+    report["kernels"] = (
+        {}
+        if numba.config.DISABLE_JIT  # pylint: disable=no-member
+        else _kernel_compile_times(recorder.buffer)
+    )
+    return report
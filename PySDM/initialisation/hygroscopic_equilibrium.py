@@ -1,5 +1,11 @@
 """
 Koehler-curve equilibrium in unsaturated conditions
+
+The root-finding kernels are compiled once per formulae choice, particles sharing
+ identical (temperature, relative humidity, kappa, f_org, radius) are solved only once,
+ and the unique problems (sorted by ambient state and radius) are split into contiguous
+ chunks solved in parallel, with the root bracket in each chunk warm-started from
+ the previous solutions.
 """
 
 import numba
@@ -12,116 +18,229 @@ from ..backends.impl_numba.warnings import warn
 default_rtol = 1e-5
 default_max_iters = 64
 
+_SOLVERS = {}
+
 # pylint: disable=too-many-locals,too-many-arguments
 
 
+def _parallel_supported():
+    try:
+        numba.parfors.parfor.ensure_parallel_support()
+    except numba.core.errors.UnsupportedParforsError:
+        return False
+    return True
+
+
+@numba.njit(**{**JIT_FLAGS, "parallel": False})
+def _warm_bracket(minfun, args, bracket, guess, step):
+    """narrows the `(a, b, fa, fb)` bracket evaluating `minfun` at the guess and then
+    at points stepping away from it (towards the root) with a doubling relative step"""
+    a, b, fa, fb = bracket
+    n_evals = 0
+    c = guess
+    while a < c < b and step < 1:
+        fc = minfun(c, *args)
+        n_evals += 1
+        if fc == 0:
+            return c, b, fc, fb, n_evals
+        if fa * fc < 0:
+            b, fb = c, fc
+            c *= 1 - step
+        else:
+            a, fa = c, fc
+            c *= 1 + step
+        step *= 2
+    return a, b, fa, fb, n_evals
+
+
+@numba.njit(**{**JIT_FLAGS, "parallel": False})
+def _same_state(
+    T, RH, kappa, f_org, i, j
+):  # pylint: disable=too-many-positional-arguments
+    return (
+        T[i] == T[j]
+        and RH[i] == RH[j]
+        and kappa[i] == kappa[j]
+        and f_org[i] == f_org[j]
+    )
+
+
+def _make_solver(*, get_bounds, get_args, minfun, formulae, skip_fa_lt_zero):
+    within_tolerance = formulae.trivia.within_tolerance
+    jit_flags = {
+        **JIT_FLAGS,
+        **{"fastmath": formulae.fastmath, "parallel": _parallel_supported()},
+    }
+
+    @numba.njit(**jit_flags)
+    def solver(
+        radii_in, T, RH, kappa, f_org, chunk_start, warm_start, rtol, max_iters
+    ):  # pylint: disable=too-many-positional-arguments
+        radii_out = np.empty_like(radii_in)
+        iters = np.zeros(len(radii_in), dtype=np.int64)
+        solved = np.zeros(len(radii_in), dtype=np.bool_)
+        warm_evals = np.zeros(len(radii_in), dtype=np.int64)
+        for chunk in numba.prange(  # pylint: disable=not-an-iterable
+            len(chunk_start) - 1
+        ):
+            step = rtol
+            for i in range(chunk_start[chunk], chunk_start[chunk + 1]):
+                a, b = get_bounds(radii_in[i], T[i], kappa[i])
+
+                if not a < b:
+                    radii_out[i] = radii_in[i]
+                    continue
+
+                args = get_args(T[i], RH[i], kappa[i], radii_in[i], f_org[i])
+                fa, fb = minfun(a, *args), minfun(b, *args)
+
+                if skip_fa_lt_zero and fa < 0:
+                    radii_out[i] = radii_in[i]
+                    continue
+
+                guess = np.nan
+                if (
+                    warm_start
+                    and i != chunk_start[chunk]
+                    and fa * fb < 0
+                    and solved[i - 1]
+                    and _same_state(T, RH, kappa, f_org, i, i - 1)
+                ):
+                    growth = radii_out[i - 1] / radii_in[i - 1]
+                    if (
+                        i - 1 != chunk_start[chunk]
+                        and solved[i - 2]
+                        and _same_state(T, RH, kappa, f_org, i - 1, i - 2)
+                    ):
+                        growth += (
+                            (growth - radii_out[i - 2] / radii_in[i - 2])
+                            * np.log(radii_in[i] / radii_in[i - 1])
+                            / np.log(radii_in[i - 1] / radii_in[i - 2])
+                        )
+                    guess = growth * radii_in[i]
+                    a, b, fa, fb, warm_evals[i] = _warm_bracket(
+                        minfun, args, (a, b, fa, fb), guess, step
+                    )
+
+                radii_out[i], iters[i] = toms748_solve(
+                    minfun,
+                    args,
+                    a,
+                    b,
+                    fa,
+                    fb,
+                    rtol=rtol,
+                    max_iter=max_iters,
+                    within_tolerance=within_tolerance,
+                )
+                solved[i] = True
+                step = (
+                    rtol
+                    if np.isnan(guess)
+                    else max(rtol, 2 * abs(radii_out[i] / guess - 1))
+                )
+        return radii_out, iters, solved, warm_evals
+
+    return solver
+
+
 def _solve_equilibrium_radii(
     *,
+    solver,
     radii_in: np.ndarray,
-    get_bounds,
-    get_args,
-    minfun,
     environment,
     kappa,
     f_org: np.ndarray,
     cell_id: np.ndarray,
     rtol: float,
     max_iters: int,
-    skip_fa_lt_zero: bool,
+    warm_start: bool,
+    stats: dict,
     RH_range: tuple = (0, 1),
 ):
-    T = environment["T"].to_ndarray()
-    RH = environment["RH"].to_ndarray()
-    formulae = environment.particulator.formulae
-    within_tolerance = formulae.trivia.within_tolerance
-    jit_flags = {**JIT_FLAGS, **{"fastmath": formulae.fastmath}}
-
     if cell_id is None:
         cell_id = np.zeros_like(radii_in, dtype=int)
     if f_org is None:
         f_org = np.zeros_like(radii_in, dtype=float)
 
-    @numba.njit(**jit_flags)
-    def impl(radii_in, iters, T, RH, cell_id, kappa, f_org):
-        radii_out = np.empty_like(radii_in)
-        for i in numba.prange(len(radii_in)):  # pylint: disable=not-an-iterable
-            cid = cell_id[i]
-            a, b = get_bounds(radii_in[i], T[cid], kappa[i])
-
-            if not a < b:
-                radii_out[i] = radii_in[i]
-                iters[i] = 0
-                continue
-
-            RH_i = np.maximum(RH_range[0], np.minimum(RH_range[1], RH[cid]))
-            args = get_args(T[cid], RH_i, kappa[i], radii_in[i], f_org[i])
-            fa, fb = minfun(a, *args), minfun(b, *args)
-
-            if skip_fa_lt_zero and fa < 0:
-                radii_out[i] = radii_in[i]
-                iters[i] = 0
-                continue
-
-            radii_out[i], iters[i] = toms748_solve(
-                minfun,
-                args,
-                a,
-                b,
-                fa,
-                fb,
-                rtol=rtol,
-                max_iter=max_iters,
-                within_tolerance=within_tolerance,
-            )
-            if iters[i] == -1:
-                warn(
-                    msg="failed to find equilibrium particle size",
-                    file=__file__,
-                    context=(
-                        "i",
-                        i,
-                        "r",
-                        radii_in[i],
-                        "T",
-                        T[cid],
-                        "RH",
-                        RH_i,
-                        "f_org",
-                        f_org[i],
-                        "kappa",
-                        kappa[i],
-                    ),
-                )
-        return radii_out
+    T = environment["T"].to_ndarray()[cell_id]
+    RH = np.clip(environment["RH"].to_ndarray()[cell_id], *RH_range)
+
+    problems, inverse = np.unique(
+        np.column_stack(np.broadcast_arrays(T, RH, kappa, f_org, radii_in)).astype(
+            float
+        ),
+        axis=0,
+        return_inverse=True,
+    )
+    inverse = inverse.reshape(-1)
+    n_chunks = min(numba.get_num_threads(), len(problems)) if len(problems) else 0
+    chunk_start = np.linspace(0, len(problems), n_chunks + 1).astype(np.int64)
 
-    iters = np.empty_like(radii_in, dtype=int)
-    radii_out = impl(
-        radii_in,
-        iters,
+    T, RH, kappa, f_org, radii = (np.ascontiguousarray(col) for col in problems.T)
+    radii_out, iters, solved, warm_evals = solver(
+        radii,
         T,
         RH,
-        cell_id,
         kappa,
         f_org,
+        chunk_start,
+        warm_start,
+        rtol,
+        max_iters,
     )
+
+    for i in np.flatnonzero(iters == -1):
+        warn(
+            msg="failed to find equilibrium particle size",
+            file=__file__,
+            context=(
+                "r",
+                radii[i],
+                "T",
+                T[i],
+                "RH",
+                RH[i],
+                "f_org",
+                f_org[i],
+                "kappa",
+                kappa[i],
+            ),
+        )
+    if stats is not None:
+        stats.update(
+            {
+                "n_particles": len(radii_in),
+                "n_unique": len(problems),
+                "n_solved": int(np.count_nonzero(solved)),
+                "iters_total": int(iters[solved].sum()),
+                "iters_max": int(iters.max(initial=0)),
+                "warm_start_evals_total": int(warm_evals.sum()),
+            }
+        )
     assert (iters != max_iters).all() and (iters != -1).all()
-    return radii_out
+    return radii_out[inverse]
 
 
-def equilibrate_dry_radii(
-    *,
-    r_wet: np.ndarray,
-    environment,
-    kappa: np.ndarray,
-    f_org: np.ndarray = None,
-    cell_id: np.ndarray = None,
-    rtol=default_rtol,
-    max_iters=default_max_iters,
-):
-    formulae = environment.particulator.formulae
+def _cached_solver(kind, formulae, factory):
+    key = (
+        kind,
+        formulae.fastmath,
+        formulae.constants,
+        tuple(
+            getattr(formulae, component).__name__
+            for component in formulae._components  # pylint: disable=protected-access
+        ),
+    )
+    if key not in _SOLVERS:
+        _SOLVERS[key] = factory(formulae)
+    return _SOLVERS[key]
+
+
+def _dry_radii_solver(formulae):
     sigma = formulae.surface_tension.sigma
     phys_volume = formulae.trivia.volume
-    const = environment.particulator.formulae.constants
+    const = formulae.constants
     RH_eq = formulae.hygroscopicity.RH_eq
     jit_flags = {**JIT_FLAGS, **{"fastmath": formulae.fastmath}}
 
@@ -141,36 +260,19 @@ def equilibrate_dry_radii(
         )
         return relative_humidity - RH_eq(r_wet, temperature, kappa, r_dry_3, sgm)
 
-    return _solve_equilibrium_radii(
-        radii_in=r_wet,
-        get_args=get_args,
+    return _make_solver(
         get_bounds=get_bounds,
+        get_args=get_args,
         minfun=minfun_dry,
-        environment=environment,
-        kappa=kappa,
-        f_org=f_org,
-        cell_id=cell_id,
-        rtol=rtol,
-        max_iters=max_iters,
+        formulae=formulae,
         skip_fa_lt_zero=False,
-        RH_range=(0, 1),
     )
 
 
-def equilibrate_wet_radii(
-    *,
-    r_dry: np.ndarray,
-    environment,
-    kappa_times_dry_volume: np.ndarray,
-    f_org: np.ndarray = None,
-    cell_id: np.ndarray = None,
-    rtol=default_rtol,
-    max_iters=default_max_iters,
-):
-    formulae = environment.particulator.formulae
+def _wet_radii_solver(formulae):
     sigma = formulae.surface_tension.sigma
     phys_volume = formulae.trivia.volume
-    const = environment.particulator.formulae.constants
+    const = formulae.constants
     RH_eq = formulae.hygroscopicity.RH_eq
     r_cr = formulae.hygroscopicity.r_cr
     jit_flags = {**JIT_FLAGS, **{"fastmath": formulae.fastmath}}
@@ -192,17 +294,71 @@ def equilibrate_wet_radii(
         )
         return relative_humidity - RH_eq(r_wet, temperature, kappa, r_dry_3, sgm)
 
-    return _solve_equilibrium_radii(
-        radii_in=r_dry,
-        get_args=get_args,
+    return _make_solver(
         get_bounds=get_bounds,
+        get_args=get_args,
         minfun=minfun_wet,
+        formulae=formulae,
+        skip_fa_lt_zero=True,
+    )
+
+
+def equilibrate_dry_radii(
+    *,
+    r_wet: np.ndarray,
+    environment,
+    kappa: np.ndarray,
+    f_org: np.ndarray = None,
+    cell_id: np.ndarray = None,
+    rtol=default_rtol,
+    max_iters=default_max_iters,
+    warm_start: bool = True,
+    stats: dict = None,
+):
+    """returns dry radii in equilibrium with the given wet radii and ambient conditions;
+    if a `stats` dict is passed, it is filled with solver iteration statistics"""
+    return _solve_equilibrium_radii(
+        solver=_cached_solver(
+            "dry", environment.particulator.formulae, _dry_radii_solver
+        ),
+        radii_in=r_wet,
         environment=environment,
-        kappa=kappa_times_dry_volume / phys_volume(radius=r_dry),
+        kappa=kappa,
         f_org=f_org,
         cell_id=cell_id,
         rtol=rtol,
         max_iters=max_iters,
-        skip_fa_lt_zero=True,
+        warm_start=warm_start,
+        stats=stats,
+        RH_range=(0, 1),
+    )
+
+
+def equilibrate_wet_radii(
+    *,
+    r_dry: np.ndarray,
+    environment,
+    kappa_times_dry_volume: np.ndarray,
+    f_org: np.ndarray = None,
+    cell_id: np.ndarray = None,
+    rtol=default_rtol,
+    max_iters=default_max_iters,
+    warm_start: bool = True,
+    stats: dict = None,
+):
+    """returns wet radii in equilibrium with the given dry radii and ambient conditions;
+    if a `stats` dict is passed, it is filled with solver iteration statistics"""
+    formulae = environment.particulator.formulae
+    return _solve_equilibrium_radii(
+        solver=_cached_solver("wet", formulae, _wet_radii_solver),
+        radii_in=r_dry,
+        environment=environment,
+        kappa=kappa_times_dry_volume / formulae.trivia.volume(radius=r_dry),
+        f_org=f_org,
+        cell_id=cell_id,
+        rtol=rtol,
+        max_iters=max_iters,
+        warm_start=warm_start,
+        stats=stats,
         RH_range=(0, 1),
     )
@@ -15,7 +15,12 @@ from PySDM.backends.impl_common.index import make_Index
 from PySDM.backends.impl_common.indexed_storage import make_IndexedStorage
 from PySDM.backends.impl_common.pair_indicator import make_PairIndicator
 from PySDM.backends.impl_common.pairwise_storage import make_PairwiseStorage
+from PySDM.impl import checkpoint
+from PySDM.impl.defragmentation import Defragmentation
+from PySDM.impl.fused_moments import FusedMoments
 from PySDM.impl.particle_attributes import ParticleAttributes
+from PySDM.impl.profiler import Profiler
+from PySDM.impl.scheduler import DAGScheduler
 
 
 class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance-attributes
@@ -35,6 +40,7 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         self.n_steps = 0
 
         self.sorting_scheme = "default"
+        self.scheduler = "sequential"
         self.condensation_solver = None
 
         self.Index = make_Index(backend)  # pylint: disable=invalid-name
@@ -47,17 +53,85 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         )
 
         self.timers = {}
+        self.profiler = None
+        self.fused_moments = None
+        self.defragmentation = None
+        self.warmup_report = None
         self.null = self.Storage.empty(0, dtype=float)
 
     def run(self, steps):
         if len(self.initialisers) > 0:
             self._notify_initialisers()
+        advection = self.dynamics.get("EulerianAdvection")
+        if not hasattr(advection, "wait_for"):
+            advection = None
+        dag = self.__dag_scheduler()
         for _ in range(steps):
-            for key, dynamic in self.dynamics.items():
-                with self.timers[key]:
-                    dynamic()
+            if dag is not None:
+                dag.step(advection)
+            else:
+                for key, dynamic in self.dynamics.items():
+                    with self.timers[key]:
+                        if advection is not None:
+                            advection.wait_for(dynamic)
+                        if self.profiler is None:
+                            dynamic()
+                        else:
+                            self.profiler.region(key, "dynamic", dynamic)
             self.n_steps += 1
+            if self.defragmentation is not None:
+                self.defragmentation()
             self._notify_observers()
+        if advection is not None:
+            advection.wait()
+
+    def __dag_scheduler(self):
+        """returns `None` for sequential execution of dynamics (the default), or
+        the `PySDM.impl.scheduler.DAGScheduler` if `scheduler` is set to `"dag"`"""
+        if self.scheduler == "sequential":
+            return None
+        if self.scheduler != "dag":
+            raise ValueError(f"unknown scheduler: {self.scheduler}")
+        if self.profiler is not None:
+            raise NotImplementedError("profiling not supported with the DAG scheduler")
+        return DAGScheduler(self)
+
+    def enable_defragmentation(self, *, interval=None, min_locality=None):
+        """makes attributes be physically reordered in memory by cell after
+        every `interval` steps and/or whenever their locality drops below
+        `min_locality` (see `PySDM.impl.defragmentation`)"""
+        self.defragmentation = Defragmentation(
+            self, interval=interval, min_locality=min_locality
+        )
+        return self.defragmentation
+
+    def save_checkpoint(self, path):
+        """saves the simulation state (see `PySDM.impl.checkpoint`) to an `.npz` file,
+        for restarting with `PySDM.builder.Builder.from_checkpoint`"""
+        checkpoint.save(self, path)
+
+    def enable_profiling(self, trace=False) -> Profiler:
+        """starts recording per-dynamic and per-backend-call timings
+        (see `PySDM.impl.profiler`), with `trace=True` individual calls are recorded
+        as well allowing for Chrome-trace export"""
+        assert self.profiler is None
+        self.profiler = Profiler(trace=trace)
+        self.profiler.attach(self)
+        return self.profiler
+
+    def enable_fused_moments(self) -> FusedMoments:
+        """makes all subsequent moment computations (e.g., for products) be carried out
+        in a single pass over super-particles (see `PySDM.impl.fused_moments`)"""
+        if self.fused_moments is None:
+            self.fused_moments = FusedMoments(self)
+        return self.fused_moments
+
+    def disable_profiling(self) -> Profiler:
+        """stops profiling, returns the profiler with the recorded data"""
+        profiler = self.profiler
+        profiler.detach()
+        self.profiler = None
+        return profiler
 
     def _notify_observers(self):
         reversed_order_so_that_environment_is_last = reversed(self.observers)
@@ -93,9 +167,10 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
             return self.environment.mesh
         return None
 
-    def normalize(self, prob, norm_factor):
+    def normalize(self, prob, norm_factor, is_first_in_pair):
         self.backend.normalize(
             prob=prob,
+            is_first_in_pair=is_first_in_pair,
             cell_id=self.attributes["cell id"],
             cell_idx=self.attributes.cell_idx,
             cell_start=self.attributes.cell_start,
@@ -118,7 +193,17 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
             RH=self.environment.get_predicted("RH"),
         )
 
-    def condensation(self, *, rtol_x, rtol_thd, counters, RH_max, success, cell_order):
+    def condensation(
+        self,
+        *,
+        rtol_x,
+        rtol_thd,
+        counters,
+        RH_max,
+        success,
+        cell_order,
+        cell_cost=None,
+    ):  # pylint: disable=too-many-arguments
         """Updates droplet volumes by simulating condensation driven by prior changes
           in environment thermodynamic state, updates the environment state.
         In the case of parcel environment, condensation is driven solely by changes in
@@ -128,6 +213,8 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
           constant in time throughout the simulation.
         This function should only change environment's predicted `thd` and
           `water_vapour_mixing_ratio` (and not `rhod`).
+        If `cell_cost` is given, cells are distributed among threads so that the sums
+          of their costs are balanced (otherwise, in a round-robin manner using `cell_order`).
         """
         self.backend.condensation(
             solver=self.condensation_solver,
@@ -154,6 +241,7 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
             timestep=self.dt,
             counters=counters,
             cell_order=cell_order,
+            cell_cost=cell_cost,
             RH_max=RH_max,
             success=success,
             cell_id=self.attributes["cell id"],
@@ -221,6 +309,62 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         for key in self.attributes.get_extensive_attribute_keys():
             self.attributes.mark_updated(key)
 
+    def fused_collision_coalescence(
+        self,
+        *,
+        collision_kernel,
+        is_first_in_pair,
+        rand,
+        gamma,
+        norm_factor,
+        n_substeps,
+        adaptive,
+        dt_left,
+        dt_range,
+        stats_n_substep,
+        stats_dt_min,
+        collision_rate,
+        collision_rate_deficit,
+        coalescence_rate,
+    ):
+        # pylint: disable=too-many-locals
+        cell_id = self.attributes["cell id"]
+        self.backend.fused_collision_coalescence(
+            multiplicity=self.attributes["multiplicity"],
+            idx=self.attributes._ParticleAttributes__idx,
+            attributes=self.attributes.get_extensive_attribute_storage(),
+            pair_kernel=collision_kernel.pair_kernel,
+            pair_kernel_args=collision_kernel.pair_kernel_args,
+            kernel_attributes=tuple(
+                self.attributes[name]
+                for name in collision_kernel.pair_kernel_attributes
+            ),
+            cell_id=cell_id,
+            cell_idx=self.attributes.cell_idx,
+            cell_start=self.attributes.cell_start,
+            is_first_in_pair=is_first_in_pair,
+            rand=rand,
+            gamma=gamma,
+            norm_factor=norm_factor,
+            timestep=self.dt,
+            dv=self.mesh.dv,
+            n_substeps=n_substeps,
+            adaptive=adaptive,
+            dt_left=dt_left,
+            dt_range=dt_range,
+            stats_n_substep=stats_n_substep,
+            stats_dt_min=stats_dt_min,
+            collision_rate=collision_rate,
+            collision_rate_deficit=collision_rate_deficit,
+            coalescence_rate=coalescence_rate,
+            healthy=self.attributes._ParticleAttributes__healthy_memory,
+        )
+        is_first_in_pair.length = len(cell_id)
+        self.attributes.sanitize()
+        self.attributes.mark_updated("multiplicity")
+        for key in self.attributes.get_extensive_attribute_keys():
+            self.attributes.mark_updated(key)
+
     def oxidation(
         self,
         *,
@@ -229,6 +373,9 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         equilibrium_consts,
         dissociation_factors,
         do_chemistry_flag,
+        cells=None,
+        relative_change=None,
+        max_relative_change=None,
     ):
         self.backend.oxidation(
             n_sd=self.n_sd,
@@ -250,6 +397,11 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
             moles_H2O2=self.attributes["moles_H2O2"],
             moles_S_IV=self.attributes["moles_S_IV"],
             moles_S_VI=self.attributes["moles_S_VI"],
+            cell_order=np.arange(self.mesh.n_cell) if cells is None else cells,
+            cell_start_arg=self.attributes.cell_start,
+            idx=self.attributes._ParticleAttributes__idx,
+            relative_change=relative_change,
+            max_relative_change=max_relative_change,
         )
         for attr in ("moles_S_IV", "moles_S_VI", "moles_H2O2", "moles_O3"):
             self.attributes.mark_updated(attr)
@@ -263,11 +415,11 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         timestep,
         environment_mixing_ratios,
         do_chemistry_flag,
+        cells=None,
     ):
         self.backend.dissolution(
             n_cell=self.mesh.n_cell,
-            n_threads=1,
-            cell_order=np.arange(self.mesh.n_cell),
+            cell_order=np.arange(self.mesh.n_cell) if cells is None else cells,
             cell_start_arg=self.attributes.cell_start,
             idx=self.attributes._ParticleAttributes__idx,
             do_chemistry_flag=do_chemistry_flag,
@@ -296,23 +448,75 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
             temperature=self.environment.get_predicted("T"),
         )
 
-    def chem_recalculate_drop_data(self, *, dissociation_factors, equilibrium_consts):
+    def chem_recalculate_drop_data(
+        self, *, dissociation_factors, equilibrium_consts, droplets=None
+    ):
         self.backend.chem_recalculate_drop_data(
             dissociation_factors=dissociation_factors,
             equilibrium_consts=equilibrium_consts,
             pH=self.attributes["pH"],
             cell_id=self.attributes["cell id"],
+            droplets=droplets,
         )
 
+    def chem_droplets(self, cells):
+        """returns the ids of the super-droplets within the given cells"""
+        return self.backend.chem_droplets(
+            cell_order=cells,
+            cell_start_arg=self.attributes.cell_start,
+            idx=self.attributes._ParticleAttributes__idx,
+        )
+
+    def chem_save_state(
+        self, *, gaseous_compounds, cells, environment_mixing_ratios, saved
+    ):
+        """stores the mole amounts of the gaseous compounds in the super-droplets and
+        the ambient mixing ratios within the given cells in `saved` (a pair of dicts
+        with per-super-droplet storages and per-cell arrays)"""
+        self.backend.chem_copy_state(
+            droplets=self.chem_droplets(cells),
+            cells=cells,
+            source=(
+                {key: self.attributes["moles_" + key] for key in gaseous_compounds},
+                environment_mixing_ratios,
+            ),
+            target=saved,
+        )
+
+    def chem_restore_state(
+        self, *, gaseous_compounds, cells, environment_mixing_ratios, saved
+    ):
+        """reverts the changes made since `chem_save_state` in the given cells"""
+        self.backend.chem_copy_state(
+            droplets=self.chem_droplets(cells),
+            cells=cells,
+            source=saved,
+            target=(
+                {key: self.attributes["moles_" + key] for key in gaseous_compounds},
+                environment_mixing_ratios,
+            ),
+        )
+        for key in gaseous_compounds:
+            self.attributes.mark_updated(f"moles_{key}")
+
     def recalculate_cell_id(self):
+        """with the "incremental" sorting scheme, super-particles changing cell
+        are recorded for re-bucketing in the next sort"""
         if not self.attributes.has_attribute("cell origin"):
             return
-        self.backend.cell_id(
+        args = (
             self.attributes["cell id"],
             self.attributes["cell origin"],
             self.backend.Storage.from_ndarray(self.environment.mesh.strides),
         )
-        self.attributes._ParticleAttributes__sorted = False
+        if self.sorting_scheme == "incremental":
+            self.attributes.cell_caretaker.update_cell_id(
+                *args, self.attributes._ParticleAttributes__idx
+            )
+            self.attributes.mark_updated("cell id", moves_recorded=True)
+        else:
+            self.backend.cell_id(*args)
+            self.attributes.mark_updated("cell id")
 
     def sort_within_pair_by_attr(self, is_first_in_pair, attr_name):
         self.backend.sort_within_pair_by_attr(
@@ -346,6 +550,18 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         """
         if len(specs) == 0:
             raise ValueError("empty specs passed")
+        if self.fused_moments is not None:
+            self.fused_moments.moments(
+                moment_0=moment_0,
+                moments=moments,
+                specs=specs,
+                attr_name=attr_name,
+                attr_range=attr_range,
+                weighting_attribute=weighting_attribute,
+                weighting_rank=weighting_rank,
+                skip_division_by_m0=skip_division_by_m0,
+            )
+            return
         attr_data, ranks = [], []
         for attr in specs:
             for rank in specs[attr]:
@@ -388,6 +604,18 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         weighting_attribute="water mass",
         weighting_rank=0,
     ):
+        if self.fused_moments is not None:
+            self.fused_moments.spectrum_moments(
+                moment_0=moment_0,
+                moments=moments,
+                attr=attr,
+                rank=rank,
+                attr_bins=attr_bins,
+                attr_name=attr_name,
+                weighting_attribute=weighting_attribute,
+                weighting_rank=weighting_rank,
+            )
+            return
         attr_data = self.attributes[attr]
         self.backend.spectrum_moments(
             moment_0=moment_0,
@@ -448,6 +676,30 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
                 n_substeps=n_substeps,
             )
 
+    def displace_with_local_substeps(
+        self,
+        *,
+        displacement,
+        courant,
+        grid,
+        n_substeps_in_cell,
+        n_substeps_of_droplet,
+        sedimentation=None,
+        precipitation_counting_level_index=0,
+    ):  # pylint: disable=too-many-arguments
+        self.backend.displace_with_local_substeps(
+            displacement=displacement,
+            courant=courant,
+            cell_origin=self.attributes["cell origin"],
+            position_in_cell=self.attributes["position in cell"],
+            cell_id=self.attributes["cell id"],
+            n_substeps_in_cell=n_substeps_in_cell,
+            n_substeps_of_droplet=n_substeps_of_droplet,
+            grid=grid,
+            sedimentation=sedimentation,
+            precipitation_counting_level_index=precipitation_counting_level_index,
+        )
+
     def isotopic_fractionation(self, heavy_isotopes: tuple):
         for isotope in heavy_isotopes:
             self.backend.isotopic_fractionation(
@@ -513,9 +765,12 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
         for key in self.attributes.get_extensive_attribute_keys():
             self.attributes.mark_updated(key)
 
-    def deposition(self, adaptive: bool):
+    def deposition(self, *, adaptive: bool, n_substeps, success):
         self.backend.deposition(
             adaptive=adaptive,
+            n_cell=self.mesh.n_cell,
+            cell_start=self.attributes.cell_start,
+            idx=self.attributes._ParticleAttributes__idx,
             multiplicity=self.attributes["multiplicity"],
             signed_water_mass=self.attributes["signed water mass"],
             current_vapour_mixing_ratio=self.environment["water_vapour_mixing_ratio"],
@@ -523,12 +778,13 @@ class Particulator:  # pylint: disable=too-many-public-methods,too-many-instance
             current_dry_potential_temperature=self.environment["thd"],
             cell_volume=self.environment.mesh.dv,
             time_step=self.dt,
-            cell_id=self.attributes["cell id"],
             predicted_vapour_mixing_ratio=self.environment.get_predicted(
                 "water_vapour_mixing_ratio"
             ),
             predicted_dry_potential_temperature=self.environment.get_predicted("thd"),
             predicted_dry_air_density=self.environment.get_predicted("rhod"),
+            n_substeps=n_substeps,
+            success=success,
         )
         self.attributes.mark_updated("signed water mass")
         # TODO #1524 - should we update here?
@@ -0,0 +1,224 @@
+"""
+lookup-table (tabulated) counterparts of JIT-compiled physics formulae of one or two
+ arguments used within `PySDM.formulae.Formulae.flatten` if requested through
+ the `tabulated` argument of `PySDM.formulae.Formulae` - tables are linearly
+ (bilinearly) interpolated on uniform grids spanning given argument ranges (outside
+ of which the original formula is evaluated); the grids are refined until an estimated
+ bound of the relative interpolation error does not exceed a given tolerance: the
+ bound follows from the linear-interpolation error estimate, `step**2 / 8` times
+ the maximum absolute second derivative (summed over axes), with the second
+ derivatives estimated by second differences using values of the original formula
+ at the table nodes and all mid-points between them
+"""
+
+import inspect
+from types import SimpleNamespace
+
+import numba
+import numpy as np
+
+from PySDM.backends.impl_numba import conf
+
+MIN_NODES = 17
+MAX_NODES = {1: 2**20 + 1, 2: 2**11 + 1}
+
+_JIT_FLAGS = {**conf.JIT_FLAGS, "parallel": False, "cache": False}
+
+
+@numba.njit(**_JIT_FLAGS)
+def _evaluate_1d(fun, x):
+    out = np.empty(len(x))
+    for i, x_i in enumerate(x):
+        out[i] = fun(x_i)
+    return out
+
+
+@numba.njit(**_JIT_FLAGS)
+def _evaluate_2d(fun, x, y):
+    out = np.empty((len(x), len(y)))
+    for i, x_i in enumerate(x):
+        for j, y_j in enumerate(y):
+            out[i, j] = fun(x_i, y_j)
+    return out
+
+
+@numba.njit(**{**_JIT_FLAGS, "inline": "always"})
+def interpolate_1d(table, lo, inv_step, x):
+    s = (x - lo) * inv_step
+    i = min(int(s), len(table) - 2)
+    w = s - i
+    return table[i] + w * (table[i + 1] - table[i])
+
+
+@numba.njit(**{**_JIT_FLAGS, "inline": "always"})
+def interpolate_2d(
+    table, lo_x, inv_step_x, lo_y, inv_step_y, x, y
+):  # pylint: disable=too-many-positional-arguments,too-many-arguments
+    s = (x - lo_x) * inv_step_x
+    i = min(int(s), table.shape[0] - 2)
+    w_x = s - i
+    s = (y - lo_y) * inv_step_y
+    j = min(int(s), table.shape[1] - 2)
+    w_y = s - j
+    return (1 - w_x) * (table[i, j] + w_y * (table[i, j + 1] - table[i, j])) + w_x * (
+        table[i + 1, j] + w_y * (table[i + 1, j + 1] - table[i + 1, j])
+    )
+
+
+def _max_over_cells(values, axis):
+    """maxima over the three fine-grid points (two nodes and the mid-point between
+    them) spanning each table interval along a given `axis`"""
+    values = np.moveaxis(values, axis, 0)
+    return np.moveaxis(
+        np.maximum(np.maximum(values[:-2:2], values[1:-1:2]), values[2::2]), 0, axis
+    )
+
+
+def _abs_second_derivative(fine, step, axis):
+    """second-difference estimates of the absolute second derivative along `axis`
+    at all points of the `fine` grid (of spacing `step`), extended to its edges"""
+    fine = np.moveaxis(fine, axis, 0)
+    estimate = np.abs(fine[2:] - 2 * fine[1:-1] + fine[:-2]) / step**2
+    return np.moveaxis(np.concatenate((estimate[:1], estimate, estimate[-1:])), 0, axis)
+
+
+def _relative_error_bounds(fine, steps, name):
+    """per-axis contributions to the relative error bound of (multi)linear interpolation
+    in a table holding every other point of the `fine` grid of function values (i.e.,
+    with nodes `steps` apart, and mid-points between them), maximised over table cells:
+    `step**2 / 8` times the maximum of the absolute second derivative within a cell,
+    over the minimum of the absolute function value therein; the second derivatives
+    are estimated with second differences on the `fine` grid, hence the bound is
+    an estimate as well (exact for functions with piecewise-constant second
+    derivatives)"""
+    if not np.isfinite(fine).all():
+        raise ValueError(f"non-finite values of {name} within the tabulated range")
+    magnitude = -np.abs(fine)
+    for axis in range(fine.ndim):
+        magnitude = _max_over_cells(magnitude, axis)
+    bounds = []
+    for axis, step in enumerate(steps):
+        curvature = _abs_second_derivative(fine, step / 2, axis)
+        for cell_axis in range(fine.ndim):
+            curvature = _max_over_cells(curvature, cell_axis)
+        bounds.append(step**2 / 8 * curvature)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return tuple(np.where(bound == 0, 0, bound / -magnitude) for bound in bounds)
+
+
+def _build_1d(fun, rng, rtol, name):
+    n_nodes = MIN_NODES
+    while True:
+        nodes = np.linspace(*rng, n_nodes)
+        fine = np.empty(2 * n_nodes - 1)
+        fine[::2] = _evaluate_1d(fun, nodes)
+        fine[1::2] = _evaluate_1d(fun, (nodes[1:] + nodes[:-1]) / 2)
+        (bound,) = _relative_error_bounds(fine, (nodes[1] - nodes[0],), name)
+        error = bound.max()
+        if error <= rtol:
+            return (nodes,), fine[::2].copy(), error
+        if n_nodes == MAX_NODES[1]:
+            break
+        n_nodes = 2 * n_nodes - 1
+    raise ValueError(
+        f"tabulation of {name} with {rtol=} over {rng} requires more than"
+        f" {MAX_NODES[1]} nodes"
+    )
+
+
+def _build_2d(fun, ranges, rtol, name):
+    n_nodes = [MIN_NODES, MIN_NODES]
+    while True:
+        x, y = (np.linspace(*rng, n) for rng, n in zip(ranges, n_nodes))
+        x_mid, y_mid = (x[1:] + x[:-1]) / 2, (y[1:] + y[:-1]) / 2
+        fine = np.empty((2 * len(x) - 1, 2 * len(y) - 1))
+        fine[::2, ::2] = _evaluate_2d(fun, x, y)
+        fine[1::2, ::2] = _evaluate_2d(fun, x_mid, y)
+        fine[::2, 1::2] = _evaluate_2d(fun, x, y_mid)
+        fine[1::2, 1::2] = _evaluate_2d(fun, x_mid, y_mid)
+        bounds = _relative_error_bounds(fine, (x[1] - x[0], y[1] - y[0]), name)
+        error = (bounds[0] + bounds[1]).max()
+        if error <= rtol:
+            return (x, y), fine[::2, ::2].copy(), error
+        refine = [bounds[dim].max() > rtol / 2 for dim in (0, 1)]
+        if not any(refine):
+            refine = [True, True]
+        if any(refine[dim] and n_nodes[dim] == MAX_NODES[2] for dim in (0, 1)):
+            break
+        n_nodes = [2 * n - 1 if refine[dim] else n for dim, n in enumerate(n_nodes)]
+    raise ValueError(
+        f"tabulation of {name} with {rtol=} over {ranges} requires more than"
+        f" {MAX_NODES[2]} nodes along an axis"
+    )
+
+
+def _source(name, args, nodes):
+    """source code of the tabulated counterpart of formula `name` of given `args`"""
+    lo = tuple(float(axis[0]) for axis in nodes)
+    hi = tuple(float(axis[-1]) for axis in nodes)
+    inv_step = tuple((len(axis) - 1) / (axis[-1] - axis[0]) for axis in nodes)
+    in_range = " and ".join(
+        f"{lo[dim]!r} <= {arg} <= {hi[dim]!r}" for dim, arg in enumerate(args)
+    )
+    interpolation = (
+        f"interpolate_1d(table, {lo[0]!r}, {inv_step[0]!r}, {args[0]})"
+        if len(args) == 1
+        else f"interpolate_2d(table, {lo[0]!r}, {inv_step[0]!r},"
+        f" {lo[1]!r}, {inv_step[1]!r}, {args[0]}, {args[1]})"
+    )
+    return (
+        f"def {name}({', '.join(args)}):\n"
+        f"    if {in_range}:\n"
+        f"        return {interpolation}\n"
+        f"    return formula({', '.join(args)})\n"
+    )
+
+
+def tabulate(
+    formula, *, ranges: tuple, rtol: float, fastmath: bool = True, name: str = None
+):
+    """returns a JIT-compiled function with the same signature as the given
+    (JIT-compiled) formula but evaluated by interpolating in a lookup table
+    spanning the given `ranges` of arguments (one `(min, max)` tuple per argument)
+    and falling back to the formula outside of them; the returned function carries
+    a `tabulation` attribute with the table nodes and the estimated bound of the
+    relative interpolation error"""
+    name = name or formula.__name__
+    py_func = getattr(formula, "py_func", formula)
+    args = tuple(
+        key
+        for key, param in inspect.signature(py_func).parameters.items()
+        if param.kind == param.POSITIONAL_OR_KEYWORD
+    )
+    if len(args) != len(inspect.signature(py_func).parameters):
+        raise ValueError(f"{name} has arguments other than positional-or-keyword")
+    if len(args) not in (1, 2) or len(ranges) != len(args):
+        raise ValueError(
+            f"one range per argument of {name} ({len(args)} given) expected"
+            " and only formulae of one or two arguments can be tabulated"
+        )
+    for rng in ranges:
+        if not rng[0] < rng[1]:
+            raise ValueError(f"invalid range {rng} given for {name}")
+
+    nodes, table, error = (_build_1d if len(args) == 1 else _build_2d)(
+        formula, ranges[0] if len(args) == 1 else ranges, rtol, name
+    )
+    loc = {}
+    exec(  # pylint:disable=exec-used
+        _source(formula.__name__, args, nodes),
+        {
+            **py_func.__globals__,  # for the inlined fall-back formula code
+            "formula": formula,
+            "table": table,
+            "interpolate_1d": interpolate_1d,
+            "interpolate_2d": interpolate_2d,
+        },
+        loc,
+    )
+    tabulated = numba.njit(
+        loc[formula.__name__],
+        **{**_JIT_FLAGS, "inline": "always", "fastmath": fastmath},
+    )
+    tabulated.tabulation = SimpleNamespace(nodes=nodes, table=table, error=error)
+    return tabulated
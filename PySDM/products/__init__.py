@@ -6,6 +6,7 @@ from .ambient_thermodynamics import *
 from .aqueous_chemistry import *
 from .collision import *
 from .condensation import *
+from .deposition import *
 from .displacement import *
 from .freezing import *
 from .housekeeping import *
@@ -3,6 +3,7 @@ products pertinent to the `PySDM.dynamics.aqueous_chemistry.AqueousChemistry` dy
 """
 
 from .acidity import Acidity
+from .aqueous_chemistry_substeps import AqueousChemistrySubsteps
 from .aqueous_mass_spectrum import AqueousMassSpectrum
 from .aqueous_mole_fraction import AqueousMoleFraction
 from .gaseous_mole_fraction import GaseousMoleFraction
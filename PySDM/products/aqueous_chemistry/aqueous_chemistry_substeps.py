@@ -0,0 +1,22 @@
+"""
+per-cell substep counts of `PySDM.dynamics.aqueous_chemistry.AqueousChemistry`
+(with adaptive substepping, the counts chosen for the next timestep based on
+ the estimates from the last one)
+"""
+
+from PySDM.products.impl import Product, register_product
+
+
+@register_product()
+class AqueousChemistrySubsteps(Product):
+    def __init__(self, name=None, unit="dimensionless"):
+        super().__init__(name=name, unit=unit)
+        self.aqueous_chemistry = None
+
+    def register(self, builder):
+        super().register(builder)
+        self.aqueous_chemistry = self.particulator.dynamics["AqueousChemistry"]
+
+    def _impl(self, **kwargs):
+        self._download_to_buffer(self.aqueous_chemistry.counters["n_substeps"])
+        return self.buffer
@@ -12,6 +12,8 @@ from PySDM.products.impl import Product, register_product
 
 @register_product()
 class CollisionTimestepMean(Product):
+    checkpoint_fields = ("count",)
+
     def __init__(self, unit="s", name=None):
         super().__init__(unit=unit, name=name)
         self.count = 0
@@ -13,6 +13,8 @@ from PySDM.products.impl import Product, register_product
 
 @register_product()
 class _CondensationTimestep(Product):
+    checkpoint_fields = ("value",)
+
     def __init__(self, name, unit, extremum, reset_value):
         super().__init__(
             name=name,
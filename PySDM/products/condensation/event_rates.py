@@ -10,6 +10,8 @@ from PySDM.products.impl import Product, register_product
 
 @register_product()
 class EventRate(Product):
+    checkpoint_fields = ("timestep_count", "event_count")
+
     def __init__(self, what, name=None, unit=None):
         super().__init__(name=name, unit=unit)
         self.condensation = None
@@ -12,6 +12,8 @@ from PySDM.products.impl import Product, register_product
 
 @register_product()
 class PeakSaturation(Product):
+    checkpoint_fields = ("RH_max",)
+
     def __init__(self, unit="dimensionless", name=None):
         super().__init__(unit=unit, name=name)
         self.condensation = None
@@ -0,0 +1,49 @@
+"""
+minimum and maximum per-cell number of substeps used by
+ `PySDM.dynamics.vapour_deposition_on_ice.VapourDepositionOnIce` in between
+ product get() calls (fetching a value resets the counter); the number of substeps
+ is variable when adaptive substepping is enabled
+"""
+
+import numpy as np
+
+from PySDM.products.impl import Product, register_product
+
+
+@register_product()
+class _DepositionSubsteps(Product):
+    checkpoint_fields = ("value",)
+
+    def __init__(self, name, unit, extremum, reset_value):
+        super().__init__(name=name, unit=unit)
+        self.extremum = extremum
+        self.reset_value = reset_value
+        self.value = None
+        self.deposition = None
+
+    def register(self, builder):
+        super().register(builder)
+        self.particulator.observers.append(self)
+        self.deposition = self.particulator.dynamics["VapourDepositionOnIce"]
+        self.value = np.full_like(self.buffer, self.reset_value)
+
+    def notify(self):
+        self._download_to_buffer(self.deposition.counters["n_substeps"])
+        self.value = self.extremum(self.buffer, self.value)
+
+    def _impl(self, **kwargs):
+        self.buffer[:] = self.value[:]
+        self.value[:] = self.reset_value
+        return self.buffer
+
+
+@register_product()
+class DepositionSubstepsMin(_DepositionSubsteps):
+    def __init__(self, name=None, unit="dimensionless"):
+        super().__init__(name=name, unit=unit, extremum=np.minimum, reset_value=np.inf)
+
+
+@register_product()
+class DepositionSubstepsMax(_DepositionSubsteps):
+    def __init__(self, name=None, unit="dimensionless"):
+        super().__init__(name=name, unit=unit, extremum=np.maximum, reset_value=-np.inf)
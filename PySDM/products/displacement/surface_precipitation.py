@@ -8,6 +8,8 @@ from PySDM.products.impl import Product, register_product
 
 @register_product()
 class SurfacePrecipitation(Product):
+    checkpoint_fields = ("accumulated_rainfall_mass", "elapsed_time")
+
     def __init__(self, name=None, unit="m/s"):
         super().__init__(unit=unit, name=name)
         self.displacement = None
@@ -7,6 +7,8 @@ from PySDM.products.impl import Product, register_product
 
 @register_product()
 class Time(Product):
+    checkpoint_fields = ("t",)
+
     def __init__(self, name=None, unit="s"):
         super().__init__(name=name, unit=unit)
         self.t = 0
@@ -6,6 +6,8 @@ from PySDM.products.impl.product import Product
 
 
 class RateProduct(Product):
+    checkpoint_fields = ("timestep_count",)
+
     def __init__(self, name, unit, counter, dynamic):
         super().__init__(name=name, unit=unit)
         self.timestep_count = 0
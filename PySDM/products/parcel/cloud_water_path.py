@@ -14,6 +14,8 @@ from PySDM.products.impl import (
 
 @register_product()
 class ParcelLiquidWaterPath(MomentProduct, ActivationFilteredProduct):
+    checkpoint_fields = ("previous", "cwp")
+
     def __init__(
         self,
         count_unactivated: bool,
@@ -9,6 +9,8 @@ from PySDM.impl import arakawa_c
 
 
 class MPDATA_1D:
+    advector_time_dependent = False  # Courant field is uploaded by the caller
+
     def __init__(
         self,
         nz,
@@ -0,0 +1,5 @@
+"""
+performance benchmarks of selected PySDM features (wall times of alternative
+ schemes or options on Box, Parcel and Kinematic2D setups), each with a `main()`
+ sized for a quick run
+"""
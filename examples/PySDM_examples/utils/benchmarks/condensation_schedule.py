@@ -0,0 +1,72 @@
+"""
+strong scaling of Numba-backend condensation in the Kinematic2D setup for each
+ of the `PySDM.dynamics.Condensation` `schedule` options; the default problem size
+ is a smoke-test one, for scaling plots call, e.g., `main(grid=(64, 64),
+ n_sd_per_gridbox=64, n_steps=60)` with `NUMBA_NUM_THREADS` set to the core count
+"""
+
+import numba
+import numpy as np
+from matplotlib import pyplot as plt
+from PySDM_examples.Arabas_et_al_2015 import Settings
+from PySDM_examples.utils.kinematic_2d import Simulation, Storage
+
+from PySDM import Formulae
+from PySDM.backends import Numba
+
+SCHEDULES = ("static", "dynamic", "balanced")
+N_THREADS = tuple(
+    n_threads
+    for n_threads in (1, 2, 4, 8, 16, 32, 64)
+    if n_threads <= numba.config.NUMBA_NUM_THREADS  # pylint: disable=no-member
+)
+
+
+def condensation_wall_time(schedule, n_threads, *, grid, n_sd_per_gridbox, n_steps):
+    settings = Settings(Formulae())
+    settings.grid = grid
+    settings.n_sd_per_gridbox = n_sd_per_gridbox
+    settings.condensation_schedule = schedule
+    settings.simulation_time = settings.dt * n_steps
+    settings.output_interval = settings.simulation_time
+    simulation = Simulation(settings, Storage(), SpinUp=None, backend_class=Numba)
+    simulation.reinit(products=())
+
+    numba.set_num_threads(n_threads)
+    profiler = simulation.particulator.enable_profiling()
+    simulation.run()
+    return profiler.report()["Condensation"]["time"]
+
+
+def main(*, grid=(8, 8), n_sd_per_gridbox=8, n_steps=4, plot=True):
+    times = {
+        schedule: np.asarray(
+            [
+                condensation_wall_time(
+                    schedule,
+                    n_threads,
+                    grid=grid,
+                    n_sd_per_gridbox=n_sd_per_gridbox,
+                    n_steps=n_steps,
+                )
+                for n_threads in N_THREADS
+            ]
+        )
+        for schedule in SCHEDULES
+    }
+    for schedule, wall_times in times.items():
+        print(schedule, dict(zip(N_THREADS, wall_times)))
+    if plot:
+        for schedule, wall_times in times.items():
+            plt.plot(N_THREADS, wall_times[0] / wall_times, label=schedule, marker="o")
+        plt.plot(N_THREADS, N_THREADS, color="gray", linestyle=":", label="ideal")
+        plt.xlabel("number of threads")
+        plt.ylabel("condensation speedup")
+        plt.legend()
+        plt.loglog(base=2)
+        plt.savefig("condensation_schedule_benchmark.pdf", format="pdf")
+    return times
+
+
+if __name__ == "__main__":
+    main()
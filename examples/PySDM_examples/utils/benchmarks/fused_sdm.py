@@ -0,0 +1,96 @@
+"""
+per-step wall time of staged vs. fused (`Coalescence(..., fused=True)`) SDM
+ coalescence in Box and Kinematic2D environments (no advection involved);
+ `main()` defaults are kept tiny - use, e.g., `n_sd_per_gridbox=256` and `grid=(32, 32)`
+ for representative timings
+"""
+
+import time
+
+import numpy as np
+
+from PySDM import Builder
+from PySDM.backends import Numba
+from PySDM.dynamics import Coalescence
+from PySDM.dynamics.collisions.collision_kernels import Geometric
+from PySDM.environments import Box, Kinematic2D
+from PySDM.initialisation.sampling.spatial_sampling import Pseudorandom
+from PySDM.physics import si
+
+SETUPS = ("Box", "Kinematic2D")
+CONCENTRATION = 100 / si.cm**3
+
+
+def make_environment(setup, grid, dt):
+    if setup == "Box":
+        return Box(dv=(1500 * si.m) ** 2 * si.m, dt=dt)
+    return Kinematic2D(
+        dt=dt,
+        grid=grid,
+        size=(1500 * si.m, 1500 * si.m),
+        rhod_of=lambda z: 1 + 0 * z,
+    )
+
+
+def coalescence_wall_time(setup, fused, *, grid, n_sd_per_gridbox, n_steps, adaptive):
+    # pylint: disable=too-many-arguments
+    n_sd = n_sd_per_gridbox * (int(np.prod(grid)) if setup == "Kinematic2D" else 1)
+    environment = make_environment(setup, grid, dt=1 * si.s)
+    mean_multiplicity = CONCENTRATION * environment.mesh.dv / n_sd_per_gridbox
+    builder = Builder(n_sd=n_sd, backend=Numba(), environment=environment)
+    builder.add_dynamic(
+        Coalescence(collision_kernel=Geometric(), adaptive=adaptive, fused=fused)
+    )
+    rng = np.random.default_rng(seed=44)
+    attributes = {
+        "multiplicity": rng.integers(1, 2 * mean_multiplicity, n_sd),
+        "volume": rng.uniform(1, 1000, n_sd) * si.um**3,
+    }
+    if setup == "Kinematic2D":
+        (
+            attributes["cell id"],
+            attributes["cell origin"],
+            attributes["position in cell"],
+        ) = environment.mesh.cellular_attributes(
+            Pseudorandom.sample(
+                backend=builder.particulator.backend, grid=grid, n_sd=n_sd
+            )
+        )
+    particulator = builder.build(attributes=attributes)
+    particulator.run(steps=1)  # JIT compilation
+
+    start = time.perf_counter()
+    particulator.run(steps=n_steps)
+    return (time.perf_counter() - start) / n_steps
+
+
+def main(*, grid=(8, 8), n_sd_per_gridbox=16, n_steps=2, adaptive=False):
+    times = {
+        setup: {
+            label: coalescence_wall_time(
+                setup,
+                fused,
+                grid=grid,
+                n_sd_per_gridbox=(
+                    n_sd_per_gridbox * int(np.prod(grid))
+                    if setup == "Box"
+                    else n_sd_per_gridbox
+                ),
+                n_steps=n_steps,
+                adaptive=adaptive,
+            )
+            for label, fused in (("staged", False), ("fused", True))
+        }
+        for setup in SETUPS
+    }
+    for setup, wall_times in times.items():
+        print(
+            setup,
+            {label: f"{value:.3e} s/step" for label, value in wall_times.items()},
+            f"speedup: {wall_times['staged'] / wall_times['fused']:.2f}",
+        )
+    return times
+
+
+if __name__ == "__main__":
+    main()
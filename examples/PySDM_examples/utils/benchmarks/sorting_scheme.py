@@ -0,0 +1,89 @@
+"""
+wall time of cell-id recalculation and cell sorting with the "default" (counting
+ sort) and "incremental" schemes (see `PySDM.impl.particle_attributes`) vs. the
+ fraction of super-particles changing cell per step, as in low-Courant-number Kinematic2D flows;
+ e.g., `main(grid=(64, 64), n_sd_per_gridbox=64)` for a sizeable problem
+"""
+
+import time
+
+import numpy as np
+from matplotlib import pyplot as plt
+
+from PySDM.backends import Numba
+from PySDM.backends.impl_common.index import make_Index
+from PySDM.backends.impl_common.indexed_storage import make_IndexedStorage
+
+SCHEMES = ("default", "incremental")
+MOVED_FRACTIONS = (0.001, 0.003, 0.01, 0.03, 0.1, 0.3)
+
+
+def sorting_wall_time(scheme, moved_fraction, *, grid, n_sd_per_gridbox, n_steps):
+    # pylint: disable=too-many-locals
+    backend = Numba()
+    n_cell = int(np.prod(grid))
+    n_sd = n_cell * n_sd_per_gridbox
+    rng = np.random.default_rng(seed=44)
+    cell_id_values = np.repeat(np.arange(n_cell), n_sd_per_gridbox)
+
+    idx = make_Index(backend).identity_index(n_sd)
+    cell_id = make_IndexedStorage(backend).from_ndarray(idx, cell_id_values)
+    cell_idx = make_Index(backend).identity_index(n_cell)
+    cell_start = backend.Storage.from_ndarray(np.zeros(n_cell + 1, dtype=int))
+    caretaker = backend.make_cell_caretaker(
+        idx.shape, idx.dtype, len(cell_start), scheme=scheme
+    )
+    caretaker(cell_id, cell_idx, cell_start, idx)
+    cell_origin = backend.Storage.from_ndarray(cell_id_values.reshape(1, n_sd))
+    strides = backend.Storage.from_ndarray(np.ones((1, 1), dtype=int))
+
+    wall_time = 0
+    for _ in range(n_steps):
+        moved = rng.random(n_sd) < moved_fraction
+        cell_id_values[moved] += rng.choice((-1, 1, -grid[1], grid[1]), moved.sum())
+        cell_id_values %= n_cell
+        cell_origin.upload(cell_id_values.reshape(1, n_sd))
+
+        start = time.perf_counter()
+        if scheme == "incremental":
+            caretaker.update_cell_id(cell_id, cell_origin, strides, idx)
+        else:
+            backend.cell_id(cell_id, cell_origin, strides)
+        caretaker(cell_id, cell_idx, cell_start, idx, bucketed=True)
+        wall_time += time.perf_counter() - start
+    return wall_time
+
+
+def main(*, grid=(8, 8), n_sd_per_gridbox=8, n_steps=2, plot=True):
+    for scheme in SCHEMES:  # JIT compilation
+        sorting_wall_time(scheme, 0, grid=(2, 2), n_sd_per_gridbox=2, n_steps=1)
+    times = {
+        scheme: np.asarray(
+            [
+                sorting_wall_time(
+                    scheme,
+                    moved_fraction,
+                    grid=grid,
+                    n_sd_per_gridbox=n_sd_per_gridbox,
+                    n_steps=n_steps,
+                )
+                for moved_fraction in MOVED_FRACTIONS
+            ]
+        )
+        for scheme in SCHEMES
+    }
+    for scheme, wall_times in times.items():
+        print(scheme, dict(zip(MOVED_FRACTIONS, wall_times)))
+    if plot:
+        for scheme, wall_times in times.items():
+            plt.plot(MOVED_FRACTIONS, wall_times, label=scheme, marker="o")
+        plt.xlabel("fraction of super-particles changing cell per timestep")
+        plt.ylabel("sorting wall time [s]")
+        plt.legend()
+        plt.loglog()
+        plt.savefig("sorting_scheme_benchmark.pdf", format="pdf")
+    return times
+
+
+if __name__ == "__main__":
+    main()
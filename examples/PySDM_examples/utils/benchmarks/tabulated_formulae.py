@@ -0,0 +1,132 @@
+"""
+lookup-table formulae (see `PySDM.physics.impl.tabulation`) vs. analytic ones:
+ max relative error and speedup of each formula at random points within the table range,
+ and Kinematic2D condensation wall time with and without tables
+ (defaults sized for a quick run)
+"""
+
+from time import perf_counter
+
+import numba
+import numpy as np
+from PySDM_examples.Arabas_et_al_2015 import Settings
+from PySDM_examples.utils.kinematic_2d import Simulation, Storage
+
+from PySDM import Formulae
+from PySDM.backends import Numba
+from PySDM.physics import si
+
+T_RANGE = (220 * si.K, 320 * si.K)
+FORMULAE_ARGS = {
+    "saturation_vapour_pressure": "MurphyKoop2005",
+    "latent_heat_vapourisation": "Lowe2019",
+    "ventilation": "Froessling1938",
+    "diffusion_thermics": "LoweEtAl2019",
+}
+TABULATED = {
+    "saturation_vapour_pressure__pvs_water": (T_RANGE,),
+    "saturation_vapour_pressure__pvs_ice": (T_RANGE,),
+    "latent_heat_vapourisation__lv": (T_RANGE,),
+    "latent_heat_sublimation__ls": (T_RANGE,),
+    "ventilation__ventilation_coefficient": ((0, 100),),
+    "air_dynamic_viscosity__eta_air": (T_RANGE,),
+    "diffusion_thermics__D": (T_RANGE, (500 * si.hPa, 1100 * si.hPa)),
+}
+
+
+@numba.njit(fastmath=True)
+def _evaluate_1d(fun, x):
+    out = np.empty_like(x)
+    for i, x_i in enumerate(x):
+        out[i] = fun(x_i)
+    return out
+
+
+@numba.njit(fastmath=True)
+def _evaluate_2d(fun, x, y):
+    out = np.empty_like(x)
+    for i, x_i in enumerate(x):
+        out[i] = fun(x_i, y[i])
+    return out
+
+
+def _evaluate(fun, args, n_repeats):
+    """returns formula values and the minimal wall time of their evaluation"""
+    evaluate = _evaluate_1d if len(args) == 1 else _evaluate_2d
+    values = evaluate(fun, *args)
+    times = []
+    for _ in range(n_repeats):
+        start = perf_counter()
+        evaluate(fun, *args)
+        times.append(perf_counter() - start)
+    return values, min(times)
+
+
+def formulae_accuracy_and_speed(*, rtol, n_points, n_repeats=5, seed=44):
+    analytic = Formulae(**FORMULAE_ARGS).flatten
+    tabulated = Formulae(
+        **FORMULAE_ARGS, tabulated=TABULATED, tabulation_rtol=rtol
+    ).flatten
+    rng = np.random.default_rng(seed=seed)
+    results = {}
+    for key, ranges in TABULATED.items():
+        args = tuple(rng.uniform(*arg_range, n_points) for arg_range in ranges)
+        exact, analytic_time = _evaluate(getattr(analytic, key), args, n_repeats)
+        approx, tabulated_time = _evaluate(getattr(tabulated, key), args, n_repeats)
+        results[key] = {
+            "table size": getattr(tabulated, key).tabulation.table.shape,
+            "max relative error": np.abs(approx / exact - 1).max(),
+            "speedup": analytic_time / tabulated_time,
+        }
+    return results
+
+
+def condensation_wall_time(tabulated, *, rtol, grid, n_sd_per_gridbox, n_steps):
+    settings = Settings(
+        Formulae(
+            tabulated=(
+                {
+                    key: TABULATED[key]
+                    for key in (
+                        "saturation_vapour_pressure__pvs_water",
+                        "latent_heat_vapourisation__lv",
+                    )
+                }
+                if tabulated
+                else None
+            ),
+            tabulation_rtol=rtol,
+        )
+    )
+    settings.grid = grid
+    settings.n_sd_per_gridbox = n_sd_per_gridbox
+    settings.simulation_time = settings.dt * n_steps
+    settings.output_interval = settings.simulation_time
+    simulation = Simulation(settings, Storage(), SpinUp=None, backend_class=Numba)
+    simulation.reinit(products=())
+
+    profiler = simulation.particulator.enable_profiling()
+    simulation.run()
+    return profiler.report()["Condensation"]["time"]
+
+
+def main(*, rtol=1e-6, n_points=10**4, grid=(8, 8), n_sd_per_gridbox=8, n_steps=4):
+    results = formulae_accuracy_and_speed(rtol=rtol, n_points=n_points)
+    for key, result in results.items():
+        print(key, result)
+    times = {
+        tabulated: condensation_wall_time(
+            tabulated,
+            rtol=rtol,
+            grid=grid,
+            n_sd_per_gridbox=n_sd_per_gridbox,
+            n_steps=n_steps,
+        )
+        for tabulated in (False, True)
+    }
+    print("condensation wall time (analytic, tabulated):", times)
+    return results, times
+
+
+if __name__ == "__main__":
+    main()
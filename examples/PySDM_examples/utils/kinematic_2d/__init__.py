@@ -13,6 +13,7 @@ The flow field advects two scalar fields in an Eulerian way: water vapour mixing
 and dry-air potential temperature.
 """
 
+from .donor_cell_2d import DonorCell_2D
 from .gui_settings import GUISettings
 from .mpdata_2d import MPDATA_2D
 from .simulation import Simulation
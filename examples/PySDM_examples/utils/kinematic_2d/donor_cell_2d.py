@@ -0,0 +1,70 @@
+"""first-order upwind advection of Eulerian fields, optionally slab-decomposed"""
+
+import numpy as np
+
+
+class DonorCell_2D:
+    """first-order upwind (donor-cell) counterpart of `MPDATA_2D` for slab-decomposed
+    runs (see `PySDM.environments.domain_decomposition`): Eulerian fields are advected
+    within the slab of the `domain` (with x-halos exchanged with the neighbouring slabs)
+    in a prescribed flow given by the `advector` (whole-domain Arakawa-C components
+    of the Courant number multiplied by the `g_factor`, i.e., the dry-air density);
+    with `domain=None`, the whole (periodic) domain is handled"""
+
+    advector_time_dependent = False
+
+    def __init__(self, *, domain, advectees, advector, g_factor, g_factor_vec):
+        self.domain = domain
+        self.advectees = {
+            key: np.array(self.__local(value), dtype=float)
+            for key, value in advectees.items()
+        }
+        self.advector = (
+            self.__local(advector[0], staggered=True),
+            self.__local(advector[1]),
+        )
+        self.g_factor = self.__local(g_factor)
+        self.courant = tuple(
+            component / g_factor_component
+            for component, g_factor_component in zip(
+                self.advector,
+                (
+                    self.__local(g_factor_vec[0], staggered=True),
+                    self.__local(g_factor_vec[1]),
+                ),
+            )
+        )
+        self.courant_uploaded = False
+
+    def __local(self, field, staggered=False):
+        if self.domain is None:
+            return np.asarray(field)
+        return self.domain.local(field, staggered=staggered)
+
+    def __with_x_halo(self, psi):
+        if self.domain is None:
+            return np.concatenate((psi[-1:], psi, psi[:1]))
+        return self.domain.exchange_halo(psi)
+
+    def __getitem__(self, key: str):
+        return self.advectees[key]
+
+    def __call__(self, displacement):
+        if not self.courant_uploaded and displacement is not None:
+            displacement.upload_courant_field(self.courant)
+            self.courant_uploaded = True
+        for psi in self.advectees.values():
+            with_halo = self.__with_x_halo(psi)
+            flux_x = (
+                np.maximum(self.advector[0], 0) * with_halo[:-1]
+                + np.minimum(self.advector[0], 0) * with_halo[1:]
+            )
+            with_halo = np.concatenate((psi[:, -1:], psi, psi[:, :1]), axis=1)
+            flux_z = (
+                np.maximum(self.advector[1], 0) * with_halo[:, :-1]
+                + np.minimum(self.advector[1], 0) * with_halo[:, 1:]
+            )
+            psi -= (np.diff(flux_x, axis=0) + np.diff(flux_z, axis=1)) / self.g_factor
+
+    def wait(self):
+        pass
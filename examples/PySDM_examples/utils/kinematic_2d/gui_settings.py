@@ -154,6 +154,8 @@ class GUISettings:
                 "constants",
                 "handle_all_breakups",
                 "terminal_velocity",
+                "tabulated",
+                "tabulation_rtol",
             )
         ]
 
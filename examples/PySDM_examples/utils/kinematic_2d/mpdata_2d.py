@@ -98,6 +98,10 @@ class MPDATA_2D:
             )
         return mpdatas
 
+    @property
+    def advector_time_dependent(self):
+        return self.stream_function_time_dependent
+
     def __getitem__(self, key: str):
         if "mpdatas" in self.__dict__:
             return self.mpdatas[key].advectee.get()
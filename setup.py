@@ -44,7 +44,8 @@ dependencies = [
 ]
 
 optional_dependencies = {
-    "unit-tests": ["pytest", "pytest-timeout", "matplotlib!=3.9.1"],
+    "unit-tests": ["pytest", "pytest-timeout", "matplotlib!=3.9.1", "netCDF4"],
+    "netcdf": ["netCDF4"],
     "nonunit-tests": ["pytest", "PySDM-examples", "PyPartMC"],
     "CI_version_pins": [
         "PyPartMC==1.7.2",
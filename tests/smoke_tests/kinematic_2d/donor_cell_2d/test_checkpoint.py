@@ -0,0 +1,109 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+from PySDM_examples.utils.kinematic_2d import DonorCell_2D
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import (
+    AmbientThermodynamics,
+    Coalescence,
+    Displacement,
+    EulerianAdvection,
+)
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Kinematic2D
+from PySDM.physics import si
+from PySDM.products import ParticleConcentration, Time
+
+from ....unit_tests.impl.test_checkpoint import (
+    N_SD,
+    N_STEPS_AFTER,
+    N_STEPS_BEFORE,
+    _box_attributes,
+    _snapshot,
+)
+
+
+def _kinematic_2d_builder(backend):
+    grid = (4, 3)
+    environment = Kinematic2D(
+        dt=1 * si.s,
+        grid=grid,
+        size=(400 * si.m, 300 * si.m),
+        rhod_of=lambda z: 1 + 0 * z,
+    )
+    x, z = (np.arange(n + 1) / n for n in grid)
+    stream_function = 0.2 * np.outer(np.cos(2 * np.pi * x), np.sin(2 * np.pi * z))
+    builder = Builder(n_sd=N_SD, backend=backend, environment=environment)
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(
+        EulerianAdvection(
+            DonorCell_2D(
+                domain=None,
+                advectees={
+                    "th": 300 * si.K + np.arange(np.prod(grid)).reshape(grid),
+                    "water_vapour_mixing_ratio": np.linspace(0.01, 0.02, 12).reshape(
+                        grid
+                    ),
+                },
+                advector=(
+                    np.diff(stream_function, axis=1),
+                    -np.diff(stream_function, axis=0),
+                ),
+                g_factor=np.ones(grid),
+                g_factor_vec=(
+                    np.ones((grid[0] + 1, grid[1])),
+                    np.ones((grid[0], grid[1] + 1)),
+                ),
+            )
+        )
+    )
+    builder.add_dynamic(Displacement())
+    builder.add_dynamic(Coalescence(collision_kernel=Golovin(b=1e6 / si.s)))
+    return builder
+
+
+def _kinematic_2d_attributes(builder):
+    mesh = builder.particulator.environment.mesh
+    positions = np.random.default_rng(44).uniform(0, 1, (2, N_SD)) * np.array(
+        mesh.grid
+    ).reshape(-1, 1)
+    cell_id, cell_origin, position_in_cell = mesh.cellular_attributes(positions)
+    return {
+        **_box_attributes(),
+        "cell id": cell_id,
+        "cell origin": cell_origin,
+        "position in cell": position_in_cell,
+    }
+
+
+def _kinematic_2d_products():
+    return (ParticleConcentration(name="n"), Time(name="t"))
+
+
+def test_restart_is_bit_identical(tmp_path):
+    # arrange
+    path = tmp_path / "checkpoint.npz"
+    builder = _kinematic_2d_builder(CPU())
+    particulator = builder.build(
+        attributes=_kinematic_2d_attributes(builder),
+        products=_kinematic_2d_products(),
+    )
+    particulator.run(steps=N_STEPS_BEFORE)
+
+    # act
+    particulator.save_checkpoint(path)
+    particulator.run(steps=N_STEPS_AFTER)
+    expected = _snapshot(particulator)
+
+    restarted = _kinematic_2d_builder(CPU()).from_checkpoint(
+        path, products=_kinematic_2d_products()
+    )
+    restarted.run(steps=N_STEPS_AFTER)
+    actual = _snapshot(restarted)
+
+    # assert
+    assert actual.keys() == expected.keys()
+    assert "thd" in expected
+    for key, value in expected.items():
+        np.testing.assert_array_equal(actual[key], value, err_msg=key)
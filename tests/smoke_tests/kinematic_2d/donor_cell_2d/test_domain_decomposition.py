@@ -0,0 +1,127 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+from PySDM_examples.utils.kinematic_2d import DonorCell_2D
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import AmbientThermodynamics, Displacement, EulerianAdvection
+from PySDM.environments import Kinematic2D
+from PySDM.environments.domain_decomposition import run_decomposed
+from PySDM.physics import si
+
+GRID = (6, 4)
+SIZE = (600 * si.m, 400 * si.m)
+N_SD = 96
+N_STEPS = 12
+DT = 10 * si.s
+
+
+def _global_state():
+    rng = np.random.default_rng(44)
+    positions = rng.uniform(0, 1, (2, N_SD)) * np.array(GRID)[:, None]
+    xx, zz = np.meshgrid(
+        np.arange(GRID[0] + 1) / GRID[0],
+        np.arange(GRID[1] + 1) / GRID[1],
+        indexing="ij",
+    )
+    stream_function = 0.15 * np.cos(2 * np.pi * xx) * np.sin(2 * np.pi * zz) + 0.3 * zz
+    advector = (
+        np.diff(stream_function, axis=1),
+        -np.diff(stream_function, axis=0),
+    )
+    _, z = np.meshgrid(np.arange(GRID[0]), np.arange(GRID[1]), indexing="ij")
+    return {
+        "positions": positions,
+        "multiplicity": np.arange(1, N_SD + 1, dtype=np.int64),
+        "volume": np.linspace(1, 100, N_SD) * si.um**3,
+        "advector": advector,
+        "thd": 300 * si.K + z + np.arange(GRID[0])[:, None] / 10,
+        "water_vapour_mixing_ratio": np.full(GRID, 0.01),
+    }
+
+
+def _worker(domain, state):
+    mine = (state["positions"][0] >= domain.start) & (
+        state["positions"][0] < domain.stop
+    )
+    environment = Kinematic2D(
+        dt=DT, grid=GRID, size=SIZE, rhod_of=lambda z: 1 + 0 * z, domain=domain
+    )
+    builder = Builder(n_sd=N_SD, backend=CPU(), environment=environment)
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(
+        EulerianAdvection(
+            DonorCell_2D(
+                domain=domain,
+                advectees={
+                    "th": state["thd"],
+                    "water_vapour_mixing_ratio": state["water_vapour_mixing_ratio"],
+                },
+                advector=state["advector"],
+                g_factor=np.ones(GRID),
+                g_factor_vec=(
+                    np.ones((GRID[0] + 1, GRID[1])),
+                    np.ones((GRID[0], GRID[1] + 1)),
+                ),
+            )
+        )
+    )
+    builder.add_dynamic(Displacement())
+    positions = state["positions"] - np.array([[domain.start], [0]])
+    positions[0, ~mine] = 0
+    cell_id, cell_origin, position_in_cell = environment.mesh.cellular_attributes(
+        positions
+    )
+    particulator = builder.build(
+        attributes={
+            "multiplicity": np.where(mine, state["multiplicity"], 0),
+            "volume": state["volume"],
+            "cell id": cell_id,
+            "cell origin": cell_origin,
+            "position in cell": position_in_cell,
+        }
+    )
+    particulator.run(steps=N_STEPS)
+
+    attributes = particulator.attributes
+    return {
+        "particles": np.array(
+            [
+                attributes["cell origin"].to_ndarray()[0]
+                + attributes["position in cell"].to_ndarray()[0]
+                + domain.start,
+                attributes["cell origin"].to_ndarray()[1]
+                + attributes["position in cell"].to_ndarray()[1],
+                attributes["multiplicity"].to_ndarray(),
+                attributes["volume"].to_ndarray(),
+            ]
+        ),
+        "thd": particulator.environment.get_thd().copy(),
+        "n_migrated": domain.n_migrated,
+    }
+
+
+def _gather(results):
+    particles = np.concatenate([result["particles"] for result in results], axis=1)
+    return (
+        particles[:, np.argsort(particles[3])],
+        np.concatenate([result["thd"] for result in results]),
+    )
+
+
+def test_decomposed_run_matches_single_slab_run():
+    # arrange
+    state = _global_state()
+
+    # act
+    expected = run_decomposed(_worker, n_slabs=1, grid=GRID, size=SIZE, args=(state,))
+    actual = run_decomposed(_worker, n_slabs=2, grid=GRID, size=SIZE, args=(state,))
+
+    # assert
+    assert sum(result["n_migrated"] for result in actual) > 0
+    assert sum(len(result["particles"][2]) for result in actual) == N_SD
+    for actual_values, expected_values in zip(_gather(actual), _gather(expected)):
+        np.testing.assert_allclose(actual_values, expected_values, rtol=1e-12)
+    thd = _gather(actual)[1]
+    assert (thd != state["thd"]).any()
+    assert state["thd"].min() <= thd.min() and thd.max() <= state["thd"].max()
@@ -0,0 +1,66 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+from PySDM_examples.utils.kinematic_2d import DonorCell_2D
+
+from PySDM.environments import Kinematic2D
+from PySDM.physics import si
+
+from ....unit_tests.dynamics.test_eulerian_advection import _build
+
+GRID_2D = (4, 3)
+
+
+def _kinematic_2d():
+    environment = Kinematic2D(
+        dt=1 * si.s,
+        grid=GRID_2D,
+        size=(400 * si.m, 300 * si.m),
+        rhod_of=lambda z: 1 + 0 * z,
+    )
+    x, z = (np.arange(n + 1) / n for n in GRID_2D)
+    stream_function = 0.2 * np.outer(np.cos(2 * np.pi * x), np.sin(2 * np.pi * z))
+    stream_function += 0.1 * z
+    solvers = DonorCell_2D(
+        domain=None,
+        advectees={
+            "th": 300 * si.K + np.arange(np.prod(GRID_2D)).reshape(GRID_2D),
+            "water_vapour_mixing_ratio": np.linspace(0.01, 0.02, 12).reshape(GRID_2D),
+        },
+        advector=(
+            np.diff(stream_function, axis=1),
+            -np.diff(stream_function, axis=0),
+        ),
+        g_factor=np.ones(GRID_2D),
+        g_factor_vec=(
+            np.ones((GRID_2D[0] + 1, GRID_2D[1])),
+            np.ones((GRID_2D[0], GRID_2D[1] + 1)),
+        ),
+    )
+    return environment, solvers
+
+
+def test_asynchronous_advection_same_results_as_synchronous():
+    # arrange
+    particulators = {
+        asynchronous: _build(*_kinematic_2d(), asynchronous=asynchronous)
+        for asynchronous in (False, True)
+    }
+    initial = particulators[False].environment.get_water_vapour_mixing_ratio()
+    initial = initial.copy()
+
+    # act
+    for particulator in particulators.values():
+        particulator.run(steps=5)
+
+    # assert
+    expected, actual = particulators[False], particulators[True]
+    np.testing.assert_array_equal(
+        actual.environment.get_water_vapour_mixing_ratio(),
+        expected.environment.get_water_vapour_mixing_ratio(),
+    )
+    for attribute in ("multiplicity", "volume", "position in cell", "cell id"):
+        np.testing.assert_array_equal(
+            actual.attributes[attribute].to_ndarray(),
+            expected.attributes[attribute].to_ndarray(),
+        )
+    assert (expected.environment.get_water_vapour_mixing_ratio() != initial).any()
@@ -0,0 +1,76 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM.backends.impl_numba.cell_partition import (
+    cost_weighted_partition,
+    round_robin_partition,
+)
+
+
+def _thread_loads(cell_cost, cell_order, thread_start):
+    return np.asarray(
+        [
+            cell_cost[cell_order[thread_start[i] : thread_start[i + 1]]].sum()
+            for i in range(len(thread_start) - 1)
+        ]
+    )
+
+
+class TestCellPartition:
+    @staticmethod
+    @pytest.mark.parametrize("n_threads", (1, 3, 8))
+    def test_round_robin_partition(n_threads):
+        # arrange
+        cell_order = np.asarray([4, 2, 0, 1, 3, 5, 7, 6, 8])
+
+        # act
+        thread_cell_order, thread_start = round_robin_partition(cell_order, n_threads)
+
+        # assert
+        for thread_id in range(n_threads):
+            np.testing.assert_array_equal(
+                thread_cell_order[
+                    thread_start[thread_id] : thread_start[thread_id + 1]
+                ],
+                cell_order[thread_id::n_threads],
+            )
+
+    @staticmethod
+    @pytest.mark.parametrize("n_threads", (1, 4, 16))
+    def test_cost_weighted_partition(n_threads):
+        # arrange
+        rng = np.random.default_rng(seed=44)
+        cell_cost = rng.choice((1, 2, 512), size=256, p=(0.6, 0.3, 0.1)).astype(float)
+
+        # act
+        cell_order, thread_start = cost_weighted_partition(cell_cost, n_threads)
+
+        # assert
+        np.testing.assert_array_equal(np.sort(cell_order), np.arange(len(cell_cost)))
+        assert thread_start[0] == 0 and thread_start[-1] == len(cell_cost)
+        loads = _thread_loads(cell_cost, cell_order, thread_start)
+        assert loads.sum() == cell_cost.sum()
+        assert loads.max() <= cell_cost.sum() / n_threads + cell_cost.max()
+
+    @staticmethod
+    def test_cost_weighted_partition_beats_round_robin():
+        # arrange
+        n_threads = 8
+        cell_cost = np.ones(64)
+        cell_cost[::n_threads] = 100
+
+        # act
+        loads = {
+            "round robin": _thread_loads(
+                cell_cost,
+                *round_robin_partition(np.arange(len(cell_cost)), n_threads),
+            ),
+            "cost weighted": _thread_loads(
+                cell_cost,
+                *cost_weighted_partition(cell_cost, n_threads),
+            ),
+        }
+
+        # assert
+        assert loads["cost weighted"].max() < loads["round robin"].max() / 4
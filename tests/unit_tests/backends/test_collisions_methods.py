@@ -206,7 +206,12 @@ class TestCollisionMethods:
     @staticmethod
     @pytest.mark.parametrize(
         "backend_class, scheme",
-        ((CPU, "counting_sort"), (CPU, "counting_sort_parallel"), (GPU, "default")),
+        (
+            (CPU, "counting_sort"),
+            (CPU, "counting_sort_parallel"),
+            (CPU, "incremental"),
+            (GPU, "default"),
+        ),
     )
     def test_cell_caretaker(backend_class, scheme):
         # Arrange
@@ -236,6 +241,56 @@ class TestCollisionMethods:
         # Assert
         assert all(cell_start.to_ndarray()[:] == np.array([0, 3]))
 
+    @staticmethod
+    @pytest.mark.parametrize(
+        "n_moved, expected_stats",
+        (
+            (0, {"incremental": 1, "full": 1}),
+            (8, {"incremental": 1, "full": 1}),
+            (300, {"incremental": 0, "full": 2}),
+        ),
+    )
+    def test_cell_caretaker_incremental(n_moved, expected_stats):
+        # Arrange
+        backend = CPU()
+        n_sd, n_cell = 600, 17
+        rng = np.random.default_rng(seed=44)
+        cell_id_values = rng.integers(0, n_cell, size=n_sd)
+
+        idx = make_Index(backend).identity_index(n_sd)
+        cell_id = make_IndexedStorage(backend).from_ndarray(idx, cell_id_values)
+        cell_idx = make_Index(backend).identity_index(n_cell)
+        cell_start = backend.Storage.from_ndarray(np.zeros(n_cell + 1, dtype=int))
+        sut = backend.make_cell_caretaker(
+            idx.shape, idx.dtype, len(cell_start), scheme="incremental"
+        )
+        sut(cell_id, cell_idx, cell_start, idx)
+
+        moved = rng.choice(n_sd, size=n_moved, replace=False)
+        cell_id_values[moved] = np.clip(
+            cell_id_values[moved] + rng.choice((-1, 1), size=n_moved), 0, n_cell - 1
+        )
+
+        # Act
+        sut.update_cell_id(
+            cell_id,
+            backend.Storage.from_ndarray(cell_id_values.reshape(1, n_sd)),
+            backend.Storage.from_ndarray(np.ones((1, 1), dtype=int)),
+            idx,
+        )
+        sut(cell_id, cell_idx, cell_start, idx, bucketed=True)
+
+        # Assert
+        assert sut.stats == expected_stats
+        np.testing.assert_array_equal(
+            cell_start.to_ndarray(),
+            np.searchsorted(np.sort(cell_id_values), np.arange(n_cell + 1)),
+        )
+        np.testing.assert_array_equal(np.sort(idx.to_ndarray()), np.arange(n_sd))
+        for cell in range(n_cell):
+            particles = idx.to_ndarray()[cell_start[cell] : cell_start[cell + 1]]
+            assert (cell_id_values[particles] == cell).all()
+
     @staticmethod
     @pytest.mark.parametrize(
         "gamma, permutation, multiplicity, cell_id, dt_left, dt, dt_max, is_first_in_pair, ",
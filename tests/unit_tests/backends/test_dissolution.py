@@ -0,0 +1,153 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM.backends import CPU
+from PySDM.dynamics.impl.chemistry_utils import GASEOUS_COMPOUNDS, SpecificGravities
+from PySDM.physics import si
+
+BACKEND = CPU()
+N_CELL = 3
+N_SD_PER_CELL = 4
+N_SD = N_CELL * N_SD_PER_CELL
+DV = 1 * si.m**3
+RHO_D = 1 * si.kg / si.m**3
+
+
+def _state(rng):
+    return {
+        "cell_id": np.repeat(np.arange(N_CELL), N_SD_PER_CELL),
+        "multiplicity": rng.integers(1e6, 1e8, N_SD),
+        "volume": rng.uniform(1, 10, N_SD) * si.um**3,
+        "do_chemistry_flag": np.arange(N_SD) % 3 != 0,
+        "mole_amounts": {
+            key: rng.uniform(0, 1e-20, N_SD) * si.mole for key in GASEOUS_COMPOUNDS
+        },
+        "dissociation_factors": {
+            compound: rng.uniform(1, 2, N_SD) for compound in GASEOUS_COMPOUNDS.values()
+        },
+        "env_mixing_ratio": {
+            compound: rng.uniform(1e-10, 1e-9, N_CELL)
+            for compound in GASEOUS_COMPOUNDS.values()
+        },
+        "T": rng.uniform(280, 300, N_CELL) * si.K,
+        "p": rng.uniform(800, 1000, N_CELL) * si.hPa,
+    }
+
+
+def _dissolution(state, cells, dv=DV, system_type="closed"):
+    """runs dissolution for a subset of cells, returning updated copies of
+    the mole amounts and ambient mixing ratios"""
+    mask = np.isin(state["cell_id"], cells)
+    cell_id = np.searchsorted(cells, state["cell_id"][mask])
+    mole_amounts = {
+        key: BACKEND.Storage.from_ndarray(val[mask])
+        for key, val in state["mole_amounts"].items()
+    }
+    env_mixing_ratio = {
+        compound: val[cells].copy()
+        for compound, val in state["env_mixing_ratio"].items()
+    }
+    n_cell = len(cells)
+    BACKEND.dissolution(
+        n_cell=n_cell,
+        cell_order=np.arange(n_cell),
+        cell_start_arg=BACKEND.Storage.from_ndarray(
+            np.searchsorted(cell_id, np.arange(n_cell + 1))
+        ),
+        idx=BACKEND.Storage.from_ndarray(np.arange(len(cell_id))),
+        do_chemistry_flag=BACKEND.Storage.from_ndarray(
+            state["do_chemistry_flag"][mask]
+        ),
+        mole_amounts=mole_amounts,
+        env_mixing_ratio=env_mixing_ratio,
+        env_T=BACKEND.Storage.from_ndarray(state["T"][cells]),
+        env_p=BACKEND.Storage.from_ndarray(state["p"][cells]),
+        env_rho_d=BACKEND.Storage.from_ndarray(np.full(n_cell, RHO_D)),
+        dissociation_factors={
+            compound: BACKEND.Storage.from_ndarray(val[mask])
+            for compound, val in state["dissociation_factors"].items()
+        },
+        timestep=1 * si.s,
+        dv=dv,
+        system_type=system_type,
+        droplet_volume=BACKEND.Storage.from_ndarray(state["volume"][mask]),
+        multiplicity=BACKEND.Storage.from_ndarray(state["multiplicity"][mask]),
+    )
+    return (
+        {key: val.to_ndarray() for key, val in mole_amounts.items()},
+        env_mixing_ratio,
+    )
+
+
+class TestDissolution:
+    @staticmethod
+    def test_multi_cell_same_as_single_cell():
+        # arrange
+        state = _state(np.random.default_rng(seed=44))
+
+        # act
+        moles, mixing_ratios = _dissolution(state, np.arange(N_CELL))
+
+        # assert
+        for cell in range(N_CELL):
+            expected_moles, expected_mixing_ratios = _dissolution(
+                state, np.asarray([cell])
+            )
+            in_cell = state["cell_id"] == cell
+            for key, val in expected_moles.items():
+                np.testing.assert_allclose(moles[key][in_cell], val, rtol=1e-12)
+            for compound, val in expected_mixing_ratios.items():
+                np.testing.assert_allclose(
+                    mixing_ratios[compound][cell], val[0], rtol=1e-12
+                )
+
+    @staticmethod
+    def test_closed_system_mass_conservation():
+        # arrange
+        state = _state(np.random.default_rng(seed=44))
+        specific_gravities = SpecificGravities(BACKEND.formulae.constants)
+        Md = BACKEND.formulae.constants.Md
+
+        # act
+        moles, mixing_ratios = _dissolution(state, np.arange(N_CELL))
+
+        # assert
+        assert not all(
+            (moles[key] == state["mole_amounts"][key]).all() for key in moles
+        )
+        for key, compound in GASEOUS_COMPOUNDS.items():
+            taken = np.bincount(
+                state["cell_id"],
+                weights=state["multiplicity"]
+                * (moles[key] - state["mole_amounts"][key]),
+            )
+            np.testing.assert_allclose(
+                state["env_mixing_ratio"][compound] - mixing_ratios[compound],
+                taken * specific_gravities[compound] * Md / DV / RHO_D,
+                rtol=1e-10,
+            )
+
+    @staticmethod
+    def test_open_system_mixing_ratios_unchanged():
+        # arrange
+        state = _state(np.random.default_rng(seed=44))
+
+        # act
+        _, mixing_ratios = _dissolution(state, np.arange(N_CELL), system_type="open")
+
+        # assert
+        for compound, val in mixing_ratios.items():
+            np.testing.assert_array_equal(val, state["env_mixing_ratio"][compound])
+
+    @staticmethod
+    def test_ambient_gas_depletion_raises():
+        # arrange
+        state = _state(np.random.default_rng(seed=44))
+        state["mole_amounts"] = {
+            key: np.zeros_like(val) for key, val in state["mole_amounts"].items()
+        }
+
+        # act
+        with pytest.raises(ValueError):
+            _dissolution(state, np.arange(N_CELL), dv=1e-20 * si.m**3)
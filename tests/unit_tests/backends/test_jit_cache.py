@@ -0,0 +1,173 @@
+"""checks the keyed persistent JIT cache of the Numba backend"""
+
+import os
+import subprocess
+import sys
+
+import numba
+import numpy as np
+import pytest
+
+from numba.core.caching import NullCache
+
+from PySDM import Builder, Formulae
+from PySDM.backends import Numba
+from PySDM.backends.impl_numba import jit_cache
+from PySDM.backends.impl_numba.jit_cache import (
+    KeyedFunctionCache,
+    UnknownObjectError,
+    fingerprint,
+)
+from PySDM.backends.impl_numba.methods.condensation_methods import (
+    CondensationMethods,
+)
+from PySDM.environments import Box
+
+SCRIPT = """
+import numpy as np
+from PySDM import Formulae
+from PySDM.backends import Numba
+
+backend = Numba(Formulae(constants={"rho_w": RHO_W}), override_jit_flags={"cache": True})
+mass = backend.Storage.from_ndarray(np.ones(3))
+volume = backend.Storage.from_ndarray(np.zeros(3))
+backend.volume_of_water_mass(volume, mass)
+print(sum(backend._volume_of_mass_body.stats.cache_hits.values()), volume.to_ndarray()[0])
+"""
+
+
+def _run(cache_dir, rho_w):
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT.replace("RHO_W", str(rho_w))],
+        env={**os.environ, "NUMBA_CACHE_DIR": str(cache_dir)},
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    return int(output[0]), float(output[1])
+
+
+class TestJitCache:
+    @staticmethod
+    def test_fingerprint_deterministic_and_keyed_by_constants():
+        # arrange
+        backends = [
+            Numba(
+                Formulae(constants={"rho_w": rho_w}), override_jit_flags={"cache": True}
+            )
+            for rho_w in (1000, 1000, 999)
+        ]
+
+        # act
+        fingerprints = [
+            fingerprint(
+                backend._volume_of_mass_body
+            )  # pylint: disable=protected-access
+            for backend in backends
+        ]
+
+        # assert
+        assert fingerprints[0] == fingerprints[1]
+        assert fingerprints[0] != fingerprints[2]
+
+    @staticmethod
+    def test_fingerprint_keyed_by_jit_flags():
+        # arrange
+        backends = [
+            Numba(override_jit_flags={"cache": True, "parallel": parallel})
+            for parallel in (False, True)
+        ]
+
+        # act
+        fingerprints = [
+            fingerprint(
+                backend._volume_of_mass_body
+            )  # pylint: disable=protected-access
+            for backend in backends
+        ]
+
+        # assert
+        assert fingerprints[0] != fingerprints[1]
+
+    @staticmethod
+    @pytest.mark.skipif(
+        numba.config.DISABLE_JIT,  # pylint: disable=no-member
+        reason="no caching without JIT",
+    )
+    def test_cache_reused_across_processes(tmp_path):
+        # act
+        first = _run(tmp_path, rho_w=1000)
+        second = _run(tmp_path, rho_w=1000)
+        other_constants = _run(tmp_path, rho_w=500)
+
+        # assert
+        assert first == (0, 1e-3)
+        assert second == (1, 1e-3)
+        assert other_constants == (0, 2e-3)
+
+    @staticmethod
+    @pytest.mark.skipif(
+        numba.config.DISABLE_JIT,  # pylint: disable=no-member
+        reason="no caching without JIT",
+    )
+    def test_condensation_kernels_cached_unless_passing_functions():
+        # arrange
+        backend = Numba(override_jit_flags={"cache": True})
+
+        # act
+        solver = backend.make_condensation_solver(
+            1,
+            1,
+            dt_range=(1e-3, 1),
+            adaptive=True,
+            fuse=32,
+            multiplier=2,
+            RH_rtol=1e-7,
+            max_iters=16,
+        )
+        calculate_ml_old = CondensationMethods.make_calculate_ml_old(
+            backend.default_jit_flags
+        )
+
+        # assert
+        assert isinstance(
+            calculate_ml_old._cache,  # pylint: disable=protected-access
+            KeyedFunctionCache,
+        )
+        for dispatcher in (
+            solver,
+            CondensationMethods._condensation,  # pylint: disable=protected-access
+        ):
+            assert isinstance(
+                dispatcher._cache,  # pylint: disable=protected-access
+                NullCache,
+            )
+
+    @staticmethod
+    def test_unknown_objects_not_fingerprinted():
+        # arrange
+        class Unknown:  # pylint: disable=too-few-public-methods
+            value = 44
+
+        unknown = Unknown()
+
+        def kernel():
+            return unknown.value
+
+        # act
+        with pytest.raises(UnknownObjectError):
+            fingerprint(numba.njit(kernel))
+        sut = jit_cache.njit(kernel, cache=True)
+
+        # assert
+        if not numba.config.DISABLE_JIT:  # pylint: disable=no-member
+            assert isinstance(sut._cache, NullCache)  # pylint: disable=protected-access
+
+    @staticmethod
+    def test_prewarm_requires_caching_backend():
+        with pytest.raises(ValueError):
+            jit_cache.prewarm(
+                lambda: Builder(
+                    n_sd=1, backend=Numba(), environment=Box(dt=1, dv=1)
+                ).build(attributes={"multiplicity": np.ones(1), "volume": np.ones(1)})
+            )
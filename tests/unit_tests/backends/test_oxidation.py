@@ -183,3 +183,70 @@ def test_oxidation(conc, dt):
             desired=conc["output"][k] * dt,
             rtol=1e-10,
         )
+
+
+def test_oxidation_relative_change_per_cell_and_rejection():
+    # Arrange
+    sut = SUT()
+    n_cell = 3
+    cell_id = np.repeat(np.arange(n_cell), 2)
+    timestep = np.asarray((1e-3, 1e-2, 1)) * si.s
+    max_relative_change = 0.1
+    init = {"S_IV": S_IV_init, "O3": O3_init, "H2O2": H2O2_init, "S_VI": S_VI_init}
+    moles = {
+        k: Storage.from_ndarray(np.full(len(cell_id), init[k] * volume))
+        for k in ("S_IV", "S_VI", "H2O2", "O3")
+    }
+    relative_change = Storage.from_ndarray(np.full(n_cell, np.nan))
+
+    # Act
+    sut.oxidation(
+        n_sd=len(cell_id),
+        cell_ids=Storage.from_ndarray(cell_id),
+        do_chemistry_flag=Storage.from_ndarray(np.full(len(cell_id), True)),
+        **{
+            name: Storage.from_ndarray(np.full(n_cell, const.data[0]))
+            for name, const in {
+                "k0": k0,
+                "k1": k1,
+                "k2": k2,
+                "k3": k3,
+                "K_SO2": K_SO2,
+                "K_HSO3": K_HSO3,
+            }.items()
+        },
+        timestep=timestep,
+        droplet_volume=Storage.from_ndarray(np.full(len(cell_id), volume)),
+        pH=Storage.from_ndarray(np.full(len(cell_id), pH)),
+        dissociation_factor_SO2=Storage.from_ndarray(np.full(len(cell_id), DF)),
+        # input/output
+        moles_O3=moles["O3"],
+        moles_H2O2=moles["H2O2"],
+        moles_S_IV=moles["S_IV"],
+        moles_S_VI=moles["S_VI"],
+        cell_order=np.asarray((0, 2)),
+        cell_start_arg=Storage.from_ndarray(np.arange(0, len(cell_id) + 1, 2)),
+        idx=Storage.from_ndarray(np.arange(len(cell_id))),
+        relative_change=relative_change,
+        max_relative_change=max_relative_change,
+    )
+
+    # Assert
+    expected_relative_change = (
+        timestep
+        / DF
+        * max(
+            O3_react_consts * S_IV_init,
+            H2O2_react_consts * S_IV_init,
+            (O3_react_consts * O3_init + H2O2_react_consts * H2O2_init),
+        )
+    )
+    assert expected_relative_change[0] < max_relative_change
+    assert expected_relative_change[2] > max_relative_change
+    np.testing.assert_allclose(
+        relative_change.to_ndarray()[[0, 2]], expected_relative_change[[0, 2]]
+    )
+    assert np.isnan(relative_change.to_ndarray()[1])
+    for k, storage in moles.items():
+        updated = storage.to_ndarray() != init[k] * volume
+        np.testing.assert_array_equal(updated, cell_id == 0)
@@ -0,0 +1,155 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+from scipy import stats
+
+from PySDM import Builder
+from PySDM.backends import CPU, Numba
+from PySDM.backends.impl_numba.methods.random_methods import philox4x32
+from PySDM.backends.impl_numba.random import AsyncRandom, Random
+from PySDM.dynamics import Coalescence
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box
+from PySDM.physics import si
+
+SIZE = 100
+SEED = 44
+
+
+def _draw(rng, sizes):
+    results = []
+    for size in sizes:
+        storage = CPU().Storage.empty(SIZE * 3, dtype=float)
+        rng(storage[:size])
+        results.append(storage[:size].to_ndarray())
+    return results
+
+
+class TestAsyncRandom:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "sizes", ((SIZE, SIZE // 2) * 4, (1, 99, 100, 101, 250, 3), (SIZE * 3,))
+    )
+    def test_same_numbers_as_synchronous(sizes):
+        # arrange
+        expected = _draw(Random(SIZE, SEED), sizes)
+
+        # act
+        actual = _draw(AsyncRandom(SIZE, SEED), sizes)
+
+        # assert
+        for expected_values, actual_values in zip(expected, actual):
+            np.testing.assert_array_equal(actual_values, expected_values)
+
+    @staticmethod
+    def test_generator_state_as_if_synchronous():
+        # arrange
+        reference = Random(SIZE, SEED)
+        sut = AsyncRandom(SIZE, SEED)
+        sizes = (SIZE, SIZE // 2, 30)
+        _draw(reference, sizes)
+        _draw(sut, sizes)
+        state = sut.generator.bit_generator.state
+
+        # act
+        after = _draw(sut, sizes)
+        sut.generator.bit_generator.state = state
+        after_restore = _draw(sut, sizes)
+
+        # assert
+        assert state == reference.generator.bit_generator.state
+        for expected_values, actual_values in zip(after, after_restore):
+            np.testing.assert_array_equal(actual_values, expected_values)
+
+    @staticmethod
+    def test_coalescence_reproducible():
+        # arrange
+        n_sd = 64
+
+        def final_multiplicity(backend):
+            builder = Builder(
+                n_sd=n_sd, backend=backend, environment=Box(dt=1 * si.s, dv=1 * si.m**3)
+            )
+            builder.add_dynamic(Coalescence(collision_kernel=Golovin(b=1e15 / si.s)))
+            particulator = builder.build(
+                attributes={
+                    "multiplicity": np.ones(n_sd, dtype=int),
+                    "volume": np.linspace(1, 100, n_sd) * si.um**3,
+                }
+            )
+            particulator.run(steps=5)
+            return particulator.attributes["multiplicity"].to_ndarray()
+
+        # act
+        expected = final_multiplicity(CPU())
+        actual = final_multiplicity(Numba(asynchronous_rng=True))
+
+        # assert
+        assert len(actual) < n_sd
+        np.testing.assert_array_equal(actual, expected)
+
+
+class TestPhiloxRandom:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "counter, key, expected",
+        (
+            ((0, 0, 0, 0), (0, 0), (0x6627E8D5, 0xE169C58D, 0xBC57AC4C, 0x9B00DBD8)),
+            (
+                (0xFFFFFFFF,) * 4,
+                (0xFFFFFFFF,) * 2,
+                (0x408F276D, 0x41C83B0E, 0xA20BC7C6, 0x6D5451FD),
+            ),
+            (
+                (0x243F6A88, 0x85A308D3, 0x13198A2E, 0x03707344),
+                (0xA4093822, 0x299F31D0),
+                (0xD16CFE09, 0x94FDCCEB, 0x5001E420, 0x24126EA1),
+            ),
+        ),
+    )
+    def test_known_answers(counter, key, expected):
+        # act
+        actual = philox4x32(
+            tuple(np.uint64(word) for word in counter),
+            tuple(np.uint64(word) for word in key),
+        )
+
+        # assert
+        assert tuple(int(word) for word in actual) == expected
+
+    @staticmethod
+    def test_stream_independent_of_threading_and_call_sizes():
+        # arrange
+        sizes = (1, 99, 100, 101, 250, 3)
+        expected = np.concatenate(_draw(Numba(rng="philox").Random(SIZE, SEED), sizes))
+        sut = Numba(rng="philox", override_jit_flags={"parallel": False}).Random(
+            SIZE, SEED
+        )
+
+        # act
+        actual = _draw(sut, (250, 250, sum(sizes) - 500))
+
+        # assert
+        np.testing.assert_array_equal(np.concatenate(actual), expected)
+
+    @staticmethod
+    def test_uniform_and_seed_dependent():
+        # arrange
+        backend = Numba(rng="philox")
+        storage = backend.Storage.empty(2**16, dtype=float)
+
+        # act
+        backend.Random(storage.shape[0], SEED)(storage)
+        values = storage.to_ndarray()
+        backend.Random(storage.shape[0], SEED + 1)(storage)
+        other = storage.to_ndarray()
+
+        # assert
+        assert 0 <= values.min() and values.max() < 1
+        assert stats.kstest(values, "uniform").pvalue > 0.001
+        assert stats.pearsonr(values, other).pvalue > 0.001
+
+    @staticmethod
+    def test_unknown_rng():
+        with pytest.raises(ValueError):
+            Numba(rng="mersenne")
@@ -1,10 +1,17 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
 import numpy as np
 import pytest
+from scipy import stats
 
-from PySDM.backends import ThrustRTC
+from PySDM import Builder
+from PySDM.backends import CPU, ThrustRTC
+from PySDM.backends.impl_numba.methods.index_methods import coprime_multiplier
+from PySDM.dynamics import Coalescence
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Kinematic2D
 from PySDM.initialisation.sampling.spectral_sampling import Linear
 from PySDM.initialisation.spectra.lognormal import Lognormal
+from PySDM.physics import si
 
 from ...dummy_particulator import DummyParticulator
 
@@ -53,3 +60,177 @@ def test_final_state(croupier, backend_class):
         ]
     )
     assert (diff >= 0).all()
+
+
+def _pairs_history(croupier, *, n_sd, n_steps, seed=44):
+    particulator = DummyParticulator(CPU, n_sd)
+    particulator.build(
+        {
+            "multiplicity": np.arange(1, n_sd + 1),
+            "cell id": np.zeros(n_sd, dtype=int),
+        }
+    )
+    attributes = particulator.attributes
+    is_first_in_pair = particulator.PairIndicator(n_sd)
+    rng = np.random.default_rng(seed)
+    u01 = particulator.Storage.empty(n_sd, dtype=float)
+    pairs = []
+    for _ in range(n_steps):
+        length = attributes.permutation_u01_length(
+            local=True, incremental=croupier == "local_incremental"
+        )
+        u01[:length].upload(rng.uniform(0, 1, length))
+        attributes.permutation(
+            u01, local=True, incremental=croupier == "local_incremental"
+        )
+        is_first_in_pair.update(
+            attributes.cell_start, attributes.cell_idx, attributes["cell id"]
+        )
+        particulator.sort_within_pair_by_attr(is_first_in_pair, "multiplicity")
+        idx = attributes._ParticleAttributes__idx.to_ndarray()
+        pairs.append(np.sort(idx.reshape(-1, 2), axis=1))
+    return pairs
+
+
+class TestIncrementalCroupier:
+    @staticmethod
+    def test_never_the_default(backend_class):
+        assert backend_class.default_croupier != "local_incremental"
+
+    @staticmethod
+    @pytest.mark.parametrize("croupier", ("local", "local_incremental"))
+    def test_pair_frequencies_uniform(croupier):
+        # arrange
+        n_sd = 64
+        n_steps = 2 * (n_sd - 1) * 25
+
+        # act
+        pairs = np.concatenate(_pairs_history(croupier, n_sd=n_sd, n_steps=n_steps))
+
+        # assert
+        counts = np.zeros((n_sd, n_sd), dtype=int)
+        np.add.at(counts, (pairs[:, 0], pairs[:, 1]), 1)
+        observed = counts[np.triu_indices(n_sd, k=1)]
+        assert observed.sum() == n_steps * n_sd // 2
+        assert stats.chisquare(observed).pvalue > 0.001
+
+    @staticmethod
+    @pytest.mark.parametrize("n", (64, 90, 97, 210))
+    def test_multiplier_uniform_over_coprimes(n):
+        # arrange
+        coprimes = [a for a in range(2, n - 1) if np.gcd(a, n) == 1]
+        n_samples = 10 * len(coprimes)
+
+        # act
+        multipliers = [
+            coprime_multiplier(n, (i + 0.5) / n_samples) for i in range(n_samples)
+        ]
+
+        # assert
+        values, counts = np.unique(multipliers, return_counts=True)
+        np.testing.assert_array_equal(values, coprimes)
+        assert (counts == 10).all()
+
+    @staticmethod
+    def test_pairs_not_reformed_in_consecutive_steps():
+        # arrange
+        n_sd = 128
+
+        # act
+        pairs = _pairs_history("local_incremental", n_sd=n_sd, n_steps=100)
+
+        # assert
+        for previous, current in zip(pairs[:-1], pairs[1:]):
+            assert not set(map(tuple, previous)) & set(map(tuple, current))
+
+    @staticmethod
+    def test_random_numbers_consumed():
+        # arrange
+        n_sd = 256
+        particulator = DummyParticulator(CPU, n_sd)
+        particulator.build(
+            {
+                "multiplicity": np.ones(n_sd, dtype=int),
+                "cell id": np.zeros(n_sd, dtype=int),
+            }
+        )
+        u01 = particulator.Storage.from_ndarray(np.random.random(n_sd))
+        sut = particulator.attributes
+
+        # act
+        lengths = []
+        for _ in range(2):
+            lengths.append(sut.permutation_u01_length(local=True, incremental=True))
+            sut.permutation(u01, local=True, incremental=True)
+
+        # assert
+        assert lengths == [n_sd, 2 + n_sd // 2 // 32 + 1]
+
+    @staticmethod
+    def test_coalescence_ensemble_matches_local_croupier():
+        """each grid cell serves as an independent realisation"""
+        # arrange
+        grid = (4, 6)
+        n_sd_per_cell = 128
+        n_sd = n_sd_per_cell * grid[0] * grid[1]
+        n_steps = 20
+
+        def final_state(croupier):
+            environment = Kinematic2D(
+                dt=1 * si.s,
+                grid=grid,
+                size=(grid[0] * si.m, grid[1] * si.m),
+                rhod_of=lambda z: 1 + 0 * z,
+            )
+            builder = Builder(n_sd=n_sd, backend=CPU(), environment=environment)
+            builder.add_dynamic(
+                Coalescence(collision_kernel=Golovin(b=1e6 / si.s), croupier=croupier)
+            )
+            cell_id, cell_origin, position_in_cell = (
+                environment.mesh.cellular_attributes(
+                    np.repeat(
+                        np.indices(grid).reshape(2, -1) + 0.5, n_sd_per_cell, axis=1
+                    )
+                )
+            )
+            particulator = builder.build(
+                attributes={
+                    "multiplicity": np.full(n_sd, 2**20),
+                    "volume": np.tile(
+                        np.linspace(10, 100, n_sd_per_cell), grid[0] * grid[1]
+                    )
+                    * si.um**3,
+                    "cell id": cell_id,
+                    "cell origin": cell_origin,
+                    "position in cell": position_in_cell,
+                }
+            )
+            particulator.run(steps=n_steps)
+            attributes = particulator.attributes
+            multiplicity = attributes["multiplicity"].to_ndarray()
+            volume = attributes["volume"].to_ndarray()
+            cells = attributes["cell id"].to_ndarray()
+            return np.asarray(
+                [
+                    np.bincount(cells, weights=weights, minlength=grid[0] * grid[1])
+                    for weights in (multiplicity, multiplicity * volume**2)
+                ]
+            )
+
+        # act
+        samples = {
+            croupier: final_state(croupier)
+            for croupier in ("local", "local_incremental")
+        }
+
+        # assert
+        for moment in range(2):
+            assert np.std(samples["local"][moment]) > 0
+            assert (
+                stats.ttest_ind(
+                    samples["local"][moment],
+                    samples["local_incremental"][moment],
+                    equal_var=False,
+                ).pvalue
+                > 0.001
+            )
@@ -4,13 +4,19 @@ import pytest
 
 from PySDM import Builder
 from PySDM.backends import CPU
+from PySDM.dynamics import Coalescence
 from PySDM.dynamics.collisions.collision_kernels import (
+    ConstantK,
+    Electric,
+    Geometric,
     Golovin,
+    Hydrodynamic,
     SimpleGeometric,
     Long1974,
 )
 from PySDM.environments import Box
 from PySDM.formulae import Formulae
+from PySDM.physics import si
 
 
 class TestKernels:
@@ -124,3 +130,58 @@ class TestKernels:
             np.testing.assert_array_less(output.to_ndarray(), [3.0e-9])
         else:
             np.testing.assert_array_less([3.0e-9], output.to_ndarray())
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "kernel_factory",
+        (
+            lambda: ConstantK(a=1e-6),
+            lambda: Golovin(b=1.5e3),
+            lambda: Geometric(collection_efficiency=0.5),
+            Hydrodynamic,
+            Electric,
+            lambda: SimpleGeometric(C=1.0),
+            Long1974,
+        ),
+    )
+    def test_fused_probabilities_of_collision(kernel_factory):
+        # arrange
+        n_sd = 101
+        rng = np.random.default_rng(seed=44)
+        attributes = {
+            "multiplicity": rng.integers(1, 1000, n_sd),
+            "volume": 4 / 3 * np.pi * (rng.uniform(1, 100, n_sd) * si.um) ** 3,
+        }
+        u01 = rng.uniform(0, 1, n_sd)
+
+        def probabilities(fused_kernel):
+            builder = Builder(
+                backend=CPU(),
+                n_sd=n_sd,
+                environment=Box(dv=1 * si.m**3, dt=1 * si.s),
+            )
+            builder.add_dynamic(
+                Coalescence(
+                    collision_kernel=kernel_factory(),
+                    adaptive=False,
+                    fused_kernel=fused_kernel,
+                )
+            )
+            particulator = builder.build(
+                attributes={key: value.copy() for key, value in attributes.items()}
+            )
+            sut = particulator.dynamics["Collision"]
+            sut.toss_candidate_pairs_and_sort_within_pair_by_multiplicity(
+                sut.is_first_in_pair, particulator.Storage.from_ndarray(u01)
+            )
+            sut.compute_probabilities_of_collision(sut.is_first_in_pair, out=sut.gamma)
+            return sut.fused_kernel, sut.gamma.to_ndarray()
+
+        # act
+        fused, fused_prob = probabilities(fused_kernel=True)
+        not_fused, prob = probabilities(fused_kernel=False)
+
+        # assert
+        assert fused and not not_fused
+        assert np.count_nonzero(prob) > 0
+        np.testing.assert_allclose(fused_prob, prob, rtol=1e-10)
@@ -2,16 +2,20 @@
 import numpy as np
 import pytest
 
-from PySDM.backends import ThrustRTC
+from PySDM import Builder
+from PySDM.backends import CPU, ThrustRTC
+from PySDM.dynamics import Coalescence
 from PySDM.dynamics.collisions.collision import DEFAULTS
+from PySDM.dynamics.collisions.collision_kernels import Geometric, Golovin
 from PySDM.environments import Box
 from PySDM.impl.mesh import Mesh
 from PySDM.initialisation.sampling.spatial_sampling import Pseudorandom
+from PySDM.physics import si
 
 from .conftest import get_dummy_particulator_and_coalescence
 
 
-class TestSDMMultiCell:  # pylint: disable=too-few-public-methods
+class TestSDMMultiCell:
     @staticmethod
     @pytest.mark.parametrize("n_sd", [2, 3, 8000])
     @pytest.mark.parametrize("adaptive", [False, True])
@@ -43,3 +47,61 @@ class TestSDMMultiCell:  # pylint: disable=too-few-public-methods
         np.testing.assert_array_equal(
             cell_id, particulator.attributes["cell id"].to_ndarray(raw=True)
         )
+
+    @staticmethod
+    @pytest.mark.parametrize("adaptive", [False, True])
+    @pytest.mark.parametrize(
+        "kernel_factory", (lambda: Golovin(b=1.5e3 / si.s), Geometric)
+    )
+    @pytest.mark.parametrize(
+        "fused_kwargs",
+        ({"fused": True}, {"fused_kernel": True}),
+        ids=("fused_step", "fused_kernel"),
+    )
+    def test_fused_matches_staged(adaptive, kernel_factory, fused_kwargs):
+        # arrange
+        n_sd = 2**12
+        grid = (8, 8)
+        rng = np.random.default_rng(seed=44)
+        multiplicity = rng.integers(10**6, 10**8, n_sd)
+        volume = rng.uniform(1, 1000, n_sd) * si.um**3
+
+        def simulation(**kwargs):
+            env = Box(dv=1 * si.m**3, dt=1 * si.s)
+            env.mesh = Mesh(grid=grid, size=grid)
+            builder = Builder(n_sd=n_sd, backend=CPU(), environment=env)
+            builder.add_dynamic(
+                Coalescence(
+                    collision_kernel=kernel_factory(), adaptive=adaptive, **kwargs
+                )
+            )
+            cell_id, _, _ = env.mesh.cellular_attributes(
+                Pseudorandom.sample(
+                    backend=builder.particulator.backend, grid=grid, n_sd=n_sd
+                )
+            )
+            particulator = builder.build(
+                attributes={
+                    "multiplicity": multiplicity.copy(),
+                    "volume": volume.copy(),
+                    "cell id": cell_id,
+                }
+            )
+            particulator.run(steps=5)
+            sut = particulator.dynamics["Collision"]
+            return {
+                "multiplicity": particulator.attributes["multiplicity"].to_ndarray(),
+                "volume": particulator.attributes["volume"].to_ndarray(),
+                "collision_rate": sut.collision_rate.to_ndarray(),
+                "coalescence_rate": sut.coalescence_rate.to_ndarray(),
+                "stats_n_substep": sut.stats_n_substep.to_ndarray(),
+            }
+
+        # act
+        staged = simulation(fused=False, fused_kernel=False)
+        fused = simulation(**fused_kwargs)
+
+        # assert
+        assert np.count_nonzero(staged["coalescence_rate"]) > 0
+        for key, value in staged.items():
+            np.testing.assert_allclose(fused[key], value, rtol=1e-12)
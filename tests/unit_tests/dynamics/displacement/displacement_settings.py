@@ -23,7 +23,7 @@ class DisplacementSettings:  # pylint: disable=too-few-public-methods,too-many-a
         self.sedimentation = False
         self.dt = None
 
-    def get_displacement(self, backend, scheme, adaptive=True):
+    def get_displacement(self, backend, scheme, adaptive=True, local_substeps=False):
         formulae = Formulae(particle_advection=scheme)
         particulator = DummyParticulator(backend, n_sd=len(self.n), formulae=formulae)
         particulator.environment = DummyEnvironment(
@@ -41,7 +41,11 @@ class DisplacementSettings:  # pylint: disable=too-few-public-methods,too-many-a
             "position in cell": position_in_cell,
         }
         particulator.build(attributes)
-        sut = Displacement(enable_sedimentation=self.sedimentation, adaptive=adaptive)
+        sut = Displacement(
+            enable_sedimentation=self.sedimentation,
+            adaptive=adaptive,
+            local_substeps=local_substeps,
+        )
         sut.register(particulator)
         sut.upload_courant_field(self.courant_field_data)
 
@@ -0,0 +1,147 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM.backends import CPU
+from PySDM.dynamics import Displacement
+
+from .displacement_settings import DisplacementSettings
+
+GRID = (4, 1)
+COURANT_FIELD = (
+    # strong convergence within the first column of cells, weak gradients elsewhere
+    np.array([[0.9], [0.2], [0.205], [0.21], [0.215]]),
+    np.zeros((4, 2)),
+)
+POSITIONS = [[0.5, 1.5, 2.5, 3.5], [0.5, 0.5, 0.5, 0.5]]
+
+
+class ConstantTerminalVelocity:  # pylint: disable=too-few-public-methods
+    def __init__(self, backend, particles):
+        self.values = backend.Storage.from_ndarray(np.full(particles.n_sd, 0.1))
+
+    def get(self):
+        return self.values
+
+
+def _settings():
+    settings = DisplacementSettings(n_sd=len(POSITIONS[0]))
+    settings.grid = GRID
+    settings.courant_field_data = COURANT_FIELD
+    settings.positions = POSITIONS
+    return settings
+
+
+def _positions(particulator):
+    return (
+        particulator.attributes["cell origin"].to_ndarray()
+        + particulator.attributes["position in cell"].to_ndarray()
+    )
+
+
+class TestLocalSubsteps:
+    @staticmethod
+    def test_n_substeps_in_cell(backend_class):
+        # arrange
+        sut, _ = _settings().get_displacement(
+            backend_class, scheme="ImplicitInSpace", local_substeps=True
+        )
+        reference, _ = _settings().get_displacement(
+            backend_class, scheme="ImplicitInSpace"
+        )
+
+        # act
+        n_substeps_in_cell = sut.n_substeps_in_cell.to_ndarray()
+
+        # assert
+        assert n_substeps_in_cell[0] > 1
+        np.testing.assert_array_equal(n_substeps_in_cell[1:], 1)
+        assert sut._n_substeps == reference._n_substeps == n_substeps_in_cell[0]
+
+    @staticmethod
+    def test_displacement(backend_class):
+        # arrange
+        sut, particulator = _settings().get_displacement(
+            backend_class, scheme="ImplicitInSpace", local_substeps=True
+        )
+        results = {}
+        for adaptive in (True, False):
+            reference, reference_particulator = _settings().get_displacement(
+                CPU, scheme="ImplicitInSpace", adaptive=adaptive
+            )
+            reference()
+            results[adaptive] = _positions(reference_particulator)
+
+        # act
+        sut()
+
+        # assert
+        positions = _positions(particulator)
+        np.testing.assert_allclose(positions[:, 0], results[True][:, 0])
+        np.testing.assert_allclose(positions[:, 1:], results[False][:, 1:])
+        assert not np.allclose(results[True][:, 1:], results[False][:, 1:])
+
+    @staticmethod
+    def test_all_substeps_in_one_backend_call(backend_class):
+        # arrange
+        sut, particulator = _settings().get_displacement(
+            backend_class, scheme="ImplicitInSpace", local_substeps=True
+        )
+        calls = []
+        displace = particulator.backend.displace_with_local_substeps
+
+        def counting_displace(**kwargs):
+            calls.append(kwargs)
+            displace(**kwargs)
+
+        particulator.backend.displace_with_local_substeps = counting_displace
+
+        # act
+        try:
+            sut()
+        finally:
+            del particulator.backend.displace_with_local_substeps
+
+        # assert
+        assert len(calls) == 1
+        np.testing.assert_array_equal(
+            sut.n_substeps_of_droplet.to_ndarray(), [sut._n_substeps, 1, 1, 1]
+        )
+
+    @staticmethod
+    def test_local_substeps_require_adaptivity():
+        with pytest.raises(ValueError):
+            Displacement(adaptive=False, local_substeps=True)
+
+    @staticmethod
+    def test_sedimentation(backend_class):
+        # arrange
+        particulators = {}
+        for local_substeps in (True, False):
+            settings = _settings()
+            settings.dt = 1
+            settings.sedimentation = True
+            settings.positions = [POSITIONS[0], [1.5] * len(POSITIONS[0])]
+            settings.grid = (GRID[0], 2)
+            settings.courant_field_data = (
+                np.repeat(COURANT_FIELD[0], 2, axis=1),
+                np.zeros((GRID[0], 3)),
+            )
+            sut, particulators[local_substeps] = settings.get_displacement(
+                backend_class if local_substeps else CPU,
+                scheme="ImplicitInSpace",
+                local_substeps=local_substeps,
+            )
+            particulators[local_substeps].attributes._ParticleAttributes__attributes[
+                "relative fall velocity"
+            ] = ConstantTerminalVelocity(
+                particulators[local_substeps].backend, particulators[local_substeps]
+            )
+
+            # act
+            sut()
+
+        # assert
+        positions = {key: _positions(value) for key, value in particulators.items()}
+        np.testing.assert_allclose(positions[True][1], positions[False][1])
+        np.testing.assert_allclose(positions[True][1], 1.3)
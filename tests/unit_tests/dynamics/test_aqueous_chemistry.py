@@ -0,0 +1,104 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import AmbientThermodynamics, AqueousChemistry
+from PySDM.dynamics.impl.chemistry_utils import AQUEOUS_COMPOUNDS
+from PySDM.environments import Parcel
+from PySDM.physics import si
+from PySDM.products import AqueousChemistrySubsteps
+
+N_SD = 8
+N_STEPS = 3
+INITIAL_S_VI = 1e-18 * si.mole
+ENVIRONMENT_MOLE_FRACTIONS = {
+    "SO2": 0.2e-9,
+    "O3": 50e-9,
+    "H2O2": 0.5e-9,
+    "CO2": 360e-6,
+    "HNO3": 0.1e-9,
+    "NH3": 0.1e-9,
+}
+
+
+def _run(n_steps=N_STEPS, **kwargs):
+    """returns the produced S(VI) amounts and substep counts after each step"""
+    builder = Builder(
+        n_sd=N_SD,
+        backend=CPU(),
+        environment=Parcel(
+            dt=1 * si.s,
+            mass_of_dry_air=1 * si.kg,
+            p0=950 * si.hPa,
+            initial_water_vapour_mixing_ratio=10 * si.g / si.kg,
+            T0=285 * si.K,
+            w=0.5 * si.m / si.s,
+        ),
+    )
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(
+        AqueousChemistry(
+            environment_mole_fractions=ENVIRONMENT_MOLE_FRACTIONS,
+            system_type="closed",
+            dry_rho=1770 * si.kg / si.m**3,
+            dry_molar_mass=132 * si.g / si.mole,
+            **kwargs,
+        )
+    )
+    attributes = {
+        "multiplicity": np.full(N_SD, 1e6),
+        "volume": np.linspace(1, 100, N_SD) * si.um**3,
+        **{f"moles_{key}": np.zeros(N_SD) for key in AQUEOUS_COMPOUNDS},
+    }
+    attributes["moles_S_VI"][:] = INITIAL_S_VI
+    particulator = builder.build(
+        attributes=attributes, products=(AqueousChemistrySubsteps(name="n"),)
+    )
+    n_substeps = []
+    for _ in range(n_steps):
+        particulator.run(steps=1)
+        n_substeps.append(particulator.products["n"].get()[0])
+    return (
+        particulator.attributes["moles_S_VI"].to_ndarray() - INITIAL_S_VI,
+        n_substeps,
+    )
+
+
+class TestAqueousChemistry:
+    @staticmethod
+    def test_fixed_substeps():
+        # act
+        _, n_substeps = _run(n_substep=3)
+
+        # assert
+        assert n_substeps == [3] * N_STEPS
+
+    @staticmethod
+    @pytest.mark.parametrize("n_substep_max", (8, 1024))
+    def test_adaptive_substeps(n_substep_max):
+        # arrange
+        reference, _ = _run(n_substep=128)
+        fixed, _ = _run(n_substep=1)
+
+        # act
+        adaptive, n_substeps = _run(
+            n_substep=1, adaptive=True, n_substep_max=n_substep_max
+        )
+
+        # assert
+        assert 1 < max(n_substeps) <= n_substep_max
+        assert np.abs(adaptive - reference).max() < np.abs(fixed - reference).max()
+
+    @staticmethod
+    def test_adaptive_substeps_refined_within_timestep():
+        # arrange
+        reference, _ = _run(n_steps=1, n_substep=128)
+        fixed, _ = _run(n_steps=1, n_substep=1)
+
+        # act
+        adaptive, _ = _run(n_steps=1, n_substep=1, adaptive=True)
+
+        # assert
+        assert np.abs(adaptive - reference).max() < np.abs(fixed - reference).max() / 10
@@ -1,7 +1,23 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import threading
+from types import SimpleNamespace
+
 import numpy as np
+import pytest
 
-from PySDM.dynamics import EulerianAdvection
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import (
+    AmbientThermodynamics,
+    Coalescence,
+    Displacement,
+    EulerianAdvection,
+)
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.dynamics.impl import register_dynamic
+from PySDM.environments import Kinematic1D
+from PySDM.impl.mesh import Mesh
+from PySDM.physics import si
 
 from ..dummy_environment import DummyEnvironment
 from ..dummy_particulator import DummyParticulator
@@ -37,3 +53,171 @@ class TestEulerianAdvection:  # pylint: disable=too-few-public-methods
         np.testing.assert_array_equal(
             env.get_thd(), env.get_predicted("thd").to_ndarray().reshape(grid)
         )
+
+
+class _Shared:  # pylint: disable=too-few-public-methods
+    """state shared by the (deep-copied) test dynamics and solvers"""
+
+    def __init__(self, n_steps):
+        self.releases = [threading.Event() for _ in range(n_steps)]
+        self.released_in_time = []
+        self.n_probe_calls = 0
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+@register_dynamic()
+class _Probe:
+    def __init__(self, shared):
+        self.shared = shared
+
+    def register(self, builder):
+        assert builder
+
+    def __call__(self):
+        self.shared.releases[self.shared.n_probe_calls].set()
+        self.shared.n_probe_calls += 1
+
+
+@register_dynamic()
+class _DeclaredProbe(_Probe):  # pylint: disable=too-few-public-methods
+    eulerian_fields = ()
+
+
+class _UpwindSolver1D:  # pylint: disable=too-few-public-methods
+    advector_time_dependent = False
+
+    def __init__(self, advectee, courant):
+        self.advectee = np.array(advectee)
+        self.courant = courant
+        self.first_call = True
+
+    def __call__(self, displacement):
+        if self.first_call:
+            displacement.upload_courant_field((np.full(len(self.advectee) + 1, 0.4),))
+            self.first_call = False
+        psi = np.concatenate((self.advectee[:1], self.advectee))
+        self.advectee[:] -= self.courant * np.diff(psi)
+
+
+class _SlowSolver1D(_UpwindSolver1D):  # pylint: disable=too-few-public-methods
+    def __init__(self, shared, **kwargs):
+        super().__init__(**kwargs)
+        self.shared = shared
+
+    def __call__(self, displacement):
+        release = self.shared.releases[len(self.shared.released_in_time)]
+        self.shared.released_in_time.append(release.wait(timeout=0.5))
+        super().__call__(displacement)
+
+
+N_SD = 32
+
+
+def _kinematic_1d(solvers_class=_UpwindSolver1D, **kwargs):
+    nz = 8
+    environment = Kinematic1D(
+        dt=1 * si.s,
+        mesh=Mesh(grid=(nz,), size=(nz * 100 * si.m,)),
+        thd_of_z=lambda z: 300 * si.K + z / si.km,
+        rhod_of_z=lambda z: 1 + 0 * z,
+    )
+    solvers = solvers_class(advectee=np.linspace(0.01, 0.02, nz), courant=0.4, **kwargs)
+    return environment, solvers
+
+
+def _build(environment, solvers, *, asynchronous, extra_dynamics=()):
+    builder = Builder(n_sd=N_SD, backend=CPU(), environment=environment)
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(EulerianAdvection(solvers, asynchronous=asynchronous))
+    builder.add_dynamic(Displacement())
+    builder.add_dynamic(Coalescence(collision_kernel=Golovin(b=1e6 / si.s)))
+    for dynamic in extra_dynamics:
+        builder.add_dynamic(dynamic)
+    grid = environment.mesh.grid
+    positions = np.random.default_rng(44).uniform(0, 1, (len(grid), N_SD)) * np.array(
+        grid
+    ).reshape(-1, 1)
+    cell_id, cell_origin, position_in_cell = environment.mesh.cellular_attributes(
+        positions
+    )
+    return builder.build(
+        attributes={
+            "multiplicity": np.full(N_SD, 1e6),
+            "volume": np.linspace(1, 100, N_SD) * si.um**3,
+            "cell id": cell_id,
+            "cell origin": cell_origin,
+            "position in cell": position_in_cell,
+        }
+    )
+
+
+class TestAsynchronousEulerianAdvection:
+    @staticmethod
+    def test_same_results_as_synchronous():
+        # arrange
+        particulators = {
+            asynchronous: _build(*_kinematic_1d(), asynchronous=asynchronous)
+            for asynchronous in (False, True)
+        }
+        initial = particulators[False].environment.get_water_vapour_mixing_ratio()
+        initial = initial.copy()
+
+        # act
+        for particulator in particulators.values():
+            particulator.run(steps=5)
+
+        # assert
+        expected, actual = particulators[False], particulators[True]
+        np.testing.assert_array_equal(
+            actual.environment.get_water_vapour_mixing_ratio(),
+            expected.environment.get_water_vapour_mixing_ratio(),
+        )
+        for attribute in ("multiplicity", "volume", "position in cell", "cell id"):
+            np.testing.assert_array_equal(
+                actual.attributes[attribute].to_ndarray(),
+                expected.attributes[attribute].to_ndarray(),
+            )
+        assert (expected.environment.get_water_vapour_mixing_ratio() != initial).any()
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "asynchronous, probe_class, expected",
+        (
+            (False, _DeclaredProbe, [False, False]),
+            (True, _DeclaredProbe, [False, True]),
+            (True, _Probe, [False, False]),
+        ),
+    )
+    def test_overlap_with_dynamics_not_accessing_eulerian_fields(
+        asynchronous, probe_class, expected
+    ):
+        # arrange
+        n_steps = 2
+        shared = _Shared(n_steps)
+        environment, solvers = _kinematic_1d(_SlowSolver1D, shared=shared)
+        particulator = _build(
+            environment,
+            solvers,
+            asynchronous=asynchronous,
+            extra_dynamics=(probe_class(shared),),
+        )
+
+        # act
+        particulator.run(steps=n_steps)
+
+        # assert
+        assert shared.released_in_time == expected
+
+    @staticmethod
+    def test_not_supported_with_domain_decomposition():
+        # arrange
+        builder = SimpleNamespace(
+            particulator=SimpleNamespace(environment=SimpleNamespace(domain=object()))
+        )
+        sut = EulerianAdvection(None, asynchronous=True)
+
+        # act & assert
+        with pytest.raises(NotImplementedError):
+            sut.register(builder)
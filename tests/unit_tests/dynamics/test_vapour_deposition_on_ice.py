@@ -14,8 +14,13 @@ from PySDM import Formulae
 from PySDM.environments import Box
 from PySDM.environments.impl import register_environment
 from PySDM.environments.impl.moist import Moist
+from PySDM.impl.mesh import Mesh
 from PySDM.dynamics import VapourDepositionOnIce, AmbientThermodynamics
-from PySDM.products import IceWaterContent
+from PySDM.products import (
+    DepositionSubstepsMax,
+    DepositionSubstepsMin,
+    IceWaterContent,
+)
 
 
 @register_environment()
@@ -29,6 +34,14 @@ class MoistBox(Box, Moist):
     def register(self, builder):
         Moist.register(self, builder)
 
+    def __setitem__(self, key, value):
+        if key not in self._ambient_air:
+            self._ambient_air[key] = self.particulator.backend.Storage.from_ndarray(
+                np.full(self.mesh.n_cell, value, dtype=float)
+            )
+        else:
+            self._ambient_air[key][:] = value
+
     def get_water_vapour_mixing_ratio(self):
         return self["water_vapour_mixing_ratio"]
 
@@ -42,6 +55,15 @@ class MoistBox(Box, Moist):
         return self[key]
 
 
+@register_environment()
+class MoistColumn(MoistBox):
+    """multi-cell variant of `MoistBox` (a column of cells of unit volume)"""
+
+    def __init__(self, dt: float, n_cell: int, mixed_phase: bool = False):
+        super().__init__(dt=dt, dv=1 * si.m**3, mixed_phase=mixed_phase)
+        self.mesh = Mesh(grid=(n_cell,), size=(n_cell * si.m,))
+
+
 DIFFUSION_COORDINATES = ("WaterMass", "WaterMassLogarithm")
 DIFFUSION_ICE_CAPACITIES = ("Spherical", "Columnar")
 COMMON = {
@@ -49,6 +71,41 @@ COMMON = {
 }
 
 
+def _set_ambient_moisture(particulator, *, RH_ice, RH_water):
+    """sets vapour-related ambient state (and the dry-air density and potential
+    temperature) for given relative humidity over ice or over water"""
+    pvs_ice = particulator.formulae.saturation_vapour_pressure.pvs_ice(
+        particulator.environment["T"][0]
+    )
+    pvs_water = particulator.formulae.saturation_vapour_pressure.pvs_water(
+        particulator.environment["T"][0]
+    )
+    vapour_pressure = (
+        np.asarray(RH_ice) * pvs_ice if RH_ice else np.asarray(RH_water) * pvs_water
+    )
+    particulator.environment["RH"] = vapour_pressure / pvs_water
+    particulator.environment["a_w_ice"] = pvs_ice / pvs_water
+    particulator.environment["Schmidt number"] = 1
+    particulator.environment["water_vapour_mixing_ratio"] = (
+        particulator.formulae.constants.eps
+        * vapour_pressure
+        / (particulator.environment["p"][0] - vapour_pressure)
+    )
+    particulator.environment["rhod"] = (
+        particulator.environment["p"][0] - vapour_pressure
+    ) / (particulator.environment["T"][0] * particulator.formulae.constants.Rd)
+    particulator.environment["thd"] = (
+        particulator.formulae.state_variable_triplet.th_dry(
+            th_std=particulator.formulae.trivia.th_std(
+                p=particulator.environment["p"][0], T=particulator.environment["T"][0]
+            ),
+            water_vapour_mixing_ratio=particulator.environment[
+                "water_vapour_mixing_ratio"
+            ].to_ndarray(),
+        )
+    )
+
+
 def make_particulator(
     *,
     dt: float,
@@ -61,12 +118,19 @@ def make_particulator(
     RH_water: float = None,
     adaptive: bool = False,
     multiplicity: int = int(1e8),
+    cell_id: Iterable = None,
 ):
-    """instantiates a particulator with minimal components for testing ice depositional growth"""
+    """instantiates a particulator with minimal components for testing ice depositional
+    growth (in a single cell, or in a column of cells if `cell_id` is given, in which
+    case `RH_ice` or `RH_water` can be specified per cell)"""
     assert RH_water is None or RH_ice is None
     builder = Builder(
         n_sd=len(signed_water_masses),
-        environment=MoistBox(dt=dt, dv=1 * si.m**3),
+        environment=(
+            MoistBox(dt=dt, dv=1 * si.m**3)
+            if cell_id is None
+            else MoistColumn(dt=dt, n_cell=max(cell_id) + 1)
+        ),
         backend=CPU(
             override_jit_flags={"parallel": False},
             formulae=Formulae(
@@ -84,39 +148,17 @@ def make_particulator(
                 shape=(builder.particulator.n_sd,), fill_value=multiplicity
             ),
             "signed water mass": np.asarray(signed_water_masses),
+            **({} if cell_id is None else {"cell id": np.asarray(cell_id)}),
         },
-        products=(IceWaterContent(),),
+        products=(
+            IceWaterContent(),
+            DepositionSubstepsMin(name="n_substeps_min"),
+            DepositionSubstepsMax(name="n_substeps_max"),
+        ),
     )
     particulator.environment["T"] = temperature
     particulator.environment["p"] = pressure
-    pvs_ice = particulator.formulae.saturation_vapour_pressure.pvs_ice(
-        particulator.environment["T"][0]
-    )
-    pvs_water = particulator.formulae.saturation_vapour_pressure.pvs_water(
-        particulator.environment["T"][0]
-    )
-    vapour_pressure = RH_ice * pvs_ice if RH_ice else RH_water * pvs_water
-    particulator.environment["RH"] = vapour_pressure / pvs_water
-    particulator.environment["a_w_ice"] = pvs_ice / pvs_water
-    particulator.environment["Schmidt number"] = 1
-    particulator.environment["water_vapour_mixing_ratio"] = (
-        particulator.formulae.constants.eps
-        * vapour_pressure
-        / (particulator.environment["p"][0] - vapour_pressure)
-    )
-    particulator.environment["rhod"] = (
-        particulator.environment["p"][0] - vapour_pressure
-    ) / (particulator.environment["T"][0] * particulator.formulae.constants.Rd)
-    particulator.environment["thd"] = (
-        particulator.formulae.state_variable_triplet.th_dry(
-            th_std=particulator.formulae.trivia.th_std(
-                p=particulator.environment["p"][0], T=particulator.environment["T"][0]
-            ),
-            water_vapour_mixing_ratio=particulator.environment[
-                "water_vapour_mixing_ratio"
-            ][0],
-        )
-    )
+    _set_ambient_moisture(particulator, RH_ice=RH_ice, RH_water=RH_water)
     return particulator
 
 
@@ -336,6 +378,95 @@ class TestVapourDepositionOnIce:
         # assert
         np.testing.assert_almost_equal(m0, m1)
 
+    @staticmethod
+    @pytest.mark.parametrize("diffusion_coordinate", DIFFUSION_COORDINATES)
+    def test_multi_cell_same_as_single_cell(diffusion_coordinate):
+        # arrange
+        rh_ice = (1.5, 1.0, 0.9)
+        water_mass_init = np.logspace(-15, -6, num=6) * si.kg
+        common = {
+            "adaptive": True,
+            "dt": 10 * si.s,
+            "diffusion_coordinate": diffusion_coordinate,
+            "diffusion_ice_capacity": "Columnar",
+            "temperature": 250 * si.K,
+            "pressure": 800 * si.hPa,
+        }
+        sut = make_particulator(
+            **common,
+            signed_water_masses=-np.tile(water_mass_init, len(rh_ice)),
+            cell_id=np.repeat(np.arange(len(rh_ice)), len(water_mass_init)),
+            RH_ice=rh_ice,
+        )
+        expected = [
+            make_particulator(
+                **common, signed_water_masses=-water_mass_init, RH_ice=rh_ice_in_cell
+            )
+            for rh_ice_in_cell in rh_ice
+        ]
+
+        # act
+        sut.run(steps=2)
+        for particulator in expected:
+            particulator.run(steps=2)
+
+        # assert
+        np.testing.assert_allclose(
+            sut.attributes["water mass"].to_ndarray(),
+            np.concatenate([p.attributes["water mass"].to_ndarray() for p in expected]),
+            rtol=1e-12,
+        )
+        np.testing.assert_allclose(
+            sut.environment["water_vapour_mixing_ratio"].to_ndarray(),
+            [p.environment["water_vapour_mixing_ratio"][0] for p in expected],
+            rtol=1e-12,
+        )
+        n_substeps = [
+            p.dynamics["VapourDepositionOnIce"].counters["n_substeps"][0]
+            for p in expected
+        ]
+        np.testing.assert_array_equal(
+            sut.dynamics["VapourDepositionOnIce"].counters["n_substeps"].to_ndarray(),
+            n_substeps,
+        )
+        assert len(set(n_substeps)) > 1
+
+    @staticmethod
+    def test_substep_count_products():
+        # arrange
+        particulator = make_particulator(
+            adaptive=True,
+            dt=10 * si.s,
+            diffusion_coordinate="WaterMass",
+            diffusion_ice_capacity="Spherical",
+            signed_water_masses=-np.logspace(-15, -6, num=6) * si.kg,
+            cell_id=np.repeat(np.arange(2), 3),
+            temperature=250 * si.K,
+            pressure=800 * si.hPa,
+            RH_ice=(1.5, 1.0),
+        )
+        n_substeps = []
+
+        # act
+        for _ in range(3):
+            particulator.run(steps=1)
+            n_substeps.append(
+                particulator.dynamics["VapourDepositionOnIce"]
+                .counters["n_substeps"]
+                .to_ndarray()
+            )
+
+        # assert
+        np.testing.assert_array_equal(
+            particulator.products["n_substeps_min"].get(), np.min(n_substeps, axis=0)
+        )
+        np.testing.assert_array_equal(
+            particulator.products["n_substeps_max"].get(), np.max(n_substeps, axis=0)
+        )
+        np.testing.assert_array_equal(
+            particulator.products["n_substeps_min"].get(), np.inf
+        )
+
 
 # TODO #1524: test is updraft matters
 # TODO #1524: test if order of condensation/deposition matters
@@ -0,0 +1,92 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import queue
+
+import numpy as np
+import pytest
+
+from PySDM.backends import CPU
+from PySDM.environments.domain_decomposition import SlabDomain, slab_bounds
+
+from ..dummy_environment import DummyEnvironment
+from ..dummy_particulator import DummyParticulator
+
+
+@pytest.mark.parametrize(
+    "n_x, n_slabs, expected",
+    (
+        (6, 1, ((0, 6),)),
+        (6, 2, ((0, 3), (3, 6))),
+        (7, 3, ((0, 2), (2, 4), (4, 7))),
+    ),
+)
+def test_slab_bounds(n_x, n_slabs, expected):
+    assert slab_bounds(n_x, n_slabs) == expected
+
+
+def test_slab_bounds_too_many_slabs():
+    with pytest.raises(ValueError):
+        slab_bounds(2, 3)
+
+
+def test_slab_domain_geometry():
+    # arrange
+    sut = SlabDomain(grid=(7, 4), size=(700, 400), n_slabs=3, rank=2, queues=None)
+
+    # act
+    geometry = (sut.start, sut.stop, sut.slab_grid, sut.slab_size)
+
+    # assert
+    assert sut.n_slabs == 3
+    assert geometry == (4, 7, (3, 4), (300, 400))
+    assert sut.local(np.arange(8), staggered=True).tolist() == [4, 5, 6, 7]
+
+
+def test_migration_in_place_rebuckets_only_migrated_super_droplets():
+    # arrange
+    leftward, rightward = queue.Queue(), queue.Queue()
+    sut = SlabDomain(
+        grid=(3, 2),
+        size=(300, 200),
+        n_slabs=1,
+        rank=0,
+        queues=(leftward, rightward, rightward, leftward),
+    )
+    position = np.array(
+        [[0.5, 1.5, 2.5, 0.5, 1.5, 2.5], [0.5, 0.5, 0.5, 1.5, 1.5, 1.5]]
+    )
+    particulator = DummyParticulator(CPU, n_sd=position.shape[1])
+    particulator.environment = DummyEnvironment(grid=(3, 2))
+    particulator.sorting_scheme = "incremental"
+    cell_id, cell_origin, position_in_cell = particulator.mesh.cellular_attributes(
+        position
+    )
+    particulator.build(
+        {
+            "multiplicity": np.arange(1, position.shape[1] + 1, dtype=np.int64),
+            "cell id": cell_id,
+            "cell origin": cell_origin,
+            "position in cell": position_in_cell,
+        }
+    )
+    attributes = particulator.attributes
+    _ = attributes.cell_start
+
+    # act
+    cell_origin[0, 0] = -1
+    cell_origin[0, 2] = 3
+    attributes["cell origin"].upload(cell_origin)
+    sut.migrate(particulator)
+    particulator.recalculate_cell_id()
+    cell_start = attributes.cell_start.to_ndarray()
+
+    # assert
+    assert sut.n_migrated == 2
+    assert attributes.super_droplet_count == position.shape[1]
+    np.testing.assert_array_equal(
+        attributes["multiplicity"].to_ndarray(raw=True), (3, 2, 1, 4, 5, 6)
+    )
+    np.testing.assert_array_equal(
+        attributes["cell origin"].to_ndarray(raw=True)[0], (0, 1, 2, 0, 1, 2)
+    )
+    np.testing.assert_array_equal(cell_start, (0, 1, 2, 3, 4, 5, 6))
+    assert attributes.cell_caretaker.stats == {"incremental": 1, "full": 1}
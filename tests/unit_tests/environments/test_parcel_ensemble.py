@@ -0,0 +1,159 @@
+"""checks if an ensemble of parcels matches a set of independent parcel simulations"""
+
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU, GPU
+from PySDM.dynamics import AmbientThermodynamics, Coalescence, Condensation
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Parcel, ParcelEnsemble
+from PySDM.physics import si
+from PySDM.products import (
+    AmbientRelativeHumidity,
+    ParcelDisplacement,
+    ParticleConcentration,
+    WaterMixingRatio,
+)
+
+W = np.asarray((0.5, 1, 2)) * si.m / si.s
+T0 = np.asarray((300, 295, 290)) * si.K
+KAPPA = np.asarray((0.1, 0.5, 1.2))
+N_SD_PER_MEMBER = 4
+N_STEPS = 10
+COMMON_CTOR_ARGS = {
+    "dt": 1 * si.s,
+    "mass_of_dry_air": 1 * si.kg,
+    "p0": 1000 * si.hPa,
+    "initial_water_vapour_mixing_ratio": 20 * si.g / si.kg,
+}
+R_DRY = np.logspace(-8, -6, N_SD_PER_MEMBER) * si.m
+N_IN_DV = np.full(N_SD_PER_MEMBER, 1e8)
+
+
+def _products():
+    return (
+        AmbientRelativeHumidity(name="RH"),
+        ParcelDisplacement(name="z"),
+        ParticleConcentration(name="n"),
+        WaterMixingRatio(name="ql", radius_range=(1 * si.um, np.inf)),
+    )
+
+
+def _run(particulator):
+    particulator.run(steps=N_STEPS)
+    return {key: product.get().copy() for key, product in particulator.products.items()}
+
+
+def _build(environment, init_attributes_args):
+    builder = Builder(
+        n_sd=len(init_attributes_args["r_dry"]), backend=CPU(), environment=environment
+    )
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(Condensation())
+    return builder.build(
+        attributes=builder.particulator.environment.init_attributes(
+            **init_attributes_args
+        ),
+        products=_products(),
+    )
+
+
+class TestParcelEnsemble:
+    @staticmethod
+    def test_ensemble_matches_independent_parcels():
+        # arrange
+        ensemble = _build(
+            ParcelEnsemble(n_members=len(W), w=W, T0=T0, **COMMON_CTOR_ARGS),
+            {
+                "n_in_dv": np.tile(N_IN_DV, len(W)),
+                "kappa": np.repeat(KAPPA, N_SD_PER_MEMBER),
+                "r_dry": np.tile(R_DRY, len(W)),
+                "cell_id": np.repeat(np.arange(len(W)), N_SD_PER_MEMBER),
+            },
+        )
+        members = [
+            _build(
+                Parcel(w=W[i], T0=T0[i], **COMMON_CTOR_ARGS),
+                {"n_in_dv": N_IN_DV, "kappa": KAPPA[i], "r_dry": R_DRY},
+            )
+            for i in range(len(W))
+        ]
+
+        # act
+        ensemble_output = _run(ensemble)
+        members_output = [_run(member) for member in members]
+
+        # assert
+        for key, values in ensemble_output.items():
+            assert values.shape == (len(W),)
+            np.testing.assert_allclose(
+                values,
+                [member_output[key][0] for member_output in members_output],
+                rtol=1e-9,
+            )
+        assert (np.diff(ensemble_output["z"]) > 0).all()
+
+    @staticmethod
+    def test_time_dependent_updraft():
+        # arrange
+        sut = ParcelEnsemble(
+            n_members=len(W),
+            w=lambda t: W * (t < 5 * si.s),
+            T0=T0,
+            **COMMON_CTOR_ARGS,
+        )
+        particulator = _build(
+            sut,
+            {
+                "n_in_dv": np.tile(N_IN_DV, len(W)),
+                "kappa": 0.5,
+                "r_dry": np.tile(R_DRY, len(W)),
+                "cell_id": np.repeat(np.arange(len(W)), N_SD_PER_MEMBER),
+            },
+        )
+
+        # act
+        output = _run(particulator)
+
+        # assert
+        np.testing.assert_allclose(output["z"], W * 5 * si.s)
+        assert np.isfinite(output["RH"]).all()
+
+    @staticmethod
+    def test_parameter_shape_mismatch():
+        with pytest.raises(ValueError):
+            ParcelEnsemble(n_members=2, w=W, T0=300 * si.K, **COMMON_CTOR_ARGS)
+
+    @staticmethod
+    def test_unsupported_backend():
+        with pytest.raises(NotImplementedError, match="Numba"):
+            Builder(
+                n_sd=1,
+                backend=GPU(),
+                environment=ParcelEnsemble(
+                    n_members=len(W), w=W, T0=T0, **COMMON_CTOR_ARGS
+                ),
+            )
+
+    @staticmethod
+    def test_unsupported_dynamic():
+        # arrange
+        builder = Builder(
+            n_sd=2 * len(W),
+            backend=CPU(),
+            environment=ParcelEnsemble(
+                n_members=len(W), w=W, T0=T0, **COMMON_CTOR_ARGS
+            ),
+        )
+        builder.add_dynamic(Coalescence(collision_kernel=Golovin(b=1.5e3 / si.s)))
+
+        # act & assert
+        with pytest.raises(NotImplementedError, match="cell volume"):
+            builder.build(
+                attributes={
+                    "multiplicity": np.ones(2 * len(W)),
+                    "volume": np.ones(2 * len(W)) * si.um**3,
+                    "cell id": np.repeat(np.arange(len(W)), 2),
+                }
+            )
@@ -0,0 +1,178 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import gc
+import threading
+
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import Coalescence
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box
+from PySDM.exporters import AsyncExporter
+from PySDM.physics import si
+from PySDM.products import ParticleConcentration, SuperDropletCountPerGridbox, Time
+
+N_SD = 64
+N_STEPS = 4
+
+
+def make_particulator():
+    builder = Builder(
+        n_sd=N_SD,
+        backend=CPU(),
+        environment=Box(dt=1 * si.s, dv=1 * si.m**3),
+    )
+    builder.add_dynamic(Coalescence(collision_kernel=Golovin(b=1e15 / si.s)))
+    return builder.build(
+        attributes={
+            "multiplicity": np.ones(N_SD, dtype=int),
+            "volume": np.linspace(1, 100, N_SD) * si.um**3,
+        },
+        products=(
+            ParticleConcentration(name="n"),
+            SuperDropletCountPerGridbox(name="n_sd"),
+            Time(name="t"),
+        ),
+    )
+
+
+class RecordingExporter:
+    def __init__(self, release=None):
+        self.records = []
+        self.release = release
+        self.closed = False
+
+    def export_products(self, particulator):
+        if self.release is not None:
+            self.release.wait()
+        self.records.append(
+            (
+                particulator.n_steps,
+                {
+                    name: np.copy(product.get())
+                    for name, product in particulator.products.items()
+                },
+            )
+        )
+
+    def export_attributes(self, particulator):
+        self.records.append(
+            (
+                particulator.n_steps,
+                {
+                    name: particulator.attributes[name].to_ndarray()
+                    for name in particulator.attributes.get_base_attributes()
+                },
+            )
+        )
+
+    def close(self):
+        self.closed = True
+
+
+class TestAsyncExporter:
+    @staticmethod
+    def test_output_matches_synchronous_export():
+        # arrange
+        particulators = make_particulator(), make_particulator()
+        expected = RecordingExporter()
+        sut = AsyncExporter(RecordingExporter(), max_queue_size=2)
+
+        # act
+        for particulator, exporter in zip(particulators, (expected, sut)):
+            for _ in range(N_STEPS):
+                particulator.run(steps=1)
+                exporter.export_products(particulator)
+                exporter.export_attributes(particulator)
+        sut.close()
+
+        # assert
+        assert sut.exporter.closed
+        assert len(sut.exporter.records) == len(expected.records) == 2 * N_STEPS
+        assert len(expected.records[-1][1]["multiplicity"]) < N_SD
+        for (step, actual), (expected_step, values) in zip(
+            sut.exporter.records, expected.records
+        ):
+            assert step == expected_step
+            assert actual.keys() == values.keys()
+            for key, value in values.items():
+                np.testing.assert_array_equal(actual[key], value)
+
+    @staticmethod
+    def test_product_snapshots_are_product_instances():
+        # arrange
+        particulator = make_particulator()
+        classes = {}
+
+        class ClassRecordingExporter(RecordingExporter):
+            def export_products(self, particulator):
+                for name, product in particulator.products.items():
+                    classes[name] = type(product)
+                super().export_products(particulator)
+
+        sut = AsyncExporter(ClassRecordingExporter())
+
+        # act
+        particulator.run(steps=1)
+        sut.export_products(particulator)
+        sut.close()
+
+        # assert
+        assert classes == {
+            name: type(product) for name, product in particulator.products.items()
+        }
+        assert sut.exporter.records[0][1]["t"] == particulator.products["t"].get()
+
+    @staticmethod
+    def test_back_pressure():
+        # arrange
+        release = threading.Event()
+        particulator = make_particulator()
+        sut = AsyncExporter(RecordingExporter(release=release), max_queue_size=1)
+        sut.export_products(particulator)
+        blocked = threading.Thread(target=sut.export_products, args=(particulator,))
+
+        # act
+        blocked.start()
+        blocked.join(timeout=0.2)
+        was_blocked = blocked.is_alive()
+        release.set()
+        blocked.join()
+        sut.flush()
+
+        # assert
+        assert was_blocked
+        assert len(sut.exporter.records) == 2
+
+    @staticmethod
+    def test_flush_on_particulator_teardown():
+        # arrange
+        particulator = make_particulator()
+        sut = AsyncExporter(RecordingExporter())
+        sut.export_products(particulator)
+        sut.flush()
+
+        # act
+        del particulator
+        gc.collect()
+
+        # assert
+        assert sut.exporter.closed
+        assert len(sut.exporter.records) == 1
+
+    @staticmethod
+    def test_error_reraised():
+        # arrange
+        class FailingExporter(RecordingExporter):
+            def export_products(self, particulator):
+                raise IOError("disk full")
+
+        particulator = make_particulator()
+        sut = AsyncExporter(FailingExporter())
+        sut.export_products(particulator)
+
+        # act & assert
+        with pytest.raises(IOError, match="disk full"):
+            sut.flush()
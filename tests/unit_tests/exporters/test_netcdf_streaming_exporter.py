@@ -0,0 +1,92 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import Coalescence
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box
+from PySDM.exporters import NetCDFStreamingExporter, read_attributes_snapshot
+from PySDM.physics import si
+from PySDM.products import ParticleConcentration, ParticleSizeSpectrumPerVolume, Time
+
+netCDF4 = pytest.importorskip("netCDF4")
+
+N_SD = 64
+N_STEPS = 5
+
+
+@pytest.fixture(name="particulator")
+def particulator_fixture():
+    builder = Builder(
+        n_sd=N_SD,
+        backend=CPU(),
+        environment=Box(dt=1 * si.s, dv=1 * si.m**3),
+    )
+    builder.add_dynamic(Coalescence(collision_kernel=Golovin(b=1e15 / si.s)))
+    return builder.build(
+        attributes={
+            "multiplicity": np.ones(N_SD, dtype=int),
+            "volume": np.linspace(1, 100, N_SD) * si.um**3,
+        },
+        products=(
+            ParticleConcentration(name="n"),
+            ParticleSizeSpectrumPerVolume(
+                name="spectrum", radius_bins_edges=np.logspace(-7, -4, 11)
+            ),
+            Time(name="t"),
+        ),
+    )
+
+
+class TestNetCDFStreamingExporter:
+    @staticmethod
+    def test_products(particulator, tmp_path):
+        # arrange
+        file = tmp_path / "output.nc"
+        expected = {"n": [], "spectrum": []}
+
+        # act
+        with NetCDFStreamingExporter(file, chunk_steps=2) as sut:
+            for _ in range(N_STEPS):
+                particulator.run(steps=1)
+                sut.export_products(particulator)
+                for name, values in expected.items():
+                    values.append(particulator.products[name].get().copy())
+
+        # assert
+        with netCDF4.Dataset(file) as ncdf:
+            assert ncdf.dimensions["T"].isunlimited()
+            np.testing.assert_array_equal(ncdf["T"][:], np.arange(1, N_STEPS + 1))
+            np.testing.assert_array_equal(ncdf["t"][:], np.arange(1, N_STEPS + 1))
+            for name, values in expected.items():
+                np.testing.assert_allclose(ncdf[name][:], np.asarray(values))
+                assert ncdf[name].filters()["zlib"]
+                assert ncdf[name].chunking()[0] == 2
+            assert ncdf["spectrum"].dimensions[-1] == "spectrum_bin_left_edges"
+
+    @staticmethod
+    def test_ragged_attributes(particulator, tmp_path):
+        # arrange
+        file = tmp_path / "output.nc"
+        expected = []
+
+        # act
+        with NetCDFStreamingExporter(file, attributes=("multiplicity",)) as sut:
+            for _ in range(N_STEPS):
+                particulator.run(steps=1)
+                sut.export_attributes(particulator)
+                expected.append(particulator.attributes["multiplicity"].to_ndarray())
+
+        # assert
+        assert len(expected[0]) != len(expected[-1])
+        with netCDF4.Dataset(file) as ncdf:
+            np.testing.assert_array_equal(
+                ncdf["row_size"][:], [len(values) for values in expected]
+            )
+            assert ncdf["row_size"].sample_dimension == "particle"
+            for snapshot, values in enumerate(expected):
+                np.testing.assert_array_equal(
+                    read_attributes_snapshot(ncdf, "multiplicity", snapshot), values
+                )
@@ -0,0 +1,201 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU, Numba
+from PySDM.dynamics import AmbientThermodynamics, Coalescence, Condensation
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box, Parcel
+from PySDM.physics import si
+from PySDM.products import (
+    AmbientTemperature,
+    CollisionTimestepMean,
+    ParticleConcentration,
+    PeakSaturation,
+    Time,
+)
+
+N_SD = 64
+N_STEPS_BEFORE = 3
+N_STEPS_AFTER = 4
+
+
+def _box_builder(backend):
+    builder = Builder(
+        n_sd=N_SD, backend=backend, environment=Box(dt=1 * si.s, dv=1 * si.m**3)
+    )
+    builder.add_dynamic(Coalescence(collision_kernel=Golovin(b=1.5e3 / si.s)))
+    return builder
+
+
+def _box_attributes():
+    rng = np.random.default_rng(seed=44)
+    return {
+        "multiplicity": rng.integers(1, 100, size=N_SD).astype(float),
+        "volume": rng.uniform(1, 100, size=N_SD) * si.um**3,
+    }
+
+
+def _box_products():
+    return (
+        ParticleConcentration(name="n"),
+        CollisionTimestepMean(name="dt_coal"),
+        Time(name="t"),
+    )
+
+
+def _parcel_builder(backend):
+    builder = Builder(
+        n_sd=N_SD,
+        backend=backend,
+        environment=Parcel(
+            dt=1 * si.s,
+            mass_of_dry_air=1 * si.mg,
+            p0=1000 * si.hPa,
+            initial_water_vapour_mixing_ratio=22.2 * si.g / si.kg,
+            T0=300 * si.K,
+            w=5 * si.m / si.s,
+        ),
+    )
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(Condensation())
+    return builder
+
+
+def _parcel_attributes(builder):
+    return builder.particulator.environment.init_attributes(
+        n_in_dv=np.full(N_SD, 1000.0),
+        kappa=0.666,
+        r_dry=np.logspace(-2, -1, N_SD) * si.um,
+    )
+
+
+def _parcel_products():
+    return (
+        AmbientTemperature(name="T"),
+        PeakSaturation(name="S_max"),
+        Time(name="t"),
+    )
+
+
+def _snapshot(particulator):
+    return {
+        **{
+            key: particulator.attributes[key].to_ndarray()
+            for key in particulator.attributes.keys()
+        },
+        **{
+            key: np.copy(product.get())
+            for key, product in particulator.products.items()
+        },
+        **{
+            key: np.copy(field)
+            for key, field in getattr(
+                particulator.dynamics.get("EulerianAdvection"), "advectees", {}
+            ).items()
+        },
+    }
+
+
+class TestCheckpoint:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "builder_factory, attributes_factory, products_factory",
+        (
+            (_box_builder, lambda _: _box_attributes(), _box_products),
+            (_parcel_builder, _parcel_attributes, _parcel_products),
+        ),
+    )
+    def test_restart_is_bit_identical(
+        tmp_path, builder_factory, attributes_factory, products_factory
+    ):
+        # arrange
+        path = tmp_path / "checkpoint.npz"
+        builder = builder_factory(CPU())
+        particulator = builder.build(
+            attributes=attributes_factory(builder), products=products_factory()
+        )
+        particulator.run(steps=N_STEPS_BEFORE)
+
+        # act
+        particulator.save_checkpoint(path)
+        particulator.run(steps=N_STEPS_AFTER)
+        expected = _snapshot(particulator)
+
+        restarted = builder_factory(CPU()).from_checkpoint(
+            path, products=products_factory()
+        )
+        restarted.run(steps=N_STEPS_AFTER)
+        actual = _snapshot(restarted)
+
+        # assert
+        assert restarted.n_steps == particulator.n_steps
+        assert actual.keys() == expected.keys()
+        for key, value in expected.items():
+            np.testing.assert_array_equal(actual[key], value, err_msg=key)
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "backend_kwargs", ({"rng": "philox"}, {"asynchronous_rng": True})
+    )
+    def test_restart_is_bit_identical_with_other_rngs(tmp_path, backend_kwargs):
+        # arrange
+        path = tmp_path / "checkpoint.npz"
+        particulator = _box_builder(Numba(**backend_kwargs)).build(
+            attributes=_box_attributes()
+        )
+        particulator.run(steps=N_STEPS_BEFORE)
+
+        # act
+        particulator.save_checkpoint(path)
+        particulator.run(steps=N_STEPS_AFTER)
+        restarted = _box_builder(Numba(**backend_kwargs)).from_checkpoint(path)
+        restarted.run(steps=N_STEPS_AFTER)
+
+        # assert
+        for key in ("multiplicity", "volume"):
+            np.testing.assert_array_equal(
+                restarted.attributes[key].to_ndarray(),
+                particulator.attributes[key].to_ndarray(),
+            )
+
+    @staticmethod
+    def test_checkpoint_of_removed_particles(tmp_path, backend_class):
+        # arrange
+        path = tmp_path / "checkpoint.npz"
+        attributes = _box_attributes()
+        attributes["multiplicity"][::2] = 1
+        particulator = _box_builder(backend_class()).build(attributes=attributes)
+        particulator.run(steps=N_STEPS_BEFORE)
+
+        # act
+        particulator.save_checkpoint(path)
+        restarted = _box_builder(backend_class()).from_checkpoint(path)
+
+        # assert
+        assert (
+            restarted.attributes.super_droplet_count
+            == particulator.attributes.super_droplet_count
+        )
+        for key in ("multiplicity", "volume"):
+            np.testing.assert_array_equal(
+                restarted.attributes[key].to_ndarray(),
+                particulator.attributes[key].to_ndarray(),
+            )
+
+    @staticmethod
+    def test_super_particle_count_mismatch(tmp_path):
+        # arrange
+        path = tmp_path / "checkpoint.npz"
+        particulator = _box_builder(CPU()).build(attributes=_box_attributes())
+        particulator.save_checkpoint(path)
+        builder = Builder(
+            n_sd=N_SD // 2,
+            backend=CPU(),
+            environment=Box(dt=1 * si.s, dv=1 * si.m**3),
+        )
+
+        # act & assert
+        with pytest.raises(ValueError):
+            builder.from_checkpoint(path)
@@ -0,0 +1,135 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU, Numba
+from PySDM.dynamics import Coalescence
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box
+from PySDM.impl.defragmentation import locality
+from PySDM.physics import si
+
+from ..dummy_environment import DummyEnvironment
+from ..dummy_particulator import DummyParticulator
+
+GRID = (3, 2)
+N_SD = 24
+KEYS = ("multiplicity", "volume", "cell id", "cell origin", "position in cell")
+
+
+def _scrambled_particulator():
+    rng = np.random.default_rng(44)
+    particulator = DummyParticulator(Numba, n_sd=N_SD)
+    particulator.environment = DummyEnvironment(grid=GRID)
+    particulator.req_attr_names += ["volume"]
+    cell_id, cell_origin, position_in_cell = particulator.mesh.cellular_attributes(
+        rng.uniform(0, 1, (2, N_SD)) * np.array(GRID)[:, None]
+    )
+    multiplicity = rng.integers(1, 10, N_SD)
+    multiplicity[::5] = 0
+    particulator.build(
+        {
+            "multiplicity": multiplicity,
+            "volume": rng.uniform(1, 100, N_SD) * si.um**3,
+            "cell id": cell_id,
+            "cell origin": cell_origin,
+            "position in cell": position_in_cell,
+        },
+        int_caster=np.int64,
+    )
+    u01 = particulator.Storage.from_ndarray(rng.uniform(0, 1, N_SD))
+    particulator.attributes.permutation(u01, local=False)
+    particulator.attributes.healthy = False
+    return particulator
+
+
+def _values(attributes):
+    return {key: attributes[key].to_ndarray() for key in KEYS}
+
+
+class TestDefragmentation:
+    @staticmethod
+    def test_defragment():
+        # arrange
+        particulator = _scrambled_particulator()
+        sut = particulator.attributes
+        sut.sanitize()
+        locality_before = locality(sut)
+        expected = _values(sut)
+
+        # act
+        sut.defragment()
+
+        # assert
+        assert locality_before < 1
+        assert locality(sut) == 1
+        idx = sut._ParticleAttributes__idx  # pylint: disable=protected-access
+        np.testing.assert_array_equal(idx.to_ndarray(), np.arange(N_SD))
+        actual = _values(sut)
+        for key in KEYS:
+            np.testing.assert_array_equal(actual[key], expected[key])
+        cell_id = sut["cell id"].to_ndarray(raw=True)[: sut.super_droplet_count]
+        assert (np.diff(cell_id) >= 0).all()
+        np.testing.assert_array_equal(
+            sut.cell_start.to_ndarray(),
+            np.searchsorted(cell_id, np.arange(np.prod(GRID) + 1)),
+        )
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "policy, expected_count",
+        (
+            ({"interval": 2}, 2),
+            ({"min_locality": 0.99}, 1),
+            ({"interval": 10, "min_locality": 0.99}, 1),
+        ),
+    )
+    def test_policy(policy, expected_count):
+        # arrange
+        particulator = _scrambled_particulator()
+        sut = particulator.enable_defragmentation(**policy)
+
+        # act
+        particulator.run(steps=5)
+
+        # assert
+        assert sut.n_defragmentations == expected_count
+        assert locality(particulator.attributes) == 1
+
+    @staticmethod
+    @pytest.mark.parametrize("policy", ({}, {"interval": 0}))
+    def test_invalid_policy(policy):
+        particulator = _scrambled_particulator()
+        with pytest.raises(ValueError):
+            particulator.enable_defragmentation(**policy)
+
+    @staticmethod
+    def test_coalescence_unaffected():
+        # arrange
+        def final_state(defragment):
+            builder = Builder(
+                n_sd=N_SD, backend=CPU(), environment=Box(dt=1 * si.s, dv=1 * si.m**3)
+            )
+            builder.add_dynamic(Coalescence(collision_kernel=Golovin(b=1e15 / si.s)))
+            particulator = builder.build(
+                attributes={
+                    "multiplicity": np.ones(N_SD, dtype=int),
+                    "volume": np.linspace(1, 100, N_SD) * si.um**3,
+                }
+            )
+            if defragment:
+                particulator.enable_defragmentation(interval=1)
+            particulator.run(steps=5)
+            return particulator.attributes
+
+        # act
+        expected = final_state(defragment=False)
+        actual = final_state(defragment=True)
+
+        # assert
+        assert actual.super_droplet_count < N_SD
+        for key in ("multiplicity", "volume"):
+            np.testing.assert_array_equal(
+                actual[key].to_ndarray(), expected[key].to_ndarray()
+            )
@@ -0,0 +1,156 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.dynamics import Coalescence
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box
+from PySDM.physics import si
+from PySDM.products import (
+    EffectiveRadius,
+    MeanRadius,
+    ParticleConcentration,
+    ParticleSizeSpectrumPerVolume,
+    VolumeSecondMoment,
+    TotalParticleConcentration,
+)
+
+N_SD = 64
+N_STEPS = 3
+
+
+def _particulator(backend_class, fused):
+    builder = Builder(
+        n_sd=N_SD,
+        backend=backend_class(double_precision=True),
+        environment=Box(dt=1 * si.s, dv=1 * si.m**3),
+    )
+    builder.add_dynamic(Coalescence(collision_kernel=Golovin(b=1.5e6 / si.s)))
+    particulator = builder.build(
+        attributes={
+            "multiplicity": np.full(N_SD, 1e6),
+            "volume": np.logspace(0, 4, N_SD) * si.um**3,
+        },
+        products=(
+            ParticleConcentration(name="n_all"),
+            ParticleConcentration(name="n_big", radius_range=(5 * si.um, np.inf)),
+            TotalParticleConcentration(name="n_total"),
+            MeanRadius(name="r_mean"),
+            EffectiveRadius(name="r_eff"),
+            VolumeSecondMoment(name="m2"),
+            ParticleSizeSpectrumPerVolume(
+                name="spectrum", radius_bins_edges=np.logspace(-7, -4, 12)
+            ),
+        ),
+    )
+    if fused:
+        particulator.enable_fused_moments()
+    return particulator
+
+
+def _binned_moments(x, multiplicity, cell_id, *, edges, rank, n_cell):
+    moment_0 = np.zeros((len(edges) - 1, n_cell))
+    moments = np.zeros((len(edges) - 1, n_cell))
+    for value, mult, cell in zip(x, multiplicity, cell_id):
+        if edges[0] <= value < edges[-1]:
+            k = np.searchsorted(edges, value, side="right") - 1
+            moment_0[k, cell] += mult
+            moments[k, cell] += mult * value**rank
+    return moment_0, np.divide(
+        moments, moment_0, out=np.zeros_like(moments), where=moment_0 != 0
+    )
+
+
+class TestFusedMoments:
+    @staticmethod
+    def test_products_match_unfused(backend_class):
+        # arrange
+        reference = _particulator(backend_class, fused=False)
+        sut = _particulator(backend_class, fused=True)
+
+        for _ in range(N_STEPS):
+            # act
+            for particulator in (reference, sut):
+                particulator.run(steps=1)
+
+            # assert
+            for name, product in reference.products.items():
+                np.testing.assert_allclose(
+                    sut.products[name].get(), product.get(), rtol=1e-12
+                )
+
+    @staticmethod
+    def test_single_pass_per_step(backend_class):
+        # arrange
+        sut = _particulator(backend_class, fused=True)
+        for product in sut.products.values():
+            product.get()
+        n_requests = len(sut.fused_moments.requests)
+        n_passes = sut.fused_moments.n_passes
+
+        # act
+        sut.run(steps=N_STEPS)
+        for _ in range(N_STEPS):
+            for product in sut.products.values():
+                product.get()
+
+        # assert
+        assert n_requests > 1
+        assert n_passes == n_requests
+        assert sut.fused_moments.n_passes == n_passes + 1
+
+    @staticmethod
+    def test_recomputed_after_attribute_update(backend_class):
+        # arrange
+        sut = _particulator(backend_class, fused=True)
+        before = sut.products["n_all"].get().copy()
+
+        # act
+        sut.attributes["multiplicity"][:] = 2 * sut.attributes[
+            "multiplicity"
+        ].to_ndarray().astype(int)
+        sut.attributes.mark_updated("multiplicity")
+        after = sut.products["n_all"].get()
+
+        # assert
+        np.testing.assert_allclose(after, 2 * before)
+
+    @staticmethod
+    @pytest.mark.parametrize("rank", (0, 1, 2.5))
+    def test_fused_moments_backend_method(backend_class, rank):
+        # arrange
+        backend = backend_class(double_precision=True)
+        n_cell = 2
+        x = np.asarray([0.5, 1.5, 2.5, 3.0, 1.0, -1.0])
+        multiplicity = np.asarray([1, 2, 3, 4, 5, 6])
+        cell_id = np.asarray([0, 1, 0, 1, 0, 1])
+        edges = np.asarray([0, 1, 2, 3])
+        storage = backend.Storage.from_ndarray
+
+        moment_0 = storage(np.full((len(edges) - 1, n_cell), np.nan))
+        moments = storage(np.full((len(edges) - 1, n_cell), np.nan))
+
+        # act
+        backend.fused_moments(
+            moment_0=moment_0,
+            moments=moments,
+            multiplicity=storage(multiplicity),
+            attr_data=storage(x.reshape(1, -1)),
+            cell_id=storage(cell_id),
+            idx=storage(np.arange(len(x))),
+            length=len(x),
+            attr_indices=storage(np.zeros((3, 1), dtype=np.int64)),
+            ranks=storage(np.asarray([float(rank)])),
+            x_edges=storage(edges.astype(float)),
+            row_offsets=storage(np.asarray([0, len(edges) - 1])),
+            weighting_ranks=storage(np.asarray([0.0])),
+            skip_division_by_m0=storage(np.asarray([False])),
+        )
+
+        # assert
+        expected_0, expected = _binned_moments(
+            x, multiplicity, cell_id, edges=edges, rank=rank, n_cell=n_cell
+        )
+        np.testing.assert_allclose(moment_0.to_ndarray(), expected_0)
+        np.testing.assert_allclose(moments.to_ndarray(), expected)
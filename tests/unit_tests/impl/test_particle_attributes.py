@@ -147,6 +147,41 @@ class TestParticleAttributes:
         # Assert
         assert particulator.attributes["cell id"][droplet_id] == 0
 
+    @staticmethod
+    def test_recalculate_cell_id_incremental_sort():
+        # Arrange
+        grid = (3, 2)
+        position = np.array(
+            [[0.5, 1.5, 2.5, 0.5, 1.5, 2.5], [0.5, 0.5, 0.5, 1.5, 1.5, 1.5]]
+        )
+        particulator = DummyParticulator(Numba, n_sd=position.shape[1])
+        particulator.environment = DummyEnvironment(grid=grid)
+        particulator.sorting_scheme = "incremental"
+        cell_id, cell_origin, position_in_cell = particulator.mesh.cellular_attributes(
+            position
+        )
+        particulator.build(
+            {
+                "multiplicity": np.ones(position.shape[1], dtype=np.int64),
+                "cell id": cell_id,
+                "cell origin": cell_origin,
+                "position in cell": position_in_cell,
+            }
+        )
+        sut = particulator.attributes
+        _ = sut.cell_start
+
+        # Act
+        cell_origin[1, 0] = 1
+        sut["cell origin"].upload(cell_origin)
+        particulator.recalculate_cell_id()
+        cell_start = sut.cell_start.to_ndarray()
+
+        # Assert
+        assert sut.cell_caretaker.stats == {"incremental": 1, "full": 1}
+        np.testing.assert_array_equal(cell_start, (0, 0, 2, 3, 4, 5, 6))
+        np.testing.assert_array_equal(sut["cell id"].to_ndarray(), (1, 1, 2, 3, 4, 5))
+
     @staticmethod
     def test_permutation_global_as_implemented_in_numba():
         n_sd = 8
@@ -0,0 +1,155 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import json
+
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import Coalescence
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box
+from PySDM.physics import si
+
+from ..dummy_environment import DummyEnvironment
+from ..dummy_particulator import DummyParticulator
+
+N_SD = 32
+N_STEPS = 2
+
+
+def _particulator(backend):
+    builder = Builder(
+        n_sd=N_SD,
+        backend=backend,
+        environment=Box(dt=1 * si.s, dv=1 * si.m**3),
+    )
+    builder.add_dynamic(
+        Coalescence(collision_kernel=Golovin(b=1.5e3 / si.s), adaptive=False)
+    )
+    return builder.build(
+        attributes={
+            "multiplicity": np.full(N_SD, 1e3),
+            "volume": np.linspace(1, 100, N_SD) * si.um**3,
+        }
+    )
+
+
+@pytest.fixture(name="particulator")
+def particulator_fixture(backend_class):
+    return _particulator(backend_class())
+
+
+class TestProfiler:
+    @staticmethod
+    def test_report(particulator):
+        # arrange
+        profiler = particulator.enable_profiling()
+
+        # act
+        particulator.run(steps=N_STEPS)
+        report = profiler.report()
+
+        # assert
+        assert tuple(report.keys()) == ("Collision",)
+        collision = report["Collision"]
+        assert collision["calls"] == N_STEPS
+        assert collision["time"] > 0
+        children = collision["children"]
+        for kernel in ("find_pairs", "compute_gamma", "collision_coalescence"):
+            assert children[kernel]["calls"] == N_STEPS
+            assert children[kernel]["bytes"] > 0
+            assert 0 < children[kernel]["time"] < collision["time"]
+        assert "counting sort" in children
+
+    @staticmethod
+    def test_chrome_trace(particulator, tmp_path):
+        # arrange
+        file = tmp_path / "trace.json"
+        profiler = particulator.enable_profiling(trace=True)
+
+        # act
+        particulator.run(steps=N_STEPS)
+        profiler.to_chrome_trace(file)
+
+        # assert
+        with open(file, encoding="utf-8") as stream:
+            events = json.load(stream)["traceEvents"]
+        assert sum(event["name"] == "Collision" for event in events) == N_STEPS
+        for event in events:
+            assert event["ph"] == "X"
+            assert event["dur"] >= 0
+
+    @staticmethod
+    def test_disable_profiling(particulator):
+        # arrange
+        profiler = particulator.enable_profiling()
+        particulator.run(steps=1)
+
+        # act
+        assert particulator.disable_profiling() is profiler
+        particulator.run(steps=1)
+
+        # assert
+        assert particulator.profiler is None
+        assert "find_pairs" not in vars(particulator.backend)
+        assert profiler.report()["Collision"]["calls"] == 1
+
+    @staticmethod
+    def test_particulators_sharing_backend_not_recorded(backend_class):
+        # arrange
+        backend = backend_class()
+        profiled, other = _particulator(backend), _particulator(backend)
+        profiler = profiled.enable_profiling()
+
+        # act
+        other.run(steps=N_STEPS)
+        profiled.run(steps=1)
+
+        # assert
+        assert profiler.report()["Collision"]["calls"] == 1
+        assert profiler.report()["Collision"]["children"]["find_pairs"]["calls"] == 1
+        profiled.disable_profiling()
+        assert "find_pairs" not in vars(backend)
+
+    @staticmethod
+    def test_incremental_sorting_scheme():
+        # arrange
+        position = np.array(
+            [[0.5, 1.5, 2.5, 0.5, 1.5, 2.5], [0.5, 0.5, 0.5, 1.5, 1.5, 1.5]]
+        )
+        particulator = DummyParticulator(CPU, n_sd=position.shape[1])
+        particulator.environment = DummyEnvironment(grid=(3, 2))
+        particulator.sorting_scheme = "incremental"
+        cell_id, cell_origin, position_in_cell = particulator.mesh.cellular_attributes(
+            position
+        )
+        particulator.build(
+            {
+                "multiplicity": np.ones(position.shape[1], dtype=np.int64),
+                "cell id": cell_id,
+                "cell origin": cell_origin,
+                "position in cell": position_in_cell,
+            }
+        )
+        profiler = particulator.enable_profiling()
+        _ = particulator.attributes.cell_start
+
+        # act
+        cell_origin[1, 0] = 1
+        particulator.attributes["cell origin"].upload(cell_origin)
+        particulator.recalculate_cell_id()
+        state = particulator.attributes.checkpoint_state
+        particulator.attributes.checkpoint_state = state
+        cell_start = particulator.attributes.cell_start.to_ndarray()
+
+        # assert
+        assert state["cell_n_moved"] == 1
+        np.testing.assert_array_equal(cell_start, (0, 0, 2, 3, 4, 5, 6))
+        assert profiler.report()["counting sort"]["calls"] == 2
+        assert particulator.attributes.cell_caretaker.stats == {
+            "incremental": 1,
+            "full": 1,
+        }
+        particulator.disable_profiling()
+        assert not hasattr(particulator.attributes.cell_caretaker, "timed_call")
@@ -0,0 +1,208 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import threading
+
+import numpy as np
+import pytest
+
+from PySDM import Builder
+from PySDM.backends import CPU
+from PySDM.dynamics import AmbientThermodynamics, Condensation
+from PySDM.dynamics.impl import register_dynamic
+from PySDM.environments import Box, Parcel
+from PySDM.impl.scheduler import DAGScheduler
+from PySDM.physics import si
+
+N_SD = 16
+N_STEPS = 3
+
+
+def _probe(name, callback, **declarations):
+    """returns a dynamic (of a distinct class as dynamics are keyed by class name)"""
+
+    def register(self, builder):
+        self.particulator = builder.particulator
+
+    return register_dynamic()(
+        type(
+            name,
+            (),
+            {
+                **declarations,
+                "particulator": None,
+                "register": register,
+                "__call__": lambda self: callback(self.particulator),
+            },
+        )
+    )()
+
+
+def _box_particulator(*dynamics):
+    builder = Builder(
+        n_sd=N_SD, backend=CPU(), environment=Box(dt=1 * si.s, dv=1 * si.m**3)
+    )
+    for dynamic in dynamics:
+        builder.add_dynamic(dynamic)
+    return builder.build(
+        attributes={
+            "multiplicity": np.ones(N_SD),
+            "volume": np.linspace(1, 100, N_SD) * si.um**3,
+        }
+    )
+
+
+def _overlap_probes(second_declarations):
+    event = threading.Event()
+    overlapped = []
+    first = _probe(
+        "First",
+        lambda _: overlapped.append(event.wait(timeout=1)),
+        reads=("volume",),
+        writes=(),
+    )
+    second = _probe("Second", lambda _: event.set(), **second_declarations)
+    return (first, second), event, overlapped
+
+
+class TestDAGScheduler:
+    @staticmethod
+    def test_sequential_by_default():
+        # arrange
+        (first, second), _, overlapped = _overlap_probes({"reads": (), "writes": ()})
+        particulator = _box_particulator(first, second)
+
+        # act
+        particulator.run(steps=1)
+
+        # assert
+        assert particulator.scheduler == "sequential"
+        assert overlapped == [False]
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "declarations, expected_graph, expected_overlap",
+        (
+            ({"reads": ("multiplicity",), "writes": ()}, (), True),
+            ({"reads": (), "writes": ("water mass",)}, ("First",), False),
+            ({}, ("First",), False),
+        ),
+    )
+    def test_independent_dynamics_run_concurrently(
+        declarations, expected_graph, expected_overlap
+    ):
+        # arrange
+        (first, second), event, overlapped = _overlap_probes(declarations)
+        particulator = _box_particulator(first, second)
+        particulator.scheduler = "dag"
+
+        # act
+        graph = DAGScheduler(particulator).graph()
+        particulator.run(steps=1)
+
+        # assert
+        assert graph == {"First": (), "Second": expected_graph}
+        assert event.is_set()
+        assert overlapped == [expected_overlap]
+
+    @staticmethod
+    def test_same_results_as_sequential():
+        # arrange
+        def simulation(scheduler):
+            volumes = []
+            builder = Builder(
+                n_sd=N_SD,
+                backend=CPU(),
+                environment=Parcel(
+                    dt=1 * si.s,
+                    mass_of_dry_air=1 * si.mg,
+                    p0=1000 * si.hPa,
+                    initial_water_vapour_mixing_ratio=22.2 * si.g / si.kg,
+                    T0=300 * si.K,
+                    w=5 * si.m / si.s,
+                ),
+            )
+            builder.add_dynamic(AmbientThermodynamics())
+            builder.add_dynamic(Condensation())
+            builder.add_dynamic(
+                _probe(
+                    "Probe",
+                    lambda particulator: volumes.append(
+                        particulator.attributes["volume"].to_ndarray()
+                    ),
+                    reads=("volume",),
+                    writes=(),
+                )
+            )
+            particulator = builder.build(
+                attributes=builder.particulator.environment.init_attributes(
+                    n_in_dv=np.full(N_SD, 1000.0),
+                    kappa=0.666,
+                    r_dry=np.logspace(-2, -1, N_SD) * si.um,
+                )
+            )
+            particulator.scheduler = scheduler
+            particulator.run(steps=N_STEPS)
+            return particulator, np.asarray(volumes)
+
+        # act
+        sequential, expected = simulation("sequential")
+        dag, actual = simulation("dag")
+
+        # assert
+        assert DAGScheduler(dag).graph() == {
+            "AmbientThermodynamics": (),
+            "Condensation": ("AmbientThermodynamics",),
+            "Probe": ("Condensation",),
+        }
+        assert (expected[-1] != expected[0]).any()
+        np.testing.assert_array_equal(actual, expected)
+        assert dag.environment["T"][0] == sequential.environment["T"][0]
+
+    @staticmethod
+    def test_exception_propagated():
+        # arrange
+        def fail(_):
+            raise ValueError("failure in a dynamic")
+
+        particulator = _box_particulator(
+            _probe("Failing", fail, reads=(), writes=()),
+            _probe("Passing", lambda _: None, reads=(), writes=()),
+        )
+        particulator.scheduler = "dag"
+
+        # act & assert
+        with pytest.raises(ValueError, match="failure in a dynamic"):
+            particulator.run(steps=1)
+
+    @staticmethod
+    def test_unknown_scheduler():
+        # arrange
+        particulator = _box_particulator()
+        particulator.scheduler = "fifo"
+
+        # act & assert
+        with pytest.raises(ValueError):
+            particulator.run(steps=1)
+
+    @staticmethod
+    def test_profiling_not_supported():
+        # arrange
+        particulator = _box_particulator()
+        particulator.scheduler = "dag"
+        particulator.enable_profiling()
+
+        # act & assert
+        with pytest.raises(NotImplementedError):
+            particulator.run(steps=1)
+
+    @staticmethod
+    def test_thread_unsafe_numba_threading_layer_refused(monkeypatch):
+        # arrange
+        monkeypatch.setattr(
+            "PySDM.impl.scheduler.numba_threading_layer", lambda: "workqueue"
+        )
+        particulator = _box_particulator()
+        particulator.scheduler = "dag"
+
+        # act & assert
+        with pytest.raises(ValueError, match="workqueue"):
+            particulator.run(steps=1)
@@ -0,0 +1,170 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numba
+import numpy as np
+import pytest
+
+from PySDM import Builder, Formulae
+from PySDM.backends import Numba
+from PySDM.dynamics import AmbientThermodynamics, Coalescence, Condensation
+from PySDM.dynamics.collisions.collision_kernels import Golovin
+from PySDM.environments import Box, Parcel
+from PySDM.physics import si
+from PySDM.products import (
+    AmbientRelativeHumidity,
+    ParticleConcentration,
+    PeakSaturation,
+    Time,
+    WallTime,
+)
+
+N_SD = 32
+N_STEPS = 3
+
+
+def _particulator(backend_class, warmup):
+    builder = Builder(
+        n_sd=N_SD,
+        backend=backend_class(Formulae(seed=44)),
+        environment=Box(dt=1 * si.s, dv=1 * si.m**3),
+    )
+    builder.add_dynamic(Coalescence(collision_kernel=Golovin(b=1.5e3 / si.s)))
+    return builder.build(
+        attributes={
+            "multiplicity": np.full(N_SD, 1e3),
+            "volume": np.linspace(1, 100, N_SD) * si.um**3,
+        },
+        products=(ParticleConcentration(name="n"), Time(name="t"), WallTime()),
+        warmup=warmup,
+    )
+
+
+def _parcel_particulator(warmup):
+    builder = Builder(
+        n_sd=N_SD,
+        backend=Numba(),
+        environment=Parcel(
+            dt=1 * si.s,
+            mass_of_dry_air=1 * si.mg,
+            p0=1000 * si.hPa,
+            initial_water_vapour_mixing_ratio=22.2 * si.g / si.kg,
+            T0=300 * si.K,
+            w=5 * si.m / si.s,
+        ),
+    )
+    builder.add_dynamic(AmbientThermodynamics())
+    builder.add_dynamic(Condensation())
+    return builder.build(
+        attributes=builder.particulator.environment.init_attributes(
+            n_in_dv=np.full(N_SD, 1000.0),
+            kappa=0.666,
+            r_dry=np.logspace(-2, -1, N_SD) * si.um,
+        ),
+        products=(AmbientRelativeHumidity(name="RH"), PeakSaturation(name="S_max")),
+        warmup=warmup,
+    )
+
+
+class TestWarmup:
+    @staticmethod
+    def test_warmup_does_not_alter_results(backend_class):
+        # arrange
+        reference = _particulator(backend_class, warmup=False)
+        sut = _particulator(backend_class, warmup=True)
+
+        # act
+        for particulator in (reference, sut):
+            particulator.run(steps=N_STEPS)
+
+        # assert
+        assert sut.n_steps == reference.n_steps == N_STEPS
+        assert sut.products["t"].get() == reference.products["t"].get()
+        np.testing.assert_array_equal(
+            sut.products["n"].get(), reference.products["n"].get()
+        )
+        for key in ("multiplicity", "volume"):
+            np.testing.assert_array_equal(
+                sut.attributes[key].to_ndarray(),
+                reference.attributes[key].to_ndarray(),
+            )
+
+    @staticmethod
+    @pytest.mark.skipif(
+        numba.config.DISABLE_JIT,  # pylint: disable=no-member
+        reason="no compilation without JIT",
+    )
+    def test_warmup_report():
+        # act
+        particulator = _particulator(Numba, warmup=True)
+        report = particulator.warmup_report
+
+        # assert
+        assert tuple(report["dynamics"].keys()) == ("Collision",)
+        assert set(report["products"].keys()) == {"n", "t", "wall time"}
+        assert "volume" in report["attributes"]
+        assert any("collision" in kernel.lower() for kernel in report["kernels"])
+        assert all(value > 0 for value in report["kernels"].values())
+        assert particulator.n_steps == 0
+
+    @staticmethod
+    def test_warmup_of_parcel_does_not_alter_results():
+        # arrange
+        reference = _parcel_particulator(warmup=False)
+        sut = _parcel_particulator(warmup=True)
+
+        # act
+        for particulator in (reference, sut):
+            particulator.run(steps=N_STEPS)
+
+        # assert
+        assert tuple(sut.warmup_report["dynamics"].keys()) == (
+            "AmbientThermodynamics",
+            "Condensation",
+        )
+        assert reference.warmup_report is None
+        for key in ("RH", "S_max"):
+            np.testing.assert_array_equal(
+                sut.products[key].get(), reference.products[key].get()
+            )
+        np.testing.assert_array_equal(
+            sut.attributes["water mass"].to_ndarray(),
+            reference.attributes["water mass"].to_ndarray(),
+        )
+
+    @staticmethod
+    def test_warmup_registers_copies_of_dynamics_and_products():
+        # arrange
+        registered = []
+
+        class RecordedCoalescence(Coalescence):
+            def register(self, builder):
+                registered.append(self)
+                super().register(builder)
+
+        class RecordedConcentration(ParticleConcentration):
+            def register(self, builder):
+                registered.append(self)
+                super().register(builder)
+
+        dynamic = RecordedCoalescence(collision_kernel=Golovin(b=1.5e3 / si.s))
+        product = RecordedConcentration(name="n")
+        builder = Builder(
+            n_sd=N_SD,
+            backend=Numba(Formulae(seed=44)),
+            environment=Box(dt=1 * si.s, dv=1 * si.m**3),
+        )
+        builder.add_dynamic(dynamic)
+
+        # act
+        builder.build(
+            attributes={
+                "multiplicity": np.full(N_SD, 1e3),
+                "volume": np.linspace(1, 100, N_SD) * si.um**3,
+            },
+            products=(product,),
+            warmup=True,
+        )
+
+        # assert
+        assert len(registered) == 4
+        assert len({id(obj) for obj in registered}) == len(registered)
+        assert all(obj is not dynamic and obj is not product for obj in registered)
@@ -5,6 +5,7 @@ from matplotlib import pyplot
 
 from PySDM import Formulae, Builder
 from PySDM.backends import Numba
+from PySDM.initialisation import hygroscopic_equilibrium
 from PySDM.initialisation.hygroscopic_equilibrium import (
     equilibrate_wet_radii,
     equilibrate_dry_radii,
@@ -14,6 +15,24 @@ from PySDM.physics import si
 from PySDM.environments import Box
 
 
+def _multi_cell_environment(formulae, T, RH):
+    class Particulator:  # pylint: disable=too-few-public-methods
+        pass
+
+    class Env:  # pylint: disable=too-few-public-methods
+        particulator = Particulator()
+        thermo = {
+            "T": Numba.Storage.from_ndarray(np.asarray(T)),
+            "RH": Numba.Storage.from_ndarray(np.asarray(RH)),
+        }
+
+        def __getitem__(self, item):
+            return self.thermo[item]
+
+    Particulator.formulae = formulae
+    return Env()
+
+
 class TestHygroscopicEquilibrium:
     @staticmethod
     @pytest.mark.parametrize("r_dry", (pytest.param(2.4e-09), pytest.param(2.5e-09)))
@@ -167,3 +186,107 @@ class TestHygroscopicEquilibrium:
                     environment=builder.particulator.environment,
                 ),
             )
+
+    @staticmethod
+    @pytest.mark.parametrize("warm_start", (True, False))
+    def test_equilibrate_wet_radii_unique_and_multi_cell(warm_start):
+        # arrange
+        formulae = Formulae()
+        env = _multi_cell_environment(
+            formulae, T=(280 * si.K, 290 * si.K, 290 * si.K), RH=(0.9, 0.95, 1.05)
+        )
+        rng = np.random.default_rng(seed=44)
+        r_dry = rng.permutation(np.repeat(np.logspace(-8.5, -6.5, 50), 6)) * si.m
+        cell_id = np.tile([0, 1, 2], len(r_dry) // 3)
+        kappa_times_dry_volume = 0.5 * formulae.trivia.volume(radius=r_dry)
+
+        # act
+        stats = {}
+        r_wet = equilibrate_wet_radii(
+            r_dry=r_dry,
+            environment=env,
+            kappa_times_dry_volume=kappa_times_dry_volume,
+            cell_id=cell_id,
+            warm_start=warm_start,
+            stats=stats,
+        )
+
+        # assert
+        assert stats["n_particles"] == len(r_dry)
+        assert stats["n_unique"] == len(
+            np.unique(np.column_stack((r_dry, cell_id)), axis=0)
+        )
+        assert 0 < stats["n_solved"] <= stats["n_unique"]
+        assert (stats["warm_start_evals_total"] > 0) == warm_start
+        for i in rng.choice(len(r_dry), size=10, replace=False):
+            np.testing.assert_allclose(
+                r_wet[i],
+                equilibrate_wet_radii(
+                    r_dry=r_dry[i : i + 1],
+                    environment=env,
+                    kappa_times_dry_volume=kappa_times_dry_volume[i : i + 1],
+                    cell_id=cell_id[i : i + 1],
+                ),
+                rtol=1e-4,
+            )
+
+    @staticmethod
+    def test_warm_start_reduces_iterations():
+        # arrange
+        formulae = Formulae()
+        env = _multi_cell_environment(formulae, T=(280 * si.K,), RH=(0.95,))
+        r_dry = np.logspace(-8.5, -6.5, 1000) * si.m
+        kappa_times_dry_volume = 0.5 * formulae.trivia.volume(radius=r_dry)
+
+        # act
+        stats = {True: {}, False: {}}
+        r_wet = {
+            warm_start: equilibrate_wet_radii(
+                r_dry=r_dry,
+                environment=env,
+                kappa_times_dry_volume=kappa_times_dry_volume,
+                warm_start=warm_start,
+                stats=stats[warm_start],
+            )
+            for warm_start in (True, False)
+        }
+
+        # assert
+        np.testing.assert_allclose(r_wet[True], r_wet[False], rtol=1e-4)
+        assert (
+            stats[True]["iters_total"] + stats[True]["warm_start_evals_total"]
+            < stats[False]["iters_total"]
+        )
+
+    @staticmethod
+    def test_solver_compiled_once_per_formulae_choice():
+        # arrange
+        r_dry = np.logspace(-8, -7, 10) * si.m
+
+        def solve(formulae):
+            return equilibrate_wet_radii(
+                r_dry=r_dry,
+                environment=_multi_cell_environment(
+                    formulae, T=(280 * si.K,), RH=(0.9,)
+                ),
+                kappa_times_dry_volume=formulae.trivia.volume(radius=r_dry),
+            )
+
+        solve(Formulae())
+        n_solvers = len(
+            hygroscopic_equilibrium._SOLVERS  # pylint: disable=protected-access
+        )
+
+        # act
+        solve(Formulae(seed=Formulae().seed + 1))
+        n_solvers_same_choice = len(
+            hygroscopic_equilibrium._SOLVERS  # pylint: disable=protected-access
+        )
+        solve(Formulae(fastmath=False))
+
+        # assert
+        assert n_solvers_same_choice == n_solvers
+        assert (
+            len(hygroscopic_equilibrium._SOLVERS)  # pylint: disable=protected-access
+            == n_solvers + 1
+        )
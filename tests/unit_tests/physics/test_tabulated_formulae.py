@@ -0,0 +1,136 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+import numpy as np
+import pytest
+
+from PySDM import Formulae
+from PySDM.backends import CPU
+from PySDM.physics import si
+
+CASES = {
+    "saturation_vapour_pressure__pvs_water": (
+        {"saturation_vapour_pressure": "MurphyKoop2005"},
+        ((200 * si.K, 330 * si.K),),
+    ),
+    "latent_heat_vapourisation__lv": (
+        {"latent_heat_vapourisation": "Lowe2019"},
+        ((230 * si.K, 320 * si.K),),
+    ),
+    "ventilation__ventilation_coefficient": (
+        {"ventilation": "Froessling1938"},
+        ((0, 100),),
+    ),
+    "trivia__th_std": ({}, ((500 * si.hPa, 1100 * si.hPa), (200 * si.K, 330 * si.K))),
+}
+
+
+def _arguments(ranges, n, seed=44):
+    rng = np.random.default_rng(seed=seed)
+    return [rng.uniform(*arg_range, n) for arg_range in ranges]
+
+
+class TestTabulatedFormulae:
+    @staticmethod
+    @pytest.mark.parametrize("key", CASES)
+    @pytest.mark.parametrize("rtol", (1e-4, 1e-7))
+    def test_error_bound(key, rtol):
+        # arrange
+        formulae_args, ranges = CASES[key]
+        exact = getattr(Formulae(**formulae_args).flatten, key)
+        args = _arguments(ranges, n=1000)
+
+        # act
+        sut = getattr(
+            Formulae(
+                **formulae_args, tabulated={key: ranges}, tabulation_rtol=rtol
+            ).flatten,
+            key,
+        )
+
+        # assert
+        assert sut.tabulation.error <= rtol
+        for arg in zip(*args):
+            np.testing.assert_allclose(sut(*arg), exact(*arg), rtol=rtol, atol=0)
+
+    @staticmethod
+    def test_same_signature_and_fallback_outside_range():
+        # arrange
+        key = "saturation_vapour_pressure__pvs_water"
+        formulae_args, ranges = CASES[key]
+        exact = getattr(Formulae(**formulae_args).flatten, key)
+
+        # act
+        sut = getattr(Formulae(**formulae_args, tabulated={key: ranges}).flatten, key)
+
+        # assert
+        assert sut(T=250 * si.K) == sut(250 * si.K)
+        for temperature in (ranges[0][0] - 1 * si.K, ranges[0][1] + 1 * si.K):
+            assert sut(temperature) == exact(temperature)
+        for temperature in ranges[0]:
+            np.testing.assert_allclose(sut(temperature), exact(temperature), rtol=1e-12)
+
+    @staticmethod
+    def test_backend_kernels_use_tabulated_formulae():
+        # arrange
+        key = "air_dynamic_viscosity__eta_air"
+        ranges = ((200 * si.K, 330 * si.K),)
+        backends = {
+            tabulated: CPU(
+                formulae=Formulae(
+                    tabulated={key: ranges} if tabulated else None,
+                    tabulation_rtol=1e-3,
+                )
+            )
+            for tabulated in (True, False)
+        }
+        temperature = _arguments(ranges, n=100)[0]
+        output = {}
+
+        # act
+        for tabulated, backend in backends.items():
+            output[tabulated] = backend.Storage.from_ndarray(np.empty_like(temperature))
+            backend.air_dynamic_viscosity(
+                output=output[tabulated],
+                temperature=backend.Storage.from_ndarray(temperature),
+            )
+
+        # assert
+        assert backends[True] is not backends[False]
+        assert str(backends[True].formulae) != str(backends[False].formulae)
+        actual, expected = (output[tab].to_ndarray() for tab in (True, False))
+        assert (actual != expected).any()
+        np.testing.assert_allclose(actual, expected, rtol=1e-3)
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "tabulated",
+        (
+            {"saturation_vapour_pressure__pvs_unknown": ((200, 300),)},
+            {"nonexistent__pvs_water": ((200, 300),)},
+        ),
+    )
+    def test_unknown_formula(tabulated):
+        with pytest.raises(ValueError):
+            Formulae(tabulated=tabulated)
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "tabulated",
+        (
+            {"saturation_vapour_pressure__pvs_water": ((300, 200),)},
+            {"saturation_vapour_pressure__pvs_water": ((200, 300), (0, 1))},
+            {"trivia__arrhenius": ((0, 1), (0, 1), (0, 1))},
+            {"trivia__vant_hoff": ((0, 1), (0, 1), (0, 1), (0, 1))},
+        ),
+    )
+    def test_invalid_tabulation(tabulated):
+        formulae = Formulae(tabulated=tabulated)
+        with pytest.raises(ValueError):
+            _ = formulae.flatten
+
+    @staticmethod
+    def test_error_bound_not_attainable():
+        formulae = Formulae(
+            tabulated={"trivia__volume": ((0, 1 * si.mm),)}, tabulation_rtol=1e-30
+        )
+        with pytest.raises(ValueError):
+            _ = formulae.flatten
@@ -21,6 +21,8 @@ CLASSES = (
     "environments.Kinematic1D",
     "environments.Kinematic2D",
     "environments.Parcel",
+    "exporters.AsyncExporter",
+    "exporters.NetCDFStreamingExporter",
     "exporters.VTKExporter",
     "initialisation.aerosol_composition.DryAerosolMixture",
     "initialisation.init_fall_momenta",